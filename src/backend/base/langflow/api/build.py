@@ -3,7 +3,8 @@ import json
 import time
 import traceback
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from functools import partial
 
 from fastapi import BackgroundTasks, HTTPException, Response
 from lfx.graph.graph.base import Graph
@@ -30,6 +31,7 @@ from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
+from langflow.services.job_queue.backends import JobEventStream
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentInputsPayload, ComponentPayload, PlaygroundPayload
 
@@ -92,6 +94,8 @@ async def start_flow_build(
             flow_name=flow_name,
         )
         queue_service.start_job(job_id, task_coro)
+        # Make the job visible to the other replicas before its id is returned to the client
+        await queue_service.create_stream(job_id)
     except Exception as e:
         await logger.aexception("Failed to create queue and start task")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -104,48 +108,44 @@ async def get_flow_events_response(
     queue_service: JobQueueService,
     event_delivery: EventDeliveryType,
 ):
-    """Get events for a specific build job, either as a stream or single event."""
+    """Get events for a specific build job, either as a stream or single event.
+
+    The job may run on this or on any other replica sharing the queue service backend.
+    """
     try:
-        main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
+        event_stream, event_manager, event_task = await queue_service.get_job_events(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
-            if event_task is None:
+            if event_manager is not None and event_task is None:
                 await logger.aerror(f"No event task found for job {job_id}")
                 raise HTTPException(status_code=404, detail="No event task found for job")
             return await create_flow_response(
-                queue=main_queue,
+                queue=event_stream,
                 event_manager=event_manager,
                 event_task=event_task,
+                cancel_job=partial(queue_service.schedule_cancel, job_id),
             )
 
         # Polling mode - get all available events
         try:
             events: list = []
-            # Get all available events from the queue without blocking
-            while not main_queue.empty():
-                _, value, _ = await main_queue.get()
+            end_of_stream = False
+            # Events read from the backend are consumed, so return every one of them, waiting
+            # only if none is available yet
+            for _, value, _ in await event_stream.get_batch():
                 if value is None:
-                    # End of stream, trigger end event
-                    if event_task is not None:
-                        event_task.cancel()
-                    event_manager.on_end(data={})
-                    # Include the end event
-                    events.append(None)
+                    end_of_stream = True
                     break
                 events.append(value.decode("utf-8"))
 
-            # If no events were available, wait for one (with timeout)
-            if not events:
-                _, value, _ = await main_queue.get()
-                if value is None:
-                    # End of stream, trigger end event
-                    if event_task is not None:
-                        event_task.cancel()
+            if end_of_stream:
+                # End of stream, trigger end event
+                if event_task is not None:
+                    event_task.cancel()
+                if event_manager is not None:
                     event_manager.on_end(data={})
-                else:
-                    events.append(value.decode("utf-8"))
 
             # Return as NDJSON format - each line is a complete JSON object
-            content = "\n".join([event for event in events if event is not None])
+            content = "\n".join(events)
             return Response(content=content, media_type="application/x-ndjson")
         except asyncio.CancelledError as exc:
             await logger.ainfo(f"Event polling was cancelled for job {job_id}")
@@ -165,11 +165,19 @@ async def get_flow_events_response(
 
 
 async def create_flow_response(
-    queue: asyncio.Queue,
-    event_manager: EventManager,
-    event_task: asyncio.Task,
+    queue: asyncio.Queue | JobEventStream,
+    event_manager: EventManager | None,
+    event_task: asyncio.Task | None,
+    cancel_job: Callable[[], None] | None = None,
 ) -> DisconnectHandlerStreamingResponse:
-    """Create a streaming response for the flow build process."""
+    """Create a streaming response for the flow build process.
+
+    Args:
+        queue: The queue or event stream to consume the job's events from.
+        event_manager: The job's event manager, if the job runs on this replica.
+        event_task: The job's task, if the job runs on this replica.
+        cancel_job: Called on disconnect to cancel a job running on another replica.
+    """
 
     async def consume_and_yield() -> AsyncIterator[str]:
         while True:
@@ -180,14 +188,21 @@ async def create_flow_response(
                 get_time = time.time()
                 yield value.decode("utf-8")
                 await logger.adebug(f"Event {event_id} consumed in {get_time - put_time:.4f}s")
+            except JobQueueNotFoundError:
+                await logger.adebug("Event stream removed, stopping consumption")
+                break
             except Exception as exc:  # noqa: BLE001
                 await logger.aexception(f"Error consuming event: {exc}")
                 break
 
     def on_disconnect() -> None:
         logger.debug("Client disconnected, closing tasks")
-        event_task.cancel()
-        event_manager.on_end(data={})
+        if event_task is not None:
+            event_task.cancel()
+        elif cancel_job is not None:
+            cancel_job()
+        if event_manager is not None:
+            event_manager.on_end(data={})
 
     return DisconnectHandlerStreamingResponse(
         consume_and_yield(),
@@ -550,7 +565,14 @@ async def cancel_flow_build(
         asyncio.CancelledError: If the task cancellation failed
     """
     # Get the event task and event manager for the job
-    _, _, event_task, _ = queue_service.get_queue_data(job_id)
+    try:
+        _, _, event_task, _ = queue_service.get_queue_data(job_id)
+    except JobQueueNotFoundError:
+        # The job may be running on another replica, which will cancel it when it sees the request
+        if not await queue_service.request_cancel(job_id):
+            raise
+        await logger.ainfo(f"Requested cancellation of job_id {job_id} running on another worker")
+        return True
 
     if event_task is None:
         await logger.awarning(f"No event task found for job_id {job_id}")
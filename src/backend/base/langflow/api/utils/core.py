@@ -319,6 +319,12 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
+    """Delete a flow with its messages, transactions and vertex builds.
+
+    The deleted messages may be held by the chat history buffers. Callers must call
+    ``get_chat_history_buffer().invalidate_all()`` once the session is committed, not before, or a
+    read in between could buffer them again.
+    """
     try:
         # TODO: Verify if deleting messages is safe in terms of session id relevance
         # If we delete messages directly, rather than setting flow_id to null,
@@ -0,0 +1,117 @@
+"""Streaming file uploads, and file responses with HTTP range support."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from langflow.services.storage.service import StorageService
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Uploads are read and written in chunks of this size so that they are never held in memory whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
+    """Convert bytes object or stream into an async generator that yields chunks."""
+    if isinstance(file_input, bytes):
+        # Handle bytes object
+        for i in range(0, len(file_input), chunk_size):
+            yield file_input[i : i + chunk_size]
+    # Handle stream object
+    elif hasattr(file_input, "read"):
+        while True:
+            chunk = await file_input.read(chunk_size) if callable(file_input.read) else file_input.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        # Handle async iterator
+        async for chunk in file_input:
+            yield chunk
+
+
+def parse_range_header(range_header: str | None, file_size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range`` header into inclusive byte offsets.
+
+    Args:
+        range_header: The value of the ``Range`` request header.
+        file_size: The size of the requested file in bytes.
+
+    Returns:
+        The first and last byte offsets to send, or None to send the whole file. Malformed and
+        multi-range headers are ignored, as RFC 9110 allows.
+
+    Raises:
+        HTTPException: 416 if the range starts past the end of the file.
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, sep, last = ranges.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else file_size - 1
+        else:
+            # A suffix range asks for the last N bytes
+            suffix_length = int(last)
+            if suffix_length <= 0:
+                raise ValueError
+            start = max(file_size - suffix_length, 0)
+            end = file_size - 1
+    except ValueError:
+        return None
+    if start >= file_size:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    if start < 0 or end < start:
+        return None
+    return start, min(end, file_size - 1)
+
+
+async def stream_file_response(
+    storage_service: StorageService,
+    flow_id: str,
+    file_name: str,
+    *,
+    range_header: str | None = None,
+    media_type: str = "application/octet-stream",
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream a stored file, or the byte range requested by ``range_header``, to the client.
+
+    The file size is read before the response starts so that missing files still raise
+    ``FileNotFoundError`` while the status code can be changed.
+    """
+    file_size = await storage_service.get_file_size(flow_id=flow_id, file_name=file_name)
+    byte_range = parse_range_header(range_header, file_size)
+    response_headers = {**(headers or {}), "Accept-Ranges": "bytes"}
+
+    if byte_range is None:
+        start, end = 0, None
+        status_code = HTTPStatus.OK
+        response_headers["Content-Length"] = str(file_size)
+    else:
+        start, end = byte_range
+        status_code = HTTPStatus.PARTIAL_CONTENT
+        response_headers["Content-Length"] = str(end - start + 1)
+        response_headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+
+    file_stream = storage_service.get_file_stream(
+        flow_id=flow_id, file_name=file_name, chunk_size=DOWNLOAD_CHUNK_SIZE, start=start, end=end
+    )
+    return StreamingResponse(file_stream, status_code=status_code, media_type=media_type, headers=response_headers)
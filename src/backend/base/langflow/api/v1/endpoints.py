@@ -38,11 +38,12 @@ from langflow.api.v1.schemas import (
     UpdateCustomComponentRequest,
     UploadFileResponse,
 )
-from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_manager import create_stream_tokens_event_manager, get_coalescing_options
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.prepared_graph_cache import graph_from_flow
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import (
@@ -160,11 +161,7 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(
-            graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name, context=context
-        )
+        graph = graph_from_flow(flow, input_request.tweaks or {}, stream=stream, user_id=str(user_id), context=context)
         if run_id is None:
             run_id = str(uuid4())
         graph.set_run_id(run_id)
@@ -463,7 +460,7 @@ async def _run_flow_internal(
     if stream:
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue, **get_coalescing_options())
         main_task = asyncio.create_task(
             run_flow_generator(
                 flow=flow,
@@ -7,12 +7,13 @@ from typing import Annotated
 from uuid import UUID
 
 import anyio
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from lfx.services.settings.service import SettingsService
 from lfx.utils.helpers import build_content_type_from_extension
 
 from langflow.api.utils import CurrentActiveUser, DbSession, ValidatedFileName
+from langflow.api.utils.file_responses import UPLOAD_CHUNK_SIZE, byte_stream_generator, stream_file_response
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -92,12 +93,20 @@ async def upload_file(
 
     # Authorization handled by get_flow dependency
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
-        full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        if file.filename:
+            full_file_name = f"{timestamp}_{file.filename}"
+            await storage_service.save_file_stream(
+                flow_id=folder,
+                file_name=full_file_name,
+                chunks=byte_stream_generator(file, chunk_size=UPLOAD_CHUNK_SIZE),
+            )
+        else:
+            # Unnamed uploads are named after their content, which has to be read first
+            file_content = await file.read()
+            full_file_name = f"{timestamp}_{hashlib.sha256(file_content).hexdigest()}"
+            await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -108,6 +117,7 @@ async def download_file(
     file_name: ValidatedFileName,
     flow: Annotated[Flow, Depends(get_flow)],
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     # Authorization handled by get_flow dependency
     flow_id_str = str(flow.id)
@@ -124,13 +134,20 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        return await stream_file_response(
+            storage_service,
+            flow_id=flow_id_str,
+            file_name=file_name,
+            range_header=range_header,
+            media_type=content_type,
+            headers=headers,
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -139,6 +156,7 @@ async def download_file(
 async def download_image(
     file_name: ValidatedFileName,
     flow_id: UUID,
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     """Download image from storage for browser rendering."""
     storage_service = get_storage_service()
@@ -158,8 +176,15 @@ async def download_image(
         raise HTTPException(status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await stream_file_response(
+            storage_service,
+            flow_id=flow_id_str,
+            file_name=file_name,
+            range_header=range_header,
+            media_type=content_type,
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
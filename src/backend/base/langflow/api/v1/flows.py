@@ -1,24 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import re
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path as StdlibPath
+from types import SimpleNamespace
 from typing import Annotated
 from uuid import UUID
 
 import orjson
 from aiofile import async_open
 from anyio import Path
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Response, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from lfx.log import logger
-from sqlmodel import and_, col, select
+from sqlalchemy import case, func
+from sqlmodel import and_, col, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
@@ -26,6 +29,7 @@ from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.auth.utils import get_current_active_user
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -40,10 +44,26 @@ from langflow.services.database.models.folder.model import Folder
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.storage.service import StorageService
 from langflow.utils.compression import compress_response
+from langflow.utils.version import get_version_info
 
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
 
+# Columns of a flow header. The flow data is selected separately, only for components.
+_FLOW_HEADER_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.folder_id,
+    Flow.is_component,
+    Flow.endpoint_name,
+    Flow.description,
+    Flow.access_type,
+    Flow.tags,
+    Flow.mcp_enabled,
+    Flow.action_name,
+    Flow.action_description,
+)
+
 
 def _get_safe_flow_path(fs_path: str, user_id: UUID, storage_service: StorageService) -> Path:
     """Get a safe filesystem path for flow storage, restricted to user's flows directory.
@@ -314,6 +334,41 @@ async def create_flow(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _flow_listing_etag(session: AsyncSession, filters: list, *variant) -> str:
+    """Return an ETag for the flows matching ``filters``.
+
+    It changes whenever a flow is added, removed or updated, since that changes the number of flows or
+    the latest ``updated_at``, and with the Langflow version, which updates the starter projects.
+    """
+    stmt = select(func.count(Flow.id), func.max(Flow.updated_at)).where(*filters)
+    count, last_updated = (await session.exec(stmt)).one()
+    key = "|".join(str(part) for part in (get_version_info()["version"], count, last_updated, *variant))
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag.removeprefix("W/") for tag in if_none_match.split(","))
+
+
+async def _read_flow_headers(session: AsyncSession, filters: list) -> list[FlowHeader]:
+    """Read the headers of the flows matching ``filters`` without loading the data of every flow.
+
+    Only components carry their data in a header, so it is selected for them and for flows that do
+    not record whether they are a component yet, which is then inferred from it.
+    """
+    data = case(
+        (or_(Flow.is_component == True, Flow.is_component == None), Flow.data),  # noqa: E711, E712
+        else_=None,
+    ).label("data")
+    rows = (await session.exec(select(*_FLOW_HEADER_COLUMNS, data).where(*filters))).all()
+    flows = validate_is_component([SimpleNamespace(**row._mapping) for row in rows])  # noqa: SLF001
+    return [FlowHeader.model_validate(vars(flow)) for flow in flows]
+
+
 @router.get("/", response_model=list[FlowRead] | Page[FlowRead] | list[FlowHeader], status_code=200)
 async def read_flows(
     *,
@@ -325,6 +380,7 @@ async def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
 ):
     """Retrieve a list of flows with pagination support.
 
@@ -341,6 +397,9 @@ async def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+            The listing carries an ETag, and a request whose ``If-None-Match`` matches it gets a 304
+            response without the flows being read.
+        if_none_match (str, optional): The ETag of a listing the client already has.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
@@ -365,17 +424,28 @@ async def read_flows(
             folder_id = default_folder_id
 
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
-                (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
-            )
+            filters = [(Flow.user_id == None) | (Flow.user_id == current_user.id)]  # noqa: E711
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            filters = [Flow.user_id == current_user.id]
 
         if remove_example_flows:
-            stmt = stmt.where(Flow.folder_id != starter_folder_id)
+            filters.append(Flow.folder_id != starter_folder_id)
 
         if components_only:
-            stmt = stmt.where(Flow.is_component == True)  # noqa: E712
+            filters.append(Flow.is_component == True)  # noqa: E712
+
+        if get_all and header_flows:
+            etag = await _flow_listing_etag(
+                session, filters, current_user.id, auth_settings.AUTO_LOGIN, remove_example_flows, components_only
+            )
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+            if _etag_matches(etag, if_none_match):
+                return Response(status_code=304, headers=headers)
+            response = compress_response(await _read_flow_headers(session, filters))
+            response.headers.update(headers)
+            return response
+
+        stmt = select(Flow).where(*filters)
 
         if get_all:
             flows = (await session.exec(stmt)).all()
@@ -384,11 +454,6 @@ async def read_flows(
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
-
             # Convert to FlowRead while session is still active to avoid detached instance errors
             flow_reads = [FlowRead.model_validate(flow, from_attributes=True) for flow in flows]
             return compress_response(flow_reads)
@@ -690,6 +755,8 @@ async def delete_flow(
     if not flow:
         raise HTTPException(status_code=404, detail="Flow not found")
     await cascade_delete_flow(session, flow.id)
+    await session.commit()
+    await get_chat_history_buffer().invalidate_all()
     return {"message": "Flow deleted successfully"}
 
 
@@ -782,7 +849,9 @@ async def delete_multiple_flows(
         for flow in flows_to_delete:
             await cascade_delete_flow(db, flow.id)
 
-        await db.flush()
+        await db.commit()
+        if flows_to_delete:
+            await get_chat_history_buffer().invalidate_all()
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -6,6 +6,7 @@ from pathlib import Path
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 from langchain_chroma import Chroma
+from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
 from lfx.log import logger
 from pydantic import BaseModel
 
@@ -397,6 +398,7 @@ async def delete_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -
             raise HTTPException(status_code=404, detail=f"Knowledge base '{kb_name}' not found")
 
         # Delete the entire knowledge base directory
+        get_knowledge_base_cache().invalidate(kb_path)
         shutil.rmtree(kb_path)
 
     except HTTPException:
@@ -427,6 +429,7 @@ async def delete_knowledge_bases_bulk(request: BulkDeleteRequest, current_user:
 
             try:
                 # Delete the entire knowledge base directory
+                get_knowledge_base_cache().invalidate(kb_path)
                 shutil.rmtree(kb_path)
                 deleted_count += 1
             except (OSError, PermissionError) as e:
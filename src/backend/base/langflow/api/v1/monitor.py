@@ -10,6 +10,7 @@ from sqlmodel import col, select
 from langflow.api.utils import DbSession, custom_params
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table_for_logs
@@ -103,8 +104,10 @@ async def get_messages(
 async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
         await session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore[attr-defined]
+        await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    await get_chat_history_buffer().invalidate_all()
 
 
 @router.put("/messages/{message_id}", dependencies=[Depends(get_current_active_user)], response_model=MessageRead)
@@ -121,6 +124,7 @@ async def update_message(
     if not db_message:
         raise HTTPException(status_code=404, detail="Message not found")
 
+    previous_session_id = db_message.session_id
     try:
         message_dict = message.model_dump(exclude_unset=True, exclude_none=True)
         if "text" in message_dict and message_dict["text"] != db_message.text:
@@ -129,8 +133,11 @@ async def update_message(
         session.add(db_message)
         await session.flush()
         await session.refresh(db_message)
+        await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    for session_id in {previous_session_id, db_message.session_id}:
+        await get_chat_history_buffer().invalidate(session_id)
     return db_message
 
 
@@ -165,8 +172,11 @@ async def update_session_id(
         for message in messages:
             await session.refresh(message)
             message_responses.append(MessageResponse.model_validate(message, from_attributes=True))
+        await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    for session_id in (old_session_id, new_session_id):
+        await get_chat_history_buffer().invalidate(session_id)
 
     return message_responses
 
@@ -182,8 +192,10 @@ async def delete_messages_session(
             .where(col(MessageTable.session_id) == session_id)
             .execution_options(synchronize_session="fetch")
         )
+        await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    await get_chat_history_buffer().invalidate(session_id)
 
     return {"message": "Messages deleted successfully"}
 
@@ -13,7 +13,7 @@ from lfx.schema.openai_responses_schemas import create_openai_error
 from langflow.api.utils import extract_global_variables_from_headers
 from langflow.api.v1.endpoints import consume_and_yield, run_flow_generator, simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
-from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_manager import create_stream_tokens_event_manager, get_coalescing_options
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.schema import (
     OpenAIErrorResponse,
@@ -98,7 +98,7 @@ async def run_flow_for_openai_responses(
         # Handle streaming response
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue, **get_coalescing_options())
 
         async def openai_stream_generator() -> AsyncGenerator[str, None]:
             """Convert Langflow events to OpenAI Responses API streaming format."""
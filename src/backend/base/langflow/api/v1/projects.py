@@ -33,6 +33,7 @@ from langflow.helpers.flow import generate_unique_flow_name
 from langflow.helpers.folders import generate_unique_folder_name
 from langflow.initial_setup.constants import ASSISTANT_FOLDER_NAME, STARTER_FOLDER_NAME
 from langflow.services.auth.mcp_encryption import encrypt_auth_settings
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.api_key.crud import create_api_key
 from langflow.services.database.models.api_key.model import ApiKeyCreate
 from langflow.services.database.models.flow.model import Flow, FlowCreate, FlowRead
@@ -192,13 +193,17 @@ async def create_project(
 
         if project.components_list:
             update_statement_components = (
-                update(Flow).where(Flow.id.in_(project.components_list)).values(folder_id=new_project.id)  # type: ignore[attr-defined]
+                update(Flow)
+                .where(Flow.id.in_(project.components_list))  # type: ignore[attr-defined]
+                .values(folder_id=new_project.id, updated_at=datetime.now(timezone.utc))
             )
             await session.exec(update_statement_components)
 
         if project.flows_list:
             update_statement_flows = (
-                update(Flow).where(Flow.id.in_(project.flows_list)).values(folder_id=new_project.id)  # type: ignore[attr-defined]
+                update(Flow)
+                .where(Flow.id.in_(project.flows_list))  # type: ignore[attr-defined]
+                .values(folder_id=new_project.id, updated_at=datetime.now(timezone.utc))
             )
             await session.exec(update_statement_flows)
 
@@ -467,13 +472,18 @@ async def update_project(
         my_collection_project = (await session.exec(select(Folder).where(Folder.name == DEFAULT_FOLDER_NAME))).first()
         if my_collection_project:
             update_statement_my_collection = (
-                update(Flow).where(Flow.id.in_(excluded_flows)).values(folder_id=my_collection_project.id)  # type: ignore[attr-defined]
+                update(Flow)
+                .where(Flow.id.in_(excluded_flows))  # type: ignore[attr-defined]
+                .values(folder_id=my_collection_project.id, updated_at=datetime.now(timezone.utc))
             )
             await session.exec(update_statement_my_collection)
 
         if concat_project_components:
             update_statement_components = (
-                update(Flow).where(Flow.id.in_(concat_project_components)).values(folder_id=existing_project.id)  # type: ignore[attr-defined]
+                update(Flow)
+                .where(Flow.id.in_(concat_project_components))  # type: ignore[attr-defined]
+                .where(Flow.folder_id.is_distinct_from(existing_project.id))  # type: ignore[union-attr]
+                .values(folder_id=existing_project.id, updated_at=datetime.now(timezone.utc))
             )
             await session.exec(update_statement_components)
 
@@ -580,9 +590,12 @@ async def delete_project(
 
     try:
         await session.delete(project)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
+        await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    if flows:
+        await get_chat_history_buffer().invalidate_all()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get("/download/{project_id}", status_code=200)
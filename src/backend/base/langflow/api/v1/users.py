@@ -2,6 +2,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
@@ -15,6 +16,7 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.api_key.cache import get_api_key_cache
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
 from langflow.services.database.models.user.model import User, UserCreate, UserRead, UserUpdate
 from langflow.services.deps import get_settings_service
@@ -123,8 +125,9 @@ async def reset_password(
     new_password = get_password_hash(user_update.password)
     user.password = new_password
 
-    await session.flush()
+    await session.commit()
     await session.refresh(user)
+    get_api_key_cache().invalidate_user(user.id)
 
     return user
 
@@ -147,4 +150,7 @@ async def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     await session.delete(user_db)
+    await session.commit()
+    get_api_key_cache().invalidate_user(user_id)
+    get_knowledge_base_cache().invalidate_username(user_id)
     return {"detail": "User deleted"}
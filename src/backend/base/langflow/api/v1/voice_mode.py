@@ -29,6 +29,7 @@ from langflow.api.v1.chat import build_flow_and_stream
 from langflow.memory import aadd_messagetables
 from langflow.schema.properties import Properties
 from langflow.services.auth.utils import get_current_user_for_websocket
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.user.model import User
@@ -305,7 +306,8 @@ async def process_message_queue(queue_key, session):
             message = await message_queues[queue_key].get()
 
             try:
-                await aadd_messagetables([message], session)
+                added = await aadd_messagetables([message], session)
+                await get_chat_history_buffer().add(added_message.model_dump() for added_message in added)
                 await logger.adebug(f"Added message to DB: {message.text[:30]}...")
             except ValueError as e:
                 await logger.aerror(f"Error saving message to database (ValueError): {e}")
@@ -2,20 +2,21 @@ import io
 import re
 import uuid
 import zipfile
-from collections.abc import AsyncGenerator, AsyncIterable
+from collections.abc import AsyncIterable
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from lfx.log.logger import logger
 from sqlmodel import col, select
 
 from langflow.api.schemas import UploadFileResponse
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.file_responses import UPLOAD_CHUNK_SIZE, byte_stream_generator, stream_file_response
 from langflow.services.database.models.file.model import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.settings.service import SettingsService
@@ -67,25 +68,6 @@ async def get_mcp_file(current_user: CurrentActiveUser, *, extension: bool = Fal
     return f"{MCP_SERVERS_FILE}_{current_user.id!s}" + (".json" if extension else "")
 
 
-async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object or stream into an async generator that yields chunks."""
-    if isinstance(file_input, bytes):
-        # Handle bytes object
-        for i in range(0, len(file_input), chunk_size):
-            yield file_input[i : i + chunk_size]
-    # Handle stream object
-    elif hasattr(file_input, "read"):
-        while True:
-            chunk = await file_input.read(chunk_size) if callable(file_input.read) else file_input.read(chunk_size)
-            if not chunk:
-                break
-            yield chunk
-    else:
-        # Handle async iterator
-        async for chunk in file_input:
-            yield chunk
-
-
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -113,16 +95,27 @@ async def save_file_routine(
     *,
     append: bool = False,
 ):
-    """Routine to save the file content to the storage service."""
+    """Routine to save the file content to the storage service.
+
+    Uploads without ``file_content`` are streamed to the storage service chunk by chunk.
+    """
     file_id = uuid.uuid4()
 
-    if not file_content:
-        file_content = await file.read()
     if not file_name:
         file_name = file.filename
 
     # Save the file using the storage service.
-    await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content, append=append)
+    if file_content:
+        await storage_service.save_file(
+            flow_id=str(current_user.id), file_name=file_name, data=file_content, append=append
+        )
+    else:
+        await storage_service.save_file_stream(
+            flow_id=str(current_user.id),
+            file_name=file_name,
+            chunks=byte_stream_generator(file, chunk_size=UPLOAD_CHUNK_SIZE),
+            append=append,
+        )
 
     return file_id, file_name
 
@@ -380,34 +373,32 @@ async def delete_files_batch(
         # Track database deletion failures
         db_failures = []
 
-        # Delete all files from the storage service
-        for file in files:
-            # Extract just the filename from the path (strip user_id prefix)
-            file_name = Path(file.path).name
+        # Delete all files from the storage service in one batch
+        # Extract just the filename from the path (strip user_id prefix)
+        file_names = [Path(file.path).name for file in files]
+        storage_errors = await storage_service.delete_files(flow_id=str(current_user.id), file_names=file_names)
+
+        for file, file_name in zip(files, file_names, strict=True):
             storage_deleted = False
 
-            try:
-                await storage_service.delete_file(flow_id=str(current_user.id), file_name=file_name)
+            if (err := storage_errors.get(file_name)) is None:
                 storage_deleted = True
-            except OSError as err:
-                # Check if this is a "permanent" failure where file/storage is gone
-                # These are safe to delete from DB even if storage deletion failed
-                if is_permanent_storage_failure(err):
-                    # File/storage is permanently gone - safe to delete from DB
-                    await logger.awarning(
-                        "File %s not found in storage (permanent failure), will remove from database: %s",
-                        file_name,
-                        err,
-                    )
-                    storage_deleted = True  # Treat as "deleted" for DB purposes
-                else:
-                    # Transient failure (network, timeout, permissions) - keep in DB for retry
-                    storage_failures.append(f"{file_name}: {err}")
-                    await logger.awarning(
-                        "Failed to delete file %s from storage (transient error, keeping in database for retry): %s",
-                        file_name,
-                        err,
-                    )
+            elif is_permanent_storage_failure(err):
+                # File/storage is permanently gone - safe to delete from DB even if storage deletion failed
+                await logger.awarning(
+                    "File %s not found in storage (permanent failure), will remove from database: %s",
+                    file_name,
+                    err,
+                )
+                storage_deleted = True  # Treat as "deleted" for DB purposes
+            else:
+                # Transient failure (network, timeout, permissions) - keep in DB for retry
+                storage_failures.append(f"{file_name}: {err}")
+                await logger.awarning(
+                    "Failed to delete file %s from storage (transient error, keeping in database for retry): %s",
+                    file_name,
+                    err,
+                )
 
             # Only delete from database if storage deletion succeeded OR it was a permanent failure
             if storage_deleted:
@@ -478,18 +469,17 @@ async def download_files_batch(
         # Create a ZIP file
         with zipfile.ZipFile(zip_stream, "w") as zip_file:
             for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=Path(file.path).name
-                )
-
                 # Get the file extension from the original filename
                 file_extension = Path(file.path).suffix
                 # Create the filename with extension
                 filename_with_extension = f"{file.name}{file_extension}"
 
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
+                # Stream the file from storage into the ZIP with the proper extension
+                with zip_file.open(filename_with_extension, "w") as zip_entry:
+                    async for chunk in storage_service.get_file_stream(
+                        flow_id=str(current_user.id), file_name=Path(file.path).name
+                    ):
+                        zip_entry.write(chunk)
 
         # Seek to the beginning of the byte stream
         zip_stream.seek(0)
@@ -529,17 +519,21 @@ async def read_file_content(file_stream: AsyncIterable[bytes] | bytes, *, decode
         if isinstance(file_stream, bytes):
             content = file_stream
         else:
+            chunks = []
             async for chunk in file_stream:
                 if not isinstance(chunk, bytes):
                     msg = "File stream must yield bytes"
                     raise TypeError(msg)
-                content += chunk
+                chunks.append(chunk)
+            content = b"".join(chunks)
         if not decode:
             return content
         try:
             return content.decode("utf-8")
         except UnicodeDecodeError as exc:
             raise HTTPException(status_code=500, detail="Invalid file encoding") from exc
+    except FileNotFoundError:
+        raise
     except ValueError as exc:
         raise HTTPException(status_code=500, detail=f"Error reading file: {exc}") from exc
     except Exception as exc:
@@ -554,6 +548,7 @@ async def download_file(
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
     *,
     return_content: bool = False,
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     """Download a file by its ID or return its content as a string/bytes.
 
@@ -563,6 +558,7 @@ async def download_file(
         session: Database session.
         storage_service: File storage service.
         return_content: If True, return raw content (str) instead of StreamingResponse.
+        range_header: Optional HTTP ``Range`` header. A single byte range is answered with 206.
 
     Returns:
         StreamingResponse for client downloads or str for internal use.
@@ -578,31 +574,20 @@ async def download_file(
 
         # If return_content is True, read the file content and return it
         if return_content:
-            # For content return, get the full file
-            file_content = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-            if file_content is None:
-                raise HTTPException(status_code=404, detail="File not found")
-            return await read_file_content(file_content, decode=True)
-
-        # Check file exists before streaming (to catch errors before response headers are sent)
-        # This is important because once StreamingResponse starts, we can't change the status code
-        try:
-            await storage_service.get_file_size(flow_id=str(current_user.id), file_name=file_name)
-        except FileNotFoundError as e:
-            raise HTTPException(status_code=404, detail=f"File not found: {e}") from e
-
-        # Wrap the async generator in byte_stream_generator to ensure proper iteration
-        file_stream = storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file_name)
-        byte_stream = byte_stream_generator(file_stream)
+            file_stream = storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file_name)
+            return await read_file_content(file_stream, decode=True)
 
         # Create the filename with extension
         file_extension = Path(file.path).suffix
         filename_with_extension = f"{file.name}{file_extension}"
 
-        # Return the file as a streaming response
-        return StreamingResponse(
-            byte_stream,
-            media_type="application/octet-stream",
+        # The file size is read before streaming, so a missing file is still reported as a 404
+        # (once StreamingResponse starts, we can't change the status code)
+        return await stream_file_response(
+            storage_service,
+            flow_id=str(current_user.id),
+            file_name=file_name,
+            range_header=range_header,
             headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
         )
 
@@ -721,34 +706,32 @@ async def delete_all_files(
         storage_failures = []
         db_failures = []
 
-        # Delete all files from the storage service
-        for file in files:
-            # Extract just the filename from the path (strip user_id prefix)
-            file_name = Path(file.path).name
+        # Delete all files from the storage service in one batch
+        # Extract just the filename from the path (strip user_id prefix)
+        file_names = [Path(file.path).name for file in files]
+        storage_errors = await storage_service.delete_files(flow_id=str(current_user.id), file_names=file_names)
+
+        for file, file_name in zip(files, file_names, strict=True):
             storage_deleted = False
 
-            try:
-                await storage_service.delete_file(flow_id=str(current_user.id), file_name=file_name)
+            if (err := storage_errors.get(file_name)) is None:
                 storage_deleted = True
-            except OSError as err:
-                # Check if this is a "permanent" failure where file/storage is gone
-                # These are safe to delete from DB even if storage deletion failed
-                if is_permanent_storage_failure(err):
-                    # File/storage is permanently gone - safe to delete from DB
-                    await logger.awarning(
-                        "File %s not found in storage, also removing from database: %s",
-                        file_name,
-                        err,
-                    )
-                    storage_deleted = True
-                else:
-                    # Transient failure (network, timeout, permissions) - keep in DB for retry
-                    storage_failures.append(f"{file_name}: {err}")
-                    await logger.awarning(
-                        "Failed to delete file %s from storage (transient error, keeping in database for retry): %s",
-                        file_name,
-                        err,
-                    )
+            elif is_permanent_storage_failure(err):
+                # File/storage is permanently gone - safe to delete from DB even if storage deletion failed
+                await logger.awarning(
+                    "File %s not found in storage, also removing from database: %s",
+                    file_name,
+                    err,
+                )
+                storage_deleted = True
+            else:
+                # Transient failure (network, timeout, permissions) - keep in DB for retry
+                storage_failures.append(f"{file_name}: {err}")
+                await logger.awarning(
+                    "Failed to delete file %s from storage (transient error, keeping in database for retry): %s",
+                    file_name,
+                    err,
+                )
 
             # Only delete from database if storage deletion succeeded OR it was a permanent failure
             if storage_deleted:
@@ -7,6 +7,7 @@ from lfx.events.event_manager import (
     PartialEventCallback,
     create_default_event_manager,
     create_stream_tokens_event_manager,
+    get_coalescing_options,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "PartialEventCallback",
     "create_default_event_manager",
     "create_stream_tokens_event_manager",
+    "get_coalescing_options",
 ]
@@ -3,3 +3,6 @@ STARTER_FOLDER_DESCRIPTION = "Starter projects to help you get started in Langfl
 
 ASSISTANT_FOLDER_NAME = "Langflow Assistant"
 ASSISTANT_FOLDER_DESCRIPTION = "Pre-built flows from Langflow Assistant to enhance your workflow."
+
+# Fingerprints of the starter projects as last updated, kept in the config directory
+STARTER_PROJECT_FINGERPRINTS_FILE_NAME = "starter_project_fingerprints.json"
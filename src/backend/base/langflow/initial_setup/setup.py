@@ -1,9 +1,11 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import re
 import shutil
+import time
 import zipfile
 from collections import defaultdict
 from copy import deepcopy
@@ -39,6 +41,7 @@ from langflow.initial_setup.constants import (
     ASSISTANT_FOLDER_NAME,
     STARTER_FOLDER_DESCRIPTION,
     STARTER_FOLDER_NAME,
+    STARTER_PROJECT_FINGERPRINTS_FILE_NAME,
 )
 from langflow.services.auth.utils import create_super_user
 from langflow.services.database.models.flow.model import Flow, FlowCreate
@@ -49,14 +52,15 @@ from langflow.services.database.models.folder.constants import (
 )
 from langflow.services.database.models.folder.model import Folder, FolderCreate, FolderRead
 from langflow.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
+from langflow.utils.version import get_version_info
 
 # In the folder ./starter_projects we have a few JSON files that represent
 # starter projects. We want to load these into the database so that users
 # can use them as a starting point for their own projects.
 
 
-def update_projects_components_with_latest_component_versions(project_data, all_types_dict):
-    # Flatten the all_types_dict for easy access
+def flatten_all_types_dict(all_types_dict: dict) -> dict:
+    """Return the components of ``all_types_dict`` by type, across categories."""
     all_types_dict_flat = {}
     for category in all_types_dict.values():
         for key, component in category.items():
@@ -66,6 +70,12 @@ def update_projects_components_with_latest_component_versions(project_data, all_
             if "metadata" in component and "hash_history" in component["metadata"]:
                 del component["metadata"]["hash_history"]
             all_types_dict_flat[key] = component
+    return all_types_dict_flat
+
+
+def update_projects_components_with_latest_component_versions(project_data, all_types_dict):
+    # Flatten the all_types_dict for easy access
+    all_types_dict_flat = flatten_all_types_dict(all_types_dict)
 
     node_changes_log = defaultdict(list)
     project_data_copy = deepcopy(project_data)
@@ -1077,6 +1087,175 @@ async def find_existing_flow(session, flow_id, flow_endpoint_name):
     return None
 
 
+async def update_and_create_starter_project(
+    session: AsyncSession, project_path: anyio.Path, project: dict, all_types_dict: dict, folder_id: UUID
+) -> dict:
+    """Update a starter project with the latest component versions and add it to the starter folder.
+
+    The project file is rewritten if the update changed it.
+
+    Returns:
+        The updated project.
+    """
+    (
+        project_name,
+        project_description,
+        project_is_component,
+        updated_at_datetime,
+        project_data,
+        project_icon,
+        project_icon_bg_color,
+        project_gradient,
+        project_tags,
+    ) = get_project_data(project)
+    updated_project_data = update_projects_components_with_latest_component_versions(
+        project_data.copy(), all_types_dict
+    )
+    updated_project_data = update_edges_with_latest_component_versions(updated_project_data)
+    if updated_project_data != project_data:
+        project_data = updated_project_data
+        await update_project_file(project_path, project, updated_project_data)
+
+    try:
+        # Create the updated starter project
+        create_new_project(
+            session=session,
+            project_name=project_name,
+            project_description=project_description,
+            project_is_component=project_is_component,
+            updated_at_datetime=updated_at_datetime,
+            project_data=project_data,
+            project_icon=project_icon,
+            project_icon_bg_color=project_icon_bg_color,
+            project_gradient=project_gradient,
+            project_tags=project_tags,
+            new_folder_id=folder_id,
+        )
+    except Exception:  # noqa: BLE001
+        await logger.aexception(f"Error while creating starter project {project_name}")
+    return project
+
+
+def starter_project_fingerprint(project: dict, all_types_dict_flat: dict, component_hashes: dict[str, str]) -> str:
+    """Return a hash of a starter project and of the current version of each component it uses.
+
+    Updating a starter project only depends on these and on the code of Langflow, so a project with
+    the same fingerprint as when it was last updated would be updated to the same flow again.
+
+    Args:
+        project: The starter project, as read from its file.
+        all_types_dict_flat: The components by type, as returned by ``flatten_all_types_dict``.
+        component_hashes: Hashes of the components already hashed for other projects, by type.
+    """
+    digest = hashlib.sha256(get_version_info()["version"].encode())
+    digest.update(orjson.dumps(project, option=orjson.OPT_SORT_KEYS))
+    nodes = (project.get("data") or {}).get("nodes", [])
+    for node_type in sorted({node.get("data", {}).get("type") or "" for node in nodes}):
+        if node_type not in component_hashes:
+            component = all_types_dict_flat.get(node_type)
+            component_hashes[node_type] = (
+                hashlib.sha256(
+                    orjson.dumps(component, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+                ).hexdigest()
+                if component is not None
+                else "-"
+            )
+        digest.update(f"\0{node_type}\0{component_hashes[node_type]}".encode())
+    return digest.hexdigest()
+
+
+def _starter_project_fingerprints_path() -> anyio.Path | None:
+    config_dir = get_settings_service().settings.config_dir
+    return anyio.Path(config_dir) / STARTER_PROJECT_FINGERPRINTS_FILE_NAME if config_dir else None
+
+
+async def _read_starter_project_fingerprints(path: anyio.Path | None) -> dict:
+    if path is None or not await path.exists():
+        return {}
+    try:
+        return orjson.loads(await path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        await logger.awarning(f"Ignoring unreadable starter project fingerprints in {path}")
+        return {}
+
+
+async def _save_starter_project_fingerprints(fingerprints: dict) -> None:
+    path = _starter_project_fingerprints_path()
+    if path is None:
+        return
+    try:
+        await path.write_bytes(orjson.dumps(fingerprints))
+    except OSError:
+        await logger.awarning(f"Could not save starter project fingerprints to {path}")
+
+
+async def reconcile_starter_projects(
+    session: AsyncSession, folder_id: UUID, starter_projects: list[tuple[anyio.Path, dict]], all_types_dict: dict
+) -> dict:
+    """Bring the starter folder in line with the starter projects, only updating those that changed.
+
+    Each project is fingerprinted together with the versions of its components and the fingerprints are
+    kept in the config directory. A project whose fingerprint matches the one recorded when it was last
+    updated, and that is still in the starter folder, is left alone. The others are updated and replace
+    their previous version, and flows of projects that no longer exist are removed.
+
+    Returns:
+        The fingerprints to record. They must only be saved once the session is committed, otherwise a
+        failed commit would leave the old flows recorded as up to date.
+    """
+    start = time.perf_counter()
+    recorded = await _read_starter_project_fingerprints(_starter_project_fingerprints_path())
+    recorded_projects: dict[str, list[str]] = recorded.get("projects", {})
+
+    stmt = select(Flow.id, Flow.name).where(Flow.folder_id == folder_id)
+    existing: dict[str, list[UUID]] = defaultdict(list)
+    for flow_id, name in (await session.exec(stmt)).all():
+        existing[name].append(flow_id)
+
+    all_types_dict_flat = flatten_all_types_dict(all_types_dict)
+    component_hashes: dict[str, str] = {}
+    fingerprints: dict[str, list[str]] = {}
+    unchanged = 0
+    update_seconds = 0.0
+    for project_path, project in starter_projects:
+        project_name = project.get("name")
+        fingerprint = starter_project_fingerprint(project, all_types_dict_flat, component_hashes)
+        if fingerprint in recorded_projects.get(project_name, []) and len(existing.get(project_name, [])) == 1:
+            fingerprints[project_name] = recorded_projects[project_name]
+            unchanged += 1
+            continue
+
+        update_start = time.perf_counter()
+        for flow_id in existing.get(project_name, []):
+            if flow := await session.get(Flow, flow_id):
+                await session.delete(flow)
+        updated_project = await update_and_create_starter_project(
+            session, project_path, project, all_types_dict, folder_id
+        )
+        # The file now holds the updated project, unless it could not be rewritten, so accept both
+        fingerprints[project_name] = sorted(
+            {fingerprint, starter_project_fingerprint(updated_project, all_types_dict_flat, component_hashes)}
+        )
+        update_seconds += time.perf_counter() - update_start
+
+    removed = 0
+    for name, flow_ids in existing.items():
+        if name not in fingerprints:
+            for flow_id in flow_ids:
+                if flow := await session.get(Flow, flow_id):
+                    await session.delete(flow)
+                    removed += 1
+    await session.flush()
+
+    updated = len(fingerprints) - unchanged
+    seconds_per_project = update_seconds / updated if updated else recorded.get("seconds_per_project", 0.0)
+    await logger.ainfo(
+        f"Reconciled starter projects in {time.perf_counter() - start:.2f}s: {updated} updated, {unchanged} unchanged, "
+        f"{removed} removed, about {unchanged * seconds_per_project:.2f}s saved by skipping unchanged projects"
+    )
+    return {"projects": fingerprints, "seconds_per_project": seconds_per_project}
+
+
 async def create_or_update_starter_projects(all_types_dict: dict) -> None:
     """Create or update starter projects.
 
@@ -1089,6 +1268,16 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
         # this is intended to be used to skip all startup project logic.
         return
 
+    settings = get_settings_service().settings
+    if settings.update_starter_projects and settings.reconcile_starter_projects:
+        async with session_scope() as session:
+            new_folder = await get_or_create_starter_folder(session)
+            starter_projects = await load_starter_projects()
+            fingerprints = await reconcile_starter_projects(session, new_folder.id, starter_projects, all_types_dict)
+        # Only record the projects as up to date once their flows are committed
+        await _save_starter_project_fingerprints(fingerprints)
+        return
+
     async with session_scope() as session:
         new_folder = await get_or_create_starter_folder(session)
         starter_projects = await load_starter_projects()
@@ -1103,43 +1292,7 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
 
             # 2. Update all starter projects with the latest component versions (this modifies the actual file data)
             for project_path, project in starter_projects:
-                (
-                    project_name,
-                    project_description,
-                    project_is_component,
-                    updated_at_datetime,
-                    project_data,
-                    project_icon,
-                    project_icon_bg_color,
-                    project_gradient,
-                    project_tags,
-                ) = get_project_data(project)
-                updated_project_data = update_projects_components_with_latest_component_versions(
-                    project_data.copy(), all_types_dict
-                )
-                updated_project_data = update_edges_with_latest_component_versions(updated_project_data)
-                if updated_project_data != project_data:
-                    project_data = updated_project_data
-                    await update_project_file(project_path, project, updated_project_data)
-
-                try:
-                    # Create the updated starter project
-                    create_new_project(
-                        session=session,
-                        project_name=project_name,
-                        project_description=project_description,
-                        project_is_component=project_is_component,
-                        updated_at_datetime=updated_at_datetime,
-                        project_data=project_data,
-                        project_icon=project_icon,
-                        project_icon_bg_color=project_icon_bg_color,
-                        project_gradient=project_gradient,
-                        project_tags=project_tags,
-                        new_folder_id=new_folder.id,
-                    )
-                except Exception:  # noqa: BLE001
-                    await logger.aexception(f"Error while creating starter project {project_name}")
-
+                await update_and_create_starter_project(session, project_path, project, all_types_dict, new_folder.id)
                 successfully_updated_projects += 1
             await logger.adebug(f"Successfully updated {successfully_updated_projects} starter projects")
         else:
@@ -1276,46 +1429,148 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
     return FolderRead.model_validate(folder_obj, from_attributes=True)
 
 
+# Changes to flow files are collected until none arrive for FS_FLOWS_WATCH_STEP_MS, for at most
+# FS_FLOWS_WATCH_DEBOUNCE_MS, so a burst of writes to a file syncs it once
+FS_FLOWS_WATCH_DEBOUNCE_MS = 1_600
+FS_FLOWS_WATCH_STEP_MS = 50
+# The watcher wakes up at least this often, or every polling interval if shorter, to pick up new
+# flows and to notice cancellation
+FS_FLOWS_WATCH_TICK_MS = 1_000
+
+
+def _fs_flow_file_path(fs_path: str, user_id: UUID | None, data_dir: anyio.Path) -> str:
+    # Relative paths are in the user's flows directory, absolute ones are used as-is
+    if Path(fs_path).is_absolute():
+        return fs_path
+    return str(Path(data_dir) / "flows" / str(user_id) / fs_path)
+
+
+async def _load_fs_flow_paths(data_dir: anyio.Path) -> dict[str, UUID]:
+    """Return the IDs of the flows stored on the file system, by file path."""
+    async with session_scope() as session:
+        stmt = select(Flow.id, Flow.fs_path, Flow.user_id).where(col(Flow.fs_path).is_not(None))
+        rows = (await session.exec(stmt)).all()
+    return {_fs_flow_file_path(fs_path, user_id, data_dir): flow_id for flow_id, fs_path, user_id in rows}
+
+
+def _changed_flow_files(paths: list[str], signatures: dict[str, tuple[int, int]]) -> dict[str, tuple[int, int]]:
+    """Return the modification time and size of the files that changed since they were last synced."""
+    changed = {}
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            continue
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != signatures.get(path):
+            changed[path] = signature
+    return changed
+
+
+async def _sync_flow_files(
+    paths: list[str], flow_paths: dict[str, UUID], signatures: dict[str, tuple[int, int]]
+) -> None:
+    """Update the flows whose files among ``paths`` changed since they were last synced."""
+    changed = await asyncio.to_thread(_changed_flow_files, paths, signatures)
+    if not changed:
+        return
+    async with session_scope() as session:
+        for path, signature in changed.items():
+            try:
+                update_data = orjson.loads(await anyio.Path(path).read_text(encoding="utf-8"))
+                flow = await session.get(Flow, flow_paths[path])
+                if flow is None:
+                    continue
+                try:
+                    for field_name in ("name", "description", "data", "locked"):
+                        if new_value := update_data.get(field_name):
+                            setattr(flow, field_name, new_value)
+                    if folder_id := update_data.get("folder_id"):
+                        flow.folder_id = UUID(folder_id)
+                    flow.updated_at = datetime.now(timezone.utc)
+                    await session.flush()
+                except Exception:  # noqa: BLE001
+                    await logger.aexception(f"Couldn't update flow {flow.id} in database from path {path}")
+                signatures[path] = signature
+            except Exception:  # noqa: BLE001
+                await logger.aexception(f"Error while handling flow file {path}")
+
+
+def _watched_directories(flow_paths: dict[str, UUID]) -> set[str]:
+    return {directory for directory in {str(Path(path).parent) for path in flow_paths} if Path(directory).is_dir()}
+
+
+async def _watch_flow_files(
+    awatch, data_dir: anyio.Path, flow_paths: dict[str, UUID], signatures: dict[str, tuple[int, int]], interval: float
+) -> None:
+    """Sync flow files as they change, until the directories holding them change.
+
+    The flows stored on the file system are reloaded every ``interval`` seconds, reading only their IDs
+    and paths, and the files of new flows are synced right away.
+    """
+    directories = _watched_directories(flow_paths)
+    last_refresh = time.monotonic()
+    watching = False
+    async for changes in awatch(
+        *directories,
+        watch_filter=lambda _change, path: path in flow_paths,
+        debounce=FS_FLOWS_WATCH_DEBOUNCE_MS,
+        step=FS_FLOWS_WATCH_STEP_MS,
+        rust_timeout=min(FS_FLOWS_WATCH_TICK_MS, max(int(interval * 1000), FS_FLOWS_WATCH_STEP_MS)),
+        yield_on_timeout=True,
+        recursive=False,
+    ):
+        if not watching:
+            # Files written before the watcher started are not reported, so check them all once
+            watching = True
+            await _sync_flow_files(list(flow_paths), flow_paths, signatures)
+        elif changes:
+            await _sync_flow_files(list({path for _, path in changes}), flow_paths, signatures)
+        if time.monotonic() - last_refresh < interval:
+            continue
+        last_refresh = time.monotonic()
+        new_flow_paths = await _load_fs_flow_paths(data_dir)
+        new_paths = [path for path in new_flow_paths if path not in flow_paths]
+        for path in set(flow_paths) - set(new_flow_paths):
+            signatures.pop(path, None)
+        flow_paths.clear()
+        flow_paths.update(new_flow_paths)
+        await _sync_flow_files(new_paths, flow_paths, signatures)
+        if _watched_directories(flow_paths) != directories:
+            return
+
+
 async def sync_flows_from_fs():
-    flow_mtimes = {}
+    """Keep flows that are stored on the file system in sync with their files.
+
+    Changes are picked up from file system notifications when ``watchfiles`` is installed, and by
+    checking every file each ``fs_flows_polling_interval`` otherwise. Either way, only the IDs and paths
+    of the flows are read from the database, and a flow is only loaded when its file changed.
+    """
     fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
-    storage_service = get_storage_service()
+    data_dir = get_storage_service().data_dir
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        awatch = None
+    signatures: dict[str, tuple[int, int]] = {}
     try:
         while True:
             try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        # Resolve path: if relative, construct full path using user's flows directory
-                        fs_path_str = flow.fs_path
-                        if not Path(fs_path_str).is_absolute():
-                            # Relative path - construct full path
-                            path = storage_service.data_dir / "flows" / str(flow.user_id) / fs_path_str
-                        else:
-                            # Absolute path - use as-is
-                            path = anyio.Path(fs_path_str)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.flush()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        await logger.aexception(
-                                            f"Couldn't update flow {flow.id} in database from path {path}"
-                                        )
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            await logger.aexception(f"Error while handling flow file {path}")
+                flow_paths = await _load_fs_flow_paths(data_dir)
+                for path in set(signatures) - set(flow_paths):
+                    del signatures[path]
+                await _sync_flow_files(list(flow_paths), flow_paths, signatures)
+                if awatch is not None and _watched_directories(flow_paths):
+                    try:
+                        await _watch_flow_files(awatch, data_dir, flow_paths, signatures, fs_flows_polling_interval)
+                        continue
+                    except FileNotFoundError:
+                        # A watched directory was removed, watch the current ones
+                        continue
+                    except (OSError, RuntimeError):
+                        await logger.awarning("Watching flow files failed, polling them instead", exc_info=True)
+                        awatch = None
             except asyncio.CancelledError:
                 await logger.adebug("Flow sync cancelled")
                 break
@@ -21,6 +21,7 @@ from fastapi_pagination import add_pagination
 from filelock import FileLock
 from lfx.interface.utils import setup_llm_caching
 from lfx.log.logger import configure, logger
+from lfx.utils.async_helpers import stop_background_loop
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from pydantic import PydanticDeprecatedSince20
 from pydantic_core import PydanticSerializationError
@@ -37,7 +38,9 @@ from langflow.initial_setup.setup import (
     sync_flows_from_fs,
 )
 from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.services.database.models.api_key.cache import get_api_key_usage_tracker
 from langflow.services.deps import (
+    get_buffered_writer_service,
     get_queue_service,
     get_service,
     get_settings_service,
@@ -376,10 +379,22 @@ def get_lifespan(*, fix_migration=False, version=None):
 
                 # Step 2: Cleaning Up Services
                 with shutdown_progress.step(2):
+                    # Flush buffered transaction and vertex build logs while the database is still available
+                    if get_settings_service().settings.buffered_log_writer_enabled:
+                        try:
+                            await asyncio.wait_for(get_buffered_writer_service().stop(), timeout=10)
+                        except asyncio.TimeoutError:
+                            await logger.awarning("Flushing buffered logs timed out after 10s.")
+                    try:
+                        await asyncio.wait_for(get_api_key_usage_tracker().stop(), timeout=10)
+                    except asyncio.TimeoutError:
+                        await logger.awarning("Writing API key usage timed out after 10s.")
                     try:
                         await asyncio.wait_for(teardown_services(), timeout=30)
                     except asyncio.TimeoutError:
                         await logger.awarning("Teardown services timed out after 30s.")
+                    # Services close the clients they opened on the background loop during teardown
+                    await asyncio.to_thread(stop_background_loop, 10)
 
                 # Step 3: Clearing Temporary Files
                 with shutdown_progress.step(3):
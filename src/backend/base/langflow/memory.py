@@ -12,6 +12,7 @@ from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.message.model import MessageRead, MessageTable
 from langflow.services.deps import session_scope
 
@@ -111,6 +112,18 @@ async def aget_messages(
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    chat_history = get_chat_history_buffer()
+    if chat_history.enabled and session_id and order_by == "timestamp" and not (sender or sender_name or flow_id):
+
+        async def load_newest(count: int) -> list[dict]:
+            async with session_scope() as session:
+                stmt = _get_variable_query(session_id=session_id, context_id=context_id, limit=count)
+                return [d.model_dump() for d in await session.exec(stmt)]
+
+        buffered = await chat_history.get_messages(str(session_id), context_id, order, limit, load_newest)
+        if buffered is not None:
+            return [await Message.create(**d) for d in buffered]
+
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, context_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
@@ -145,6 +158,7 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
             messages_models = await aadd_messagetables(messages_models, session)
+        await get_chat_history_buffer().add(message.model_dump() for message in messages_models)
         return [await Message.create(**message.model_dump()) for message in messages_models]
     except Exception as e:
         await logger.aexception(e)
@@ -155,11 +169,13 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
 
+    previous_keys: dict[UUID, tuple[str, str | None]] = {}
     async with session_scope() as session:
         updated_messages: list[MessageTable] = []
         for message in messages:
             msg = await session.get(MessageTable, message.id)
             if msg:
+                previous_keys[msg.id] = (msg.session_id, msg.context_id or None)
                 msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
                 # Convert flow_id to UUID if it's a string preventing error when saving to database
                 if msg.flow_id and isinstance(msg.flow_id, str):
@@ -173,7 +189,9 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
                 await logger.awarning(error_message)
                 raise ValueError(error_message)
 
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        updated = [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+    await get_chat_history_buffer().update((message.model_dump() for message in updated), previous_keys)
+    return updated
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession, retry_count: int = 0):
@@ -262,6 +280,11 @@ async def adelete_messages(session_id: str | None = None, context_id: str | None
             .execution_options(synchronize_session="fetch")
         )
         await session.exec(stmt)
+    if context_id:
+        # Contexts are not scoped to a session
+        await get_chat_history_buffer().invalidate_all()
+    else:
+        await get_chat_history_buffer().invalidate(session_id)
 
 
 async def delete_message(id_: str) -> None:
@@ -274,6 +297,8 @@ async def delete_message(id_: str) -> None:
         message = await session.get(MessageTable, id_)
         if message:
             await session.delete(message)
+    if message:
+        await get_chat_history_buffer().invalidate(message.session_id)
 
 
 def store_message(
@@ -0,0 +1,149 @@
+"""Cache of prepared graphs used by the run endpoints.
+
+Parsing a flow into a Graph (group flattening, cycle detection, vertex
+parameters, layer sorting) is the same work for every request against an
+unchanged flow. ``PreparedGraphCache`` keeps a ``PreparedGraph`` per
+(flow id, flow ``updated_at``, tweak fingerprint) so each request only builds
+a lightweight per-run instance from it.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.prepared import PreparedGraph
+
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from langflow.schema.graph import Tweaks
+    from langflow.services.database.models.flow.model import Flow
+
+DEFAULT_MAX_SIZE = 128
+
+
+def fingerprint_tweaks(tweaks: Tweaks | dict[str, Any] | None, *, stream: bool) -> str:
+    """Return a stable hash of the tweaks (and stream flag) applied to a flow."""
+    if tweaks is not None and not isinstance(tweaks, dict):
+        tweaks = tweaks.model_dump()
+    payload = orjson.dumps({"tweaks": tweaks or {}, "stream": stream}, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class PreparedGraphCache:
+    """A thread-safe LRU cache of ``PreparedGraph`` objects.
+
+    Attributes:
+        max_size (int): Maximum number of prepared graphs to keep. A value of 0 disables caching.
+        hits (int): Number of requests served from a prepared graph.
+        misses (int): Number of requests that had to parse the flow.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cache: OrderedDict[tuple, PreparedGraph] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def make_key(flow: Flow, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool) -> tuple:
+        updated_at = flow.updated_at.isoformat() if flow.updated_at else None
+        return (str(flow.id), updated_at, fingerprint_tweaks(tweaks, stream=stream))
+
+    def get_prepared_graph(self, flow: Flow, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool) -> PreparedGraph:
+        """Return the prepared graph for ``flow`` with ``tweaks`` applied, building it on a miss."""
+        key = self.make_key(flow, tweaks, stream=stream)
+        with self._lock:
+            prepared = self._cache.get(key)
+            if prepared is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return prepared
+            self.misses += 1
+
+        prepared = build_prepared_graph(flow, tweaks, stream=stream)
+        if self.max_size > 0:
+            with self._lock:
+                # A newer version of the flow supersedes every cached entry for older versions
+                for stale_key in [k for k in self._cache if k[0] == key[0] and k[1] != key[1]]:
+                    del self._cache[stale_key]
+                self._cache[key] = prepared
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+        return prepared
+
+    def invalidate_flow(self, flow_id: str) -> None:
+        """Drop all prepared graphs for ``flow_id``."""
+        flow_id = str(flow_id)
+        with self._lock:
+            for key in [k for k in self._cache if k[0] == flow_id]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+def build_prepared_graph(flow: Flow, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool) -> PreparedGraph:
+    if flow.data is None:
+        msg = f"Flow {flow.id} has no data"
+        raise ValueError(msg)
+    graph_data = process_tweaks(copy.deepcopy(flow.data), tweaks or {}, stream=stream)
+    return PreparedGraph(graph_data, flow_id=str(flow.id), flow_name=flow.name)
+
+
+_prepared_graph_cache: PreparedGraphCache | None = None
+_prepared_graph_cache_lock = threading.Lock()
+
+
+def get_prepared_graph_cache() -> PreparedGraphCache:
+    """Return the process-wide prepared graph cache, creating it on first use."""
+    global _prepared_graph_cache  # noqa: PLW0603
+    if _prepared_graph_cache is None:
+        with _prepared_graph_cache_lock:
+            if _prepared_graph_cache is None:
+                max_size = get_settings_service().settings.prepared_graph_cache_size
+                _prepared_graph_cache = PreparedGraphCache(max_size=max_size)
+    return _prepared_graph_cache
+
+
+def graph_from_flow(
+    flow: Flow,
+    tweaks: Tweaks | dict[str, Any] | None,
+    *,
+    stream: bool = False,
+    user_id: str | None = None,
+    context: dict | None = None,
+) -> Graph:
+    """Return a fresh per-run Graph for ``flow`` built from its cached prepared graph.
+
+    When the cache is disabled (``prepared_graph_cache_size`` set to 0) the flow is parsed directly.
+    """
+    cache = get_prepared_graph_cache()
+    if cache.max_size <= 0:
+        if flow.data is None:
+            msg = f"Flow {flow.id} has no data"
+            raise ValueError(msg)
+        graph_data = process_tweaks(flow.data.copy(), tweaks or {}, stream=stream)
+        return Graph.from_payload(
+            graph_data, flow_id=str(flow.id), user_id=user_id, flow_name=flow.name, context=context
+        )
+    prepared = cache.get_prepared_graph(flow, tweaks, stream=stream)
+    return prepared.instantiate(user_id=user_id, context=context)
@@ -0,0 +1,6 @@
+"""Buffered writer service module for langflow."""
+
+from langflow.services.buffered_writer.factory import BufferedWriterServiceFactory
+from langflow.services.buffered_writer.service import BufferedWriterService
+
+__all__ = ["BufferedWriterService", "BufferedWriterServiceFactory"]
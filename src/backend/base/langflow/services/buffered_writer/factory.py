@@ -0,0 +1,29 @@
+"""Buffered writer service factory for langflow."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.buffered_writer.service import BufferedWriterService
+from langflow.services.factory import ServiceFactory
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class BufferedWriterServiceFactory(ServiceFactory):
+    """Factory for creating BufferedWriterService instances."""
+
+    def __init__(self):
+        super().__init__(BufferedWriterService)
+
+    def create(self, settings_service: SettingsService):
+        """Create a new BufferedWriterService instance.
+
+        Args:
+            settings_service: The settings service holding the buffer and retention settings.
+
+        Returns:
+            A new BufferedWriterService instance.
+        """
+        return BufferedWriterService(settings_service)
@@ -0,0 +1,241 @@
+"""Write-behind buffer for transaction and vertex build logs."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+from lfx.services.deps import session_scope
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transactions, trim_transactions_for_flow
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_builds,
+    trim_vertex_builds_for_vertex,
+    trim_vertex_builds_globally,
+)
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.settings.service import SettingsService
+
+
+class BufferedWriterService(Service):
+    """Buffers transaction and vertex build records and writes them to the database in batches.
+
+    Logging a transaction or a vertex build used to open a session, insert one row, run the
+    retention deletes and commit, once per component execution. This service instead appends
+    records to an in-memory buffer that a background task flushes with multi-row inserts,
+    either when ``batch_size`` records are pending or every ``flush_interval`` seconds.
+    Retention limits are enforced by a separate periodic sweep that only visits the flows and
+    vertices written since the previous sweep.
+
+    When the buffer holds ``max_buffer_size`` records, writers wait for a flush. If the flush
+    fails the records are kept for the next attempt, and the oldest ones are dropped once the
+    buffer would grow past ``max_buffer_size``.
+
+    Attributes:
+        name (str): Unique identifier for the service.
+        flushed_transactions (int): Number of transactions written to the database.
+        flushed_vertex_builds (int): Number of vertex builds written to the database.
+        flush_count (int): Number of successful flushes.
+        failed_flushes (int): Number of flushes that raised an error.
+        dropped (int): Number of records dropped because the buffer was full.
+        max_queue_depth (int): Highest number of pending records observed.
+    """
+
+    name = "buffered_writer_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.batch_size = max(1, settings.buffered_log_writer_batch_size)
+        self.flush_interval = settings.buffered_log_writer_flush_interval
+        self.max_buffer_size = max(self.batch_size, settings.buffered_log_writer_max_buffer_size)
+        self.retention_interval = settings.buffered_log_writer_retention_interval
+
+        self._transactions: list[TransactionTable] = []
+        self._vertex_builds: list[VertexBuildTable] = []
+        self._dirty_flows: set[UUID] = set()
+        self._dirty_vertices: set[tuple[UUID, str]] = set()
+        self._flush_lock = asyncio.Lock()
+        self._flush_event = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._sweep_task: asyncio.Task | None = None
+        self._closed = False
+
+        self.flushed_transactions = 0
+        self.flushed_vertex_builds = 0
+        self.flush_count = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+
+    def is_enabled(self) -> bool:
+        """Check if buffered writing is enabled in the settings."""
+        return getattr(self.settings_service.settings, "buffered_log_writer_enabled", False)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of records waiting to be flushed."""
+        return len(self._transactions) + len(self._vertex_builds)
+
+    def is_started(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def start(self) -> None:
+        """Start the background flush and retention sweep tasks."""
+        self._closed = False
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._sweep_task = asyncio.create_task(self._sweep_loop())
+        logger.debug("BufferedWriterService started")
+
+    async def add_transaction(self, transaction: TransactionBase) -> None:
+        """Queue a transaction to be written with the next batch."""
+        if not transaction.flow_id:
+            await logger.adebug("Transaction flow_id is None")
+            return
+        self._transactions.append(TransactionTable(**transaction.model_dump()))
+        await self._on_record_added()
+
+    async def add_vertex_build(self, vertex_build: VertexBuildBase) -> None:
+        """Queue a vertex build to be written with the next batch."""
+        self._vertex_builds.append(VertexBuildTable(**vertex_build.model_dump()))
+        await self._on_record_added()
+
+    async def _on_record_added(self) -> None:
+        if not self._closed and not self.is_started():
+            self.start()
+        depth = self.queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        if depth >= self.max_buffer_size or self._closed:
+            # Backpressure: the writer waits for the buffer to drain instead of growing it further
+            await self.flush()
+        elif depth >= self.batch_size:
+            self._flush_event.set()
+
+    async def flush(self) -> int:
+        """Write all buffered records to the database in a single transaction.
+
+        Returns:
+            int: The number of records written.
+        """
+        async with self._flush_lock:
+            transactions, self._transactions = self._transactions, []
+            vertex_builds, self._vertex_builds = self._vertex_builds, []
+            if not transactions and not vertex_builds:
+                return 0
+
+            # Read the keys before committing, the records are expired afterwards
+            flows = {transaction.flow_id for transaction in transactions}
+            vertices = {(vertex_build.flow_id, vertex_build.id) for vertex_build in vertex_builds}
+            try:
+                async with session_scope() as session:
+                    if transactions:
+                        await log_transactions(session, transactions)
+                    if vertex_builds:
+                        await log_vertex_builds(session, vertex_builds)
+            except Exception as exc:  # noqa: BLE001
+                self.failed_flushes += 1
+                self._requeue(transactions, vertex_builds)
+                await logger.awarning(f"Error flushing buffered logs: {exc!s}")
+                return 0
+
+            self._dirty_flows.update(flows)
+            self._dirty_vertices.update(vertices)
+            self.flushed_transactions += len(transactions)
+            self.flushed_vertex_builds += len(vertex_builds)
+            self.flush_count += 1
+            return len(transactions) + len(vertex_builds)
+
+    def _requeue(self, transactions: list[TransactionTable], vertex_builds: list[VertexBuildTable]) -> None:
+        """Put records from a failed flush back in front of the buffer, dropping the oldest if it is full."""
+        self._transactions = transactions + self._transactions
+        self._vertex_builds = vertex_builds + self._vertex_builds
+        overflow = self.queue_depth - self.max_buffer_size
+        if overflow <= 0:
+            return
+        # Drop from the larger buffer first so one kind of record cannot starve the other
+        while overflow > 0:
+            buffer = self._transactions if len(self._transactions) >= len(self._vertex_builds) else self._vertex_builds
+            del buffer[0]
+            overflow -= 1
+            self.dropped += 1
+
+    async def sweep(self) -> None:
+        """Enforce the retention limits for the flows and vertices written since the last sweep."""
+        flows, self._dirty_flows = self._dirty_flows, set()
+        vertices, self._dirty_vertices = self._dirty_vertices, set()
+        if not flows and not vertices:
+            return
+
+        settings = self.settings_service.settings
+        try:
+            async with session_scope() as session:
+                for flow_id in flows:
+                    await trim_transactions_for_flow(session, flow_id, settings.max_transactions_to_keep)
+                for flow_id, vertex_id in vertices:
+                    await trim_vertex_builds_for_vertex(
+                        session, flow_id, vertex_id, settings.max_vertex_builds_per_vertex
+                    )
+                if vertices:
+                    await trim_vertex_builds_globally(session, settings.max_vertex_builds_to_keep)
+        except Exception as exc:  # noqa: BLE001
+            # Retry the same flows and vertices on the next sweep
+            self._dirty_flows.update(flows)
+            self._dirty_vertices.update(vertices)
+            await logger.awarning(f"Error trimming buffered logs: {exc!s}")
+
+    async def _flush_loop(self) -> None:
+        while not self._closed:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            self._flush_event.clear()
+            await self.flush()
+
+    async def _sweep_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.retention_interval)
+            await self.sweep()
+
+    def stats(self) -> dict[str, int]:
+        """Return the queue depth and write counters."""
+        return {
+            "queue_depth": self.queue_depth,
+            "pending_transactions": len(self._transactions),
+            "pending_vertex_builds": len(self._vertex_builds),
+            "max_queue_depth": self.max_queue_depth,
+            "max_buffer_size": self.max_buffer_size,
+            "flushed_transactions": self.flushed_transactions,
+            "flushed_vertex_builds": self.flushed_vertex_builds,
+            "flush_count": self.flush_count,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+        }
+
+    async def stop(self) -> None:
+        """Stop the background tasks, then flush the remaining records and run a final sweep.
+
+        Must be called while the database service is still available. Records logged after
+        this call are written immediately.
+        """
+        self._closed = True
+        tasks = [task for task in (self._flush_task, self._sweep_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._flush_task = None
+        self._sweep_task = None
+
+        await self.flush()
+        await self.sweep()
+        await logger.adebug(f"BufferedWriterService stopped: {self.stats()}")
+
+    async def teardown(self) -> None:
+        await self.stop()
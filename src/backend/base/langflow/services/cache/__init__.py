@@ -1,4 +1,10 @@
-from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.service import (
+    AsyncInMemoryCache,
+    CacheService,
+    RedisCache,
+    ShardedAsyncInMemoryCache,
+    ThreadingInMemoryCache,
+)
 
 from . import factory, service
 
@@ -6,6 +12,7 @@ __all__ = [
     "AsyncInMemoryCache",
     "CacheService",
     "RedisCache",
+    "ShardedAsyncInMemoryCache",
     "ThreadingInMemoryCache",
     "factory",
     "service",
@@ -0,0 +1,301 @@
+"""Write-through buffer of the most recent messages of each chat session, kept in the cache service.
+
+Memory components read the last messages of a session on every run, which used to query the
+``message`` table each time. ``ChatHistoryBuffer`` keeps up to ``capacity`` of the newest
+messages of each (session_id, context_id) pair in the cache service, oldest first. A buffer is
+loaded from the database the first time it is read, and ``astore_message``, ``aadd_messages``,
+``aupdate_messages`` and ``adelete_messages`` update it after their changes are committed, so
+later reads of up to ``capacity`` messages are answered without a query.
+
+All buffers of a session are stored under one cache key, so deleting a session drops them at
+once. Changes that cannot be mapped to a session, such as deleting the messages of a flow,
+increase a generation number that makes every buffer stale.
+
+The buffers only see the writes of the process that holds them: they are meant for deployments
+that run a single worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import threading
+import weakref
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from lfx.services.cache.utils import CACHE_MISS
+
+from langflow.schema.validators import str_to_timestamp
+from langflow.services.cache.base import AsyncBaseCacheService
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from uuid import UUID
+
+DEFAULT_CAPACITY = 0
+LOCK_STRIPES = 64
+GENERATION_KEY = "chat_history:generation"
+
+
+def _session_key(session_id: str) -> str:
+    return f"chat_history:{session_id}"
+
+
+def _timestamp_key(message: dict[str, Any]) -> datetime:
+    # Dumped messages hold their timestamp as a "YYYY-MM-DD HH:MM:SS UTC" string
+    timestamp = str_to_timestamp(message["timestamp"])
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+class ChatHistoryBuffer:
+    """Keeps the newest messages of each chat session and context in the cache service.
+
+    Each context buffer holds message dicts sorted by timestamp and a ``complete`` flag, set when
+    it holds every message of its context. The buffer of the ``None`` context holds the messages
+    of all contexts of the session, as queries without a context ID return them. Error messages
+    are never buffered, like ``aget_messages`` never returns them.
+
+    Attributes:
+        capacity (int): Messages kept per session and context. 0 disables the buffers.
+        hits (int): Reads answered from a buffer.
+        misses (int): Reads that loaded a buffer from the database or fell back to it.
+        invalidations (int): Sessions dropped and generations started because of changes.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Locks can only be awaited on the event loop they were first used on
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list[asyncio.Lock]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._locks_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def _lock(self, session_id: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._locks_lock:
+            locks = self._locks.get(loop)
+            if locks is None:
+                locks = self._locks[loop] = [asyncio.Lock() for _ in range(LOCK_STRIPES)]
+        return locks[hash(session_id) % LOCK_STRIPES]
+
+    @staticmethod
+    def _cache():
+        from langflow.services.deps import get_cache_service
+
+        return get_cache_service()
+
+    async def _get(self, key: str) -> Any:
+        cache = self._cache()
+        if isinstance(cache, AsyncBaseCacheService):
+            return await cache.get(key)
+        return cache.get(key)
+
+    async def _set(self, key: str, value: Any) -> None:
+        cache = self._cache()
+        if isinstance(cache, AsyncBaseCacheService):
+            await cache.set(key, value)
+        else:
+            cache.set(key, value)
+
+    async def _delete(self, key: str) -> None:
+        cache = self._cache()
+        if isinstance(cache, AsyncBaseCacheService):
+            await cache.delete(key)
+        else:
+            cache.delete(key)
+
+    async def _generation(self) -> int:
+        generation = await self._get(GENERATION_KEY)
+        return 0 if generation is CACHE_MISS or generation is None else generation
+
+    async def _get_entry(self, session_id: str) -> dict[str, Any]:
+        """Return the buffers of a session, or an empty entry if they are missing or stale."""
+        generation = await self._generation()
+        entry = await self._get(_session_key(session_id))
+        if entry is CACHE_MISS or not isinstance(entry, dict) or entry.get("generation") != generation:
+            return {"generation": generation, "contexts": {}}
+        return entry
+
+    async def get_messages(
+        self,
+        session_id: str,
+        context_id: str | None,
+        order: str | None,
+        limit: int | None,
+        load: Callable[[int], Awaitable[list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]] | None:
+        """Return messages of a session and context ordered by timestamp, as ``aget_messages`` would.
+
+        Args:
+            session_id: The session ID of the messages.
+            context_id: The context ID of the messages, or None for all contexts of the session.
+            order: "DESC" for the newest messages first, anything else for the oldest first.
+            limit: The number of messages to return, or None for all of them.
+            load: Returns the newest messages of the session and context, up to the given number,
+                newest first. Used to fill a missing buffer.
+
+        Returns:
+            The messages, or None if the buffer cannot answer the read and the database must be queried.
+        """
+        if not self.enabled or (limit and limit > self.capacity):
+            return None
+        context_id = context_id or None
+        descending = order == "DESC"
+        async with self._lock(session_id):
+            entry = await self._get_entry(session_id)
+            buffer = entry["contexts"].get(context_id)
+            if buffer is not None and _answers(buffer, limit, descending=descending):
+                self.hits += 1
+            else:
+                self.misses += 1
+                # Reload missing buffers and buffers that updates left with fewer messages than they can hold
+                if buffer is not None and len(buffer["messages"]) >= self.capacity:
+                    return None
+                messages = (await load(self.capacity))[::-1]
+                buffer = {"messages": messages, "complete": len(messages) < self.capacity}
+                entry = {"generation": entry["generation"], "contexts": {**entry["contexts"], context_id: buffer}}
+                await self._set(_session_key(session_id), entry)
+                if not _answers(buffer, limit, descending=descending):
+                    return None
+        messages = buffer["messages"]
+        if limit:
+            messages = messages[-limit:] if descending else messages[:limit]
+        return messages[::-1] if descending else list(messages)
+
+    async def add(self, messages: Iterable[dict[str, Any]]) -> None:
+        """Add stored messages to the buffers of their session, if the session has any."""
+        if not self.enabled:
+            return
+        for session_id, session_messages in _group_by_session(messages).items():
+            async with self._lock(session_id):
+                entry = await self._get_entry(session_id)
+                if not entry["contexts"]:
+                    continue
+                contexts = dict(entry["contexts"])
+                for message in session_messages:
+                    self._insert(contexts, message)
+                await self._set(_session_key(session_id), {"generation": entry["generation"], "contexts": contexts})
+
+    async def update(
+        self, messages: Iterable[dict[str, Any]], previous_keys: dict[UUID, tuple[str, str | None]]
+    ) -> None:
+        """Replace updated messages in the buffers of their session.
+
+        Args:
+            messages: The messages after the update.
+            previous_keys: The session ID and context ID of each message before the update, by ID.
+        """
+        if not self.enabled:
+            return
+        moved_sessions: set[str] = set()
+        updated: list[dict[str, Any]] = []
+        for message in messages:
+            previous_key = previous_keys.get(message["id"])
+            if previous_key is not None and previous_key != (message["session_id"], message["context_id"] or None):
+                moved_sessions.update((previous_key[0], message["session_id"]))
+            else:
+                updated.append(message)
+        for session_id in moved_sessions:
+            await self.invalidate(session_id)
+        for session_id, session_messages in _group_by_session(updated).items():
+            if session_id in moved_sessions:
+                continue
+            async with self._lock(session_id):
+                entry = await self._get_entry(session_id)
+                if not entry["contexts"]:
+                    continue
+                contexts = dict(entry["contexts"])
+                for message in session_messages:
+                    self._remove(contexts, message)
+                    self._insert(contexts, message)
+                await self._set(_session_key(session_id), {"generation": entry["generation"], "contexts": contexts})
+
+    def _insert(self, contexts: dict[str | None, dict[str, Any]], message: dict[str, Any]) -> None:
+        if message.get("error"):
+            return
+        for context_id in {message["context_id"] or None, None}:
+            buffer = contexts.get(context_id)
+            if buffer is None:
+                continue
+            buffered = [buffered for buffered in buffer["messages"] if buffered["id"] != message["id"]]
+            complete = buffer["complete"]
+            timestamp = _timestamp_key(message)
+            if not buffered or timestamp >= _timestamp_key(buffered[-1]):
+                buffered.append(message)
+            # An incomplete buffer only holds the messages newer than its oldest one
+            elif complete or timestamp >= _timestamp_key(buffered[0]):
+                timestamps = [_timestamp_key(buffered) for buffered in buffered]
+                buffered.insert(bisect.bisect_right(timestamps, timestamp), message)
+            if len(buffered) > self.capacity:
+                buffered = buffered[-self.capacity :]
+                complete = False
+            contexts[context_id] = {"messages": buffered, "complete": complete}
+
+    @staticmethod
+    def _remove(contexts: dict[str | None, dict[str, Any]], message: dict[str, Any]) -> None:
+        for context_id in {message["context_id"] or None, None}:
+            buffer = contexts.get(context_id)
+            if buffer is not None:
+                messages = [buffered for buffered in buffer["messages"] if buffered["id"] != message["id"]]
+                contexts[context_id] = {**buffer, "messages": messages}
+
+    async def invalidate(self, session_id: str) -> None:
+        """Drop the buffers of a session whose messages were changed or deleted."""
+        if not self.enabled:
+            return
+        async with self._lock(session_id):
+            await self._delete(_session_key(session_id))
+        self.invalidations += 1
+
+    async def invalidate_all(self) -> None:
+        """Make every buffer stale, after changes to messages of unknown sessions."""
+        if not self.enabled:
+            return
+        await self._set(GENERATION_KEY, await self._generation() + 1)
+        self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the buffers."""
+        return {
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+def _answers(buffer: dict[str, Any], limit: int | None, *, descending: bool) -> bool:
+    # An incomplete buffer only has the newest messages, and updates can leave it with fewer than the limit
+    return buffer["complete"] or bool(descending and limit and len(buffer["messages"]) >= limit)
+
+
+def _group_by_session(messages: Iterable[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    sessions: dict[str, list[dict[str, Any]]] = {}
+    for message in messages:
+        sessions.setdefault(message["session_id"], []).append(message)
+    return sessions
+
+
+_chat_history_buffer: ChatHistoryBuffer | None = None
+_lock = threading.Lock()
+
+
+def get_chat_history_buffer() -> ChatHistoryBuffer:
+    """Return the process-wide buffer of recent chat messages."""
+    global _chat_history_buffer  # noqa: PLW0603
+    if _chat_history_buffer is None:
+        with _lock:
+            if _chat_history_buffer is None:
+                from langflow.services.deps import get_settings_service
+
+                capacity = get_settings_service().settings.chat_history_cache_size
+                _chat_history_buffer = ChatHistoryBuffer(capacity=capacity)
+    return _chat_history_buffer
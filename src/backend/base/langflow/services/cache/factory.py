@@ -6,7 +6,13 @@ from lfx.log.logger import logger
 from typing_extensions import override
 
 from langflow.services.cache.disk import AsyncDiskCache
-from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.service import (
+    AsyncInMemoryCache,
+    CacheService,
+    RedisCache,
+    ShardedAsyncInMemoryCache,
+    ThreadingInMemoryCache,
+)
 from langflow.services.factory import ServiceFactory
 
 if TYPE_CHECKING:
@@ -36,6 +42,13 @@ class CacheServiceFactory(ServiceFactory):
             return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
         if settings_service.settings.cache_type == "async":
             return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+        if settings_service.settings.cache_type == "sharded":
+            return ShardedAsyncInMemoryCache(
+                max_bytes=settings_service.settings.cache_max_bytes or None,
+                expiration_time=settings_service.settings.cache_expire,
+                num_shards=settings_service.settings.cache_shards,
+                sweep_interval=settings_service.settings.cache_sweep_interval,
+            )
         if settings_service.settings.cache_type == "disk":
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
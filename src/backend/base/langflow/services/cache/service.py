@@ -1,9 +1,12 @@
 import asyncio
 import pickle
+import sys
 import threading
 import time
 from collections import OrderedDict
-from typing import Generic, Union
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any, Generic, Union
 
 import dill
 from lfx.log.logger import logger
@@ -17,6 +20,7 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.utils import estimate_size
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
@@ -353,3 +357,232 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def contains(self, key) -> bool:
         return key in self.cache
+
+
+class _ShardEntry:
+    __slots__ = ("expires_at", "last_access", "size", "value")
+
+    def __init__(self, value, size: int, expires_at: float | None) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.last_access = time.monotonic()
+
+
+class _CacheShard:
+    __slots__ = ("entries", "lock", "size")
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = asyncio.Lock()
+        self.size = 0
+
+
+class ShardedAsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    """An async in-memory cache split into shards that each have their own lock.
+
+    Keys are spread over ``num_shards`` LRU dictionaries, so operations on different keys do
+    not wait for each other. Every entry records an estimate of the memory it holds and the
+    cache evicts least recently used entries across all shards once the total goes over
+    ``max_bytes`` or the number of entries goes over ``max_size``. Expired entries are removed
+    when they are read and by a background task that sweeps all shards every ``sweep_interval``
+    seconds.
+
+    Attributes:
+        max_size (int, optional): Maximum number of items to store in the cache.
+        max_bytes (int, optional): Maximum estimated size of all items, in bytes.
+        expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        sweep_interval (float): Seconds between two sweeps of expired items. 0 disables the sweeper.
+
+    Example:
+        cache = ShardedAsyncInMemoryCache(max_bytes=512 * 1024 * 1024, expiration_time=600)
+
+        await cache.set("a", 1)
+        a = await cache.get("a")
+        cache.stats()  # {"hits": 1, "misses": 0, "evictions": 0, ...}
+    """
+
+    def __init__(
+        self,
+        max_size=None,
+        max_bytes=None,
+        expiration_time=3600,
+        num_shards: int = 16,
+        sweep_interval: float = 60,
+        size_estimator: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        """Initialize a new ShardedAsyncInMemoryCache instance.
+
+        Args:
+            max_size (int, optional): Maximum number of items to store in the cache.
+            max_bytes (int, optional): Maximum estimated size of all items, in bytes.
+            expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            num_shards (int): Number of shards the keys are spread over.
+            sweep_interval (float): Seconds between two sweeps of expired items. 0 disables the sweeper.
+            size_estimator (Callable[[Any], int]): Returns the estimated size of a value in bytes.
+        """
+        if num_shards < 1:
+            msg = "num_shards must be at least 1"
+            raise ValueError(msg)
+        self._shards = [_CacheShard() for _ in range(num_shards)]
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.expiration_time = expiration_time
+        self.sweep_interval = sweep_interval
+        self._size_estimator = size_estimator
+        self._sweeper: asyncio.Task | None = None
+        self._items = 0
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _shard(self, key) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _is_expired(self, entry: _ShardEntry, now: float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _remove(self, shard: _CacheShard, key) -> None:
+        entry = shard.entries.pop(key, None)
+        if entry is not None:
+            shard.size -= entry.size
+            self._bytes -= entry.size
+            self._items -= 1
+
+    async def _estimate_size(self, value) -> int:
+        if value is None or isinstance(value, str | bytes | int | float | bool):
+            return sys.getsizeof(value)
+        # Walking a cached graph takes tens of milliseconds, keep it off the event loop
+        return await asyncio.to_thread(self._size_estimator, value)
+
+    async def get(self, key, lock: asyncio.Lock | None = None):
+        shard = self._shard(key)
+        async with lock or shard.lock:
+            return self._get(shard, key)
+
+    def _get(self, shard: _CacheShard, key):
+        entry = shard.entries.get(key)
+        now = time.monotonic()
+        if entry is None or self._is_expired(entry, now):
+            if entry is not None:
+                self._remove(shard, key)
+                self.expirations += 1
+            self.misses += 1
+            return CACHE_MISS
+        shard.entries.move_to_end(key)
+        entry.last_access = now
+        self.hits += 1
+        return entry.value
+
+    async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        size = await self._estimate_size(value)
+        shard = self._shard(key)
+        async with lock or shard.lock:
+            self._set(shard, key, value, size)
+        self._ensure_sweeper()
+
+    def _set(self, shard: _CacheShard, key, value, size: int) -> None:
+        self._remove(shard, key)
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(
+                f"Not caching '{key}': its estimated size of {size} bytes is over the cache limit of "
+                f"{self.max_bytes} bytes."
+            )
+            self.evictions += 1
+            return
+        expires_at = time.monotonic() + self.expiration_time if self.expiration_time else None
+        shard.entries[key] = _ShardEntry(value, size, expires_at)
+        shard.size += size
+        self._bytes += size
+        self._items += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries of all shards until the cache is within its limits."""
+        while (self.max_bytes and self._bytes > self.max_bytes) or (self.max_size and self._items > self.max_size):
+            # The first entry of each shard is its least recently used one
+            victim = min(
+                (shard for shard in self._shards if shard.entries),
+                key=lambda shard: next(iter(shard.entries.values())).last_access,
+            )
+            self._remove(victim, next(iter(victim.entries)))
+            self.evictions += 1
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        shard = self._shard(key)
+        async with lock or shard.lock:
+            self._remove(shard, key)
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:
+        for shard in self._shards:
+            async with lock or shard.lock:
+                for key in list(shard.entries):
+                    self._remove(shard, key)
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        existing_value = await self.get(key, lock)
+        if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
+            existing_value.update(value)
+            value = existing_value
+        await self.set(key, value, lock)
+
+    async def contains(self, key) -> bool:
+        entry = self._shard(key).entries.get(key)
+        return entry is not None and not self._is_expired(entry, time.monotonic())
+
+    async def sweep(self) -> int:
+        """Remove all expired items and return how many were removed."""
+        removed = 0
+        for shard in self._shards:
+            async with shard.lock:
+                now = time.monotonic()
+                expired = [key for key, entry in shard.entries.items() if self._is_expired(entry, now)]
+                for key in expired:
+                    self._remove(shard, key)
+                removed += len(expired)
+        self.expirations += removed
+        return removed
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                if removed := await self.sweep():
+                    await logger.adebug(f"Removed {removed} expired items from the cache")
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Error while removing expired items from the cache")
+
+    def _ensure_sweeper(self) -> None:
+        if not self.sweep_interval or not self.expiration_time:
+            return
+        loop = asyncio.get_running_loop()
+        if self._sweeper is None or self._sweeper.done() or self._sweeper.get_loop() is not loop:
+            self._sweeper = loop.create_task(self._sweep_periodically())
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "items": self._items,
+            "bytes": self._bytes,
+        }
+
+    async def teardown(self) -> None:
+        if self._sweeper is not None and not self._sweeper.done():
+            self._sweeper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sweeper
+        self._sweeper = None
+        await self.clear()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the ShardedAsyncInMemoryCache instance."""
+        return (
+            f"ShardedAsyncInMemoryCache(num_shards={len(self._shards)}, max_size={self.max_size}, "
+            f"max_bytes={self.max_bytes}, expiration_time={self.expiration_time})"
+        )
@@ -1,8 +1,11 @@
 import base64
 import contextlib
+import gc
 import hashlib
+import sys
 import tempfile
 from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, ModuleType
 from typing import TYPE_CHECKING, Any
 
 from fastapi import UploadFile
@@ -17,6 +20,11 @@ CACHE_DIR = user_cache_dir("langflow", "langflow")
 
 PREFIX = "langflow_cache"
 
+DEFAULT_SIZE_ESTIMATE_MAX_OBJECTS = 500_000
+
+# Objects shared by every cached value. Counting them would charge each entry for the whole interpreter.
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
 
 def create_cache_folder(func):
     def wrapper(*args, **kwargs):
@@ -44,6 +52,26 @@ def clear_old_cache_files(max_cache_size: int = 3) -> None:
                 cache_file.unlink()
 
 
+def estimate_size(value: Any, max_objects: int = DEFAULT_SIZE_ESTIMATE_MAX_OBJECTS) -> int:
+    """Estimate the memory held by ``value`` and everything it references, in bytes.
+
+    Objects reachable more than once are counted once. Classes, modules and functions are
+    skipped since they are shared with the rest of the process. The walk stops after
+    ``max_objects`` objects, so the result is a lower bound for very large values.
+    """
+    seen: set[int] = set()
+    pending = [value]
+    total = 0
+    while pending and len(seen) < max_objects:
+        obj = pending.pop()
+        if isinstance(obj, _SHARED_TYPES) or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0)
+        pending.extend(gc.get_referents(obj))
+    return total
+
+
 def filter_json(json_data):
     filtered_data = json_data.copy()
 
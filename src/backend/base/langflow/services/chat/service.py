@@ -3,9 +3,18 @@ from collections import defaultdict
 from threading import RLock
 from typing import Any
 
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.run_state import RunStateError, dumps_run_state, graph_from_run_state, loads_run_state
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_MISS
+
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
-from langflow.services.deps import get_cache_service
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import RedisCache
+from langflow.services.deps import get_cache_service, get_settings_service
+
+RUN_STATE_TYPE = "run_state"
 
 
 class ChatService(Service):
@@ -17,6 +26,30 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        settings_service = get_settings_service()
+        self.store_run_state = (
+            settings_service is not None
+            and settings_service.settings.graph_cache_serialization == "run_state"
+            and isinstance(self.cache_service, RedisCache | AsyncDiskCache)
+        )
+
+    def _to_cache_entry(self, data: Any) -> dict[str, Any]:
+        if self.store_run_state and isinstance(data, Graph):
+            try:
+                return {"result": dumps_run_state(data), "type": RUN_STATE_TYPE}
+            except RunStateError as exc:
+                logger.debug(f"Storing the whole graph in the cache: {exc}")
+        return {"result": data, "type": type(data)}
+
+    @staticmethod
+    def _restore_run_state(entry: dict[str, Any]) -> Any:
+        try:
+            graph = graph_from_run_state(loads_run_state(entry["result"]))
+        except Exception as exc:  # noqa: BLE001
+            # Callers rebuild the graph from the flow on a cache miss
+            logger.warning(f"Could not restore the cached run state: {exc!s}")
+            return CACHE_MISS
+        return {"result": graph, "type": Graph}
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -29,10 +62,7 @@ class ChatService(Service):
         Returns:
             bool: True if the cache was set successfully, False otherwise.
         """
-        result_dict = {
-            "result": data,
-            "type": type(data),
-        }
+        result_dict = self._to_cache_entry(data)
         if isinstance(self.cache_service, AsyncBaseCacheService):
             await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
             return await self.cache_service.contains(key)
@@ -52,8 +82,13 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+            entry = await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+        else:
+            entry = await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+        if isinstance(entry, dict) and entry.get("type") == RUN_STATE_TYPE:
+            # Rebuilding the graph instantiates its components, keep it off the event loop
+            return await asyncio.to_thread(self._restore_run_state, entry)
+        return entry
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
@@ -0,0 +1,281 @@
+"""Process-wide cache of authenticated API keys and write-behind API key usage counters.
+
+Every request authenticated with an API key used to select the key with its user and write the
+incremented usage counters back, so each request paid for a read and a write on the ``apikey``
+table. ``ApiKeyCache`` keeps the user of a valid key for ``ttl`` seconds, keyed by a SHA-256 hash
+of the key so the cache never holds the key itself. Deleting a key drops its entry, and updating
+or deleting a user drops the entries of all its keys. Other workers only see these changes once
+their entries expire, which is why the TTL is kept short.
+
+``ApiKeyUsageTracker`` adds up the uses of each key in memory and writes them with one update per
+key every ``flush_interval`` seconds, and once more on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+from sqlmodel import col, update
+
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+DEFAULT_TTL = 30.0
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_FLUSH_INTERVAL = 10.0
+
+
+def hash_api_key(api_key: str) -> str:
+    """Return the hash an API key is cached under."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class ApiKeyCache:
+    """An LRU cache of the users of valid API keys, keyed by the hash of the key.
+
+    Each entry holds a snapshot of the user's columns, and every hit returns a new ``User`` built
+    from it, so callers cannot change the cached user or attach it to a session.
+
+    Attributes:
+        ttl (float): Seconds an entry is used before the key is checked against the database again.
+        max_entries (int): Number of keys kept.
+        hits (int): Lookups that found a valid entry.
+        misses (int): Lookups that found none.
+        invalidations (int): Entries dropped because their key or user changed.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # key hash -> (api key id, user id, user columns, expiry)
+        self._entries: OrderedDict[str, tuple[UUID, UUID, dict[str, Any], float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, api_key: str) -> tuple[UUID, User] | None:
+        """Return the ID of ``api_key`` and a copy of its user, or None if it is not cached."""
+        if not self.enabled:
+            return None
+        key_hash = hash_api_key(api_key)
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is None or entry[3] < time.monotonic():
+                self._entries.pop(key_hash, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key_hash)
+        api_key_id, _, user_columns, _ = entry
+        return api_key_id, User(**user_columns)
+
+    def put(self, api_key: str, api_key_id: UUID, user: User) -> None:
+        """Remember that ``api_key`` authenticates ``user``."""
+        if not self.enabled:
+            return
+        user_columns = {name: getattr(user, name) for name in User.model_fields}
+        key_hash = hash_api_key(api_key)
+        with self._lock:
+            self._entries[key_hash] = (api_key_id, user.id, user_columns, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_key(self, api_key_id: UUID) -> int:
+        """Drop the entry of an API key that was deleted or deactivated.
+
+        Returns:
+            The number of entries dropped.
+        """
+        return self._invalidate(lambda entry: entry[0] == api_key_id)
+
+    def invalidate_user(self, user_id: UUID) -> int:
+        """Drop the entries of every API key of a user that was updated, deactivated or deleted.
+
+        Returns:
+            The number of entries dropped.
+        """
+        return self._invalidate(lambda entry: entry[1] == user_id)
+
+    def _invalidate(self, matches) -> int:
+        with self._lock:
+            key_hashes = [key_hash for key_hash, entry in self._entries.items() if matches(entry)]
+            for key_hash in key_hashes:
+                del self._entries[key_hash]
+            self.invalidations += len(key_hashes)
+        return len(key_hashes)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the cache and the number of cached keys."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+class ApiKeyUsageTracker:
+    """Adds up API key uses in memory and writes them to the database in batches.
+
+    The flush task starts with the first recorded use. If a flush fails, its uses are added back
+    and written with the next one.
+
+    Attributes:
+        flush_interval (float): Seconds between writes of the pending uses.
+        flushed_uses (int): Uses written to the database.
+        flush_count (int): Number of successful flushes.
+        failed_flushes (int): Number of flushes that raised an error.
+    """
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        self.flush_interval = flush_interval
+        self.flushed_uses = 0
+        self.flush_count = 0
+        self.failed_flushes = 0
+        # api key id -> (uses, last used at)
+        self._pending: dict[UUID, tuple[int, datetime]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> dict[UUID, tuple[int, datetime]]:
+        """The uses of each API key waiting to be written."""
+        return dict(self._pending)
+
+    def record(self, api_key_id: UUID, used_at: datetime | None = None) -> None:
+        """Count one use of an API key."""
+        used_at = used_at or datetime.now(timezone.utc)
+        uses, _ = self._pending.get(api_key_id, (0, used_at))
+        self._pending[api_key_id] = (uses + 1, used_at)
+        if not self.is_started():
+            self.start()
+
+    def is_started(self) -> bool:
+        if self._flush_task is None or self._flush_task.done():
+            return False
+        # A task left behind by an event loop that is no longer running does not flush anything
+        return self._flush_task.get_loop() is asyncio.get_running_loop()
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def flush(self) -> int:
+        """Add the pending uses to the counters of their API keys.
+
+        Returns:
+            int: The number of uses written.
+        """
+        from langflow.services.deps import session_scope
+
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            try:
+                async with session_scope() as session:
+                    for api_key_id, (uses, last_used_at) in pending.items():
+                        await session.exec(
+                            update(ApiKey)
+                            .where(col(ApiKey.id) == api_key_id)
+                            .values(total_uses=col(ApiKey.total_uses) + uses, last_used_at=last_used_at)
+                        )
+            except Exception as exc:  # noqa: BLE001
+                self.failed_flushes += 1
+                self._requeue(pending)
+                await logger.awarning(f"Error writing API key usage: {exc!s}")
+                return 0
+            uses = sum(uses for uses, _ in pending.values())
+            self.flushed_uses += uses
+            self.flush_count += 1
+            return uses
+
+    def _requeue(self, pending: dict[UUID, tuple[int, datetime]]) -> None:
+        for api_key_id, (uses, last_used_at) in pending.items():
+            newer_uses, newer_last_used_at = self._pending.get(api_key_id, (0, last_used_at))
+            self._pending[api_key_id] = (uses + newer_uses, max(last_used_at, newer_last_used_at))
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def clear(self) -> None:
+        """Drop the pending uses without writing them."""
+        self._pending.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of pending uses and the write counters."""
+        return {
+            "pending_keys": len(self._pending),
+            "pending_uses": sum(uses for uses, _ in self._pending.values()),
+            "flushed_uses": self.flushed_uses,
+            "flush_count": self.flush_count,
+            "failed_flushes": self.failed_flushes,
+        }
+
+    async def stop(self) -> None:
+        """Stop the flush task and write the remaining uses.
+
+        Must be called while the database service is still available.
+        """
+        if self.is_started():
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        self._flush_task = None
+        await self.flush()
+
+
+_api_key_cache: ApiKeyCache | None = None
+_api_key_usage_tracker: ApiKeyUsageTracker | None = None
+_lock = threading.Lock()
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Return the process-wide cache of authenticated API keys."""
+    global _api_key_cache  # noqa: PLW0603
+    if _api_key_cache is None:
+        with _lock:
+            if _api_key_cache is None:
+                from langflow.services.deps import get_settings_service
+
+                _api_key_cache = ApiKeyCache(ttl=get_settings_service().settings.api_key_cache_ttl)
+    return _api_key_cache
+
+
+def get_api_key_usage_tracker() -> ApiKeyUsageTracker:
+    """Return the process-wide API key usage tracker."""
+    global _api_key_usage_tracker  # noqa: PLW0603
+    if _api_key_usage_tracker is None:
+        with _lock:
+            if _api_key_usage_tracker is None:
+                from langflow.services.deps import get_settings_service
+
+                flush_interval = get_settings_service().settings.api_key_usage_flush_interval
+                _api_key_usage_tracker = ApiKeyUsageTracker(flush_interval=flush_interval)
+    return _api_key_usage_tracker
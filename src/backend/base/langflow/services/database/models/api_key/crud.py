@@ -1,13 +1,14 @@
-import datetime
 import os
 import secrets
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.database.models.api_key.cache import get_api_key_cache, get_api_key_usage_tracker
 from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service
@@ -30,7 +31,7 @@ async def create_api_key(session: AsyncSession, api_key_create: ApiKeyCreate, us
         api_key=generated_api_key,
         name=api_key_create.name,
         user_id=user_id,
-        created_at=api_key_create.created_at or datetime.datetime.now(datetime.timezone.utc),
+        created_at=api_key_create.created_at or datetime.now(timezone.utc),
     )
 
     session.add(api_key)
@@ -50,6 +51,9 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID, user_id: UUID)
         msg = "API Key not found"
         raise ValueError(msg)
     await session.delete(api_key)
+    # Commit before dropping the cache entry, or a request in between could cache the key again
+    await session.commit()
+    get_api_key_cache().invalidate_key(api_key_id)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
@@ -72,19 +76,45 @@ async def check_key(session: AsyncSession, api_key: str) -> User | None:
 
 
 async def _check_key_from_db(session: AsyncSession, api_key: str, settings_service) -> User | None:
-    """Validate API key against the database."""
+    """Validate API key against the database.
+
+    Valid keys are cached for ``api_key_cache_ttl`` seconds. Their uses are added up in memory and
+    written every ``api_key_usage_flush_interval`` seconds, or with each request when it is 0.
+    """
+    track_usage = settings_service.settings.disable_track_apikey_usage is not True
+    cache = get_api_key_cache()
+    if api_key and (cached := cache.get(api_key)) is not None:
+        api_key_id, user = cached
+        if track_usage:
+            await _record_api_key_use(session, api_key_id)
+        return user
+
     query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = (await session.exec(query)).first()
     if api_key_object is not None:
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            api_key_object.total_uses += 1
-            api_key_object.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-            session.add(api_key_object)
-            await session.flush()
+        if track_usage:
+            await _record_api_key_use(session, api_key_object.id)
+        if api_key_object.user is not None:
+            cache.put(api_key, api_key_object.id, api_key_object.user)
         return api_key_object.user
     return None
 
 
+async def _record_api_key_use(session: AsyncSession, api_key_id: UUID) -> None:
+    usage_tracker = get_api_key_usage_tracker()
+    if usage_tracker.flush_interval > 0:
+        usage_tracker.record(api_key_id)
+        return
+    await session.exec(
+        update(ApiKey)
+        .where(col(ApiKey.id) == api_key_id)
+        .values(
+            total_uses=col(ApiKey.total_uses) + 1,
+            last_used_at=datetime.now(timezone.utc),
+        )
+    )
+
+
 async def _check_key_from_env(session: AsyncSession, api_key: str, settings_service) -> User | None:
     """Validate API key against the environment variable.
 
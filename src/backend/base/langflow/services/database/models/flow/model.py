@@ -12,7 +12,7 @@ from fastapi import HTTPException, status
 from lfx.log.logger import logger
 from pydantic import BaseModel, ValidationInfo, field_serializer, field_validator
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Text, UniqueConstraint, text
+from sqlalchemy import Text, UniqueConstraint, event, inspect, text
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema.data import Data
@@ -213,6 +213,31 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     )
 
 
+# The flow header columns, which must move ``updated_at`` when they change for the listing ETag to follow
+FLOW_HEADER_FIELDS = (
+    "name",
+    "folder_id",
+    "is_component",
+    "endpoint_name",
+    "description",
+    "access_type",
+    "tags",
+    "mcp_enabled",
+    "action_name",
+    "action_description",
+)
+
+
+@event.listens_for(Flow, "before_update")
+def _touch_updated_at(_mapper, _connection, target: Flow) -> None:
+    """Bump ``updated_at`` when a header column changes and the writer did not set it."""
+    attrs = inspect(target).attrs
+    if attrs.updated_at.history.has_changes():
+        return
+    if any(attrs[field].history.has_changes() for field in FLOW_HEADER_FIELDS):
+        target.updated_at = datetime.now(timezone.utc)
+
+
 class FlowCreate(FlowBase):
     user_id: UUID | None = None
     folder_id: UUID | None = None
@@ -2,6 +2,7 @@ from uuid import UUID
 
 from lfx.utils.async_helpers import run_until_complete
 
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
 
@@ -14,12 +15,15 @@ async def _update_message(message_id: UUID | str, message: MessageUpdate | dict)
         if not db_message:
             msg = "Message not found"
             raise ValueError(msg)
+        previous_session_id = db_message.session_id
         message_dict = message.model_dump(exclude_unset=True, exclude_none=True)
         db_message.sqlmodel_update(message_dict)
         session.add(db_message)
         await session.flush()
         await session.refresh(db_message)
-        return db_message
+    for session_id in {previous_session_id, db_message.session_id}:
+        await get_chat_history_buffer().invalidate(session_id)
+    return db_message
 
 
 def update_message(message_id: UUID | str, message: MessageUpdate | dict):
@@ -75,6 +75,40 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionTable]) -> None:
+    """Insert a batch of transactions without enforcing the retention limit.
+
+    Used by the buffered writer, which trims old transactions in a periodic sweep instead
+    of on every insert. The caller is responsible for committing the session.
+
+    Args:
+        db: Database session
+        transactions: Transaction records to insert
+    """
+    db.add_all(transactions)
+    await db.flush()
+
+
+async def trim_transactions_for_flow(db: AsyncSession, flow_id: UUID, max_entries: int) -> None:
+    """Delete the oldest transactions of a flow, keeping the newest ``max_entries``.
+
+    Args:
+        db: Database session
+        flow_id: The flow whose transactions should be trimmed
+        max_entries: The number of transactions to keep for the flow
+    """
+    delete_older = delete(TransactionTable).where(
+        TransactionTable.flow_id == flow_id,
+        col(TransactionTable.id).in_(
+            select(TransactionTable.id)
+            .where(TransactionTable.flow_id == flow_id)
+            .order_by(col(TransactionTable.timestamp).desc())
+            .offset(max_entries)
+        ),
+    )
+    await db.exec(delete_older)
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse] | TransactionReadResponse:
@@ -8,6 +8,7 @@ from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.database.models.api_key.cache import get_api_key_cache
 from langflow.services.database.models.user.model import User, UserUpdate
 
 
@@ -45,10 +46,17 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
     flag_modified(user_db, "updated_at")
 
     try:
-        await db.flush()
+        await db.commit()
     except IntegrityError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    # Authenticated API keys carry a copy of the user, including whether it is active. Drop them
+    # only once the change is committed, so no request can cache the old user again.
+    get_api_key_cache().invalidate_user(user_db.id)
+    # Knowledge base paths are built from the cached user name, which a rename changes
+    from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
+
+    get_knowledge_base_cache().invalidate_username(user_db.id)
     return user_db
 
 
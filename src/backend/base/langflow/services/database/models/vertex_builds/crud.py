@@ -130,6 +130,62 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildTable]) -> None:
+    """Insert a batch of vertex builds without enforcing any retention limits.
+
+    Used by the buffered writer, which trims old builds in a periodic sweep instead of
+    on every insert. The caller is responsible for committing the session.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (list[VertexBuildTable]): The vertex build records to insert.
+    """
+    db.add_all(vertex_builds)
+    await db.flush()
+
+
+async def trim_vertex_builds_for_vertex(db: AsyncSession, flow_id: UUID, vertex_id: str, max_per_vertex: int) -> None:
+    """Delete older builds of a single vertex, keeping the newest ``max_per_vertex``.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        flow_id (UUID): The flow the vertex belongs to.
+        vertex_id (str): The vertex whose build history should be trimmed.
+        max_per_vertex (int): The number of builds to keep for the vertex.
+    """
+    keep_vertex_subq = (
+        select(VertexBuildTable.build_id)
+        .where(
+            VertexBuildTable.flow_id == flow_id,
+            VertexBuildTable.id == vertex_id,
+        )
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(max_per_vertex)
+    )
+    delete_vertex_older = delete(VertexBuildTable).where(
+        VertexBuildTable.flow_id == flow_id,
+        VertexBuildTable.id == vertex_id,
+        col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
+    )
+    await db.exec(delete_vertex_older)
+
+
+async def trim_vertex_builds_globally(db: AsyncSession, max_global: int) -> None:
+    """Delete older builds across all vertices, keeping the newest ``max_global``.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        max_global (int): The number of builds to keep in total.
+    """
+    keep_global_subq = (
+        select(VertexBuildTable.build_id)
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(max_global)
+    )
+    delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
+    await db.exec(delete_global_older)
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -7,6 +7,7 @@ from aiofile import async_open
 from lfx.graph import Graph
 from lfx.graph.vertex.param_handler import ParameterHandler
 from lfx.log.logger import configure, logger
+from lfx.services.variable.resolver import invalidate_user_variables
 from lfx.utils.util import update_settings
 from sqlmodel import delete, select, text
 
@@ -14,6 +15,7 @@ from langflow.api.utils import cascade_delete_flow
 from langflow.load.utils import replace_tweaks_with_env
 from langflow.processing.process import process_tweaks, run_graph
 from langflow.services.auth.utils import get_password_hash
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.cache.service import AsyncBaseCacheService
 from langflow.services.database.models import Flow, User, Variable
 from langflow.services.database.utils import initialize_database
@@ -223,6 +225,7 @@ class LangflowRunnerExperimental:
             flow_id = flow_dict["id"]
             uuid_obj = flow_id if isinstance(flow_id, UUID) else UUID(str(flow_id))
             await cascade_delete_flow(session, uuid_obj)
+        await get_chat_history_buffer().invalidate_all()
 
     @staticmethod
     async def clear_user_state(user_id: str):
@@ -232,7 +235,10 @@ class LangflowRunnerExperimental:
             for flow_id in flow_ids:
                 await cascade_delete_flow(session, flow_id)
             await session.exec(delete(Variable).where(Variable.user_id == user_id))
+            invalidate_user_variables(user_id)
             await session.exec(delete(User).where(User.id == user_id))
+        if flow_ids:
+            await get_chat_history_buffer().invalidate_all()
 
     async def init_db_if_needed(self):
         if not await self.database_exists_check() and self.should_initialize_db:
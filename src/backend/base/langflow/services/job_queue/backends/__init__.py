@@ -0,0 +1,17 @@
+from langflow.services.job_queue.backends.base import (
+    JobEvent,
+    JobEventStream,
+    JobQueueBackend,
+    JobQueueNotFoundError,
+)
+from langflow.services.job_queue.backends.memory import InMemoryJobQueueBackend
+from langflow.services.job_queue.backends.redis_streams import RedisStreamsJobQueueBackend
+
+__all__ = [
+    "InMemoryJobQueueBackend",
+    "JobEvent",
+    "JobEventStream",
+    "JobQueueBackend",
+    "JobQueueNotFoundError",
+    "RedisStreamsJobQueueBackend",
+]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+JobEvent = tuple[str | None, bytes | None, float]
+"""An event as produced by the EventManager: (event_id, encoded event or None for end of stream, put time)."""
+
+
+class JobQueueNotFoundError(Exception):
+    """Exception raised when a job queue is not found."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        super().__init__(f"Job queue not found for job_id: {job_id}")
+
+
+class JobQueueBackend(ABC):
+    """Storage for the event stream of each job.
+
+    The replica running a job publishes its events to the backend, and any replica can consume
+    them. Each event is delivered to a single consumer, like items of an ``asyncio.Queue``, and
+    removed once read. A stream holds at most ``max_len`` unread events: publishing waits for
+    consumers to catch up rather than dropping events. Streams expire ``ttl`` seconds after
+    they were last written to or touched.
+    """
+
+    name: str
+
+    def __init__(self, *, max_len: int, ttl: float) -> None:
+        self.max_len = max_len
+        self.ttl = ttl
+
+    @abstractmethod
+    async def create(self, job_id: str) -> None:
+        """Create an empty event stream for a job."""
+
+    @abstractmethod
+    async def publish(self, job_id: str, event: JobEvent) -> None:
+        """Append an event to the job's stream and refresh its expiry.
+
+        Waits while the stream holds ``max_len`` unread events.
+
+        Raises:
+            JobQueueNotFoundError: If the job's stream does not exist or was deleted while waiting.
+        """
+
+    @abstractmethod
+    async def read(self, job_id: str, *, timeout: float | None = None, count: int = 100) -> list[JobEvent]:
+        """Consume up to ``count`` events that no consumer has read yet.
+
+        Args:
+            job_id: The job whose events are read.
+            timeout: Seconds to wait when no event is available. ``0`` returns immediately and
+                ``None`` waits until an event arrives.
+            count: Maximum number of events to return.
+
+        Raises:
+            JobQueueNotFoundError: If the job's stream does not exist or has expired.
+        """
+
+    @abstractmethod
+    async def exists(self, job_id: str) -> bool:
+        """Return True if the job's stream exists."""
+
+    @abstractmethod
+    async def touch(self, job_id: str) -> None:
+        """Refresh the expiry of a job's stream while its job is still running."""
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        """Delete a job's stream and cancellation flag."""
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> bool:
+        """Ask the replica running a job to cancel it. Returns False if the job does not exist."""
+
+    @abstractmethod
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        """Return True if cancellation of the job was requested."""
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired streams. Returns the number of streams removed."""
+        return 0
+
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+        return
+
+
+class JobEventStream:
+    """Queue-like consumer of a job's events, backed by a JobQueueBackend.
+
+    Events are fetched from the backend in batches and handed out one at a time, so it can
+    replace the job's ``asyncio.Queue`` on the consumer side regardless of which replica runs
+    the job.
+    """
+
+    def __init__(self, backend: JobQueueBackend, job_id: str, *, poll_timeout: float = 5.0) -> None:
+        self.backend = backend
+        self.job_id = job_id
+        self.poll_timeout = poll_timeout
+        self._buffer: list[JobEvent] = []
+
+    async def get(self) -> JobEvent:
+        """Return the next event, waiting until one is available."""
+        while not self._buffer:
+            self._buffer = await self.backend.read(self.job_id, timeout=self.poll_timeout)
+        return self._buffer.pop(0)
+
+    async def get_batch(self) -> list[JobEvent]:
+        """Return all events available, waiting until there is at least one."""
+        events = await self.get_available()
+        while not events:
+            events = await self.backend.read(self.job_id, timeout=self.poll_timeout)
+        return events
+
+    async def get_available(self) -> list[JobEvent]:
+        """Return all events available right now without waiting."""
+        events, self._buffer = self._buffer, []
+        while True:
+            batch = await self.backend.read(self.job_id, timeout=0)
+            if not batch:
+                return events
+            events.extend(batch)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from langflow.services.job_queue.backends.base import JobQueueBackend, JobQueueNotFoundError
+
+if TYPE_CHECKING:
+    from langflow.services.job_queue.backends.base import JobEvent
+
+
+class _MemoryStream:
+    def __init__(self, ttl: float) -> None:
+        # Only events no consumer has read yet, they are removed when read
+        self.events: deque[JobEvent] = deque()
+        self.cancel_requested = False
+        self.condition = asyncio.Condition()
+        self.ttl = ttl
+        self.expires_at = time.monotonic() + ttl
+
+    def touch(self) -> None:
+        self.expires_at = time.monotonic() + self.ttl
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+class InMemoryJobQueueBackend(JobQueueBackend):
+    """Process-local backend that mimics the Redis streams backend.
+
+    Unread events are kept in deques and only visible to the current process, which makes
+    it the default for single-worker deployments and a stand-in for Redis in tests. When a
+    stream holds ``max_len`` unread events, publishing waits until a consumer reads some.
+    """
+
+    name = "memory"
+
+    def __init__(self, *, max_len: int = 10000, ttl: float = 600) -> None:
+        super().__init__(max_len=max_len, ttl=ttl)
+        self._streams: dict[str, _MemoryStream] = {}
+
+    def _get_stream(self, job_id: str) -> _MemoryStream:
+        stream = self._streams.get(job_id)
+        if stream is None or stream.expired():
+            self._streams.pop(job_id, None)
+            raise JobQueueNotFoundError(job_id)
+        return stream
+
+    async def create(self, job_id: str) -> None:
+        self._streams.setdefault(job_id, _MemoryStream(self.ttl))
+
+    async def publish(self, job_id: str, event: JobEvent) -> None:
+        stream = self._get_stream(job_id)
+
+        def has_room() -> bool:
+            return len(stream.events) < self.max_len or self._streams.get(job_id) is not stream
+
+        async with stream.condition:
+            # Backpressure: unread events are never dropped. If no consumer shows up, the stream
+            # expires and is deleted, which wakes the publisher up.
+            await stream.condition.wait_for(has_room)
+            if self._streams.get(job_id) is not stream:
+                raise JobQueueNotFoundError(job_id)
+            stream.events.append(event)
+            stream.touch()
+            stream.condition.notify_all()
+
+    async def read(self, job_id: str, *, timeout: float | None = None, count: int = 100) -> list[JobEvent]:
+        stream = self._get_stream(job_id)
+
+        def ready() -> bool:
+            return bool(stream.events) or self._streams.get(job_id) is not stream
+
+        async with stream.condition:
+            if timeout != 0:
+                try:
+                    await asyncio.wait_for(stream.condition.wait_for(ready), timeout=timeout)
+                except asyncio.TimeoutError:
+                    return []
+            if self._streams.get(job_id) is not stream:
+                raise JobQueueNotFoundError(job_id)
+            events = [stream.events.popleft() for _ in range(min(count, len(stream.events)))]
+            if events:
+                # Wake up publishers waiting for room
+                stream.condition.notify_all()
+        return events
+
+    async def exists(self, job_id: str) -> bool:
+        try:
+            self._get_stream(job_id)
+        except JobQueueNotFoundError:
+            return False
+        return True
+
+    async def touch(self, job_id: str) -> None:
+        stream = self._streams.get(job_id)
+        if stream is not None:
+            stream.touch()
+
+    async def delete(self, job_id: str) -> None:
+        stream = self._streams.pop(job_id, None)
+        if stream is not None:
+            # Wake up consumers waiting on the stream so they notice it is gone
+            async with stream.condition:
+                stream.condition.notify_all()
+
+    async def request_cancel(self, job_id: str) -> bool:
+        try:
+            stream = self._get_stream(job_id)
+        except JobQueueNotFoundError:
+            return False
+        stream.cancel_requested = True
+        return True
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        stream = self._streams.get(job_id)
+        return stream is not None and stream.cancel_requested
+
+    async def cleanup_expired(self) -> int:
+        expired = [job_id for job_id, stream in self._streams.items() if stream.expired()]
+        for job_id in expired:
+            await self.delete(job_id)
+        return len(expired)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from typing import TYPE_CHECKING
+
+from langflow.services.job_queue.backends.base import JobQueueBackend, JobQueueNotFoundError
+
+if TYPE_CHECKING:
+    from redis.asyncio import StrictRedis
+
+    from langflow.services.job_queue.backends.base import JobEvent
+
+CONSUMER_GROUP = "consumers"
+
+
+class RedisStreamsJobQueueBackend(JobQueueBackend):
+    """Backend storing each job's events in a Redis stream so they can be consumed from any replica.
+
+    Every stream has a single consumer group, which gives each event to exactly one reader
+    across replicas, and events are deleted from the stream once read. Publishing waits while
+    ``max_len`` events are unread. Streams expire ``ttl`` seconds after the last write, so
+    finished jobs are cleaned up by Redis itself.
+    """
+
+    name = "redis"
+    BACKPRESSURE_POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        client: StrictRedis,
+        *,
+        max_len: int = 10000,
+        ttl: float = 600,
+        prefix: str = "langflow:job_queue",
+    ) -> None:
+        super().__init__(max_len=max_len, ttl=ttl)
+        self._client = client
+        self.prefix = prefix
+        self.consumer_name = f"{socket.gethostname()}-{os.getpid()}"
+
+    @classmethod
+    def from_settings(cls, *, host: str, port: int, db: int, url: str | None, max_len: int, ttl: float):
+        from redis.asyncio import StrictRedis
+
+        client = StrictRedis.from_url(url) if url else StrictRedis(host=host, port=port, db=db)
+        return cls(client, max_len=max_len, ttl=ttl)
+
+    def _stream_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}:events"
+
+    def _cancel_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}:cancel"
+
+    @property
+    def _ttl_seconds(self) -> int:
+        return max(1, int(self.ttl))
+
+    async def create(self, job_id: str) -> None:
+        from redis.exceptions import ResponseError
+
+        key = self._stream_key(job_id)
+        try:
+            await self._client.xgroup_create(key, CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        await self._client.expire(key, self._ttl_seconds)
+
+    async def publish(self, job_id: str, event: JobEvent) -> None:
+        event_id, value, put_time = event
+        fields = {
+            "event_id": event_id or "",
+            "value": value or b"",
+            "end": "1" if value is None else "0",
+            "put_time": repr(put_time),
+        }
+        key = self._stream_key(job_id)
+        # Trimming the stream would drop events nobody has read, wait for consumers instead
+        while await self._client.xlen(key) >= self.max_len:  # noqa: ASYNC110 - consumers run in other processes
+            await asyncio.sleep(self.BACKPRESSURE_POLL_INTERVAL)
+        # NOMKSTREAM: recreating an expired stream would leave it without its consumer group
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, fields, nomkstream=True)
+            pipe.expire(key, self._ttl_seconds)
+            entry_id, _ = await pipe.execute()
+        if entry_id is None:
+            raise JobQueueNotFoundError(job_id)
+
+    async def read(self, job_id: str, *, timeout: float | None = None, count: int = 100) -> list[JobEvent]:
+        from redis.exceptions import ResponseError
+
+        # redis-py does not block when ``block`` is None and blocks forever when it is 0
+        block = None if timeout == 0 else int((timeout or 0) * 1000)
+        try:
+            response = await self._client.xreadgroup(
+                CONSUMER_GROUP,
+                self.consumer_name,
+                streams={self._stream_key(job_id): ">"},
+                count=count,
+                block=block,
+                noack=True,
+            )
+        except ResponseError as exc:
+            # NOGROUP when the stream never existed or expired, UNBLOCKED when it was deleted while waiting
+            if "NOGROUP" in str(exc) or "UNBLOCKED" in str(exc):
+                raise JobQueueNotFoundError(job_id) from exc
+            raise
+        if not response:
+            return []
+
+        events: list[JobEvent] = []
+        entry_ids = []
+        for _, entries in response:
+            for entry_id, fields in entries:
+                entry_ids.append(entry_id)
+                event_id = fields[b"event_id"].decode() or None
+                value = None if fields[b"end"] == b"1" else fields[b"value"]
+                events.append((event_id, value, float(fields[b"put_time"])))
+        # Read events are not acknowledged and never read again, so they can go
+        await self._client.xdel(self._stream_key(job_id), *entry_ids)
+        return events
+
+    async def exists(self, job_id: str) -> bool:
+        return bool(await self._client.exists(self._stream_key(job_id)))
+
+    async def touch(self, job_id: str) -> None:
+        await self._client.expire(self._stream_key(job_id), self._ttl_seconds)
+
+    async def delete(self, job_id: str) -> None:
+        await self._client.delete(self._stream_key(job_id), self._cancel_key(job_id))
+
+    async def request_cancel(self, job_id: str) -> bool:
+        if not await self.exists(job_id):
+            return False
+        await self._client.set(self._cancel_key(job_id), "1", ex=self._ttl_seconds)
+        return True
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return bool(await self._client.exists(self._cancel_key(job_id)))
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -1,11 +1,35 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
+from langflow.services.job_queue.backends import InMemoryJobQueueBackend, RedisStreamsJobQueueBackend
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
-        return JobQueueService()
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        if settings.job_queue_backend == "redis":
+            logger.debug("Creating job queue service with the Redis streams backend")
+            backend = RedisStreamsJobQueueBackend.from_settings(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                max_len=settings.job_queue_max_events,
+                ttl=settings.job_queue_ttl,
+            )
+        else:
+            backend = InMemoryJobQueueBackend(max_len=settings.job_queue_max_events, ttl=settings.job_queue_ttl)
+        return JobQueueService(backend)
@@ -1,77 +1,89 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from functools import partial
 
 from lfx.log.logger import logger
 
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, get_coalescing_options
 from langflow.services.base import Service
-
-
-class JobQueueNotFoundError(Exception):
-    """Exception raised when a job queue is not found."""
-
-    def __init__(self, job_id: str) -> None:
-        self.job_id = job_id
-        super().__init__(f"Job queue not found for job_id: {job_id}")
+from langflow.services.job_queue.backends import (
+    InMemoryJobQueueBackend,
+    JobEventStream,
+    JobQueueBackend,
+    JobQueueNotFoundError,
+)
 
 
 class JobQueueService(Service):
-    """Asynchronous service for managing job-specific queues and their associated tasks.
+    """Asynchronous service for managing job-specific queues, their tasks and their event streams.
 
     This service allows clients to:
       - Create dedicated asyncio queues for individual jobs.
       - Associate each queue with an EventManager, enabling event-driven handling.
       - Launch and manage asynchronous tasks that process these job queues.
+      - Consume the events of a job from any replica through a pluggable JobQueueBackend.
       - Safely clean up resources by cancelling active tasks and emptying queues.
-      - Automatically perform periodic cleanup of inactive or completed job queues.
+      - Automatically release finished jobs once their event stream has expired.
 
-    The cleanup process follows a two-phase approach:
-      1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
-      2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
-         since the task was marked
+    Events put on a job's queue by its EventManager are forwarded to the backend, which keeps
+    them in a bounded stream. Consumers read from the backend instead of the local queue, so a
+    build started on one replica can be polled or streamed from another one when a shared
+    backend such as Redis is configured. Streams expire ``ttl`` seconds after the last event;
+    while a job is running its replica keeps the stream alive and watches for cancellation
+    requests made from other replicas.
 
     Attributes:
         name (str): Unique identifier for the service.
+        backend (JobQueueBackend): Storage for the event streams of the jobs.
         _queues (dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]]):
-            Dictionary mapping job IDs to a tuple containing:
+            Dictionary mapping the IDs of the jobs running on this replica to a tuple containing:
               * The job's asyncio.Queue instance.
               * The associated EventManager instance.
               * The asyncio.Task processing the job (if any).
-              * The cleanup timestamp (if any).
+              * The time all of the job's events were forwarded to the backend (if any).
+        _forwarders (dict[str, asyncio.Task]): Tasks forwarding each job's queue to the backend.
         _cleanup_task (asyncio.Task | None): Background task for periodic cleanup.
         _closed (bool): Flag indicating whether the service is currently active.
-        CLEANUP_GRACE_PERIOD (int): Number of seconds to wait after a task is marked for cleanup
-            before actually removing it. This grace period allows for:
-              * Pending operations to complete
-              * Related systems to finish their work
-              * Inspection or recovery if needed
-            Default is 300 seconds (5 minutes).
+        cleanup_interval (float): Seconds between cleanups of expired streams and finished jobs.
+        MAINTENANCE_INTERVAL (float): Seconds between checks for remote cancellation requests
+            (and stream expiry refreshes) while a job is running.
 
     Example:
         service = JobQueueService()
-        await service.start()
+        service.start()
         queue, event_manager = service.create_queue("job123")
         service.start_job("job123", some_async_coroutine())
-        # Retrieve and use the queue data as needed
-        data = service.get_queue_data("job123")
+        # Consume the job's events, possibly from another replica
+        events, _, _ = await service.get_job_events("job123")
+        event_id, value, put_time = await events.get()
         await service.cleanup_job("job123")
         await service.stop()
     """
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, backend: JobQueueBackend | None = None, *, cleanup_interval: float = 60) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            backend (JobQueueBackend | None): Storage for the job event streams. Defaults to a process-local
+                InMemoryJobQueueBackend.
+            cleanup_interval (float): Seconds between cleanups of expired streams and finished jobs.
         """
+        self.backend: JobQueueBackend = backend or InMemoryJobQueueBackend()
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
+        self._forwarders: dict[str, asyncio.Task] = {}
+        self._background_tasks: set[asyncio.Task] = set()
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
-        self.CLEANUP_GRACE_PERIOD = 300  # 5 minutes before cleaning up marked tasks
+        self.cleanup_interval = cleanup_interval
+        self.MAINTENANCE_INTERVAL = 1.0
 
     def is_started(self) -> bool:
         """Check if the JobQueueService has started.
@@ -90,11 +102,11 @@ class JobQueueService(Service):
         """Start the JobQueueService and begin the periodic cleanup routine.
 
         This method marks the service as active and launches a background task that
-        periodically checks and cleans up job queues whose tasks have been completed or cancelled.
+        periodically removes expired event streams and releases the jobs they belonged to.
         """
         self._closed = False
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-        logger.debug("JobQueueService started: periodic cleanup task initiated.")
+        logger.debug(f"JobQueueService started with the {self.backend.name} backend: periodic cleanup task initiated.")
 
     async def stop(self) -> None:
         """Gracefully stop the JobQueueService by terminating background operations and cleaning up all resources.
@@ -104,6 +116,7 @@ class JobQueueService(Service):
             2. Cancels the background periodic cleanup task and awaits its termination.
             3. Iterates over all registered job queues to clean up their resources—cancelling active tasks and
             clearing queued items.
+            4. Closes the backend.
         """
         self._closed = True
         if self._cleanup_task:
@@ -117,6 +130,7 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        await self.backend.close()
         await logger.adebug("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
@@ -125,6 +139,8 @@ class JobQueueService(Service):
     def create_queue(self, job_id: str) -> tuple[asyncio.Queue, EventManager]:
         """Create and register a new queue along with its corresponding event manager for a job.
 
+        The events put on the queue are forwarded to the job's stream in the backend.
+
         Args:
             job_id (str): Unique identifier for the job.
 
@@ -147,6 +163,7 @@ class JobQueueService(Service):
 
         # Register the queue without an active task.
         self._queues[job_id] = (main_queue, event_manager, None, None)
+        self._forwarders[job_id] = asyncio.create_task(self._forward_events(job_id, main_queue))
         logger.debug(f"Queue and event manager successfully created for job_id {job_id}")
         return main_queue, event_manager
 
@@ -159,6 +176,9 @@ class JobQueueService(Service):
           - Launches a new asynchronous task using the provided coroutine.
           - Updates the internal registry with the new task.
 
+        When the task finishes, for whatever reason, the end of the job's event stream is signalled
+        to its consumers.
+
         Args:
             job_id (str): Unique identifier for the job.
             task_coro: A coroutine representing the job's asynchronous task.
@@ -180,11 +200,22 @@ class JobQueueService(Service):
 
         # Initiate the new asynchronous task.
         task = asyncio.create_task(task_coro)
+        task.add_done_callback(partial(self._on_job_done, job_id))
         self._queues[job_id] = (main_queue, event_manager, task, None)
         logger.debug(f"New task started for job_id {job_id}")
 
+    def _on_job_done(self, job_id: str, task: asyncio.Task) -> None:
+        """Signal the end of the stream when the current task of a job finishes."""
+        queue_data = self._queues.get(job_id)
+        if queue_data is None or queue_data[2] is not task:
+            # The job was cleaned up or its task was replaced
+            return
+        # Tokens held for coalescing must reach the stream before its end
+        queue_data[1].flush_tokens()
+        queue_data[0].put_nowait((None, None, time.time()))
+
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
-        """Retrieve the complete data structure associated with a job's queue.
+        """Retrieve the complete data structure associated with a job's queue on this replica.
 
         Args:
             job_id (str): Unique identifier for the job.
@@ -192,7 +223,7 @@ class JobQueueService(Service):
         Returns:
             tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
                 A tuple containing the job's main queue, its linked event manager, the associated task (if any),
-                and the cleanup timestamp (if any).
+                and the time its events were all forwarded to the backend (if any).
 
         Raises:
             JobQueueNotFoundError: If the job_id is not found.
@@ -207,14 +238,69 @@ class JobQueueService(Service):
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
 
+    async def create_stream(self, job_id: str) -> None:
+        """Create the backend stream of a job so other replicas can find it before its first event is published."""
+        await self.backend.create(job_id)
+
+    async def get_job_events(self, job_id: str) -> tuple[JobEventStream, EventManager | None, asyncio.Task | None]:
+        """Return a consumer for the events of a job running on any replica.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+
+        Returns:
+            tuple[JobEventStream, EventManager | None, asyncio.Task | None]: The job's event stream, and its
+                event manager and task when the job runs on this replica (None otherwise).
+
+        Raises:
+            JobQueueNotFoundError: If the job's stream does not exist or has expired.
+            RuntimeError: If the service is closed.
+        """
+        if self._closed:
+            msg = f"Queue service is closed for job_id: {job_id}"
+            raise RuntimeError(msg)
+
+        queue_data = self._queues.get(job_id)
+        if queue_data is not None:
+            forwarder = self._forwarders.get(job_id)
+            if forwarder is not None and not forwarder.done():
+                # The forwarder may not have created the stream yet
+                await self.create_stream(job_id)
+            _, event_manager, task, _ = queue_data
+            return JobEventStream(self.backend, job_id), event_manager, task
+
+        if not await self.backend.exists(job_id):
+            raise JobQueueNotFoundError(job_id)
+        return JobEventStream(self.backend, job_id), None, None
+
+    async def request_cancel(self, job_id: str) -> bool:
+        """Cancel a job running on this replica, or ask the replica running it to cancel it.
+
+        Returns:
+            bool: False if the job is unknown to this replica and to the backend.
+        """
+        queue_data = self._queues.get(job_id)
+        if queue_data is not None:
+            task = queue_data[2]
+            if task is not None and not task.done():
+                task.cancel()
+            return True
+        return await self.backend.request_cancel(job_id)
+
+    def schedule_cancel(self, job_id: str) -> None:
+        """Request the cancellation of a job from synchronous code, such as a disconnect handler."""
+        task = asyncio.create_task(self.request_cancel(job_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
         The cleanup process includes:
           1. Verifying if the job's queue is registered.
           2. Cancelling the running task (if active) and awaiting its termination.
-          3. Clearing all items from the job's queue.
-          4. Removing the job's entry from the internal registry.
+          3. Stopping the forwarding of the job's events and clearing all items from its queue.
+          4. Removing the job's entry from the internal registry and its stream from the backend.
 
         Args:
             job_id (str): Unique identifier for the job to be cleaned up.
@@ -236,6 +322,11 @@ class JobQueueService(Service):
                 await logger.aerror(f"Error in task for job_id {job_id}: {exc}")
             await logger.adebug(f"Task cancellation complete for job_id {job_id}")
 
+        forwarder = self._forwarders.pop(job_id, None)
+        if forwarder and not forwarder.done():
+            forwarder.cancel()
+            await asyncio.wait([forwarder])
+
         # Clear the queue since we just cancelled the task or it has completed
         items_cleared = 0
         while not main_queue.empty():
@@ -248,68 +339,88 @@ class JobQueueService(Service):
         await logger.adebug(f"Removed {items_cleared} items from queue for job_id {job_id}")
         # Remove the job entry from the registry
         self._queues.pop(job_id, None)
+        try:
+            await self.backend.delete(job_id)
+        except Exception as exc:  # noqa: BLE001
+            await logger.awarning(f"Could not delete the event stream for job_id {job_id}: {exc}")
         await logger.adebug(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
+    async def _forward_events(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Publish the events put on a job's queue to the backend until the end of the stream.
+
+        While waiting for events, the forwarder periodically refreshes the expiry of the stream of a
+        running job and cancels the job if another replica requested it.
+        """
+        try:
+            await self.backend.create(job_id)
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=self.MAINTENANCE_INTERVAL)
+                except asyncio.TimeoutError:
+                    await self._maintain_job(job_id)
+                    continue
+                await self.backend.publish(job_id, event)
+                if event[1] is None:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            await logger.aerror(f"Error forwarding events for job_id {job_id}: {exc}")
+        finally:
+            queue_data = self._queues.get(job_id)
+            if queue_data is not None:
+                self._queues[job_id] = (*queue_data[:3], asyncio.get_running_loop().time())
+
+    async def _maintain_job(self, job_id: str) -> None:
+        """Keep the stream of a running job alive and apply cancellation requests from other replicas."""
+        queue_data = self._queues.get(job_id)
+        task = queue_data[2] if queue_data else None
+        if task is None or task.done():
+            # Orphaned or finished jobs are left to expire
+            return
+        await self.backend.touch(job_id)
+        if await self.backend.is_cancel_requested(job_id):
+            await logger.adebug(f"Cancellation of job_id {job_id} requested by another replica")
+            task.cancel()
+
     async def _periodic_cleanup(self) -> None:
-        """Execute a periodic task that cleans up completed or cancelled job queues.
+        """Execute a periodic task that cleans up expired streams and the jobs they belonged to.
 
         This internal coroutine continuously:
-          - Sleeps for a fixed interval (60 seconds).
-          - Initiates the cleanup of job queues by calling _cleanup_old_queues.
+          - Sleeps for ``cleanup_interval`` seconds.
+          - Initiates the cleanup of expired jobs by calling _cleanup_expired_jobs.
           - Monitors and logs any exceptions during the cleanup cycle.
 
         The loop terminates when the service is marked as closed.
         """
         while not self._closed:
             try:
-                await asyncio.sleep(60)  # Sleep for 60 seconds before next cleanup attempt.
-                await self._cleanup_old_queues()
+                await asyncio.sleep(self.cleanup_interval)
+                await self._cleanup_expired_jobs()
             except asyncio.CancelledError:
                 await logger.adebug("Periodic cleanup task received cancellation signal.")
                 raise
             except Exception as exc:  # noqa: BLE001
                 await logger.aerror(f"Exception encountered during periodic cleanup: {exc}")
 
-    async def _cleanup_old_queues(self) -> None:
-        """Scan all registered job queues and clean up those with completed, failed or orphaned tasks."""
-        current_time = asyncio.get_running_loop().time()
+    async def _cleanup_expired_jobs(self) -> None:
+        """Remove expired streams and release the local jobs that are not running and whose stream has expired.
+
+        Running jobs keep their stream alive, so a job is released ``ttl`` seconds after its last event
+        once it has finished, or ``ttl`` seconds after its creation if its task was never started.
+        """
+        expired = await self.backend.cleanup_expired()
+        if expired:
+            await logger.adebug(f"Removed {expired} expired job event streams")
 
         for job_id in list(self._queues.keys()):
-            _, _, task, cleanup_time = self._queues[job_id]
-
-            should_cleanup = False
-            cleanup_reason = ""
-
-            # Case 1: Orphaned queue (created but task never started)
-            if task is None:
-                should_cleanup = True
-                cleanup_reason = "Orphaned queue (no task associated)"
-            # Case 2: Task has finished (Success, Failure, or Cancellation)
-            elif task.done():
-                should_cleanup = True
-                if task.cancelled():
-                    cleanup_reason = "Task cancelled"
-                elif task.exception() is not None:
-                    # Don't try to log the exception yet as it might be handled elsewhere;
-                    # the grace period allows other systems to inspect it if needed.
-                    cleanup_reason = "Task failed with exception"
-                else:
-                    cleanup_reason = "Task completed successfully"
-
-            if should_cleanup:
-                if cleanup_time is None:
-                    # Mark for cleanup by setting the timestamp
-                    self._queues[job_id] = (
-                        self._queues[job_id][0],
-                        self._queues[job_id][1],
-                        self._queues[job_id][2],
-                        current_time,
-                    )
-                    await logger.adebug(f"Job queue for job_id {job_id} marked for cleanup - {cleanup_reason}")
-                elif current_time - cleanup_time >= self.CLEANUP_GRACE_PERIOD:
-                    # Enough time has passed, perform the actual cleanup
-                    await logger.adebug(f"Cleaning up job_id {job_id} after grace period due to: {cleanup_reason}")
-                    await self.cleanup_job(job_id)
+            task = self._queues[job_id][2]
+            if task is not None and not task.done():
+                continue
+            if not await self.backend.exists(job_id):
+                reason = "Orphaned queue (no task associated)" if task is None else "Task finished"
+                await logger.adebug(f"Cleaning up job_id {job_id} after its event stream expired: {reason}")
+                await self.cleanup_job(job_id)
 
     def _create_default_event_manager(self, queue: asyncio.Queue) -> EventManager:
         """Creates the default event manager with predefined events.
@@ -320,7 +431,7 @@ class JobQueueService(Service):
         Returns:
             EventManager: The configured EventManager instance.
         """
-        manager = EventManager(queue)
+        manager = EventManager(queue, **get_coalescing_options())
         # Registering predefined events
         event_names_types = [
             ("on_token", "token"),
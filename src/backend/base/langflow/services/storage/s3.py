@@ -6,24 +6,36 @@ file upload, download, deletion, and listing operations.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import os
 from typing import TYPE_CHECKING, Any
 
+from lfx.utils.async_helpers import get_background_loop
+
 from langflow.logging.logger import logger
 
 from .service import StorageService
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterable, AsyncIterator, Sequence
 
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+# S3 rejects multipart uploads whose parts, except the last one, are smaller than 5 MiB
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+# delete_objects accepts at most 1000 keys per request
+MAX_DELETE_BATCH_SIZE = 1000
+
+
 class S3StorageService(StorageService):
     """A service class for handling S3 storage operations using aioboto3."""
 
+    multipart_part_size: int = 8 * 1024 * 1024
+    """Size of the parts of multipart uploads. Streams that fit in one part are sent with a single put_object."""
+
     def __init__(self, session_service: SessionService, settings_service: SettingsService) -> None:
         """Initialize the S3 storage service with session and settings services.
 
@@ -57,7 +69,17 @@ class S3StorageService(StorageService):
 
         # Create session - AWS credentials are picked up from environment variables
         self.session = aioboto3.Session()
+        self.max_pool_connections = settings_service.settings.object_storage_max_pool_connections
+        # One client, and so one connection pool, is shared by all operations until teardown
         self._client = None
+        self._client_context = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._client_lock = asyncio.Lock()
+        # Sync code reads files through run_until_complete, whose background loop gets a client of its own
+        self._background_client = None
+        self._background_client_context = None
+        self._background_client_loop: asyncio.AbstractEventLoop | None = None
+        self._background_client_lock = asyncio.Lock()
 
         self.set_ready()
         logger.info(
@@ -122,9 +144,49 @@ class S3StorageService(StorageService):
         """
         return logical_path
 
-    def _get_client(self):
-        """Get or create an S3 client using the async context manager."""
-        return self.session.client("s3")
+    def _new_client(self):
+        from botocore.config import Config
+
+        return self.session.client("s3", config=Config(max_pool_connections=self.max_pool_connections))
+
+    @contextlib.asynccontextmanager
+    async def _get_client(self):
+        """Yield the shared S3 client, creating it on first use.
+
+        The client's connections belong to the event loop that opened them. Calls made on the
+        background loop of ``run_until_complete`` share a second client, and calls made from any
+        other event loop get a short-lived client of their own.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is get_background_loop().loop:
+            yield await self._get_background_client(loop)
+            return
+        if self._client_loop is not None and self._client_loop is not loop:
+            async with self._new_client() as s3_client:
+                yield s3_client
+            return
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    client_context = self._new_client()
+                    self._client = await client_context.__aenter__()
+                    self._client_context = client_context
+                    self._client_loop = loop
+        yield self._client
+
+    async def _get_background_client(self, loop: asyncio.AbstractEventLoop):
+        if self._background_client_loop is not loop:
+            # The background loop was restarted, the client of the previous one went with it
+            self._background_client = self._background_client_context = None
+            self._background_client_loop = loop
+            self._background_client_lock = asyncio.Lock()
+        if self._background_client is None:
+            async with self._background_client_lock:
+                if self._background_client is None:
+                    client_context = self._new_client()
+                    self._background_client = await client_context.__aenter__()
+                    self._background_client_context = client_context
+        return self._background_client
 
     async def save_file(self, flow_id: str, file_name: str, data: bytes, *, append: bool = False) -> None:
         """Save a file to S3.
@@ -147,42 +209,114 @@ class S3StorageService(StorageService):
 
         try:
             async with self._get_client() as s3_client:
-                put_params: dict[str, Any] = {
-                    "Bucket": self.bucket_name,
-                    "Key": key,
-                    "Body": data,
-                }
-
-                if self.tags:
-                    tag_string = "&".join([f"{k}={v}" for k, v in self.tags.items()])
-                    put_params["Tagging"] = tag_string
-
-                await s3_client.put_object(**put_params)
+                await s3_client.put_object(**self._object_params(key), Body=data)
 
             await logger.ainfo(f"File {file_name} saved successfully to S3: s3://{self.bucket_name}/{key}")
 
         except Exception as e:
-            error_msg = str(e)
-            error_code = None
+            raise self._save_error(e, flow_id, file_name) from e
 
-            if hasattr(e, "response") and isinstance(e.response, dict):
-                error_info = e.response.get("Error", {})
-                error_code = error_info.get("Code")
-                error_msg = error_info.get("Message", str(e))
+    async def save_file_stream(
+        self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes], *, append: bool = False
+    ) -> int:
+        """Save a file to S3 from a stream of chunks using a multipart upload.
 
-            logger.exception(f"Error saving file {file_name} to S3 in flow {flow_id}: {error_msg}")
+        At most one part is buffered in memory. Streams smaller than a part are sent with a single
+        put_object, and a failed multipart upload is aborted so that S3 discards its parts.
 
-            if error_code == "NoSuchBucket":
-                msg = f"S3 bucket '{self.bucket_name}' does not exist"
-                raise FileNotFoundError(msg) from e
-            if error_code == "AccessDenied":
-                msg = "Access denied to S3 bucket. Please check your AWS credentials and bucket permissions"
-                raise PermissionError(msg) from e
-            if error_code == "InvalidAccessKeyId":
-                msg = "Invalid AWS credentials. Please check your AWS access key and secret key"
-                raise PermissionError(msg) from e
-            msg = f"Failed to save file to S3: {error_msg}"
-            raise RuntimeError(msg) from e
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            file_name: The name of the file to be saved
+            chunks: The content of the file
+            append: If True, append to existing file (not supported in S3, will raise error)
+
+        Returns:
+            int: The number of bytes written
+
+        Raises:
+            NotImplementedError: If append=True (not supported in S3)
+        """
+        if append:
+            msg = "Append mode is not supported for S3 storage"
+            raise NotImplementedError(msg)
+
+        key = self.build_full_path(flow_id, file_name)
+        part_size = max(self.multipart_part_size, MIN_MULTIPART_PART_SIZE)
+        buffer = bytearray()
+        written = 0
+        upload_id = None
+        parts: list[dict[str, Any]] = []
+
+        try:
+            async with self._get_client() as s3_client:
+                try:
+                    async for chunk in chunks:
+                        buffer += chunk
+                        written += len(chunk)
+                        while len(buffer) >= part_size:
+                            if upload_id is None:
+                                upload = await s3_client.create_multipart_upload(**self._object_params(key))
+                                upload_id = upload["UploadId"]
+                            parts.append(
+                                await self._upload_part(s3_client, key, upload_id, len(parts) + 1, buffer[:part_size])
+                            )
+                            del buffer[:part_size]
+
+                    if upload_id is None:
+                        await s3_client.put_object(**self._object_params(key), Body=bytes(buffer))
+                    else:
+                        if buffer:
+                            parts.append(await self._upload_part(s3_client, key, upload_id, len(parts) + 1, buffer))
+                        await s3_client.complete_multipart_upload(
+                            Bucket=self.bucket_name, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+                        )
+                except BaseException:
+                    if upload_id is not None:
+                        with contextlib.suppress(Exception):
+                            await s3_client.abort_multipart_upload(Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+                    raise
+
+            await logger.ainfo(
+                f"File {file_name} saved successfully to S3: s3://{self.bucket_name}/{key} "
+                f"({written} bytes in {max(len(parts), 1)} part(s))"
+            )
+        except Exception as e:
+            raise self._save_error(e, flow_id, file_name) from e
+        return written
+
+    def _object_params(self, key: str) -> dict[str, Any]:
+        params: dict[str, Any] = {"Bucket": self.bucket_name, "Key": key}
+        if self.tags:
+            params["Tagging"] = "&".join([f"{k}={v}" for k, v in self.tags.items()])
+        return params
+
+    async def _upload_part(self, s3_client, key: str, upload_id: str, part_number: int, body) -> dict[str, Any]:
+        response = await s3_client.upload_part(
+            Bucket=self.bucket_name, Key=key, UploadId=upload_id, PartNumber=part_number, Body=bytes(body)
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _save_error(self, error: Exception, flow_id: str, file_name: str) -> Exception:
+        """Log a failed save and return the builtin exception to raise for it."""
+        error_msg = str(error)
+        error_code = None
+
+        if hasattr(error, "response") and isinstance(error.response, dict):
+            error_info = error.response.get("Error", {})
+            error_code = error_info.get("Code")
+            error_msg = error_info.get("Message", str(error))
+
+        logger.exception(f"Error saving file {file_name} to S3 in flow {flow_id}: {error_msg}")
+
+        if error_code == "NoSuchBucket":
+            return FileNotFoundError(f"S3 bucket '{self.bucket_name}' does not exist")
+        if error_code == "AccessDenied":
+            return PermissionError(
+                "Access denied to S3 bucket. Please check your AWS credentials and bucket permissions"
+            )
+        if error_code == "InvalidAccessKeyId":
+            return PermissionError("Invalid AWS credentials. Please check your AWS access key and secret key")
+        return RuntimeError(f"Failed to save file to S3: {error_msg}")
 
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from S3.
@@ -216,13 +350,25 @@ class S3StorageService(StorageService):
         else:
             return content
 
-    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = 8192) -> AsyncIterator[bytes]:
-        """Retrieve a file from S3 as a stream.
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        chunk_size: int = 8192,
+        *,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Retrieve a file, or a byte range of it, from S3 as a stream.
+
+        Ranges are fetched with a ranged get_object, so only the requested bytes leave S3.
 
         Args:
             flow_id: The flow/user identifier for namespacing
             file_name: The name of the file to retrieve
             chunk_size: Size of chunks to yield (default: 8192 bytes)
+            start: Offset of the first byte to yield
+            end: Offset of the last byte to yield, inclusive. None reads to the end.
 
         Yields:
             bytes: Chunks of the file content
@@ -233,8 +379,11 @@ class S3StorageService(StorageService):
         key = self.build_full_path(flow_id, file_name)
 
         try:
+            get_params: dict[str, Any] = {"Bucket": self.bucket_name, "Key": key}
+            if start or end is not None:
+                get_params["Range"] = f"bytes={start}-{'' if end is None else end}"
             async with self._get_client() as s3_client:
-                response = await s3_client.get_object(Bucket=self.bucket_name, Key=key)
+                response = await s3_client.get_object(**get_params)
                 body = response["Body"]
 
                 try:
@@ -263,34 +412,46 @@ class S3StorageService(StorageService):
         Returns:
             list[str]: A list of file names (without the prefix)
 
+        Raises:
+            Exception: If there's an error listing files from S3
+        """
+        return [file_name async for page in self.iter_files(flow_id) for file_name in page]
+
+    async def iter_files(self, flow_id: str, *, prefix: str = "", page_size: int = 1000) -> AsyncIterator[list[str]]:
+        """List the files of a flow namespace page by page.
+
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            prefix: Only list the files whose name starts with this prefix
+            page_size: Maximum number of file names per page, at most 1000
+
+        Yields:
+            list[str]: A page of file names (without the namespace prefix)
+
         Raises:
             Exception: If there's an error listing files from S3
         """
         if not isinstance(flow_id, str):
             flow_id = str(flow_id)
 
-        prefix = self.build_full_path(flow_id, "")
+        namespace = self.build_full_path(flow_id, "")
 
         try:
             async with self._get_client() as s3_client:
                 paginator = s3_client.get_paginator("list_objects_v2")
-                files = []
-
-                async for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
-                    if "Contents" in page:
-                        for obj in page["Contents"]:
-                            # Extract just the filename (remove the prefix)
-                            full_key = obj["Key"]
-                            # Remove the flow_id prefix to get just the filename
-                            file_name = full_key[len(prefix) :]
-                            if file_name:  # Skip the directory marker if it exists
-                                files.append(file_name)
+                async for page in paginator.paginate(
+                    Bucket=self.bucket_name,
+                    Prefix=namespace + prefix,
+                    PaginationConfig={"PageSize": page_size},
+                ):
+                    # Skip the directory marker if it exists
+                    files = [obj["Key"][len(namespace) :] for obj in page.get("Contents", [])]
+                    if files := [file_name for file_name in files if file_name]:
+                        yield files
 
         except Exception:
             logger.exception(f"Error listing files in S3 flow {flow_id}")
             raise
-        else:
-            return files
 
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from S3.
@@ -312,6 +473,40 @@ class S3StorageService(StorageService):
             logger.exception(f"Error deleting file {file_name} from S3 in flow {flow_id}")
             raise
 
+    async def delete_files(self, flow_id: str, file_names: Sequence[str]) -> dict[str, OSError]:
+        """Delete files from S3 with one delete_objects request per 1000 files.
+
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            file_names: The names of the files to be deleted
+
+        Returns:
+            dict[str, OSError]: The files S3 could not delete, with the error it reported for each.
+                Missing files count as deleted, as with delete_file.
+        """
+        failures: dict[str, OSError] = {}
+        keys = {self.build_full_path(flow_id, file_name): file_name for file_name in file_names}
+        batches = [list(keys)[i : i + MAX_DELETE_BATCH_SIZE] for i in range(0, len(keys), MAX_DELETE_BATCH_SIZE)]
+
+        try:
+            async with self._get_client() as s3_client:
+                for batch in batches:
+                    response = await s3_client.delete_objects(
+                        Bucket=self.bucket_name,
+                        Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                    )
+                    for error in response.get("Errors", []):
+                        message = f"{error.get('Code')}: {error.get('Message')}"
+                        error_type = PermissionError if error.get("Code") == "AccessDenied" else OSError
+                        failures[keys[error["Key"]]] = error_type(message)
+
+        except Exception:
+            logger.exception(f"Error deleting {len(keys)} files from S3 in flow {flow_id}")
+            raise
+
+        await logger.ainfo(f"Deleted {len(keys) - len(failures)} of {len(keys)} files from S3 in flow {flow_id}")
+        return failures
+
     async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in S3.
 
@@ -344,10 +539,54 @@ class S3StorageService(StorageService):
         else:
             return file_size
 
-    async def teardown(self) -> None:
-        """Perform any cleanup operations when the service is being torn down.
+    async def get_file_version(self, flow_id: str, file_name: str) -> str:
+        """Get the version of a file in S3 from its ETag, size and modification time.
 
-        For S3, we don't need to do anything as aioboto3 handles cleanup
-        via context managers.
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            file_name: The name of the file
+
+        Returns:
+            str: The version of the file
+
+        Raises:
+            FileNotFoundError: If the file does not exist in S3
         """
+        key = self.build_full_path(flow_id, file_name)
+
+        try:
+            async with self._get_client() as s3_client:
+                response = await s3_client.head_object(Bucket=self.bucket_name, Key=key)
+
+        except Exception as e:
+            if hasattr(e, "response") and e.response.get("Error", {}).get("Code") in ["NoSuchKey", "404"]:
+                msg = f"File not found: {file_name}"
+                raise FileNotFoundError(msg) from e
+
+            logger.exception(f"Error getting file version for {file_name} in S3 flow {flow_id}")
+            raise
+        else:
+            return f"{response['ETag']}:{response['ContentLength']}:{response['LastModified'].isoformat()}"
+
+    async def teardown(self) -> None:
+        """Close the shared S3 clients and their connection pools."""
+        client_context, self._client, self._client_context = self._client_context, None, None
+        self._client_loop = None
+        background_context, self._background_client, self._background_client_context = (
+            self._background_client_context,
+            None,
+            None,
+        )
+        background_loop, self._background_client_loop = self._background_client_loop, None
+        if client_context is not None:
+            try:
+                await client_context.__aexit__(None, None, None)
+            except Exception:  # noqa: BLE001
+                logger.warning("Error closing the S3 client", exc_info=True)
+        if background_context is not None and background_loop is not None and background_loop.is_running():
+            closed = asyncio.run_coroutine_threadsafe(background_context.__aexit__(None, None, None), background_loop)
+            try:
+                await asyncio.wait_for(asyncio.wrap_future(closed), timeout=10)
+            except Exception:  # noqa: BLE001
+                logger.warning("Error closing the S3 client of the background loop", exc_info=True)
         logger.info("S3 storage service teardown complete")
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from lfx.log.logger import logger
 from sqlmodel import col, delete, select
 
+from langflow.services.cache.chat_history import get_chat_history_buffer
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
@@ -20,6 +21,7 @@ async def cleanup_orphaned_records() -> None:
     """Clean up all records that reference non-existent flows."""
     from langflow.services.database.models.flow.model import Flow
 
+    messages_deleted = False
     async with session_scope() as session:
         # Create a subquery of existing flow IDs
         flow_ids_subquery = select(Flow.id)
@@ -45,6 +47,8 @@ async def cleanup_orphaned_records() -> None:
 
                     # Delete all orphaned records in a single query
                     await session.exec(delete(table).where(col(table.flow_id).in_(orphaned_flow_ids)))
+                    if table is MessageTable:
+                        messages_deleted = True
 
                     # Clean up any associated storage files
                     storage_service: StorageService = get_storage_service()
@@ -68,6 +72,10 @@ async def cleanup_orphaned_records() -> None:
             except Exception as exc:  # noqa: BLE001
                 logger.error(f"Error cleaning up orphaned records in {table.__name__}: {exc!s}")
 
+    # Only once the deletions are committed, or a read in between could buffer the messages again
+    if messages_deleted:
+        await get_chat_history_buffer().invalidate_all()
+
 
 class CleanupWorker:
     def __init__(self) -> None:
@@ -0,0 +1,163 @@
+"""Thread that calls the tracers of the tracing service off the event loop.
+
+The LangSmith, Langfuse, Phoenix, Opik, LangWatch and Traceloop tracers serialize inputs and outputs,
+and some of them send requests, when a component trace starts or ends. The tracing service used
+to make these calls from a task on the event loop, stalling every other request of the worker.
+``TraceExporter`` queues them instead and calls them, in order, from a dedicated thread.
+
+The queue is bounded. When it is full, a droppable event is discarded under the "drop" policy,
+while under the "block" policy, and for required events, the caller waits for room without
+blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Literal
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+
+# (context of the caller, trace function, its arguments, future of the caller waiting for it)
+_TraceEvent = tuple[contextvars.Context, "Callable[..., Any]", tuple, "asyncio.Future | None"]
+
+
+class TraceExporter:
+    """Calls trace functions on a dedicated thread, in the order they were queued.
+
+    Each function runs in a copy of the context it was queued from, so tracers that read context
+    variables see the same values as on the event loop.
+
+    Attributes:
+        max_queue_size (int): Maximum number of events waiting to be exported.
+        queue_full_policy (str): "drop" or "block", for droppable events queued while the queue is full.
+        exported (int): Events whose trace function was called.
+        failed (int): Events whose trace function raised an error.
+        dropped (int): Events discarded because the queue was full.
+        blocked (int): Events whose caller waited for room in the queue.
+        max_queue_depth (int): Highest number of waiting events observed.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        queue_full_policy: Literal["drop", "block"] = "drop",
+    ) -> None:
+        self.max_queue_size = max(1, max_queue_size)
+        self.queue_full_policy = queue_full_policy
+        self.exported = 0
+        self.failed = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.max_queue_depth = 0
+        self._queue: queue.Queue[_TraceEvent | None] = queue.Queue(maxsize=self.max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be exported."""
+        return self._queue.qsize()
+
+    def is_started(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the export thread, if it is not running."""
+        with self._thread_lock:
+            if self.is_started():
+                return
+            self._thread = threading.Thread(target=self._export_loop, name="langflow-trace-exporter", daemon=True)
+            self._thread.start()
+
+    async def export(self, trace_func: Callable[..., Any], *args: Any, required: bool = False) -> bool:
+        """Queue a call of ``trace_func(*args)`` on the export thread.
+
+        Args:
+            trace_func: The tracer function to call.
+            *args: Its arguments.
+            required: Wait for room in a full queue instead of applying the drop policy.
+
+        Returns:
+            bool: False if the event was dropped.
+        """
+        return await self._put((contextvars.copy_context(), trace_func, args, None), required=required)
+
+    async def run(self, trace_func: Callable[..., Any], *args: Any) -> None:
+        """Call ``trace_func(*args)`` on the export thread, after the events queued before it, and wait for it."""
+        done = asyncio.get_running_loop().create_future()
+        await self._put((contextvars.copy_context(), trace_func, args, done), required=True)
+        await done
+
+    async def _put(self, event: _TraceEvent, *, required: bool) -> bool:
+        if not self.is_started():
+            self.start()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if self.queue_full_policy == "drop" and not required:
+                self.dropped += 1
+                return False
+            self.blocked += 1
+            await asyncio.to_thread(self._queue.put, event)
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return True
+
+    def _export_loop(self) -> None:
+        while (event := self._queue.get()) is not None:
+            self._export(event)
+
+    def _export(self, event: _TraceEvent) -> None:
+        context, trace_func, args, done = event
+        try:
+            context.run(trace_func, *args)
+        except Exception:  # noqa: BLE001
+            self.failed += 1
+            logger.exception("Error processing trace_func")
+        else:
+            self.exported += 1
+        if done is not None:
+            # The loop of the caller may be closed if it stopped waiting
+            with contextlib.suppress(RuntimeError):
+                done.get_loop().call_soon_threadsafe(_resolve, done)
+
+    def stats(self) -> dict[str, int]:
+        """Return the queue depth and export counters."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "max_queue_size": self.max_queue_size,
+            "exported": self.exported,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+        }
+
+    async def stop(self, timeout: float = 10) -> None:
+        """Export the queued events, then stop the thread.
+
+        Gives up after ``timeout`` seconds, leaving the daemon thread to finish on its own.
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        await asyncio.to_thread(self._queue.put, None)
+        await asyncio.to_thread(thread.join, timeout)
+        if thread.is_alive():
+            await logger.awarning(f"Trace exporter did not finish within {timeout}s: {self.stats()}")
+        else:
+            await logger.adebug(f"Trace exporter stopped: {self.stats()}")
+        self._thread = None
+
+
+def _resolve(done: asyncio.Future) -> None:
+    if not done.done():
+        done.set_result(None)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import os
 from collections import defaultdict
 from contextlib import asynccontextmanager
@@ -10,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 from lfx.log.logger import logger
 
 from langflow.services.base import Service
+from langflow.services.tracing.exporter import TraceExporter
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -81,9 +81,7 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
         self.running = False
-        self.worker_task: asyncio.Task | None = None
 
 
 class ComponentTraceContext:
@@ -105,6 +103,7 @@ class ComponentTraceContext:
         self.outputs: dict[str, dict] = defaultdict(dict)
         self.outputs_metadata: dict[str, dict] = defaultdict(dict)
         self.logs: dict[str, list[Log | dict[Any, Any]]] = defaultdict(list)
+        self.exported: bool = False
 
 
 class TracingService(Service):
@@ -119,30 +118,28 @@ class TracingService(Service):
         3. end_tracers: end the trace for a graph run
 
     check context var in public methods.
+
+    The tracers are called from the thread of ``exporter``, shared by all the runs of the service,
+    so their serialization and network calls do not block the event loop.
     """
 
     name = "tracing_service"
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.deactivated = self.settings_service.settings.deactivate_tracing
-
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
-            try:
-                trace_func(*args)
-            except Exception:  # noqa: BLE001
-                await logger.aexception("Error processing trace_func")
-            finally:
-                trace_context.traces_queue.task_done()
+        settings = self.settings_service.settings
+        self.deactivated = settings.deactivate_tracing
+        self.exporter = TraceExporter(
+            max_queue_size=settings.tracing_queue_size,
+            queue_full_policy=settings.tracing_queue_full_policy,
+        )
 
     async def _start(self, trace_context: TraceContext) -> None:
         if trace_context.running or self.deactivated:
             return
         try:
             trace_context.running = True
-            trace_context.worker_task = asyncio.create_task(self._trace_worker(trace_context))
+            self.exporter.start()
         except Exception:  # noqa: BLE001
             await logger.aexception("Error starting tracing service")
 
@@ -251,17 +248,7 @@ class TracingService(Service):
             await logger.adebug(f"Error initializing tracers: {e}")
 
     async def _stop(self, trace_context: TraceContext) -> None:
-        try:
-            trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
-            if trace_context.worker_task:
-                trace_context.worker_task.cancel()
-                trace_context.worker_task = None
-
-        except Exception:  # noqa: BLE001
-            await logger.aexception("Error stopping tracing service")
+        trace_context.running = False
 
     def _end_all_tracers(self, trace_context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
         for tracer in trace_context.tracers.values():
@@ -280,8 +267,8 @@ class TracingService(Service):
     async def end_tracers(self, outputs: dict, error: Exception | None = None) -> None:
         """End the trace for a graph run.
 
-        - stop worker for current trace_context
-        - call end for all the tracers
+        - stop the current trace_context
+        - call end for all the tracers, once the component traces queued before are exported
         """
         if self.deactivated:
             return
@@ -289,7 +276,7 @@ class TracingService(Service):
         if trace_context is None:
             return
         await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        await self.exporter.run(self._end_all_tracers, trace_context, outputs, error)
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -383,18 +370,26 @@ class TracingService(Service):
             yield self
             return
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        component_trace_context.exported = await self.exporter.export(
+            self._start_component_traces, component_trace_context, trace_context
+        )
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            if component_trace_context.exported:
+                await self.exporter.export(
+                    self._end_component_traces, component_trace_context, trace_context, e, required=True
+                )
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            # A trace that was dropped when it started is not ended either
+            if component_trace_context.exported:
+                await self.exporter.export(
+                    self._end_component_traces, component_trace_context, trace_context, None, required=True
+                )
+
+    async def teardown(self) -> None:
+        await self.exporter.stop()
 
     @property
     def project_name(self):
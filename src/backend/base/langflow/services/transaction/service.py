@@ -71,6 +71,12 @@ class TransactionService(Service, TransactionServiceProtocol):
                 flow_id=flow_uuid,
             )
 
+            if getattr(self.settings_service.settings, "buffered_log_writer_enabled", False):
+                from langflow.services.deps import get_buffered_writer_service
+
+                await get_buffered_writer_service().add_transaction(transaction)
+                return
+
             async with session_scope() as session:
                 await crud_log_transaction(session, transaction)
 
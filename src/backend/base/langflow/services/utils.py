@@ -137,6 +137,11 @@ async def teardown_services() -> None:
     service_manager = get_service_manager()
     await service_manager.teardown()
 
+    from langflow.services.database.models.api_key.cache import get_api_key_cache
+
+    # The cached users belong to the database that was just torn down
+    get_api_key_cache().clear()
+
 
 def initialize_settings_service() -> None:
     """Initialize the settings manager."""
@@ -227,6 +232,7 @@ def register_all_service_factories() -> None:
     from lfx.services.settings import factory as settings_factory
 
     from langflow.services.auth import factory as auth_factory
+    from langflow.services.buffered_writer import factory as buffered_writer_factory
     from langflow.services.cache import factory as cache_factory
     from langflow.services.chat import factory as chat_factory
     from langflow.services.database import factory as database_factory
@@ -253,6 +259,7 @@ def register_all_service_factories() -> None:
     service_manager.register_factory(telemetry_factory.TelemetryServiceFactory())
     service_manager.register_factory(tracing_factory.TracingServiceFactory())
     service_manager.register_factory(transaction_factory.TransactionServiceFactory())
+    service_manager.register_factory(buffered_writer_factory.BufferedWriterServiceFactory())
     service_manager.register_factory(state_factory.StateServiceFactory())
     service_manager.register_factory(job_queue_factory.JobQueueServiceFactory())
     service_manager.register_factory(task_factory.TaskServiceFactory())
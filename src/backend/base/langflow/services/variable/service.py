@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from lfx.log.logger import logger
+from lfx.services.variable.resolver import invalidate_user_variables
+from sqlalchemy import event
 from sqlmodel import select
 
 from langflow.services.auth import utils as auth_utils
@@ -21,6 +23,14 @@ if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+def _invalidate_user_variables_on_commit(session: AsyncSession, user_id: UUID | str) -> None:
+    """Drop the user's cached decrypted variables once ``session`` commits.
+
+    Invalidating before the commit would let a concurrent run cache the old values again.
+    """
+    event.listen(session.sync_session, "after_commit", lambda _: invalidate_user_variables(user_id), once=True)
+
+
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
@@ -300,6 +310,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        _invalidate_user_variables_on_commit(session, user_id)
         return variable
 
     async def update_variable_fields(
@@ -331,6 +342,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.flush()
         await session.refresh(db_variable)
+        _invalidate_user_variables_on_commit(session, user_id)
         return db_variable
 
     async def delete_variable(
@@ -345,6 +357,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{name} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        _invalidate_user_variables_on_commit(session, user_id)
 
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
         stmt = select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)
@@ -353,6 +366,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        _invalidate_user_variables_on_commit(session, user_id)
 
     async def create_variable(
         self,
@@ -388,4 +402,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        _invalidate_user_variables_on_commit(session, user_id)
         return variable
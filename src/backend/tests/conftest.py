@@ -1,6 +1,7 @@
 import asyncio
 import json
 import shutil
+import socket
 
 # we need to import tmpdir
 import tempfile
@@ -295,6 +296,29 @@ def distributed_client_fixture(
     monkeypatch.undo()
 
 
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    """Run a moto S3 server for the module. aiobotocore cannot use moto's in-process mocks."""
+    from moto.server import ThreadedMotoServer
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def aws_environment(monkeypatch, s3_endpoint):
+    """Point AWS clients at the moto S3 server with dummy credentials."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ENDPOINT_URL_S3", s3_endpoint)
+
+
 def get_graph(type_="basic"):
     """Get a graph from a json file."""
     if type_ == "basic":
@@ -73,6 +73,8 @@ def mock_settings_service():
     else:
         settings_service.settings.object_storage_tags = default_tags
 
+    settings_service.settings.object_storage_max_pool_connections = 10
+
     return settings_service
 
 
@@ -0,0 +1,70 @@
+"""Authentication overhead per request for API keys, at high request rates.
+
+Each request opens a session and checks its API key, as ``api_key_security`` does. Before the
+cache, every check selected the key with its user and wrote the incremented usage counters back,
+which SQLite serializes across concurrent requests. With the cache, repeated checks of a key are
+answered from memory and its uses are added up and written by a single update per flush.
+"""
+
+import asyncio
+import statistics
+import time
+
+from langflow.services.database.models.api_key.cache import get_api_key_cache, get_api_key_usage_tracker
+from langflow.services.database.models.api_key.crud import check_key, create_api_key
+from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate
+from langflow.services.deps import session_scope
+
+KEYS = 20
+CONCURRENCY = 64
+REQUESTS = 2_000
+
+
+async def _authenticate(api_key: str) -> float:
+    start = time.perf_counter()
+    async with session_scope() as session:
+        assert await check_key(session, api_key) is not None
+    return (time.perf_counter() - start) * 1000
+
+
+async def _run(api_keys: list[str]) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def request(index: int) -> float:
+        async with semaphore:
+            return await _authenticate(api_keys[index % len(api_keys)])
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(request(index) for index in range(REQUESTS)))
+    return latencies, REQUESTS / (time.perf_counter() - start)
+
+
+async def test_api_key_auth_overhead(client, active_user, monkeypatch):  # noqa: ARG001
+    async with session_scope() as session:
+        api_keys = [
+            (await create_api_key(session, ApiKeyCreate(name=f"key {index}"), active_user.id)).api_key
+            for index in range(KEYS)
+        ]
+
+    cache = get_api_key_cache()
+    tracker = get_api_key_usage_tracker()
+    with monkeypatch.context() as patched:
+        patched.setattr(cache, "ttl", 0)
+        patched.setattr(tracker, "flush_interval", 0)
+        uncached, uncached_rps = await _run(api_keys)
+
+    cache.clear()
+    cached, cached_rps = await _run(api_keys)
+    await tracker.flush()
+
+    async with session_scope() as session:
+        total_uses = sum(api_key.total_uses for api_key in (await session.exec(ApiKey.__table__.select())).all())
+    assert total_uses == 2 * REQUESTS
+
+    print(f"\n{REQUESTS} API key checks, {CONCURRENCY} concurrent, ms per check")  # noqa: T201
+    for name, latencies, rps in (("database", uncached, uncached_rps), ("cached", cached, cached_rps)):
+        p50 = statistics.median(latencies)
+        p99 = statistics.quantiles(latencies, n=100)[-1]
+        print(f"  {name:>8}: p50={p50:.2f} p99={p99:.2f} ({rps:.0f} checks/s)")  # noqa: T201
+    print(f"  cache: {cache.stats()}")  # noqa: T201
+    assert statistics.median(cached) < statistics.median(uncached)
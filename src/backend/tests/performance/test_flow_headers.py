@@ -0,0 +1,82 @@
+"""Latency of listing flow headers for a user with 5,000 flows.
+
+The previous path loaded every flow with its data and built the headers from the models. The
+projected path selects the header columns, and the data of components only. A client that sends
+back the ETag of an unchanged listing gets a 304 response after a single aggregate query.
+"""
+
+import statistics
+import time
+
+from langflow.api.utils import validate_is_component
+from langflow.api.v1.flows import _read_flow_headers
+from langflow.services.database.models.flow.model import Flow, FlowHeader
+from langflow.services.deps import session_scope
+from langflow.utils.compression import compress_response
+from sqlmodel import select
+
+FLOWS = 5_000
+COMPONENT_EVERY = 10
+NODES_PER_FLOW = 20
+ROUNDS = 5
+
+
+def _flow_data(index: int) -> dict:
+    nodes = [
+        {
+            "id": f"node-{index}-{node}",
+            "data": {"node": {"template": {"code": {"value": "x = 1\n" * 100}, "text": {"value": "text " * 50}}}},
+        }
+        for node in range(1 if index % COMPONENT_EVERY == 0 else NODES_PER_FLOW)
+    ]
+    return {"nodes": nodes, "edges": []}
+
+
+async def _old_headers(session, user_id):
+    flows = (await session.exec(select(Flow).where(Flow.user_id == user_id))).all()
+    flows = validate_is_component(flows)
+    return [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
+
+
+async def _timed(read) -> list[float]:
+    latencies = []
+    for _ in range(ROUNDS):
+        async with session_scope() as session:
+            start = time.perf_counter()
+            compress_response(await read(session))
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def test_flow_header_listing(client, logged_in_headers, active_user):
+    async with session_scope() as session:
+        session.add_all(
+            Flow(
+                name=f"flow {index}",
+                data=_flow_data(index),
+                is_component=index % COMPONENT_EVERY == 0,
+                user_id=active_user.id,
+            )
+            for index in range(FLOWS)
+        )
+
+    full = await _timed(lambda session: _old_headers(session, active_user.id))
+    projected = await _timed(lambda session: _read_flow_headers(session, [Flow.user_id == active_user.id]))
+
+    params = {"get_all": True, "header_flows": True}
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    assert len(response.json()) >= FLOWS
+    not_modified = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        response = await client.get(
+            "api/v1/flows/", params=params, headers={**logged_in_headers, "If-None-Match": response.headers["ETag"]}
+        )
+        not_modified.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 304
+
+    print(f"\n{FLOWS} flows, ms per listing")  # noqa: T201
+    print(f"  full rows:   p50={statistics.median(full):.1f}")  # noqa: T201
+    print(f"  projected:   p50={statistics.median(projected):.1f}")  # noqa: T201
+    print(f"  304 request: p50={statistics.median(not_modified):.1f}")  # noqa: T201
+    assert statistics.median(projected) < statistics.median(full)
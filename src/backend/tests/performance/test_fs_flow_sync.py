@@ -0,0 +1,97 @@
+"""Cost of keeping 500 file system flows in sync, per polling interval and per change.
+
+The previous sync loaded every flow stored on the file system, with its data, and checked each
+file one by one on every interval. The new sync reads the flow IDs and paths only, and with
+``watchfiles`` it is told which files changed instead of checking them. The last measurement is
+the time from writing a flow file to the flow being updated in the database by the watcher.
+"""
+
+import asyncio
+import statistics
+import time
+
+import anyio
+import orjson
+from langflow.initial_setup.setup import _load_fs_flow_paths, _sync_flow_files, _watch_flow_files
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.deps import get_storage_service, session_scope
+from sqlmodel import col, select
+from watchfiles import awatch
+
+FLOWS = 500
+NODES_PER_FLOW = 20
+ROUNDS = 5
+
+
+def _flow_data(index: int) -> dict:
+    nodes = [{"id": f"node-{index}-{node}", "data": {"code": "x = 1\n" * 100}} for node in range(NODES_PER_FLOW)]
+    return {"nodes": nodes, "edges": []}
+
+
+async def _previous_poll() -> None:
+    """One interval of the previous sync, for files that did not change."""
+    async with session_scope() as session:
+        flows = (await session.exec(select(Flow).where(col(Flow.fs_path).is_not(None)))).all()
+        for flow in flows:
+            path = anyio.Path(flow.fs_path)
+            if await path.exists():
+                await path.stat()
+
+
+async def _timed(poll) -> float:
+    latencies = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await poll()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+async def _flow_name(flow_id) -> str:
+    async with session_scope() as session:
+        return (await session.get(Flow, flow_id)).name
+
+
+async def test_fs_flow_sync(active_user, tmp_path):
+    flow_ids = []
+    async with session_scope() as session:
+        for index in range(FLOWS):
+            path = tmp_path / f"flow-{index}.json"
+            flow = Flow(name=f"fs flow {index}", data=_flow_data(index), fs_path=str(path), user_id=active_user.id)
+            path.write_bytes(orjson.dumps({"name": flow.name, "data": flow.data}))
+            session.add(flow)
+            flow_ids.append(flow.id)
+
+    data_dir = get_storage_service().data_dir
+    flow_paths = await _load_fs_flow_paths(data_dir)
+    signatures: dict[str, tuple[int, int]] = {}
+    await _sync_flow_files(list(flow_paths), flow_paths, signatures)
+
+    async def poll() -> None:
+        paths = await _load_fs_flow_paths(data_dir)
+        await _sync_flow_files(list(paths), paths, signatures)
+
+    previous_ms = await _timed(_previous_poll)
+    poll_ms = await _timed(poll)
+    watch_ms = await _timed(lambda: _load_fs_flow_paths(data_dir))
+
+    watcher = asyncio.create_task(_watch_flow_files(awatch, data_dir, flow_paths, signatures, interval=10))
+    try:
+        await asyncio.sleep(0.5)
+        path = tmp_path / "flow-0.json"
+        start = time.perf_counter()
+        path.write_bytes(orjson.dumps({"name": "renamed flow", "data": _flow_data(0)}))
+        while await _flow_name(flow_ids[0]) != "renamed flow":
+            assert time.perf_counter() - start < 10, "the watcher did not sync the change"
+            await asyncio.sleep(0.01)
+        change_ms = (time.perf_counter() - start) * 1000
+    finally:
+        watcher.cancel()
+
+    print(f"\n{FLOWS} flows stored on the file system, ms")  # noqa: T201
+    print(f"  previous sync, per interval:  {previous_ms:.1f}")  # noqa: T201
+    print(f"  polling sync, per interval:   {poll_ms:.1f}")  # noqa: T201
+    print(f"  watching sync, per interval:  {watch_ms:.1f}")  # noqa: T201
+    print(f"  watching sync, change synced: {change_ms:.1f}")  # noqa: T201
+    assert poll_ms < previous_ms
+    assert watch_ms < poll_ms
@@ -0,0 +1,122 @@
+"""Size and latency of caching a graph as a run state versus pickling it.
+
+Runs a chain of components to completion and stores the graph through ChatService
+with AsyncDiskCache and RedisCache, once with the current pickle path and once as
+a run state. The Redis client is replaced by an in-memory store so the numbers
+only include serialization, not network time.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import RedisCache
+from langflow.services.chat.service import ChatService
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+
+N_COMPONENTS = 30
+ROUNDS = 20
+
+
+class InMemoryRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    async def setex(self, key, _expiration, value) -> bool:
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def exists(self, key) -> int:
+        return int(key in self.values)
+
+
+def _redis_cache() -> RedisCache:
+    cache = RedisCache.__new__(RedisCache)
+    cache._client = InMemoryRedis()
+    cache.expiration_time = 3600
+    return cache
+
+
+def _chat_service(cache_service, serialization: str) -> ChatService:
+    settings_service = MagicMock()
+    settings_service.settings.graph_cache_serialization = serialization
+    with (
+        patch("langflow.services.chat.service.get_cache_service", return_value=cache_service),
+        patch("langflow.services.chat.service.get_settings_service", return_value=settings_service),
+    ):
+        return ChatService()
+
+
+async def _built_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(input_value="hello " * 50)
+    previous = chat_input.message_response
+    for i in range(N_COMPONENTS):
+        component = CombineTextComponent(_id=f"combine-{i}")
+        component.set(text1=previous, text2=f"step {i}", delimiter=" ")
+        previous = component.combine_texts
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=previous)
+    graph = Graph.from_payload(Graph(chat_input, chat_output).dump(), flow_id="flow")
+    graph.prepare()
+    while graph._run_queue:
+        await graph.astep()
+    return graph
+
+
+async def _measure(chat_service: ChatService, graph: Graph, stored_size) -> dict[str, float] | str:
+    try:
+        await chat_service.set_cache("flow", graph)
+    except Exception as exc:
+        return f"fails: {type(exc).__name__}"
+    await chat_service.get_cache("flow")  # Warm up the prepared topology
+
+    set_time = get_time = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await chat_service.set_cache("flow", graph)
+        set_time += time.perf_counter() - start
+        start = time.perf_counter()
+        cached = await chat_service.get_cache("flow")
+        get_time += time.perf_counter() - start
+    assert isinstance(cached["result"], Graph)
+    return {
+        "size_kb": stored_size() / 1024,
+        "set_ms": set_time / ROUNDS * 1000,
+        "get_ms": get_time / ROUNDS * 1000,
+    }
+
+
+@pytest.mark.parametrize("backend", ["disk", "redis"])
+async def test_run_state_versus_pickle(tmp_path, backend):
+    graph = await _built_graph()
+    results = {}
+    for serialization in ("pickle", "run_state"):
+        if backend == "disk":
+            cache_service = AsyncDiskCache(cache_dir=str(tmp_path / serialization))
+
+            def stored_size(cache_service=cache_service):
+                return len(cache_service.cache.get("flow")["value"])
+        else:
+            cache_service = _redis_cache()
+
+            def stored_size(cache_service=cache_service):
+                return len(cache_service._client.values["flow"])
+
+        chat_service = _chat_service(cache_service, serialization)
+        results[serialization] = await _measure(chat_service, graph, stored_size)
+
+    print(f"\n{backend} cache, {N_COMPONENTS + 2} built vertices")  # noqa: T201
+    for serialization, result in results.items():
+        print(f"  {serialization:>9}: {result}")  # noqa: T201
+
+    run_state = results["run_state"]
+    assert isinstance(run_state, dict)
+    if isinstance(results["pickle"], dict):
+        assert run_state["size_kb"] < results["pickle"]["size_kb"]
@@ -0,0 +1,145 @@
+"""Cost of knowledge base ingestion with the hash index versus reading back the whole collection.
+
+The first benchmark ingests 100k rows, half of them already stored, into a knowledge base that
+holds 1M documents. It times only the duplicate check, which is where the previous path spent
+its time: comparing every row hash to a list of the 1M stored hashes. That path is timed on a
+sample of rows and extrapolated, since running it on every row takes most of an hour. The new path
+loads the hash index file and processes the rows column by column.
+
+The second benchmark stores rows in a real Chroma collection with an embedding model that takes
+a fixed time per batch, once with ``Chroma.add_texts`` embedding the batches one after another
+and once with the component embedding several batches at a time.
+"""
+
+import hashlib
+import time
+
+import pandas as pd
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from lfx.base.knowledge_bases.hash_index import HASH_INDEX_FILE_NAME, KnowledgeBaseHashIndex
+from lfx.components.files_and_knowledge.ingestion import KnowledgeIngestionComponent
+
+EXISTING_DOCUMENTS = 1_000_000
+NEW_ROWS = 100_000
+LIST_LOOKUP_SAMPLE = 200
+
+CHROMA_ROWS = 2_000
+CHUNK_SIZE = 250
+EMBEDDING_LATENCY = 0.5
+
+CONFIG = [
+    {"column_name": "text", "vectorize": True, "identifier": False},
+    {"column_name": "title", "vectorize": False, "identifier": False},
+    {"column_name": "category", "vectorize": False, "identifier": False},
+]
+
+
+class StoredCollection:
+    """Stands in for a Chroma collection whose hash index is already on disk."""
+
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    def count(self) -> int:
+        return self._count
+
+
+class SlowEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that take ``EMBEDDING_LATENCY`` seconds per batch of ``CHUNK_SIZE`` texts."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(EMBEDDING_LATENCY * -(-len(texts) // CHUNK_SIZE))
+        return super().embed_documents(texts)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _rows(start: int, count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "text": [f"document {index}" for index in range(start, start + count)],
+            "title": [f"title {index}" for index in range(start, start + count)],
+            "category": [f"category {index % 10}" for index in range(start, start + count)],
+        }
+    )
+
+
+def _component(kb_path, **kwargs) -> KnowledgeIngestionComponent:
+    component = KnowledgeIngestionComponent(knowledge_base=kb_path.name, allow_duplicates=False, **kwargs)
+    component._cached_kb_path = kb_path
+    component.log = lambda *_args, **_kwargs: None
+    return component
+
+
+def _list_lookup(df_source: pd.DataFrame, id_list: list[str]) -> int:
+    """The duplicate check of the previous ingestion path."""
+    kept = 0
+    for _, row in df_source.iterrows():
+        if _text_hash(str(row["text"])) not in id_list:
+            kept += 1
+    return kept
+
+
+def test_duplicate_check_against_one_million_documents(tmp_path):
+    kb_path = tmp_path / "benchmark_kb"
+    kb_path.mkdir()
+    existing_hashes = [_text_hash(f"document {index}") for index in range(EXISTING_DOCUMENTS)]
+    (kb_path / HASH_INDEX_FILE_NAME).write_text("".join(f"{value}\n" for value in existing_hashes))
+    # Half of the new rows are already stored
+    df_source = _rows(EXISTING_DOCUMENTS - NEW_ROWS // 2, NEW_ROWS)
+
+    sample = df_source.iloc[: NEW_ROWS // 2].sample(LIST_LOOKUP_SAMPLE // 2, random_state=0)
+    sample = pd.concat([sample, df_source.iloc[NEW_ROWS // 2 :].head(LIST_LOOKUP_SAMPLE // 2)])
+    start = time.perf_counter()
+    kept_in_sample = _list_lookup(sample, existing_hashes)
+    list_seconds = (time.perf_counter() - start) * NEW_ROWS / LIST_LOOKUP_SAMPLE
+
+    start = time.perf_counter()
+    hash_index = KnowledgeBaseHashIndex.load(kb_path, StoredCollection(EXISTING_DOCUMENTS))
+    load_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    texts, _ = _component(kb_path)._prepare_documents(df_source, CONFIG, hash_index.hashes)
+    prepare_seconds = time.perf_counter() - start
+
+    print(f"\n{NEW_ROWS} rows into a knowledge base of {EXISTING_DOCUMENTS} documents")  # noqa: T201
+    print(f"  list lookup per row (extrapolated): {list_seconds:.1f} s")  # noqa: T201
+    print(f"  hash index load:                    {load_seconds:.2f} s")  # noqa: T201
+    print(f"  column-wise processing:             {prepare_seconds:.2f} s")  # noqa: T201
+    assert kept_in_sample == LIST_LOOKUP_SAMPLE // 2
+    assert len(texts) == NEW_ROWS // 2
+    assert load_seconds + prepare_seconds < list_seconds
+
+
+async def test_concurrent_embedding_batches(tmp_path):
+    df_source = _rows(0, CHROMA_ROWS)
+
+    sequential_path = tmp_path / "sequential_kb"
+    chroma = Chroma(
+        persist_directory=str(sequential_path),
+        embedding_function=SlowEmbeddings(size=32),
+        collection_name=sequential_path.name,
+    )
+    start = time.perf_counter()
+    chroma.add_texts(
+        df_source["text"].tolist(),
+        metadatas=df_source[["title", "category"]].to_dict("records"),
+    )
+    sequential_seconds = time.perf_counter() - start
+
+    batched_path = tmp_path / "batched_kb"
+    batched_path.mkdir()
+    component = _component(batched_path, chunk_size=CHUNK_SIZE)
+    component._build_embeddings = lambda *_args: SlowEmbeddings(size=32)
+    start = time.perf_counter()
+    await component._create_vector_store(df_source, CONFIG, "model", None)
+    batched_seconds = time.perf_counter() - start
+
+    collection = Chroma(persist_directory=str(batched_path), collection_name=batched_path.name)._collection
+    print(f"\n{CHROMA_ROWS} rows, batches of {CHUNK_SIZE}, {EMBEDDING_LATENCY * 1000:.0f} ms per batch")  # noqa: T201
+    print(f"  sequential batches: {sequential_seconds:.2f} s")  # noqa: T201
+    print(f"  concurrent batches: {batched_seconds:.2f} s")  # noqa: T201
+    assert collection.count() == CHROMA_ROWS
+    assert batched_seconds < sequential_seconds
@@ -0,0 +1,68 @@
+"""Latency of repeated Knowledge Retrieval queries with and without the vector store cache.
+
+Every query of the uncached run clears the cache first, so it looks up the user, reads and
+decrypts the embedding metadata, builds the embedding model and opens the Chroma collection,
+as each query did before the cache. Building the embedding model is simulated with
+a fixed delay, since creating a provider client or loading a local model is what dominates it
+in practice and needs network access or model files here.
+"""
+
+import json
+import statistics
+import time
+from unittest.mock import patch
+
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
+from lfx.components.files_and_knowledge.retrieval import KnowledgeRetrievalComponent
+
+DOCUMENTS = 2_000
+QUERIES = 50
+EMBEDDING_BUILD_SECONDS = 0.02
+
+
+def _build_embeddings(_metadata):
+    time.sleep(EMBEDDING_BUILD_SECONDS)
+    return DeterministicFakeEmbedding(size=64)
+
+
+async def _query_latencies(component, *, cached: bool) -> list[float]:
+    latencies = []
+    for index in range(QUERIES):
+        if not cached:
+            get_knowledge_base_cache().clear()
+        component.search_query = f"document {index}"
+        start = time.perf_counter()
+        await component.retrieve_data()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def test_repeated_queries_reuse_the_vector_store(active_user, tmp_path):
+    kb_path = tmp_path / active_user.username / "benchmark_kb"
+    kb_path.mkdir(parents=True)
+    (kb_path / "embedding_metadata.json").write_text(
+        json.dumps({"embedding_provider": "HuggingFace", "embedding_model": "benchmark", "api_key": None})
+    )
+    Chroma(
+        persist_directory=str(kb_path),
+        embedding_function=DeterministicFakeEmbedding(size=64),
+        collection_name=kb_path.name,
+    ).add_texts([f"document {index}" for index in range(DOCUMENTS)])
+
+    component = KnowledgeRetrievalComponent(
+        knowledge_base=kb_path.name, top_k=5, include_embeddings=False, _user_id=active_user.id
+    )
+    component._build_embeddings = _build_embeddings
+    with patch("lfx.components.files_and_knowledge.retrieval._KNOWLEDGE_BASES_ROOT_PATH", tmp_path):
+        uncached = await _query_latencies(component, cached=False)
+        get_knowledge_base_cache().clear()
+        cached = await _query_latencies(component, cached=True)
+
+    print(f"\n{QUERIES} queries over {DOCUMENTS} documents, ms per query")  # noqa: T201
+    for name, latencies in (("uncached", uncached), ("cached", cached[1:])):
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"  {name:>8}: p50={p50:.2f} p95={p95:.2f}")  # noqa: T201
+    assert statistics.median(cached[1:]) < statistics.median(uncached)
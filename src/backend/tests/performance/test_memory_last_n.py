@@ -0,0 +1,97 @@
+"""Time for a memory component to read the last messages of a long chat session.
+
+The Message History component used to fetch up to 10,000 messages of the session, build a
+``Message`` from each one and keep the last N in Python. It now asks the database for the last N
+messages, and with ``chat_history_cache_size`` set, reads them from the buffer of recent messages
+that storing a message keeps up to date in the cache service.
+"""
+
+import itertools
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.memory import aadd_messagetables, aget_messages, astore_message
+from langflow.schema.message import Message
+from langflow.services.cache.chat_history import get_chat_history_buffer
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.deps import session_scope
+
+MESSAGES = 12_000
+LAST_N = 100
+READS = 20
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# Stored timestamps have a precision of one second, so every message gets its own second
+SECONDS = itertools.count()
+
+
+async def _create_session(session_id: str) -> None:
+    async with session_scope() as session:
+        await aadd_messagetables(
+            [
+                MessageTable(
+                    text=f"Message {index} " + "text " * 40,
+                    sender="User" if index % 2 else "Machine",
+                    sender_name="User" if index % 2 else "AI",
+                    session_id=session_id,
+                    timestamp=START + timedelta(seconds=next(SECONDS)),
+                    files=[],
+                    category="message",
+                )
+                for index in range(MESSAGES)
+            ],
+            session,
+        )
+
+
+async def _read_sliced(session_id: str) -> list[Message]:
+    # Past 10,000 messages this misses the newest ones, which the benchmark does not check for
+    stored = await aget_messages(session_id=session_id, limit=10000, order="ASC")
+    return stored[-LAST_N:]
+
+
+async def _read_last_n(session_id: str) -> list[Message]:
+    return (await aget_messages(session_id=session_id, limit=LAST_N, order="DESC"))[::-1]
+
+
+async def _median_ms(read, session_id: str) -> float:
+    timings = []
+    for index in range(READS):
+        start = time.perf_counter()
+        messages = await read(session_id)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert len(messages) == LAST_N
+        # Each turn of the chat stores a message, which the next read must see
+        stored = await astore_message(
+            Message(
+                text=f"Turn {read.__name__} {index}",
+                sender="User",
+                sender_name="User",
+                session_id=session_id,
+                timestamp=START + timedelta(seconds=next(SECONDS)),
+            )
+        )
+        if read is not _read_sliced:
+            assert (await read(session_id))[-1].id == stored[0].id
+    return statistics.median(timings)
+
+
+@pytest.mark.usefixtures("client")
+async def test_reading_last_messages_of_a_long_session(monkeypatch):
+    session_id = "long_session"
+    await _create_session(session_id)
+    buffer = get_chat_history_buffer()
+
+    sliced_ms = await _median_ms(_read_sliced, session_id)
+    last_n_ms = await _median_ms(_read_last_n, session_id)
+    monkeypatch.setattr(buffer, "capacity", LAST_N)
+    buffered_ms = await _median_ms(_read_last_n, session_id)
+
+    print(f"\nLast {LAST_N} of {MESSAGES} messages, median ms per read")  # noqa: T201
+    print(f"  10,000 rows, sliced: {sliced_ms:.2f}")  # noqa: T201
+    print(f"  last N in SQL:       {last_n_ms:.2f}")  # noqa: T201
+    print(f"  buffered:            {buffered_ms:.2f}")  # noqa: T201
+    print(f"  buffer: {buffer.stats()}")  # noqa: T201
+    assert last_n_ms < sliced_ms
+    assert buffered_ms < last_n_ms
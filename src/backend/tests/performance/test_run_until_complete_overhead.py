@@ -0,0 +1,115 @@
+"""Overhead of ``run_until_complete`` for sync code called while an event loop is running.
+
+Components such as the flow tool, the file readers and the memory helpers call it from sync code
+in loops. It used to start a thread pool and a new event loop for each coroutine and close both
+afterwards. It now submits the coroutine to a long-lived background loop. The first benchmark runs
+a coroutine that does nothing but yield to the loop, so only the overhead is measured. The second
+one sends a request to a local echo server: a connection belongs to the loop that opened it, so
+with a loop per call every request opens a new one, while the background loop keeps it open.
+"""
+
+import asyncio
+import concurrent.futures
+import socketserver
+import statistics
+import threading
+import time
+
+from lfx.utils.async_helpers import run_until_complete
+
+CALLS = 2_000
+REQUESTS = 500
+
+
+class _EchoHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            self.wfile.write(line)
+
+
+def _run_in_new_thread_and_loop(coro):
+    def run_in_new_loop():
+        new_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        try:
+            return new_loop.run_until_complete(coro)
+        finally:
+            new_loop.close()
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        return executor.submit(run_in_new_loop).result()
+
+
+async def _yield():
+    await asyncio.sleep(0)
+    return True
+
+
+async def _request(address, connection=None):
+    reader, writer = connection or await asyncio.open_connection(*address)
+    writer.write(b"ping\n")
+    await writer.drain()
+    assert await reader.readline() == b"ping\n"
+    if connection is None:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _open_connection(address):
+    return await asyncio.open_connection(*address)
+
+
+async def _close_connection(connection) -> None:
+    connection[1].close()
+    await connection[1].wait_closed()
+
+
+def _timings_us(run) -> list[float]:
+    timings = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        assert run(_yield())
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+async def test_run_until_complete_overhead():
+    per_call = _timings_us(_run_in_new_thread_and_loop)
+    shared = _timings_us(run_until_complete)
+
+    print(f"\n{CALLS} calls of run_until_complete from a running loop, us per call")  # noqa: T201
+    for name, timings in (("thread and loop per call", per_call), ("background loop", shared)):
+        p50 = statistics.median(timings)
+        p99 = statistics.quantiles(timings, n=100)[-1]
+        print(f"  {name:>24}: p50={p50:.0f} p99={p99:.0f}")  # noqa: T201
+    assert statistics.median(shared) < statistics.median(per_call)
+
+
+async def test_run_until_complete_with_a_reused_connection():
+    with socketserver.ThreadingTCPServer(("127.0.0.1", 0), _EchoHandler) as server:
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        address = server.server_address
+
+        per_call = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            _run_in_new_thread_and_loop(_request(address))
+            per_call.append((time.perf_counter() - start) * 1_000_000)
+
+        # The connection is opened once on the background loop and used by every later call
+        connection = run_until_complete(_open_connection(address))
+        shared = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            run_until_complete(_request(address, connection))
+            shared.append((time.perf_counter() - start) * 1_000_000)
+        run_until_complete(_close_connection(connection))
+        server.shutdown()
+
+    print(f"\n{REQUESTS} requests to a local server through run_until_complete, us per request")  # noqa: T201
+    for name, timings in (("connection per call", per_call), ("reused connection", shared)):
+        p50 = statistics.median(timings)
+        p99 = statistics.quantiles(timings, n=100)[-1]
+        print(f"  {name:>19}: p50={p50:.0f} p99={p99:.0f}")  # noqa: T201
+    assert statistics.median(shared) < statistics.median(per_call)
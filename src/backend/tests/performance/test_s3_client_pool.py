@@ -0,0 +1,111 @@
+"""Latency of small-file S3 operations with a shared client versus a client per call.
+
+Runs against a local moto S3 server. ``PerCallClientS3StorageService`` opens a new client
+for every operation, as S3StorageService did before it kept one client per service.
+Deleting through delete_files is compared with one delete_file call per file.
+"""
+
+import asyncio
+import contextlib
+import time
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("aioboto3")
+
+from langflow.services.storage.s3 import S3StorageService
+
+BUCKET = "langflow-benchmark"
+N_FILES = 200
+CONCURRENCY = 16
+
+
+class PerCallClientS3StorageService(S3StorageService):
+    @contextlib.asynccontextmanager
+    async def _get_client(self):
+        async with self._new_client() as s3_client:
+            yield s3_client
+
+
+@pytest.fixture
+def settings_service(aws_environment, tmp_path):  # noqa: ARG001
+    settings_service = Mock()
+    settings_service.settings.config_dir = str(tmp_path)
+    settings_service.settings.object_storage_bucket_name = BUCKET
+    settings_service.settings.object_storage_prefix = "files"
+    settings_service.settings.object_storage_tags = {}
+    settings_service.settings.object_storage_max_pool_connections = CONCURRENCY
+    return settings_service
+
+
+async def _timed(operation, file_names) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def run(file_name):
+        async with semaphore:
+            await operation(file_name)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(file_name) for file_name in file_names))
+    return time.perf_counter() - start
+
+
+async def _measure(service: S3StorageService, flow_id: str) -> dict[str, float]:
+    file_names = [f"file_{index}.txt" for index in range(N_FILES)]
+    results = {
+        "save": await _timed(lambda name: service.save_file(flow_id, name, b"x" * 1024), file_names),
+        "get": await _timed(lambda name: service.get_file(flow_id, name), file_names),
+        "size": await _timed(lambda name: service.get_file_size(flow_id, name), file_names),
+        "delete": await _timed(lambda name: service.delete_file(flow_id, name), file_names),
+    }
+    return {operation: elapsed / N_FILES * 1000 for operation, elapsed in results.items()}
+
+
+async def test_shared_client_versus_client_per_call(settings_service):
+    shared = S3StorageService(Mock(), settings_service)
+    per_call = PerCallClientS3StorageService(Mock(), settings_service)
+    async with shared._get_client() as s3_client:
+        with contextlib.suppress(s3_client.exceptions.BucketAlreadyOwnedByYou):
+            await s3_client.create_bucket(Bucket=BUCKET)
+
+    try:
+        results = {
+            "client per call": await _measure(per_call, "per_call"),
+            "shared client": await _measure(shared, "shared"),
+        }
+    finally:
+        await shared.teardown()
+
+    print(f"\n{N_FILES} files of 1 KiB, {CONCURRENCY} concurrent operations, ms per operation")  # noqa: T201
+    for name, result in results.items():
+        print(f"  {name:>15}: " + ", ".join(f"{op}={ms:.2f}" for op, ms in result.items()))  # noqa: T201
+    assert sum(results["shared client"].values()) < sum(results["client per call"].values())
+
+
+async def test_batched_delete_versus_delete_per_file(settings_service):
+    service = S3StorageService(Mock(), settings_service)
+    file_names = [f"file_{index}.txt" for index in range(N_FILES)]
+    async with service._get_client() as s3_client:
+        with contextlib.suppress(s3_client.exceptions.BucketAlreadyOwnedByYou):
+            await s3_client.create_bucket(Bucket=BUCKET)
+
+    try:
+        timings = {}
+        for flow_id in ("per_file", "batched"):
+            await _timed(lambda name, flow_id=flow_id: service.save_file(flow_id, name, b"x"), file_names)
+        start = time.perf_counter()
+        for file_name in file_names:
+            await service.delete_file("per_file", file_name)
+        timings["delete_file per file"] = time.perf_counter() - start
+        start = time.perf_counter()
+        failures = await service.delete_files("batched", file_names)
+        timings["delete_files"] = time.perf_counter() - start
+    finally:
+        await service.teardown()
+
+    print(f"\nDeleting {N_FILES} files")  # noqa: T201
+    for name, elapsed in timings.items():
+        print(f"  {name:>20}: {elapsed * 1000:.1f} ms")  # noqa: T201
+    assert failures == {}
+    assert timings["delete_files"] < timings["delete_file per file"]
@@ -0,0 +1,42 @@
+"""Startup time spent on starter projects, re-creating all of them versus reconciling them.
+
+Re-creating deletes every starter project, updates each one to the latest component versions and
+adds it back, as every start did before. Reconciling fingerprints the projects and their
+components and leaves the unchanged ones alone, which is the common case when a worker restarts.
+"""
+
+import statistics
+import time
+
+import pytest
+from langflow.initial_setup.setup import create_or_update_starter_projects
+from langflow.interface.components import get_and_cache_all_types_dict
+from langflow.services.deps import get_settings_service
+
+ROUNDS = 3
+
+
+async def _startup_seconds(all_types_dict) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await create_or_update_starter_projects(all_types_dict)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.mark.usefixtures("client")
+async def test_reconciling_starter_projects(monkeypatch):
+    settings = get_settings_service().settings
+    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+
+    monkeypatch.setattr(settings, "reconcile_starter_projects", False)
+    recreate_seconds = await _startup_seconds(all_types_dict)
+    monkeypatch.setattr(settings, "reconcile_starter_projects", True)
+    await create_or_update_starter_projects(all_types_dict)  # Records the fingerprints
+    reconcile_seconds = await _startup_seconds(all_types_dict)
+
+    print("\nStarter projects at startup")  # noqa: T201
+    print(f"  re-create all: {recreate_seconds:.2f} s")  # noqa: T201
+    print(f"  reconcile:     {reconcile_seconds:.2f} s")  # noqa: T201
+    assert reconcile_seconds < recreate_seconds
@@ -0,0 +1,117 @@
+"""Event loop lag while flows run with tracing disabled, with tracers called on the loop, and with the exporter.
+
+Every tracer of the benchmark serializes the inputs and outputs of each component trace and
+then waits 2 ms, standing in for the request a tracing backend would send. Before the exporter,
+the tracing service called them from a task on the event loop. A probe task measures how late
+its 1 ms sleeps wake up while 16 flows of 10 components each run concurrently.
+"""
+
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+from langflow.services.tracing.base import BaseTracer
+from langflow.services.tracing.exporter import TraceExporter
+from langflow.services.tracing.service import TracingService
+from lfx.services.settings.base import Settings
+from lfx.services.settings.service import SettingsService
+
+RUNS = 16
+COMPONENTS = 10
+EXPORT_SECONDS = 0.002
+PROBE_SECONDS = 0.001
+TRACERS = ("langsmith", "langwatch", "langfuse", "arize_phoenix", "opik", "traceloop")
+
+
+class SlowTracer(BaseTracer):
+    def __init__(self, trace_name, trace_type, project_name, trace_id, user_id=None, session_id=None):  # noqa: ARG002
+        self.trace_id = trace_id
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    def _export(self, payload) -> None:
+        json.dumps(payload, default=str)
+        time.sleep(EXPORT_SECONDS)
+
+    def add_trace(self, trace_id, trace_name, trace_type, inputs, metadata=None, vertex=None) -> None:  # noqa: ARG002
+        self._export(inputs)
+
+    def end_trace(self, trace_id, trace_name, outputs=None, error=None, logs=()) -> None:  # noqa: ARG002
+        self._export(outputs)
+
+    def end(self, inputs, outputs, error=None, metadata=None) -> None:  # noqa: ARG002
+        self._export(outputs)
+
+    def get_langchain_callback(self):
+        return None
+
+
+async def _export_on_loop(_exporter, trace_func, *args, **_kwargs):
+    trace_func(*args)
+    return True
+
+
+async def _run_flow(tracing_service: TracingService, index: int) -> None:
+    await tracing_service.start_tracers(uuid.uuid4(), f"run {index}", "user", "session", "benchmark")
+    for component_index in range(COMPONENTS):
+        component = MagicMock()
+        component.get_vertex.return_value = None
+        component.trace_type = "chain"
+        trace_name = f"component {component_index}"
+        inputs = {"input_value": "text " * 200}
+        async with tracing_service.trace_component(component, trace_name, inputs) as traced:
+            await asyncio.sleep(0.005)
+            traced.set_outputs(trace_name, {"message": "text " * 200})
+    await tracing_service.end_tracers({})
+
+
+async def _loop_lag(*, deactivated: bool) -> list[float]:
+    settings = Settings()
+    settings.deactivate_tracing = deactivated
+    tracing_service = TracingService(SettingsService(settings, MagicMock()))
+    lags = []
+    done = False
+
+    async def probe() -> None:
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(PROBE_SECONDS)
+            lags.append((time.perf_counter() - start - PROBE_SECONDS) * 1000)
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.gather(*(_run_flow(tracing_service, index) for index in range(RUNS)))
+    done = True
+    await probe_task
+    await tracing_service.teardown()
+    return lags
+
+
+async def test_event_loop_lag_with_tracing():
+    getters = [
+        patch(f"langflow.services.tracing.service._get_{name}_tracer", return_value=SlowTracer) for name in TRACERS
+    ]
+    for getter in getters:
+        getter.start()
+    try:
+        disabled = await _loop_lag(deactivated=True)
+        with (
+            patch.object(TraceExporter, "export", _export_on_loop),
+            patch.object(TraceExporter, "run", _export_on_loop),
+        ):
+            on_loop = await _loop_lag(deactivated=False)
+        exporter = await _loop_lag(deactivated=False)
+    finally:
+        for getter in getters:
+            getter.stop()
+
+    print(f"\nEvent loop lag, ms, {RUNS} concurrent flows of {COMPONENTS} components, {len(TRACERS)} tracers")  # noqa: T201
+    for name, lags in (("tracing disabled", disabled), ("tracers on loop", on_loop), ("trace exporter", exporter)):
+        p50 = statistics.median(lags)
+        p99 = statistics.quantiles(lags, n=100)[-1]
+        print(f"  {name:>16}: p50={p50:.2f} p99={p99:.2f} max={max(lags):.2f}")  # noqa: T201
+    assert statistics.quantiles(exporter, n=100)[-1] < statistics.quantiles(on_loop, n=100)[-1]
@@ -23,6 +23,7 @@ from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.deps import session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
+from sqlmodel import select
 
 
 @pytest.fixture
@@ -1142,3 +1143,147 @@ class TestMessageResponseFromMessage:
 
         with pytest.raises(ValueError, match="required fields"):
             MessageResponse.from_message(message)
+
+
+@pytest.fixture
+def chat_history_buffer(monkeypatch):
+    from langflow.services.cache.chat_history import get_chat_history_buffer
+
+    buffer = get_chat_history_buffer()
+    monkeypatch.setattr(buffer, "capacity", 5)
+    return buffer
+
+
+def _chat(session_id: str, count: int, context_id: str | None = None, start: int = 0) -> list[Message]:
+    return [
+        Message(
+            text=f"Message {index}",
+            sender="User",
+            sender_name="User",
+            session_id=session_id,
+            context_id=context_id,
+            timestamp=datetime(2024, 1, 1, 0, 0, index, tzinfo=timezone.utc),
+        )
+        for index in range(start, start + count)
+    ]
+
+
+@pytest.mark.usefixtures("client")
+async def test_chat_history_buffer_answers_recent_reads(chat_history_buffer):
+    session_id = "buffered_session"
+    await aadd_messages(_chat(session_id, 8))
+
+    messages = await aget_messages(session_id=session_id, order="DESC", limit=3)
+    assert [m.text for m in messages] == ["Message 7", "Message 6", "Message 5"]
+    misses = chat_history_buffer.misses
+    messages = await aget_messages(session_id=session_id, order="DESC", limit=5)
+    assert [m.text for m in messages] == [f"Message {index}" for index in range(7, 2, -1)]
+    assert chat_history_buffer.misses == misses
+
+    # The buffer only holds the newest messages, older ones and longer reads come from the database
+    messages = await aget_messages(session_id=session_id, order="ASC", limit=2)
+    assert [m.text for m in messages] == ["Message 0", "Message 1"]
+    messages = await aget_messages(session_id=session_id, order="DESC", limit=8)
+    assert len(messages) == 8
+
+
+@pytest.mark.usefixtures("client")
+async def test_chat_history_buffer_follows_writes(chat_history_buffer):
+    session_id = "buffered_session_writes"
+    await aadd_messages(_chat(session_id, 3, context_id="context"))
+    assert [m.text for m in await aget_messages(session_id=session_id, order="ASC")] == [
+        "Message 0",
+        "Message 1",
+        "Message 2",
+    ]
+    hits = chat_history_buffer.hits
+
+    stored = await astore_message(_chat(session_id, 1, context_id="context", start=3)[0])
+    messages = await aget_messages(session_id=session_id, context_id="context", order="DESC", limit=2)
+    assert [m.text for m in messages] == ["Message 3", "Message 2"]
+    messages = await aget_messages(session_id=session_id, order="DESC", limit=1)
+    assert messages[0].id == stored[0].id
+
+    stored[0].text = "Edited"
+    await aupdate_messages(stored[0])
+    messages = await aget_messages(session_id=session_id, order="DESC", limit=1)
+    assert messages[0].text == "Edited"
+
+    stored[0].error = True
+    await aupdate_messages(stored[0])
+    messages = await aget_messages(session_id=session_id, order="DESC", limit=1)
+    assert messages[0].text == "Message 2"
+    assert chat_history_buffer.hits > hits
+
+    await adelete_messages(session_id)
+    assert await aget_messages(session_id=session_id, order="DESC", limit=2) == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_chat_history_buffer_matches_database(chat_history_buffer, monkeypatch):
+    session_id = "buffered_session_compare"
+    await aadd_messages(_chat(session_id, 4, context_id="first") + _chat(session_id, 4, context_id="second", start=4))
+
+    reads = [
+        {"order": "DESC", "limit": 3},
+        {"order": "ASC", "limit": None},
+        {"context_id": "first", "order": "DESC", "limit": 2},
+        {"context_id": "second", "order": "ASC", "limit": None},
+    ]
+    buffered = [await aget_messages(session_id=session_id, **read) for read in reads]
+    monkeypatch.setattr(chat_history_buffer, "capacity", 0)
+    stored = [await aget_messages(session_id=session_id, **read) for read in reads]
+    assert [[m.model_dump() for m in messages] for messages in buffered] == [
+        [m.model_dump() for m in messages] for messages in stored
+    ]
+
+    monkeypatch.setattr(chat_history_buffer, "capacity", 5)
+    await adelete_messages(context_id="first")
+    messages = await aget_messages(session_id=session_id, order="ASC")
+    assert [m.context_id for m in messages] == ["second"] * 4
+
+
+async def test_chat_history_buffer_is_invalidated_after_a_flow_is_deleted(
+    client, logged_in_headers, chat_history_buffer, monkeypatch
+):
+    response = await client.post("api/v1/flows/", json={"name": "buffered_flow", "data": {}}, headers=logged_in_headers)
+    flow_id = response.json()["id"]
+    session_id = "buffered_session_deleted_flow"
+    messages = _chat(session_id, 3)
+    for message in messages:
+        message.flow_id = flow_id
+    await aadd_messages(messages)
+    assert len(await aget_messages(session_id=session_id, order="DESC", limit=2)) == 2
+
+    # Another session must no longer see the messages when the buffers are invalidated
+    visible_at_invalidation = []
+    invalidate_all = chat_history_buffer.invalidate_all
+
+    async def invalidate_all_after_checking():
+        async with session_scope() as session:
+            stmt = select(MessageTable).where(MessageTable.session_id == session_id)
+            visible_at_invalidation.append(len((await session.exec(stmt)).all()))
+        await invalidate_all()
+
+    monkeypatch.setattr(chat_history_buffer, "invalidate_all", invalidate_all_after_checking)
+    response = await client.delete(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+
+    assert response.status_code == 200
+    assert visible_at_invalidation == [0]
+    assert await aget_messages(session_id=session_id, order="DESC", limit=2) == []
+
+
+@pytest.mark.usefixtures("client")
+@pytest.mark.parametrize("order", ["Ascending", "Descending"])
+async def test_memory_component_retrieves_last_messages(order):
+    from lfx.components.models_and_agents.memory import MemoryComponent
+
+    session_id = f"memory_component_{order}"
+    await aadd_messages(_chat(session_id, 6))
+    component = MemoryComponent()
+    component.set(mode="Retrieve", session_id=session_id, n_messages=3, order=order)
+
+    messages = await component.retrieve_messages()
+
+    texts = ["Message 3", "Message 4", "Message 5"]
+    assert [m.text for m in messages] == (texts if order == "Ascending" else texts[::-1])
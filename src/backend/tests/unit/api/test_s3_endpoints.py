@@ -20,6 +20,17 @@ from fastapi import HTTPException
 from langflow.services.storage.s3 import S3StorageService
 
 
+async def stream_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def missing_file_stream(**_):
+    msg = "File not found in S3"
+    raise FileNotFoundError(msg)
+    yield  # pragma: no cover
+
+
 class TestS3FileEndpoints:
     """Test file API endpoints with S3 storage mock."""
 
@@ -31,8 +42,9 @@ class TestS3FileEndpoints:
         """
         service = MagicMock(spec=S3StorageService)
         service.get_file = AsyncMock(return_value=b"test file content")
-        service.get_file_stream = MagicMock(return_value=iter([b"chunk1", b"chunk2", b"chunk3"]))
+        service.get_file_stream = MagicMock(side_effect=lambda **_: stream_chunks(b"test file ", b"content"))
         service.save_file = AsyncMock()
+        service.save_file_stream = AsyncMock()
         service.delete_file = AsyncMock()
         service.get_file_size = AsyncMock(return_value=1024)
         return service
@@ -75,7 +87,9 @@ class TestS3FileEndpoints:
                 )
 
                 # API extracts "document.pdf" from "user_123/subfolder/document.pdf" (last segment only)
-                mock_storage_service.get_file.assert_called_once_with(flow_id="user_123", file_name="document.pdf")
+                mock_storage_service.get_file_stream.assert_called_once_with(
+                    flow_id="user_123", file_name="document.pdf"
+                )
 
     @pytest.mark.asyncio
     async def test_download_file_returns_streaming_response(self, mock_storage_service, mock_settings):
@@ -184,7 +198,7 @@ class TestS3FileEndpoints:
     async def test_storage_error_converted_to_http_exception(self, mock_storage_service, mock_settings):
         """Test that storage FileNotFoundError is converted to HTTPException with 404 status."""
         # Mock storage service to raise FileNotFoundError
-        mock_storage_service.get_file.side_effect = FileNotFoundError("File not found in S3")
+        mock_storage_service.get_file_stream.side_effect = missing_file_stream
 
         with (
             patch("langflow.services.deps.get_storage_service", return_value=mock_storage_service),
@@ -229,14 +243,25 @@ class TestS3FileEndpoints:
             mock_file = MagicMock()
             mock_file.filename = "upload.txt"
             mock_file.size = 1024
-            mock_file.read = AsyncMock(return_value=b"file content")
+            mock_file.read = AsyncMock(side_effect=[b"file ", b"content", b""])
+            saved = {}
+
+            async def save_file_stream(*, flow_id, file_name, chunks, append):
+                saved.update(flow_id=flow_id, file_name=file_name, append=append)
+                saved["data"] = b"".join([chunk async for chunk in chunks])
+
+            mock_storage_service.save_file_stream.side_effect = save_file_stream
 
             with patch("langflow.api.v2.files.upload_user_file"):
                 from langflow.api.v2.files import save_file_routine
 
                 await save_file_routine(mock_file, mock_storage_service, mock_user, file_name="upload.txt")
 
-                # Verify storage service was called
-                mock_storage_service.save_file.assert_called_once_with(
-                    flow_id="user_123", file_name="upload.txt", data=b"file content", append=False
-                )
+                # Verify the upload was streamed to the storage service
+                mock_storage_service.save_file.assert_not_called()
+                assert saved == {
+                    "flow_id": "user_123",
+                    "file_name": "upload.txt",
+                    "append": False,
+                    "data": b"file content",
+                }
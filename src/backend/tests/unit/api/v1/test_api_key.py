@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from fastapi import status
 from httpx import AsyncClient
 
@@ -125,3 +127,56 @@ async def test_delete_api_key_route_unauthorized(client: AsyncClient, logged_in_
         user = await session.get(User, user2.id)
         if user:
             await session.delete(user)
+
+
+async def test_deleted_api_key_is_rejected_at_once(client: AsyncClient, logged_in_headers):
+    response = await client.post("api/v1/api_key/", json={"name": "cached"}, headers=logged_in_headers)
+    api_key = response.json()
+    api_key_headers = {"x-api-key": api_key["api_key"]}
+    client.cookies.clear()  # Authenticate with the API key, not the login cookie
+
+    # The second request is authenticated from the cache
+    for _ in range(2):
+        response = await client.get("api/v1/users/whoami", headers=api_key_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    response = await client.get("api/v1/users/whoami", headers=api_key_headers)
+    assert response.status_code in {status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN}
+
+
+async def test_api_key_of_deactivated_user_is_rejected_at_once(
+    client: AsyncClient, logged_in_headers, logged_in_headers_super_user, active_user
+):
+    response = await client.post("api/v1/api_key/", json={"name": "cached"}, headers=logged_in_headers)
+    api_key_headers = {"x-api-key": response.json()["api_key"]}
+    client.cookies.clear()  # Authenticate with the API key, not the login cookie
+    response = await client.get("api/v1/users/whoami", headers=api_key_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.patch(
+        f"api/v1/users/{active_user.id}", json={"is_active": False}, headers=logged_in_headers_super_user
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.get("api/v1/users/whoami", headers=api_key_headers)
+    assert response.status_code in {status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN}
+
+
+async def test_api_key_uses_are_written_in_batches(client: AsyncClient, logged_in_headers):
+    from langflow.services.database.models.api_key.cache import get_api_key_usage_tracker
+
+    response = await client.post("api/v1/api_key/", json={"name": "counted"}, headers=logged_in_headers)
+    api_key = response.json()
+    client.cookies.clear()  # Authenticate with the API key, not the login cookie
+    for _ in range(3):
+        response = await client.get("api/v1/users/whoami", headers={"x-api-key": api_key["api_key"]})
+        assert response.status_code == status.HTTP_200_OK
+
+    tracker = get_api_key_usage_tracker()
+    assert tracker.pending[UUID(api_key["id"])][0] == 3
+    assert await tracker.flush() >= 3
+
+    response = await client.get("api/v1/api_key/", headers=logged_in_headers)
+    (listed,) = [key for key in response.json()["api_keys"] if key["id"] == api_key["id"]]
+    assert listed["total_uses"] == 3
+    assert listed["last_used_at"] is not None
@@ -59,6 +59,72 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flow_headers_only_include_component_data(client: AsyncClient, logged_in_headers):
+    data = {"nodes": [{"id": "node"}], "edges": []}
+    for name, is_component in (("header flow", False), ("header component", True)):
+        response = await client.post(
+            "api/v1/flows/",
+            json={"name": name, "data": data, "is_component": is_component},
+            headers=logged_in_headers,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client.get(
+        "api/v1/flows/", params={"get_all": True, "header_flows": True}, headers=logged_in_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    headers = {header["name"]: header for header in response.json()}
+    assert headers["header flow"]["data"] is None
+    assert headers["header component"]["data"] == data
+    assert "user_id" not in headers["header flow"]
+
+
+async def test_read_flow_headers_not_modified(client: AsyncClient, logged_in_headers):
+    params = {"get_all": True, "header_flows": True}
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    etag = response.headers["ETag"]
+
+    response = await client.get("api/v1/flows/", params=params, headers={**logged_in_headers, "If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    create_response = await client.post(
+        "api/v1/flows/", json={"name": "new flow", "data": {"nodes": [], "edges": []}}, headers=logged_in_headers
+    )
+    response = await client.get("api/v1/flows/", params=params, headers={**logged_in_headers, "If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert create_response.json()["id"] in {header["id"] for header in response.json()}
+
+
+
+async def test_read_flow_headers_etag_follows_mcp_settings(client: AsyncClient, logged_in_headers):
+    from langflow.services.database.models.flow.model import Flow
+    from langflow.services.deps import session_scope
+
+    params = {"get_all": True, "header_flows": True}
+    create_response = await client.post(
+        "api/v1/flows/", json={"name": "mcp flow", "data": {"nodes": [], "edges": []}}, headers=logged_in_headers
+    )
+    flow_id = uuid.UUID(create_response.json()["id"])
+    etag = (await client.get("api/v1/flows/", params=params, headers=logged_in_headers)).headers["ETag"]
+
+    async with session_scope() as session:
+        flow = await session.get(Flow, flow_id)
+        flow.mcp_enabled = True
+        flow.action_name = "mcp_flow_action"
+        session.add(flow)
+
+    response = await client.get("api/v1/flows/", params=params, headers={**logged_in_headers, "If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    headers = {header["id"]: header for header in response.json()}
+    assert headers[str(flow_id)]["action_name"] == "mcp_flow_action"
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
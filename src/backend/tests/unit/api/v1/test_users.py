@@ -96,3 +96,26 @@ async def test_delete_user(client: AsyncClient, logged_in_headers_super_user):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(result, dict), "The result must be a dictionary"
     assert "detail" in result, "The result must have an 'detail' key"
+
+
+async def test_renaming_or_deleting_a_user_forgets_its_knowledge_base_name(
+    client: AsyncClient, logged_in_headers_super_user
+):
+    from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
+
+    cache = get_knowledge_base_cache()
+    basic_case = {"username": "kb_user", "password": "string"}
+    response_ = await client.post("api/v1/users/", json=basic_case, headers=logged_in_headers_super_user)
+    id_ = response_.json()["id"]
+    cache.set_username(id_, "kb_user")
+
+    basic_case["username"] = "kb_user_renamed"
+    await client.patch(f"api/v1/users/{id_}", json=basic_case, headers=logged_in_headers_super_user)
+
+    assert cache.get_username(id_) is None
+
+    cache.set_username(id_, "kb_user_renamed")
+    response = await client.delete(f"api/v1/users/{id_}", headers=logged_in_headers_super_user)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert cache.get_username(id_) is None
@@ -5,6 +5,7 @@ import os
 import tempfile
 import uuid
 from contextlib import suppress
+from functools import partial
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -24,6 +25,7 @@ from langflow.main import create_app
 from langflow.services.auth.utils import get_password_hash
 from langflow.services.database.models.api_key.model import ApiKey, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User, UserRead
+from langflow.services.storage.service import StorageService
 from lfx.services.deps import session_scope
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
@@ -168,6 +170,48 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_file_range(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("digits.txt", b"0123456789")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_id = response.json()["id"]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+    assert response.headers["content-length"] == "4"
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.content == b"789"
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=10-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */10"
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.content == b"0123456789"
+
+
+async def test_upload_large_file_is_streamed(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    content = bytes(range(256)) * 10_000  # Larger than one upload chunk
+
+    response = await files_client.post("api/v2/files", files={"file": ("large.bin", content)}, headers=headers)
+    assert response.status_code == 201
+    assert response.json()["size"] == len(content)
+
+    response = await files_client.get(f"api/v2/files/{response.json()['id']}", headers=headers)
+    assert response.content == content
+
+
 async def test_download_file_not_found(files_client, files_created_api_key):
     """Test that downloading a non-existent file returns 404 error."""
     headers = {"x-api-key": files_created_api_key.api_key}
@@ -1091,6 +1135,8 @@ class TestStorageFailureHandling:
 
         mock_storage_service = AsyncMock()
         mock_storage_service.delete_file = AsyncMock(side_effect=mock_delete_file)
+        # Batch deletes go through the default delete_files, which calls delete_file per file
+        mock_storage_service.delete_files = partial(StorageService.delete_files, mock_storage_service)
 
         result = await delete_files_batch(
             file_ids=file_ids,
@@ -1139,6 +1185,7 @@ class TestStorageFailureHandling:
 
         mock_storage_service = AsyncMock()
         mock_storage_service.delete_file = AsyncMock()
+        mock_storage_service.delete_files = partial(StorageService.delete_files, mock_storage_service)
 
         result = await delete_all_files(
             current_user=mock_current_user,
@@ -1184,6 +1231,7 @@ class TestStorageFailureHandling:
 
         mock_storage_service = AsyncMock()
         mock_storage_service.delete_file = AsyncMock(side_effect=mock_delete_file)
+        mock_storage_service.delete_files = partial(StorageService.delete_files, mock_storage_service)
 
         result = await delete_all_files(
             current_user=mock_current_user,
@@ -1221,6 +1269,7 @@ class TestStorageFailureHandling:
 
         mock_storage_service = AsyncMock()
         mock_storage_service.delete_file = AsyncMock()
+        mock_storage_service.delete_files = partial(StorageService.delete_files, mock_storage_service)
 
         result = await delete_files_batch(
             file_ids=file_ids,
@@ -1268,6 +1317,7 @@ class TestStorageFailureHandling:
 
         mock_storage_service = AsyncMock()
         mock_storage_service.delete_file = AsyncMock(side_effect=mock_delete_file)
+        mock_storage_service.delete_files = partial(StorageService.delete_files, mock_storage_service)
 
         result = await delete_files_batch(
             file_ids=file_ids,
@@ -26,6 +26,11 @@ class FakeStorageService:  # Minimal stub for storage interactions
         else:
             self._store[key] = data
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks, *, append: bool = False):
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data, append=append)
+        return len(data)
+
     async def get_file_size(self, flow_id: str, file_name: str):
         return len(self._store.get(f"{flow_id}/{file_name}", b""))
 
@@ -0,0 +1,79 @@
+"""Tests for the persisted knowledge base hash index."""
+
+import uuid
+
+import pytest
+from lfx.base.knowledge_bases.hash_index import HASH_INDEX_FILE_NAME, KnowledgeBaseHashIndex
+
+chromadb = pytest.importorskip("chromadb")
+
+
+@pytest.fixture
+def collection():
+    client = chromadb.EphemeralClient()
+    name = f"kb-{uuid.uuid4().hex}"
+    yield client.get_or_create_collection(name=name, embedding_function=None)
+    client.delete_collection(name)
+
+
+def add_documents(collection, hashes):
+    collection.add(
+        ids=[str(uuid.uuid4()) for _ in hashes],
+        embeddings=[[0.1, 0.2] for _ in hashes],
+        documents=["text" for _ in hashes],
+        metadatas=[{"_id": value} if value else {"source": "manual"} for value in hashes],
+    )
+
+
+def test_missing_index_is_built_from_the_collection(collection, tmp_path):
+    add_documents(collection, ["a", "b", "b"])
+
+    index = KnowledgeBaseHashIndex.load(tmp_path, collection, page_size=2)
+
+    assert index.hashes == {"a", "b"}
+    assert index.documents == 3
+    assert (tmp_path / HASH_INDEX_FILE_NAME).read_text().split() == ["a", "b", "b"]
+
+
+def test_up_to_date_index_is_read_from_disk(collection, tmp_path):
+    add_documents(collection, ["a", "b"])
+    KnowledgeBaseHashIndex.load(tmp_path, collection)
+    (tmp_path / HASH_INDEX_FILE_NAME).write_text("x\ny\n")
+
+    index = KnowledgeBaseHashIndex.load(tmp_path, collection)
+
+    # The file accounts for every document, so the collection is not read again
+    assert index.hashes == {"x", "y"}
+
+
+def test_stale_index_is_rebuilt(collection, tmp_path):
+    add_documents(collection, ["a"])
+    KnowledgeBaseHashIndex.load(tmp_path, collection)
+    add_documents(collection, ["b"])
+
+    index = KnowledgeBaseHashIndex.load(tmp_path, collection)
+
+    assert index.hashes == {"a", "b"}
+    assert index.documents == 2
+
+
+def test_added_hashes_are_appended(collection, tmp_path):
+    add_documents(collection, ["a"])
+    index = KnowledgeBaseHashIndex.load(tmp_path, collection)
+
+    add_documents(collection, ["b", "c"])
+    index.add(["b", "c"])
+
+    assert "b" in index
+    assert len(index) == 3
+    assert KnowledgeBaseHashIndex.load(tmp_path, collection).hashes == {"a", "b", "c"}
+
+
+def test_documents_without_a_hash_still_count(collection, tmp_path):
+    add_documents(collection, ["a", None])
+
+    index = KnowledgeBaseHashIndex.load(tmp_path, collection)
+
+    assert index.hashes == {"a"}
+    assert index.documents == 2
+    assert KnowledgeBaseHashIndex.load(tmp_path, collection).documents == 2
@@ -0,0 +1,101 @@
+"""Tests for the process-wide knowledge base vector store cache."""
+
+import json
+
+import pytest
+from lfx.base.knowledge_bases.vector_store_cache import KnowledgeBaseCache, get_knowledge_base_cache
+
+
+@pytest.fixture
+def kb_path(tmp_path):
+    path = tmp_path / "user" / "kb"
+    path.mkdir(parents=True)
+    (path / "embedding_metadata.json").write_text(json.dumps({"embedding_model": "model-a"}))
+    return path
+
+
+def test_stores_are_reused_for_the_same_fingerprint(kb_path):
+    cache = KnowledgeBaseCache()
+    fingerprint = cache.metadata_fingerprint(kb_path)
+    store = object()
+
+    assert cache.get(kb_path, fingerprint) is None
+    cache.put(kb_path, fingerprint, store)
+
+    assert cache.get(kb_path, fingerprint) is store
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_fingerprint_follows_the_metadata_and_api_key(kb_path, tmp_path):
+    cache = KnowledgeBaseCache()
+    fingerprint = cache.metadata_fingerprint(kb_path)
+
+    assert cache.metadata_fingerprint(kb_path, "runtime-key") != fingerprint
+    (kb_path / "embedding_metadata.json").write_text(json.dumps({"embedding_model": "model-b"}))
+    assert cache.metadata_fingerprint(kb_path) != fingerprint
+    assert cache.metadata_fingerprint(tmp_path / "missing") is None
+
+
+def test_new_fingerprint_replaces_the_old_store(kb_path):
+    cache = KnowledgeBaseCache()
+    cache.put(kb_path, "old", object())
+    cache.put(kb_path, "new", object())
+
+    assert cache.get(kb_path, "old") is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_invalidate_drops_the_stores_of_a_knowledge_base(kb_path, tmp_path):
+    cache = KnowledgeBaseCache()
+    other_path = tmp_path / "user" / "other"
+    cache.put(kb_path, "fingerprint", object())
+    cache.put(other_path, "fingerprint", object())
+
+    assert cache.invalidate(kb_path) == 1
+
+    assert cache.get(kb_path, "fingerprint") is None
+    assert cache.get(other_path, "fingerprint") is not None
+
+
+def test_invalidate_username_forgets_the_user_name():
+    cache = KnowledgeBaseCache()
+    cache.set_username("user-id", "alice")
+    cache.set_username("other-id", "bob")
+
+    cache.invalidate_username("user-id")
+
+    assert cache.get_username("user-id") is None
+    assert cache.get_username("other-id") == "bob"
+
+
+def test_least_recently_used_stores_are_evicted(tmp_path):
+    cache = KnowledgeBaseCache(max_entries=2)
+    cache.put(tmp_path / "a", "fingerprint", "a")
+    cache.put(tmp_path / "b", "fingerprint", "b")
+    cache.get(tmp_path / "a", "fingerprint")
+    cache.put(tmp_path / "c", "fingerprint", "c")
+
+    assert cache.get(tmp_path / "b", "fingerprint") is None
+    assert cache.get(tmp_path / "a", "fingerprint") == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_idle_stores_and_usernames_expire(tmp_path, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("lfx.base.knowledge_bases.vector_store_cache.time.monotonic", lambda: now)
+    cache = KnowledgeBaseCache(idle_timeout=60)
+    cache.put(tmp_path / "a", "fingerprint", "a")
+    cache.set_username("user-id", "alice")
+
+    now += 30
+    assert cache.get(tmp_path / "a", "fingerprint") == "a"
+    assert cache.get_username("user-id") == "alice"
+
+    now += 61
+    assert cache.get(tmp_path / "a", "fingerprint") is None
+    assert cache.get_username("user-id") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_get_knowledge_base_cache_returns_one_cache():
+    assert get_knowledge_base_cache() is get_knowledge_base_cache()
@@ -7,6 +7,7 @@ from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from lfx.base.data.parse_cache import ParseCache
 from lfx.components.files_and_knowledge.file import FileComponent
 from lfx.components.files_and_knowledge.save_file import SaveToFileComponent
 from lfx.components.langchain_utilities.csv_agent import CSVAgentComponent
@@ -50,6 +51,7 @@ class TestS3CompatibleComponents:
         """Mock S3 settings."""
         settings = MagicMock()
         settings.settings.storage_type = "s3"
+        settings.settings.file_parse_cache_max_mb = 0
         return settings
 
     @pytest.fixture
@@ -57,6 +59,7 @@ class TestS3CompatibleComponents:
         """Mock local settings."""
         settings = MagicMock()
         settings.settings.storage_type = "local"
+        settings.settings.file_parse_cache_max_mb = 0
         return settings
 
     @pytest.fixture
@@ -240,6 +243,33 @@ class TestS3CompatibleComponents:
             assert result is not None
             mock_storage_service.get_file.assert_called_with("user_123", "large_file.csv")
 
+    def test_parse_cache_hits_do_not_download_s3_files(self, s3_settings, mock_storage_service, tmp_path):
+        """Test that the parse cache keys S3 files on their version instead of downloading them."""
+        mock_storage_service.get_file.return_value = b"csv,content\n1,2"
+        mock_storage_service.get_file_version.return_value = '"etag-1":15:2024-01-01T00:00:00+00:00'
+        cache = ParseCache(tmp_path / "parse_cache", max_bytes=1024 * 1024)
+
+        def load():
+            component = FileComponent()
+            component.path = "user_123/data.csv"
+            return component.load_files()
+
+        with (
+            mock_s3_environment(s3_settings, mock_storage_service),
+            patch("lfx.base.data.base_file.get_parse_cache", return_value=cache),
+        ):
+            first = load()
+            downloads = mock_storage_service.get_file.call_count
+            second = load()
+
+            assert second.equals(first)
+            assert mock_storage_service.get_file.call_count == downloads
+
+            mock_storage_service.get_file_version.return_value = '"etag-2":15:2024-01-02T00:00:00+00:00'
+            load()
+
+            assert mock_storage_service.get_file.call_count > downloads
+
     def test_s3_error_handling(self, s3_settings, mock_storage_service):
         """Test error handling with S3 operations."""
         mock_storage_service.get_file.side_effect = FileNotFoundError("File not found")
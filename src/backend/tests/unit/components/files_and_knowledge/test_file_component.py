@@ -1,5 +1,6 @@
 import json
 import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -143,6 +144,91 @@ class TestFileComponentDynamicOutputs:
         assert result.data["doc"] == mock_result["doc"]
         assert result.data["file_path"] == "test.pdf"
 
+    @patch("subprocess.run")
+    def test_process_files_uses_the_docling_worker_pool(self, mock_subprocess, tmp_path):
+        """Test that advanced mode sends every file to the worker pool when it is enabled."""
+        from lfx.base.data.base_file import BaseFileComponent
+        from lfx.schema.data import Data
+
+        component = FileComponent()
+        component.advanced_mode = True
+        component.markdown = True
+        component.md_image_placeholder = "<!-- image -->"
+        component.md_page_break_placeholder = ""
+        component.pipeline = "standard"
+        component.ocr_engine = "None"
+        component.silent_errors = False
+
+        files = []
+        for name in ("first.pdf", "second.pdf", "third.pdf"):
+            path = tmp_path / name
+            path.write_bytes(b"%PDF-1.4 test")
+            files.append(BaseFileComponent.BaseFile(data=Data(data={"file_path": str(path)}), path=path))
+
+        pool = MagicMock(max_workers=2)
+        pool.convert.side_effect = lambda job: {
+            "ok": True,
+            "mode": "markdown",
+            "text": f"content of {job['file_path'].rsplit('/', 1)[-1]}",
+            "meta": {"file_path": job["file_path"]},
+        }
+        pool.stats.return_value = {"workers": 2, "workers_recycled": 0, "timeouts": 0}
+
+        with patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool", return_value=pool):
+            result = component.process_files(files)
+
+        mock_subprocess.assert_not_called()
+        assert pool.convert.call_count == 3
+        assert pool.convert.call_args.args[0]["ocr_engine"] is None
+        assert [item.data[0].text for item in result] == [
+            "content of first.pdf",
+            "content of second.pdf",
+            "content of third.pdf",
+        ]
+
+    def test_docling_worker_pool_rejects_unsafe_file_paths(self):
+        """Test that the worker pool validates file paths like the one-shot subprocess does."""
+        component = FileComponent()
+        component.markdown = True
+        component.md_image_placeholder = "<!-- image -->"
+        component.md_page_break_placeholder = ""
+        component.pipeline = "standard"
+        component.ocr_engine = "None"
+        pool = MagicMock(max_workers=1)
+        pool.stats.return_value = {"workers": 1, "workers_recycled": 0, "timeouts": 0}
+
+        (result,) = component._process_docling_in_pool(["report;rm -rf.pdf"], pool)
+
+        pool.convert.assert_not_called()
+        assert result.data["error"] == "Unsafe file path detected."
+
+    def test_parse_cache_options_follow_the_parser(self):
+        """Test that the parse cache is keyed by the parser a batch goes through."""
+        from lfx.base.data.base_file import BaseFileComponent
+        from lfx.schema.data import Data
+
+        def batch(*names):
+            return [BaseFileComponent.BaseFile(data=Data(), path=Path(name)) for name in names]
+
+        component = FileComponent()
+        component.advanced_mode = False
+        component.markdown = False
+        component.md_image_placeholder = "<!-- image -->"
+        component.md_page_break_placeholder = ""
+        component.pipeline = "standard"
+        component.ocr_engine = "easyocr"
+
+        assert component.parse_cache_options(batch("a.pdf", "b.txt")) == {"parser": "standard"}
+
+        component.advanced_mode = True
+        docling_options = component.parse_cache_options(batch("a.pdf", "b.docx"))
+        assert docling_options["parser"] == "docling"
+        assert docling_options["ocr_engine"] == "easyocr"
+        assert "file_path" not in docling_options
+        # Without Docling the batch is parsed the standard way, with a mix it depends on the whole batch
+        assert component.parse_cache_options(batch("b.yaml")) == {"parser": "standard"}
+        assert component.parse_cache_options(batch("a.pdf", "b.yaml")) is None
+
     def test_dynamic_outputs_have_tool_mode_enabled(self):
         """Test that all dynamically created outputs have tool_mode=True."""
         component = FileComponent()
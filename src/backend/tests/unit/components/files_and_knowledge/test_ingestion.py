@@ -1,15 +1,29 @@
+import hashlib
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from langflow.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
 from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
 from lfx.components.knowledge_bases.ingestion import KnowledgeIngestionComponent
+from pydantic import Field
 
 from tests.base import ComponentTestBaseWithClient
 
 
+class RecordingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that record the batches they were asked to embed."""
+
+    batches: list[list[str]] = Field(default_factory=list)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return super().embed_documents(texts)
+
+
 class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
     @pytest.fixture
     def component_class(self):
@@ -19,7 +33,7 @@ class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
     @pytest.fixture(autouse=True)
     def mock_knowledge_base_path(self, tmp_path):
         """Mock the knowledge base root path directly."""
-        with patch("langflow.components.knowledge_bases.ingestion._KNOWLEDGE_BASES_ROOT_PATH", tmp_path):
+        with patch("lfx.components.files_and_knowledge.ingestion._KNOWLEDGE_BASES_ROOT_PATH", tmp_path):
             yield
 
     @pytest.fixture
@@ -213,55 +227,114 @@ class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
         assert "text" in metadata["summary"]["vectorized_columns"]
         assert "category" in metadata["summary"]["identifier_columns"]
 
-    async def test_convert_df_to_data_objects(self, component_class, default_kwargs):
-        """Test converting DataFrame to Data objects."""
+    def test_prepare_documents(self, component_class, default_kwargs):
+        """Test building page contents and metadata from the DataFrame."""
         component = component_class(**default_kwargs)
         data_df = default_kwargs["input_df"]
         config_list = default_kwargs["column_config"]
 
-        # Mock Chroma to avoid actual vector store operations
-        with patch("langflow.components.knowledge_bases.ingestion.Chroma") as mock_chroma:
-            mock_chroma_instance = MagicMock()
-            mock_chroma_instance.get.return_value = {"metadatas": []}
-            mock_chroma.return_value = mock_chroma_instance
+        texts, metadatas = component._prepare_documents(data_df, config_list, set())
+
+        assert texts == ["Sample text 1", "Sample text 2"]
+        assert len(metadatas) == 2
+        first_metadata = metadatas[0]
+        assert first_metadata["title"] == "Title 1"
+        assert first_metadata["category"] == "cat1"
+        # The identifier column is hashed instead of the content
+        assert first_metadata["_id"] == hashlib.sha256(b"cat1").hexdigest()
+        assert "text" not in first_metadata
 
-            data_objects = await component._convert_df_to_data_objects(data_df, config_list)
+    def test_prepare_documents_no_duplicates(self, component_class, default_kwargs):
+        """Test that rows already stored, or repeated in the input, are skipped."""
+        default_kwargs["allow_duplicates"] = False
+        component = component_class(**default_kwargs)
+        data_df = DataFrame(
+            {
+                "text": ["stored", "new", "new", "other"],
+                "title": ["a", "b", "c", None],
+                "category": ["x", "y", "z", "w"],
+            }
+        )
+        config_list = [{"column_name": "text", "vectorize": True, "identifier": False}]
+        existing_hashes = {hashlib.sha256(b"stored").hexdigest()}
 
-        assert len(data_objects) == 2
-        assert all(isinstance(obj, Data) for obj in data_objects)
+        texts, metadatas = component._prepare_documents(data_df, config_list, existing_hashes)
 
-        # Check first data object
-        first_obj = data_objects[0]
-        assert "text" in first_obj.data
-        assert "title" in first_obj.data
-        assert "category" in first_obj.data
-        assert "_id" in first_obj.data
+        assert texts == ["new", "other"]
+        assert metadatas[0]["title"] == "b"
+        # Missing values are left out of the metadata
+        assert "title" not in metadatas[1]
 
-    async def test_convert_df_to_data_objects_no_duplicates(self, component_class, default_kwargs):
-        """Test converting DataFrame to Data objects with duplicate prevention."""
-        default_kwargs["allow_duplicates"] = False
+    def test_prepare_documents_allow_duplicates(self, component_class, default_kwargs):
+        """Test that every row is kept when duplicates are allowed."""
+        default_kwargs["allow_duplicates"] = True
         component = component_class(**default_kwargs)
-        data_df = default_kwargs["input_df"]
-        config_list = default_kwargs["column_config"]
+        data_df = DataFrame({"text": ["same", "same"], "title": ["a", "b"]})
+        config_list = [{"column_name": "text", "vectorize": True, "identifier": False}]
 
-        # Mock Chroma with existing hash
-        with patch("langflow.components.knowledge_bases.ingestion.Chroma") as mock_chroma:
-            # Simulate existing document with same hash
-            existing_hash = "some_existing_hash"
-            mock_chroma_instance = MagicMock()
-            mock_chroma_instance.get.return_value = {"metadatas": [{"_id": existing_hash}]}
-            mock_chroma.return_value = mock_chroma_instance
+        texts, _ = component._prepare_documents(data_df, config_list, {hashlib.sha256(b"same").hexdigest()})
 
-            # Mock hashlib to return the existing hash for first row
-            with patch("langflow.components.knowledge_bases.ingestion.hashlib.sha256") as mock_hash:
-                mock_hash_obj = MagicMock()
-                mock_hash_obj.hexdigest.side_effect = [existing_hash, "different_hash"]
-                mock_hash.return_value = mock_hash_obj
+        assert texts == ["same", "same"]
+
+    def test_prepare_documents_joins_vectorized_columns(self, component_class, default_kwargs):
+        """Test that vectorized columns are joined and missing values skipped."""
+        component = component_class(**default_kwargs)
+        data_df = DataFrame({"title": ["Title 1", None], "text": ["body 1", "body 2"]})
+        config_list = [
+            {"column_name": "title", "vectorize": True, "identifier": False},
+            {"column_name": "text", "vectorize": True, "identifier": False},
+        ]
+
+        texts, metadatas = component._prepare_documents(data_df, config_list, set())
+
+        assert texts == ["Title 1 body 1", "body 2"]
+        assert metadatas[1] == {"_id": hashlib.sha256(b"body 2").hexdigest()}
+
+    async def test_create_vector_store_is_incremental(self, component_class, default_kwargs, tmp_path, active_user):
+        """Test that ingestion embeds only new rows and keeps the hash index in step with the collection."""
+        default_kwargs["chunk_size"] = 2
+        component = component_class(**default_kwargs)
+        config_list = [{"column_name": "text", "vectorize": True, "identifier": False}]
+        embeddings = RecordingEmbeddings(size=8)
+        kb_path = tmp_path / active_user.username / "test_kb"
+
+        with patch.object(component, "_build_embeddings", return_value=embeddings):
+            first = DataFrame({"text": [f"row {index}" for index in range(5)]})
+            await component._create_vector_store(first, config_list, "model", None)
+            # Batches of chunk_size rows
+            assert sorted(len(batch) for batch in embeddings.batches) == [1, 2, 2]
+
+            second = DataFrame({"text": ["row 3", "row 4", "row 5", "row 6", "row 6"]})
+            await component._create_vector_store(second, config_list, "model", None)
+
+        assert embeddings.batches[3:] == [["row 5", "row 6"]]
+        collection = Chroma(persist_directory=str(kb_path), collection_name="test_kb")._collection
+        assert collection.count() == 7
+        stored = collection.get(include=["documents", "metadatas", "embeddings"])
+        assert sorted(stored["documents"]) == [f"row {index}" for index in range(7)]
+        assert all(
+            metadata["_id"] == hashlib.sha256(doc.encode()).hexdigest()
+            for doc, metadata in zip(stored["documents"], stored["metadatas"], strict=True)
+        )
+        index_lines = (kb_path / "hash_index.txt").read_text().split()
+        assert sorted(index_lines) == sorted(metadata["_id"] for metadata in stored["metadatas"])
+
+    async def test_create_vector_store_rebuilds_a_missing_hash_index(
+        self, component_class, default_kwargs, tmp_path, active_user
+    ):
+        """Test that the hash index is rebuilt from the collection when it is missing."""
+        component = component_class(**default_kwargs)
+        config_list = [{"column_name": "text", "vectorize": True, "identifier": False}]
+        kb_path = tmp_path / active_user.username / "test_kb"
 
-                data_objects = await component._convert_df_to_data_objects(data_df, config_list)
+        with patch.object(component, "_build_embeddings", return_value=DeterministicFakeEmbedding(size=8)):
+            await component._create_vector_store(DataFrame({"text": ["a", "b"]}), config_list, "model", None)
+            (kb_path / "hash_index.txt").unlink()
+            await component._create_vector_store(DataFrame({"text": ["a", "c"]}), config_list, "model", None)
 
-        # Should only return one object (second row) since first is duplicate
-        assert len(data_objects) == 1
+        collection = Chroma(persist_directory=str(kb_path), collection_name="test_kb")._collection
+        assert sorted(collection.get()["documents"]) == ["a", "b", "c"]
+        assert len((kb_path / "hash_index.txt").read_text().split()) == 3
 
     def test_is_valid_collection_name(self, component_class, default_kwargs):
         """Test collection name validation."""
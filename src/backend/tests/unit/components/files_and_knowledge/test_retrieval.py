@@ -4,7 +4,10 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from langflow.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
 from lfx.components.knowledge_bases.retrieval import KnowledgeRetrievalComponent
 from pydantic import SecretStr
 
@@ -20,7 +23,7 @@ class TestKnowledgeRetrievalComponent(ComponentTestBaseWithClient):
     @pytest.fixture(autouse=True)
     def mock_knowledge_base_path(self, tmp_path):
         """Mock the knowledge base root path directly."""
-        with patch("langflow.components.knowledge_bases.retrieval._KNOWLEDGE_BASES_ROOT_PATH", tmp_path):
+        with patch("lfx.components.files_and_knowledge.retrieval._KNOWLEDGE_BASES_ROOT_PATH", tmp_path):
             yield
 
     @pytest.fixture
@@ -361,6 +364,33 @@ class TestKnowledgeRetrievalComponent(ComponentTestBaseWithClient):
             mock_get_metadata.assert_called_once()
             mock_build_embeddings.assert_called_once()
 
+    async def test_retrieve_data_reuses_the_vector_store(self, component_class, default_kwargs, tmp_path, active_user):
+        """Test that repeated queries reuse the opened store until the knowledge base is invalidated."""
+        kb_path = tmp_path / active_user.username / default_kwargs["knowledge_base"]
+        embeddings = DeterministicFakeEmbedding(size=8)
+        Chroma(persist_directory=str(kb_path), embedding_function=embeddings, collection_name="test_kb").add_texts(
+            ["first document", "second document"], metadatas=[{"_id": "1"}, {"_id": "2"}]
+        )
+        default_kwargs["search_query"] = "document"
+        component = component_class(**default_kwargs)
+
+        with patch.object(component, "_build_embeddings", return_value=embeddings) as mock_build_embeddings:
+            first = await component.retrieve_data()
+            second = await component.retrieve_data()
+            assert mock_build_embeddings.call_count == 1
+
+            get_knowledge_base_cache().invalidate(kb_path)
+            await component.retrieve_data()
+            assert mock_build_embeddings.call_count == 2
+
+            # A different embedding configuration opens a new store
+            component.api_key = SecretStr("runtime-key")
+            await component.retrieve_data()
+            assert mock_build_embeddings.call_count == 3
+
+        assert len(first) == len(second) == 2
+        assert sorted(first["content"]) == ["first document", "second document"]
+
     def test_include_embeddings_parameter(self, component_class, default_kwargs):
         """Test that include_embeddings parameter is properly set."""
         # Test with embeddings enabled
@@ -523,3 +523,116 @@ async def test_update_table_params_handles_user_id_not_set_error():
             await update_table_params_with_load_from_db_fields(
                 custom_component, params, "table_data", fallback_to_env_vars=True
             )
+
+
+# =====================================================================================
+# BATCHED VARIABLE RESOLUTION TESTS
+# =====================================================================================
+
+
+@pytest.fixture
+def batched_variables():
+    """Patch the variable service so that it serves a batch of decrypted variables."""
+    from lfx.services.variable import resolver as resolver_module
+    from lfx.services.variable.resolver import DecryptedVariableCache
+
+    variable_service = MagicMock()
+    variable_service.get_all_decrypted_variables = AsyncMock(
+        return_value={"DB_KEY": "db-value", "OTHER_KEY": "other-value"}
+    )
+    with (
+        patch("lfx.interface.initialize.loading.get_variable_service", return_value=variable_service),
+        patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope,
+        patch.object(resolver_module, "_decrypted_variable_cache", DecryptedVariableCache(ttl=60)),
+    ):
+        mock_session_scope.return_value.__aenter__.return_value = MagicMock()
+        yield variable_service
+
+
+def make_run_component(run_id="run-1", context=None):
+    custom_component = MagicMock()
+    custom_component.user_id = "00000000-0000-0000-0000-000000000001"
+    custom_component.graph = MagicMock(context=context or {}, _run_id=run_id, variable_resolver=None)
+    custom_component.get_variable = AsyncMock(side_effect=ValueError("MISSING_KEY variable not found."))
+    return custom_component
+
+
+@pytest.mark.asyncio
+async def test_update_params_fetches_variables_once_per_run(batched_variables):
+    """All load_from_db fields of a run are served by a single batched fetch."""
+    first = make_run_component()
+    second = make_run_component()
+    second.graph = first.graph
+
+    result = await update_params_with_load_from_db_fields(
+        first, {"api_key": "DB_KEY", "other": "OTHER_KEY"}, ["api_key", "other"]
+    )
+    second_result = await update_params_with_load_from_db_fields(second, {"api_key": "DB_KEY"}, ["api_key"])
+
+    assert result == {"api_key": "db-value", "other": "other-value"}
+    assert second_result == {"api_key": "db-value"}
+    batched_variables.get_all_decrypted_variables.assert_awaited_once()
+    first.get_variable.assert_not_called()
+    second.get_variable.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_table_params_use_the_run_resolver(batched_variables):
+    """Table columns are resolved from the same batch as regular fields."""
+    custom_component = make_run_component()
+    params = {
+        "api_key": "DB_KEY",
+        "table_data": [{"secret": "OTHER_KEY"}, {"secret": "DB_KEY"}],
+        "table_data_load_from_db_columns": ["secret"],
+    }
+
+    result = await update_params_with_load_from_db_fields(custom_component, params, ["api_key", "table:table_data"])
+
+    assert result["api_key"] == "db-value"
+    assert result["table_data"] == [{"secret": "other-value"}, {"secret": "db-value"}]
+    batched_variables.get_all_decrypted_variables.assert_awaited_once()
+    custom_component.get_variable.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("batched_variables")
+async def test_update_params_batched_lookup_keeps_individual_semantics():
+    """Overrides, Session ID fields and missing variables still go through get_variable."""
+    custom_component = make_run_component(context={"request_variables": {"DB_KEY": "override"}})
+    custom_component.get_variable = AsyncMock(return_value="individual-value")
+
+    result = await update_params_with_load_from_db_fields(
+        custom_component,
+        {"api_key": "DB_KEY", "session_id": "OTHER_KEY", "other": "UNKNOWN_KEY"},
+        ["api_key", "session_id", "other"],
+    )
+
+    assert result == {"api_key": "individual-value", "session_id": "individual-value", "other": "individual-value"}
+    looked_up = [call.kwargs["name"] for call in custom_component.get_variable.await_args_list]
+    assert looked_up == ["DB_KEY", "OTHER_KEY", "UNKNOWN_KEY"]
+
+    custom_component.get_variable = AsyncMock(side_effect=ValueError("UNKNOWN_KEY variable not found."))
+    with pytest.raises(ValueError, match="UNKNOWN_KEY variable not found"):
+        await update_params_with_load_from_db_fields(custom_component, {"other": "UNKNOWN_KEY"}, ["other"])
+
+
+@pytest.mark.asyncio
+async def test_update_params_new_run_reuses_cached_variables(batched_variables):
+    """A new run gets its own resolver but is served from the per-user cache."""
+    from lfx.services.variable.resolver import invalidate_user_variables
+
+    first = make_run_component(run_id="run-1")
+    await update_params_with_load_from_db_fields(first, {"api_key": "DB_KEY"}, ["api_key"])
+    second = make_run_component(run_id="run-2")
+    await update_params_with_load_from_db_fields(second, {"api_key": "DB_KEY"}, ["api_key"])
+
+    assert first.graph.variable_resolver is not second.graph.variable_resolver
+    batched_variables.get_all_decrypted_variables.assert_awaited_once()
+
+    invalidate_user_variables(second.user_id)
+    batched_variables.get_all_decrypted_variables.return_value = {"DB_KEY": "rotated"}
+    third = make_run_component(run_id="run-3")
+    result = await update_params_with_load_from_db_fields(third, {"api_key": "DB_KEY"}, ["api_key"])
+
+    assert result == {"api_key": "rotated"}
+    assert batched_variables.get_all_decrypted_variables.await_count == 2
@@ -0,0 +1 @@
+"""Tests for buffered writer service module."""
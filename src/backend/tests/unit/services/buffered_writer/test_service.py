@@ -0,0 +1,148 @@
+"""Tests for BufferedWriterService."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.buffered_writer.service import BufferedWriterService
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+
+MODULE = "langflow.services.buffered_writer.service"
+
+
+def _settings_service(**overrides) -> MagicMock:
+    settings_service = MagicMock()
+    settings_service.settings = MagicMock()
+    settings_service.settings.buffered_log_writer_enabled = True
+    settings_service.settings.buffered_log_writer_batch_size = 10
+    settings_service.settings.buffered_log_writer_flush_interval = 60.0
+    settings_service.settings.buffered_log_writer_max_buffer_size = 20
+    settings_service.settings.buffered_log_writer_retention_interval = 60.0
+    settings_service.settings.max_transactions_to_keep = 3000
+    settings_service.settings.max_vertex_builds_to_keep = 3000
+    settings_service.settings.max_vertex_builds_per_vertex = 2
+    for key, value in overrides.items():
+        setattr(settings_service.settings, key, value)
+    return settings_service
+
+
+def _transaction(flow_id=None) -> TransactionBase:
+    return TransactionBase(vertex_id="vertex", status="success", flow_id=flow_id or uuid4())
+
+
+def _vertex_build(flow_id=None, vertex_id="vertex") -> VertexBuildBase:
+    return VertexBuildBase(id=vertex_id, valid=True, flow_id=flow_id or uuid4())
+
+
+@pytest.fixture
+def session_scope():
+    mock_session = AsyncMock()
+    with patch(f"{MODULE}.session_scope") as mock_session_scope:
+        mock_session_scope.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session_scope.return_value.__aexit__ = AsyncMock(return_value=None)
+        yield mock_session_scope
+
+
+@pytest.fixture
+async def service():
+    service = BufferedWriterService(_settings_service())
+    yield service
+    with patch.object(service, "flush", AsyncMock()), patch.object(service, "sweep", AsyncMock()):
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_records_are_buffered_until_flush(service: BufferedWriterService, session_scope) -> None:
+    with (
+        patch(f"{MODULE}.log_transactions", AsyncMock()) as log_transactions,
+        patch(f"{MODULE}.log_vertex_builds", AsyncMock()) as log_vertex_builds,
+    ):
+        await service.add_transaction(_transaction())
+        await service.add_vertex_build(_vertex_build())
+        assert service.queue_depth == 2
+        log_transactions.assert_not_called()
+
+        assert await service.flush() == 2
+
+        session_scope.assert_called_once()
+        assert len(log_transactions.call_args[0][1]) == 1
+        assert len(log_vertex_builds.call_args[0][1]) == 1
+    assert service.queue_depth == 0
+    assert service.stats()["flushed_transactions"] == 1
+    assert service.stats()["flushed_vertex_builds"] == 1
+    assert service.stats()["flush_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_size_wakes_the_flusher(service: BufferedWriterService, session_scope) -> None:
+    with (
+        patch(f"{MODULE}.log_transactions", AsyncMock()) as log_transactions,
+        patch(f"{MODULE}.log_vertex_builds", AsyncMock()),
+    ):
+        for _ in range(service.batch_size):
+            await service.add_transaction(_transaction())
+        for _ in range(50):
+            if service.queue_depth == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert service.queue_depth == 0
+        log_transactions.assert_awaited_once()
+        assert session_scope.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_and_drops_oldest(service: BufferedWriterService) -> None:
+    with patch(f"{MODULE}.session_scope", side_effect=Exception("Database error")):
+        for _ in range(service.max_buffer_size + 5):
+            await service.add_transaction(_transaction())
+
+    stats = service.stats()
+    assert stats["queue_depth"] == service.max_buffer_size
+    assert stats["failed_flushes"] >= 1
+    assert stats["dropped"] == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("session_scope")
+async def test_sweep_trims_only_written_flows_and_vertices(service: BufferedWriterService) -> None:
+    flow_id = uuid4()
+    with (
+        patch(f"{MODULE}.log_transactions", AsyncMock()),
+        patch(f"{MODULE}.log_vertex_builds", AsyncMock()),
+        patch(f"{MODULE}.trim_transactions_for_flow", AsyncMock()) as trim_transactions,
+        patch(f"{MODULE}.trim_vertex_builds_for_vertex", AsyncMock()) as trim_vertex,
+        patch(f"{MODULE}.trim_vertex_builds_globally", AsyncMock()) as trim_global,
+    ):
+        await service.add_transaction(_transaction(flow_id))
+        await service.add_transaction(_transaction(flow_id))
+        await service.add_vertex_build(_vertex_build(flow_id, "a"))
+        await service.add_vertex_build(_vertex_build(flow_id, "b"))
+        await service.flush()
+        await service.sweep()
+        await service.sweep()
+
+    trim_transactions.assert_awaited_once()
+    assert trim_transactions.call_args[0][1:] == (flow_id, 3000)
+    assert {call.args[1:] for call in trim_vertex.call_args_list} == {(flow_id, "a", 2), (flow_id, "b", 2)}
+    trim_global.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("session_scope")
+async def test_stop_flushes_pending_records() -> None:
+    service = BufferedWriterService(_settings_service())
+    with (
+        patch(f"{MODULE}.log_transactions", AsyncMock()) as log_transactions,
+        patch(f"{MODULE}.log_vertex_builds", AsyncMock()),
+        patch(f"{MODULE}.trim_transactions_for_flow", AsyncMock()) as trim_transactions,
+    ):
+        await service.add_transaction(_transaction())
+        await service.stop()
+
+        log_transactions.assert_awaited_once()
+        trim_transactions.assert_awaited_once()
+    assert service.queue_depth == 0
+    assert not service.is_started()
@@ -0,0 +1,131 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.cache import service as cache_service_module
+from langflow.services.cache.factory import CacheServiceFactory
+from langflow.services.cache.service import ShardedAsyncInMemoryCache
+from langflow.services.cache.utils import estimate_size
+from lfx.services.cache.utils import CACHE_MISS
+
+
+def fixed_size(value) -> int:
+    return value["size"] if isinstance(value, dict) else 1
+
+
+@pytest.fixture
+async def cache():
+    cache = ShardedAsyncInMemoryCache(num_shards=4, sweep_interval=0, size_estimator=fixed_size)
+    yield cache
+    await cache.teardown()
+
+
+async def test_get_set_delete(cache):
+    await cache.set("a", {"size": 10})
+    assert await cache.get("a") == {"size": 10}
+    assert await cache.contains("a")
+    await cache.delete("a")
+    assert await cache.get("a") is CACHE_MISS
+    assert not await cache.contains("a")
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "expirations": 0, "items": 0, "bytes": 0}
+
+
+async def test_upsert_merges_dicts(cache):
+    await cache.upsert("a", {"size": 1, "result": "first"})
+    await cache.upsert("a", {"type": "str"})
+    assert await cache.get("a") == {"size": 1, "result": "first", "type": "str"}
+
+
+async def test_evicts_least_recently_used_items_across_shards_by_size(cache):
+    cache.max_bytes = 130
+    for key in ("a", "b", "c"):
+        await cache.set(key, {"size": 40})
+    # "b" and "c" were inserted later, "a" was read last
+    await cache.get("a")
+    await cache.set("d", {"size": 40})
+
+    assert await cache.contains("a")
+    assert not await cache.contains("b")
+    assert await cache.contains("d")
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 120
+    assert stats["items"] == 3
+
+
+async def test_evicts_by_item_count(cache):
+    cache.max_size = 2
+    for key in ("a", "b", "c"):
+        await cache.set(key, "value")
+    assert [await cache.contains(key) for key in ("a", "b", "c")] == [False, True, True]
+
+
+async def test_values_larger_than_the_cache_are_not_stored(cache):
+    cache.max_bytes = 100
+    await cache.set("a", {"size": 10})
+    await cache.set("big", {"size": 101})
+    assert not await cache.contains("big")
+    assert await cache.contains("a")
+
+
+async def test_replacing_an_item_updates_the_byte_count(cache):
+    await cache.set("a", {"size": 10})
+    await cache.set("a", {"size": 30})
+    assert cache.stats()["bytes"] == 30
+    assert cache.stats()["items"] == 1
+
+
+async def test_expired_items_are_missed_and_swept(cache):
+    cache.expiration_time = 10
+    with patch.object(cache_service_module.time, "monotonic", return_value=100.0):
+        await cache.set("a", {"size": 1})
+        await cache.set("b", {"size": 1})
+    with patch.object(cache_service_module.time, "monotonic", return_value=110.0):
+        assert await cache.get("a") is CACHE_MISS
+        assert await cache.sweep() == 1
+    stats = cache.stats()
+    assert stats["expirations"] == 2
+    assert stats["items"] == 0
+    assert stats["bytes"] == 0
+
+
+async def test_background_sweeper_removes_expired_items():
+    cache = ShardedAsyncInMemoryCache(expiration_time=0.01, sweep_interval=0.01, size_estimator=fixed_size)
+    await cache.set("a", {"size": 1})
+    for _ in range(100):
+        if cache.stats()["items"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert cache.stats()["expirations"] == 1
+    await cache.teardown()
+    assert cache.stats()["items"] == 0
+
+
+async def test_operations_on_other_shards_do_not_wait_for_a_held_lock(cache):
+    held = cache._shard("a")
+    other_key = next(key for key in map(str, range(100)) if cache._shard(key) is not held)
+    async with held.lock:
+        await asyncio.wait_for(cache.set(other_key, "value"), timeout=1)
+        assert await asyncio.wait_for(cache.get(other_key), timeout=1) == "value"
+
+
+def test_estimate_size_counts_shared_objects_once():
+    payload = "x" * 10_000
+    assert estimate_size([payload]) > 10_000
+    assert estimate_size([payload, payload]) < 2 * 10_000
+
+
+def test_factory_creates_the_sharded_cache():
+    settings_service = MagicMock()
+    settings_service.settings.cache_type = "sharded"
+    settings_service.settings.cache_expire = 60
+    settings_service.settings.cache_max_bytes = 0
+    settings_service.settings.cache_shards = 8
+    settings_service.settings.cache_sweep_interval = 5
+
+    cache = CacheServiceFactory().create(settings_service)
+
+    assert isinstance(cache, ShardedAsyncInMemoryCache)
+    assert cache.max_bytes is None
+    assert cache.expiration_time == 60
+    assert cache.sweep_interval == 5
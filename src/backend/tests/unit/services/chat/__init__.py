@@ -0,0 +1 @@
+"""Tests for chat service module."""
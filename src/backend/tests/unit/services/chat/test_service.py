@@ -0,0 +1,105 @@
+"""Tests for how ChatService stores graphs in external caches."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.chat.service import RUN_STATE_TYPE, ChatService
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.graph.graph.run_state import graph_from_run_state
+from lfx.services.cache.utils import CacheMiss
+
+
+def _flow_payload() -> dict:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(input_value="hello")
+    combine = CombineTextComponent(_id="combine")
+    combine.set(text1=chat_input.message_response, text2="world", delimiter=" ")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=combine.combine_texts)
+    return Graph(chat_input, chat_output).dump()
+
+
+def _make_chat_service(cache_service, serialization: str) -> ChatService:
+    settings_service = MagicMock()
+    settings_service.settings.graph_cache_serialization = serialization
+    with (
+        patch("langflow.services.chat.service.get_cache_service", return_value=cache_service),
+        patch("langflow.services.chat.service.get_settings_service", return_value=settings_service),
+    ):
+        return ChatService()
+
+
+@pytest.fixture
+async def disk_cache(tmp_path):
+    cache = AsyncDiskCache(cache_dir=str(tmp_path))
+    yield cache
+    await cache.teardown()
+
+
+async def test_run_state_is_stored_instead_of_the_graph(disk_cache):
+    chat_service = _make_chat_service(disk_cache, "run_state")
+    graph = Graph.from_payload(_flow_payload(), flow_id="flow")
+    graph.prepare()
+    graph.set_run_id("run")
+    await graph.astep()
+
+    await chat_service.set_cache("flow", graph)
+
+    stored = await disk_cache.get("flow")
+    assert stored["type"] == RUN_STATE_TYPE
+    assert isinstance(stored["result"], bytes)
+
+    cached = await chat_service.get_cache("flow")
+    restored = cached["result"]
+    assert isinstance(restored, Graph)
+    assert restored is not graph
+    assert restored.run_id == "run"
+    assert list(restored._run_queue) == list(graph._run_queue)
+    assert restored.get_vertex("chat_input").built
+
+
+async def test_run_state_is_restored_off_the_event_loop(disk_cache):
+    chat_service = _make_chat_service(disk_cache, "run_state")
+    graph = Graph.from_payload(_flow_payload(), flow_id="flow")
+    graph.prepare()
+    await chat_service.set_cache("flow", graph)
+
+    threads = []
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return graph_from_run_state(*args, **kwargs)
+
+    with patch("langflow.services.chat.service.graph_from_run_state", side_effect=record_thread):
+        cached = await chat_service.get_cache("flow")
+
+    assert isinstance(cached["result"], Graph)
+    assert threads
+    assert threads[0] is not threading.current_thread()
+
+
+async def test_unreadable_run_state_is_a_cache_miss(disk_cache):
+    chat_service = _make_chat_service(disk_cache, "run_state")
+    await disk_cache.set("flow", {"result": b'{"version": 0}', "type": RUN_STATE_TYPE})
+
+    assert isinstance(await chat_service.get_cache("flow"), CacheMiss)
+
+
+async def test_run_state_is_only_used_for_external_caches_when_enabled(disk_cache):
+    assert not _make_chat_service(disk_cache, "pickle").store_run_state
+    assert _make_chat_service(disk_cache, "run_state").store_run_state
+
+    chat_service = _make_chat_service(AsyncInMemoryCache(), "run_state")
+    assert not chat_service.store_run_state
+    graph = Graph.from_payload(_flow_payload(), flow_id="flow")
+
+    await chat_service.set_cache("flow", graph)
+
+    cached = await chat_service.get_cache("flow")
+    assert cached["type"] is Graph
+    assert cached["result"] is graph
@@ -0,0 +1 @@
+"""Tests for job queue service module."""
@@ -0,0 +1,99 @@
+"""Tests for the Redis streams job queue backend, against fakeredis."""
+
+import asyncio
+
+import fakeredis
+import pytest
+from langflow.services.job_queue.backends.base import JobQueueNotFoundError
+from langflow.services.job_queue.backends.redis_streams import RedisStreamsJobQueueBackend
+
+
+@pytest.fixture
+async def backend():
+    backend = RedisStreamsJobQueueBackend(fakeredis.FakeAsyncRedis(), max_len=100, ttl=60)
+    backend.BACKPRESSURE_POLL_INTERVAL = 0.01
+    yield backend
+    await backend.close()
+
+
+async def test_events_round_trip(backend) -> None:
+    await backend.create("job")
+    await backend.publish("job", ("1", b"payload", 1.5))
+    await backend.publish("job", (None, None, 2.0))
+
+    assert await backend.read("job", timeout=0) == [("1", b"payload", 1.5), (None, None, 2.0)]
+
+
+async def test_each_event_is_delivered_once(backend) -> None:
+    other = RedisStreamsJobQueueBackend(backend._client, max_len=100, ttl=60)
+    other.consumer_name = "other-replica"
+    await backend.create("job")
+    for i in range(4):
+        await backend.publish("job", (str(i), b"x", 0.0))
+
+    first = await backend.read("job", timeout=0, count=2)
+    second = await other.read("job", timeout=0)
+
+    assert [event[0] for event in first + second] == ["0", "1", "2", "3"]
+    assert await backend.read("job", timeout=0) == []
+
+
+async def test_read_events_are_removed_from_the_stream(backend) -> None:
+    await backend.create("job")
+    for i in range(5):
+        await backend.publish("job", (str(i), b"x", 0.0))
+
+    await backend.read("job", timeout=0, count=3)
+
+    assert await backend._client.xlen(backend._stream_key("job")) == 2
+
+
+async def test_publishing_waits_for_unread_events_to_be_consumed(backend) -> None:
+    backend.max_len = 3
+    await backend.create("job")
+
+    async def publish_all() -> None:
+        for i in range(10):
+            await backend.publish("job", (str(i), b"x", 0.0))
+
+    publisher = asyncio.create_task(publish_all())
+    await asyncio.sleep(0.05)
+    assert not publisher.done()
+    assert await backend._client.xlen(backend._stream_key("job")) == 3
+
+    received = []
+    while len(received) < 10:
+        received.extend(await backend.read("job", timeout=0, count=2))
+        await asyncio.sleep(0.01)
+    await asyncio.wait_for(publisher, timeout=1)
+    assert [event[0] for event in received] == [str(i) for i in range(10)]
+
+
+async def test_publishing_to_an_expired_stream_raises(backend) -> None:
+    await backend.create("job")
+    # Expiry removes the stream and its consumer group, like a delete
+    await backend._client.delete(backend._stream_key("job"))
+
+    with pytest.raises(JobQueueNotFoundError):
+        await backend.publish("job", ("1", b"x", 0.0))
+    assert not await backend.exists("job")
+
+
+async def test_cancellation_and_delete(backend) -> None:
+    assert not await backend.request_cancel("job")
+    await backend.create("job")
+
+    assert await backend.exists("job")
+    assert await backend.request_cancel("job")
+    assert await backend.is_cancel_requested("job")
+
+    await backend.delete("job")
+    assert not await backend.exists("job")
+    assert not await backend.is_cancel_requested("job")
+
+
+async def test_streams_expire(backend) -> None:
+    await backend.create("job")
+    await backend.publish("job", ("1", b"x", 0.0))
+
+    assert 0 < await backend._client.ttl(backend._stream_key("job")) <= 60
@@ -0,0 +1,226 @@
+"""Tests for JobQueueService with a shared backend."""
+
+import asyncio
+import time
+
+import pytest
+from langflow.api.build import get_flow_events_response
+from langflow.api.utils import EventDeliveryType
+from langflow.services.job_queue.backends import InMemoryJobQueueBackend
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            msg = "Condition not met in time"
+            raise AssertionError(msg)
+        await asyncio.sleep(0.01)
+
+
+async def _stop(service: JobQueueService) -> None:
+    # cleanup_job re-raises the CancelledError of the tasks it cancels, so cancel them first
+    for job_id in list(service._queues):
+        task = service._queues[job_id][2]
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait([task])
+    await service.stop()
+
+
+@pytest.fixture
+def backend() -> InMemoryJobQueueBackend:
+    return InMemoryJobQueueBackend(max_len=100, ttl=60)
+
+
+@pytest.fixture
+async def replicas(backend: InMemoryJobQueueBackend):
+    """Two services sharing a backend, standing in for two replicas sharing Redis."""
+    first = JobQueueService(backend)
+    second = JobQueueService(backend)
+    for service in (first, second):
+        service.MAINTENANCE_INTERVAL = 0.01
+    yield first, second
+    for service in (first, second):
+        await _stop(service)
+
+
+@pytest.mark.asyncio
+async def test_events_are_consumed_from_another_replica(replicas) -> None:
+    owner, other = replicas
+    _, event_manager = owner.create_queue("job")
+
+    async def job() -> None:
+        event_manager.on_token(data={"chunk": "a"})
+        event_manager.on_token(data={"chunk": "b"})
+
+    owner.start_job("job", job())
+    await owner.create_stream("job")
+
+    events, remote_event_manager, remote_task = await other.get_job_events("job")
+    assert remote_event_manager is None
+    assert remote_task is None
+
+    values = []
+    while (value := (await events.get())[1]) is not None:
+        values.append(value)
+    assert len(values) == 2
+    assert b'"chunk": "a"' in values[0]
+
+
+@pytest.mark.asyncio
+async def test_each_event_is_delivered_once(replicas) -> None:
+    owner, other = replicas
+    _, event_manager = owner.create_queue("job")
+    owner.start_job("job", asyncio.sleep(10))
+    for i in range(4):
+        event_manager.on_token(data={"chunk": str(i)})
+
+    local_events, _, _ = await owner.get_job_events("job")
+    remote_events, _, _ = await other.get_job_events("job")
+    await _wait_for(owner._queues["job"][0].empty)
+    await asyncio.sleep(0.05)
+
+    received = await local_events.get_available() + await remote_events.get_available()
+    assert len(received) == 4
+
+
+@pytest.mark.asyncio
+async def test_polling_returns_every_event_read_from_the_backend(replicas) -> None:
+    owner, other = replicas
+    owner.create_queue("job")
+    owner.start_job("job", asyncio.sleep(10))
+    await owner.create_stream("job")
+
+    async def poll() -> list[str]:
+        response = await get_flow_events_response(
+            job_id="job", queue_service=other, event_delivery=EventDeliveryType.POLLING
+        )
+        return [line for line in response.body.decode().split("\n") if line]
+
+    # The waiting poll reads the three events at once, as they are published before it wakes up
+    first_poll = asyncio.create_task(poll())
+    await asyncio.sleep(0.05)
+    for i in range(3):
+        await owner.backend.publish("job", (str(i), f'{{"chunk": "{i}"}}'.encode(), 0.0))
+
+    polled = await asyncio.wait_for(first_poll, timeout=2)
+    while len(polled) < 3:
+        polled.extend(await asyncio.wait_for(poll(), timeout=2))
+    assert len(polled) == 3
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_raises(replicas) -> None:
+    _, other = replicas
+    with pytest.raises(JobQueueNotFoundError):
+        await other.get_job_events("missing")
+    assert await other.request_cancel("missing") is False
+
+
+@pytest.mark.asyncio
+async def test_end_of_stream_is_signalled_when_job_fails(replicas) -> None:
+    owner, other = replicas
+    owner.create_queue("job")
+
+    async def failing_job() -> None:
+        msg = "boom"
+        raise ValueError(msg)
+
+    owner.start_job("job", failing_job())
+    await owner.create_stream("job")
+    events, _, _ = await other.get_job_events("job")
+    _, value, _ = await asyncio.wait_for(events.get(), timeout=2)
+    assert value is None
+
+
+@pytest.mark.asyncio
+async def test_cancellation_requested_from_another_replica(replicas) -> None:
+    owner, other = replicas
+    owner.create_queue("job")
+    owner.start_job("job", asyncio.sleep(10))
+    _, _, task, _ = owner.get_queue_data("job")
+    await owner.create_stream("job")
+
+    assert await other.request_cancel("job") is True
+    await _wait_for(task.done)
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_publishing_waits_for_unread_events_to_be_consumed() -> None:
+    backend = InMemoryJobQueueBackend(max_len=3, ttl=60)
+    await backend.create("job")
+
+    async def publish_all() -> None:
+        for i in range(10):
+            await backend.publish("job", (str(i), b"x", 0.0))
+
+    publisher = asyncio.create_task(publish_all())
+    await asyncio.sleep(0.05)
+    assert not publisher.done()
+
+    received = []
+    while len(received) < 10:
+        received.extend(await backend.read("job", timeout=1, count=2))
+    await asyncio.wait_for(publisher, timeout=1)
+    assert [event_id for event_id, _, _ in received] == [str(i) for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_read_events_are_removed_from_the_stream() -> None:
+    backend = InMemoryJobQueueBackend(max_len=100, ttl=60)
+    await backend.create("job")
+    for i in range(5):
+        await backend.publish("job", (str(i), b"x", 0.0))
+
+    assert len(await backend.read("job", timeout=0, count=3)) == 3
+    assert len(backend._streams["job"].events) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiting_publisher_fails_when_the_stream_is_deleted() -> None:
+    backend = InMemoryJobQueueBackend(max_len=1, ttl=60)
+    await backend.create("job")
+    await backend.publish("job", ("0", b"x", 0.0))
+
+    publisher = asyncio.create_task(backend.publish("job", ("1", b"x", 0.0)))
+    await asyncio.sleep(0.01)
+    await backend.delete("job")
+
+    with pytest.raises(JobQueueNotFoundError):
+        await asyncio.wait_for(publisher, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_are_released_when_their_stream_expires() -> None:
+    service = JobQueueService(InMemoryJobQueueBackend(ttl=0.05))
+    service.MAINTENANCE_INTERVAL = 0.01
+    service.create_queue("finished")
+    service.start_job("finished", asyncio.sleep(0))
+    service.create_queue("orphan")
+    await asyncio.sleep(0.1)
+
+    await service._cleanup_expired_jobs()
+
+    with pytest.raises(JobQueueNotFoundError):
+        service.get_queue_data("finished")
+    with pytest.raises(JobQueueNotFoundError):
+        service.get_queue_data("orphan")
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_running_jobs_keep_their_stream_alive() -> None:
+    service = JobQueueService(InMemoryJobQueueBackend(ttl=0.05))
+    service.MAINTENANCE_INTERVAL = 0.01
+    service.create_queue("running")
+    service.start_job("running", asyncio.sleep(10))
+    await asyncio.sleep(0.15)
+
+    await service._cleanup_expired_jobs()
+
+    assert service.get_queue_data("running")[2] is not None
+    assert await service.backend.exists("running")
+    await _stop(service)
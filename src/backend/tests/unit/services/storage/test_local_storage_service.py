@@ -142,6 +142,65 @@ class TestLocalStorageServiceFileOperations:
         assert retrieved == data
 
 
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+class TestLocalStorageServiceStreamOperations:
+    """Test streaming writes and range reads in LocalStorageService."""
+
+    async def test_save_file_stream(self, local_storage_service):
+        """Test that a stream of chunks is saved as one file."""
+        written = await local_storage_service.save_file_stream("stream_flow", "file.bin", stream(b"ab", b"cd", b"e"))
+
+        assert written == 5
+        assert await local_storage_service.get_file("stream_flow", "file.bin") == b"abcde"
+        assert await local_storage_service.list_files("stream_flow") == ["file.bin"]
+
+    async def test_save_file_stream_append(self, local_storage_service):
+        """Test that append mode adds the stream to the end of the existing file."""
+        await local_storage_service.save_file("stream_flow", "log.txt", b"first ")
+
+        await local_storage_service.save_file_stream("stream_flow", "log.txt", stream(b"second"), append=True)
+
+        assert await local_storage_service.get_file("stream_flow", "log.txt") == b"first second"
+
+    async def test_failed_stream_keeps_the_existing_file(self, local_storage_service):
+        """Test that a stream that fails midway leaves neither a partial nor a temporary file."""
+        await local_storage_service.save_file("stream_flow", "file.txt", b"original")
+
+        async def failing_stream():
+            yield b"partial"
+            msg = "client disconnected"
+            raise ConnectionError(msg)
+
+        with pytest.raises(ConnectionError):
+            await local_storage_service.save_file_stream("stream_flow", "file.txt", failing_stream())
+
+        assert await local_storage_service.get_file("stream_flow", "file.txt") == b"original"
+        assert [path.name async for path in (local_storage_service.data_dir / "stream_flow").iterdir()] == ["file.txt"]
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected"),
+        [(0, None, b"0123456789"), (2, 5, b"2345"), (7, None, b"789"), (8, 20, b"89"), (0, 0, b"0")],
+    )
+    async def test_get_file_stream_range(self, local_storage_service, start, end, expected):
+        """Test that range reads return the bytes from start to end inclusive."""
+        await local_storage_service.save_file("stream_flow", "digits.txt", b"0123456789")
+
+        chunks = [
+            chunk
+            async for chunk in local_storage_service.get_file_stream(
+                "stream_flow", "digits.txt", chunk_size=3, start=start, end=end
+            )
+        ]
+
+        assert b"".join(chunks) == expected
+        assert all(len(chunk) <= 3 for chunk in chunks)
+
+
 @pytest.mark.asyncio
 class TestLocalStorageServiceListOperations:
     """Test list operations in LocalStorageService."""
@@ -265,6 +324,31 @@ class TestLocalStorageServiceDeleteOperations:
         assert len(listed_files) == 0
 
 
+@pytest.mark.asyncio
+class TestLocalStorageServiceBulkOperations:
+    """Test the bulk operations LocalStorageService inherits from StorageService."""
+
+    async def test_delete_files(self, local_storage_service):
+        """Test deleting several files at once."""
+        for file_name in ("a.txt", "b.txt", "c.txt"):
+            await local_storage_service.save_file("bulk_flow", file_name, b"content")
+
+        failures = await local_storage_service.delete_files("bulk_flow", ["a.txt", "b.txt", "missing.txt"])
+
+        assert failures == {}
+        assert await local_storage_service.list_files("bulk_flow") == ["c.txt"]
+
+    async def test_iter_files(self, local_storage_service):
+        """Test listing the files with a prefix page by page."""
+        for file_name in ("log_1.txt", "log_2.txt", "log_3.txt", "data.csv"):
+            await local_storage_service.save_file("bulk_flow", file_name, b"content")
+
+        pages = [page async for page in local_storage_service.iter_files("bulk_flow", prefix="log_", page_size=2)]
+
+        assert [len(page) for page in pages] == [2, 1]
+        assert sorted(name for page in pages for name in page) == ["log_1.txt", "log_2.txt", "log_3.txt"]
+
+
 @pytest.mark.asyncio
 class TestLocalStorageServiceFileSizeOperations:
     """Test file size operations in LocalStorageService."""
@@ -0,0 +1,146 @@
+"""Tests for S3StorageService against a local moto S3 server."""
+
+import contextlib
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+pytest.importorskip("aioboto3")
+
+from langflow.services.storage.s3 import MIN_MULTIPART_PART_SIZE, S3StorageService
+
+BUCKET = "langflow-test"
+
+
+@pytest.fixture
+async def s3_storage_service(aws_environment, s3_endpoint, tmp_path):  # noqa: ARG001
+    settings_service = Mock()
+    settings_service.settings.config_dir = str(tmp_path)
+    settings_service.settings.object_storage_bucket_name = BUCKET
+    settings_service.settings.object_storage_prefix = "files"
+    settings_service.settings.object_storage_tags = {"env": "test"}
+    settings_service.settings.object_storage_max_pool_connections = 10
+    service = S3StorageService(Mock(), settings_service)
+    async with service.session.client("s3") as s3_client:
+        with contextlib.suppress(s3_client.exceptions.BucketAlreadyOwnedByYou):
+            await s3_client.create_bucket(Bucket=BUCKET)
+    yield service
+    await service.teardown()
+    # The server lives for the whole module, start every test from an empty bucket
+    async with httpx.AsyncClient() as client:
+        await client.post(f"{s3_endpoint}/moto-api/reset")
+
+
+async def stream(data: bytes, chunk_size: int):
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+async def read_stream(service: S3StorageService, file_name: str, **kwargs) -> bytes:
+    return b"".join([chunk async for chunk in service.get_file_stream("flow", file_name, **kwargs)])
+
+
+@pytest.mark.asyncio
+class TestS3StorageServiceStreaming:
+    async def test_small_streams_are_saved_with_a_single_put(self, s3_storage_service):
+        written = await s3_storage_service.save_file_stream("flow", "small.txt", stream(b"hello world", 4))
+
+        assert written == 11
+        assert await s3_storage_service.get_file("flow", "small.txt") == b"hello world"
+
+    async def test_large_streams_use_a_multipart_upload(self, s3_storage_service):
+        data = bytes(range(256)) * (MIN_MULTIPART_PART_SIZE * 2 // 256 + 100)
+        s3_storage_service.multipart_part_size = MIN_MULTIPART_PART_SIZE
+
+        written = await s3_storage_service.save_file_stream("flow", "large.bin", stream(data, 1024 * 1024))
+
+        assert written == len(data)
+        assert await s3_storage_service.get_file_size("flow", "large.bin") == len(data)
+        assert await read_stream(s3_storage_service, "large.bin", chunk_size=1024 * 1024) == data
+        async with s3_storage_service.session.client("s3") as s3_client:
+            head = await s3_client.head_object(Bucket=BUCKET, Key="files/flow/large.bin")
+        # Multipart ETags end with the number of parts
+        assert head["ETag"].strip('"').endswith("-3")
+
+    async def test_failed_streams_abort_the_multipart_upload(self, s3_storage_service):
+        s3_storage_service.multipart_part_size = MIN_MULTIPART_PART_SIZE
+
+        async def failing_stream():
+            yield b"x" * MIN_MULTIPART_PART_SIZE
+            msg = "client disconnected"
+            raise ConnectionError(msg)
+
+        with pytest.raises(RuntimeError, match="client disconnected"):
+            await s3_storage_service.save_file_stream("flow", "broken.bin", failing_stream())
+
+        assert "broken.bin" not in await s3_storage_service.list_files("flow")
+        async with s3_storage_service.session.client("s3") as s3_client:
+            uploads = await s3_client.list_multipart_uploads(Bucket=BUCKET)
+        assert not uploads.get("Uploads")
+
+    async def test_file_version_changes_when_the_file_is_replaced(self, s3_storage_service):
+        await s3_storage_service.save_file("flow", "file.txt", b"first")
+        version = await s3_storage_service.get_file_version("flow", "file.txt")
+
+        assert await s3_storage_service.get_file_version("flow", "file.txt") == version
+        await s3_storage_service.save_file("flow", "file.txt", b"second")
+        assert await s3_storage_service.get_file_version("flow", "file.txt") != version
+        with pytest.raises(FileNotFoundError):
+            await s3_storage_service.get_file_version("flow", "missing.txt")
+
+    async def test_append_is_not_supported(self, s3_storage_service):
+        with pytest.raises(NotImplementedError):
+            await s3_storage_service.save_file_stream("flow", "file.txt", stream(b"data", 2), append=True)
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected"),
+        [(0, None, b"0123456789"), (2, 5, b"2345"), (7, None, b"789"), (0, 0, b"0")],
+    )
+    async def test_range_reads(self, s3_storage_service, start, end, expected):
+        await s3_storage_service.save_file("flow", "digits.txt", b"0123456789")
+
+        assert await read_stream(s3_storage_service, "digits.txt", start=start, end=end) == expected
+
+
+@pytest.mark.asyncio
+class TestS3StorageServiceClient:
+    async def test_operations_share_one_client(self, s3_storage_service):
+        await s3_storage_service.save_file("flow", "a.txt", b"a")
+        async with s3_storage_service._get_client() as first_client:
+            pass
+        await s3_storage_service.get_file("flow", "a.txt")
+        await s3_storage_service.list_files("flow")
+        async with s3_storage_service._get_client() as second_client:
+            pass
+
+        assert first_client is second_client
+        assert first_client.meta.config.max_pool_connections == 10
+
+    async def test_teardown_closes_the_client(self, s3_storage_service):
+        await s3_storage_service.save_file("flow", "a.txt", b"a")
+
+        await s3_storage_service.teardown()
+
+        assert s3_storage_service._client is None
+        # A later call opens a new client
+        assert await s3_storage_service.get_file("flow", "a.txt") == b"a"
+
+    async def test_delete_files(self, s3_storage_service):
+        for index in range(5):
+            await s3_storage_service.save_file("flow", f"{index}.txt", b"data")
+
+        failures = await s3_storage_service.delete_files("flow", ["0.txt", "1.txt", "2.txt", "missing.txt"])
+
+        assert failures == {}
+        assert sorted(await s3_storage_service.list_files("flow")) == ["3.txt", "4.txt"]
+
+    async def test_iter_files_pages_through_a_prefix(self, s3_storage_service):
+        for index in range(5):
+            await s3_storage_service.save_file("flow", f"report_{index}.txt", b"data")
+        await s3_storage_service.save_file("flow", "other.txt", b"data")
+
+        pages = [page async for page in s3_storage_service.iter_files("flow", prefix="report_", page_size=2)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert sorted(name for page in pages for name in page) == [f"report_{index}.txt" for index in range(5)]
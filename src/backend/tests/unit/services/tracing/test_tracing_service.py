@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -186,8 +187,6 @@ async def test_start_end_tracers(tracing_service):
         assert tracer.metadata_param == outputs
         assert tracer.outputs_param == trace_context.all_outputs
 
-    # Verify worker_task is cancelled
-    assert trace_context.worker_task is None
     assert not trace_context.running
 
 
@@ -413,8 +412,8 @@ async def test_start_tracers_with_exception(tracing_service):
 
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("mock_tracers")
-async def test_trace_worker_with_exception(tracing_service):
-    """Test trace worker exception handling."""
+async def test_trace_exporter_with_exception(tracing_service):
+    """Test trace exporter exception handling."""
     run_id = uuid.uuid4()
     run_name = "test_run"
     user_id = "test_user"
@@ -426,25 +425,103 @@ async def test_trace_worker_with_exception(tracing_service):
         msg = "Mock trace function exception"
         raise ValueError(msg)
 
-    with patch("langflow.services.tracing.service.logger") as mock_logger:
-        # Configure async mock method
-        mock_logger.aexception = AsyncMock()
-
-        # Remove incorrect context manager usage
+    with patch("langflow.services.tracing.exporter.logger") as mock_logger:
         await tracing_service.start_tracers(run_id, run_name, user_id, session_id, project_name)
 
-        # Get trace_context and add failing trace function to queue
-        trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
+        await tracing_service.exporter.export(failing_trace_func)
+        await tracing_service.end_tracers({})
 
-        # Wait for async queue processing
-        await asyncio.sleep(0.1)
+        # Verify exception was logged and the run was still ended
+        mock_logger.exception.assert_called_with("Error processing trace_func")
+        assert tracing_service.exporter.failed == 1
+        for tracer in trace_context_var.get().tracers.values():
+            assert tracer.end_called
 
-        # Verify exception was logged
-        mock_logger.aexception.assert_called_with("Error processing trace_func")
 
-        # Cleanup
-        await tracing_service.end_tracers({})
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_tracers_are_called_off_the_event_loop(tracing_service, mock_component):
+    """Test that the tracers are called from the exporter thread, in the order the traces were queued."""
+    loop_thread = threading.get_ident()
+    calls = []
+
+    def record(name):
+        def trace_func(*_args, **_kwargs):
+            calls.append((name, threading.get_ident()))
+
+        return trace_func
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    tracer = trace_context_var.get().tracers["langsmith"]
+    tracer.add_trace = record("add_trace")
+    tracer.end_trace = record("end_trace")
+    tracer.end = record("end")
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+        pass
+    await tracing_service.end_tracers({})
+
+    assert [name for name, _ in calls] == ["add_trace", "end_trace", "end"]
+    assert all(thread != loop_thread for _, thread in calls)
+    await tracing_service.teardown()
+    assert not tracing_service.exporter.is_started()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_component_traces_are_dropped_when_the_queue_is_full(mock_settings_service, mock_component):
+    """Test the drop policy: traces that do not fit in the queue are counted and neither started nor ended."""
+    mock_settings_service.settings.tracing_queue_size = 1
+    tracing_service = TracingService(mock_settings_service)
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    busy, release = threading.Event(), threading.Event()
+    await tracing_service.exporter.export(lambda: busy.set() or release.wait())
+    await asyncio.to_thread(busy.wait)  # The exporter is busy
+    await tracing_service.exporter.export(lambda: None)  # Fills the queue
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+        pass
+    release.set()
+    await tracing_service.end_tracers({})
+
+    assert tracing_service.exporter.dropped == 1
+    for tracer in trace_context_var.get().tracers.values():
+        assert tracer.add_trace_list == []
+        assert tracer.end_trace_list == []
+        assert tracer.end_called
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_component_traces_wait_when_the_queue_is_full(mock_settings_service, mock_component):
+    """Test the block policy: traces wait for room in the queue without blocking the event loop."""
+    mock_settings_service.settings.tracing_queue_size = 1
+    mock_settings_service.settings.tracing_queue_full_policy = "block"
+    tracing_service = TracingService(mock_settings_service)
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    busy, release = threading.Event(), threading.Event()
+    await tracing_service.exporter.export(lambda: busy.set() or release.wait())
+    await asyncio.to_thread(busy.wait)
+    await tracing_service.exporter.export(lambda: None)
+
+    async def trace():
+        async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+            pass
+
+    task = asyncio.create_task(trace())
+    await asyncio.sleep(0.1)
+    assert not task.done()  # The loop keeps running while the trace waits
+    release.set()
+    await task
+    await tracing_service.end_tracers({})
+
+    assert tracing_service.exporter.dropped == 0
+    assert tracing_service.exporter.blocked >= 1
+    for tracer in trace_context_var.get().tracers.values():
+        assert len(tracer.add_trace_list) == 1
+        assert len(tracer.end_trace_list) == 1
+    await tracing_service.teardown()
 
 
 @pytest.mark.asyncio
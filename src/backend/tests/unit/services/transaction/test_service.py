@@ -17,6 +17,7 @@ class TestTransactionService:
         settings_service = MagicMock()
         settings_service.settings = MagicMock()
         settings_service.settings.transactions_storage_enabled = True
+        settings_service.settings.buffered_log_writer_enabled = False
         return settings_service
 
     @pytest.fixture
@@ -186,3 +187,27 @@ class TestTransactionService:
                 outputs={"result": "output"},
                 status="success",
             )
+
+    @pytest.mark.asyncio
+    async def test_should_enqueue_when_buffered_writer_enabled(self, service: TransactionService) -> None:
+        """Verify log_transaction hands the record to the buffered writer instead of writing it."""
+        service.settings_service.settings.buffered_log_writer_enabled = True
+        buffered_writer = MagicMock()
+        buffered_writer.add_transaction = AsyncMock()
+
+        with (
+            patch("langflow.services.deps.get_buffered_writer_service", return_value=buffered_writer),
+            patch("langflow.services.transaction.service.session_scope") as mock_session_scope,
+        ):
+            await service.log_transaction(
+                flow_id="550e8400-e29b-41d4-a716-446655440000",
+                vertex_id="test-vertex-id",
+                inputs={"key": "value"},
+                outputs={"result": "output"},
+                status="success",
+            )
+
+            mock_session_scope.assert_not_called()
+            buffered_writer.add_transaction.assert_awaited_once()
+            transaction = buffered_writer.add_transaction.call_args[0][0]
+            assert transaction.vertex_id == "test-vertex-id"
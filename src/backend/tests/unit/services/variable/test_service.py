@@ -333,3 +333,39 @@ async def test_create_credential_variable_with_fernet_signature_succeeds(service
     assert variable.name == "TEST_CRED"
     # The value should be encrypted (different from input)
     assert variable.value != "gAAAAABsome-value"
+
+
+async def test_variable_changes_invalidate_the_decrypted_variable_cache(service, session: AsyncSession):
+    """Creating, updating or deleting a variable drops the user's cached decrypted variables once committed."""
+    from lfx.services.variable import resolver as resolver_module
+    from lfx.services.variable.resolver import DecryptedVariableCache
+
+    user_id = uuid4()
+    cache = DecryptedVariableCache(ttl=60)
+
+    async def cache_variables():
+        cache.set(user_id, await service.get_all_decrypted_variables(user_id, session=session))
+
+    with patch.object(resolver_module, "_decrypted_variable_cache", cache):
+        variable = await service.create_variable(user_id, "TEST_VAR", "first", session=session)
+        await session.commit()
+
+        await cache_variables()
+        await service.update_variable(user_id, "TEST_VAR", "second", session=session)
+        # A run reading the variables before the commit still sees the old values
+        assert cache.get(user_id) == {"TEST_VAR": "first"}
+        await session.commit()
+        assert cache.get(user_id) is None
+
+        await cache_variables()
+        assert cache.get(user_id) == {"TEST_VAR": "second"}
+        await service.update_variable_fields(
+            user_id, variable.id, VariableUpdate(id=variable.id, value="third"), session
+        )
+        await session.commit()
+        assert cache.get(user_id) is None
+
+        await cache_variables()
+        await service.delete_variable(user_id, "TEST_VAR", session=session)
+        await session.commit()
+        assert cache.get(user_id) is None
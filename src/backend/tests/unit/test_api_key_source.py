@@ -9,14 +9,26 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from langflow.services.database.models.api_key.cache import get_api_key_cache, get_api_key_usage_tracker
 from langflow.services.database.models.api_key.crud import (
     _check_key_from_db,
     _check_key_from_env,
     check_key,
+    delete_api_key,
 )
 from langflow.services.database.models.user.model import User
 
 
+@pytest.fixture(autouse=True)
+def clear_api_key_cache():
+    """Start and end each test without cached keys or pending uses."""
+    get_api_key_cache().clear()
+    get_api_key_usage_tracker().clear()
+    yield
+    get_api_key_cache().clear()
+    get_api_key_usage_tracker().clear()
+
+
 @pytest.fixture
 def mock_user():
     """Create a mock active user."""
@@ -200,6 +212,7 @@ class TestCheckKeyFromDb:
     async def test_valid_key_returns_user(self, mock_session, mock_user, mock_settings_service_db):
         """Valid API key should return the associated user."""
         mock_api_key = MagicMock()
+        mock_api_key.id = uuid4()
         mock_api_key.user = mock_user
         mock_api_key.total_uses = 0
 
@@ -210,7 +223,7 @@ class TestCheckKeyFromDb:
         result = await _check_key_from_db(mock_session, "sk-valid-key", mock_settings_service_db)
 
         assert result == mock_user
-        assert mock_api_key.total_uses == 1
+        assert get_api_key_usage_tracker().pending[mock_api_key.id][0] == 1
 
     @pytest.mark.asyncio
     async def test_invalid_key_returns_none(self, mock_session, mock_settings_service_db):
@@ -225,8 +238,9 @@ class TestCheckKeyFromDb:
 
     @pytest.mark.asyncio
     async def test_usage_tracking_increments(self, mock_session, mock_user, mock_settings_service_db):
-        """API key usage should be tracked when not disabled."""
+        """API key uses should be counted in memory until the next flush when tracking is not disabled."""
         mock_api_key = MagicMock()
+        mock_api_key.id = uuid4()
         mock_api_key.user = mock_user
         mock_api_key.total_uses = 5
 
@@ -234,11 +248,13 @@ class TestCheckKeyFromDb:
         mock_result.first.return_value = mock_api_key
         mock_session.exec.return_value = mock_result
 
+        await _check_key_from_db(mock_session, "sk-valid-key", mock_settings_service_db)
         await _check_key_from_db(mock_session, "sk-valid-key", mock_settings_service_db)
 
-        assert mock_api_key.total_uses == 6
-        mock_session.add.assert_called_once_with(mock_api_key)
-        mock_session.flush.assert_called_once()
+        assert get_api_key_usage_tracker().pending[mock_api_key.id][0] == 2
+        assert mock_api_key.total_uses == 5  # Written by the tracker, not on the request
+        mock_session.add.assert_not_called()
+        mock_session.flush.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_usage_tracking_disabled(self, mock_session, mock_user, mock_settings_service_db):
@@ -257,6 +273,7 @@ class TestCheckKeyFromDb:
 
         assert mock_api_key.total_uses == 5  # Not incremented
         mock_session.add.assert_not_called()
+        assert get_api_key_usage_tracker().pending == {}
 
     @pytest.mark.asyncio
     async def test_empty_key_returns_none(self, mock_session, mock_settings_service_db):
@@ -269,6 +286,26 @@ class TestCheckKeyFromDb:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_deleted_key_leaves_the_cache_after_commit(self, mock_session, mock_user, mock_settings_service_db):
+        """A deleted key should stay cached until the delete is committed, then be dropped."""
+        mock_api_key = MagicMock()
+        mock_api_key.id = uuid4()
+        mock_api_key.user = mock_user
+        mock_api_key.user_id = mock_user.id
+        mock_result = MagicMock()
+        mock_result.first.return_value = mock_api_key
+        mock_session.exec.return_value = mock_result
+        mock_session.get.return_value = mock_api_key
+        await _check_key_from_db(mock_session, "sk-valid-key", mock_settings_service_db)
+
+        cached_at_commit = []
+        mock_session.commit.side_effect = lambda: cached_at_commit.append(get_api_key_cache().get("sk-valid-key"))
+        await delete_api_key(mock_session, mock_api_key.id, mock_user.id)
+
+        assert cached_at_commit[0] is not None
+        assert get_api_key_cache().get("sk-valid-key") is None
+
 
 # ============================================================================
 # _check_key_from_env tests
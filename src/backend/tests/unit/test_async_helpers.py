@@ -1,12 +1,14 @@
 """Tests for async_helpers.py functions."""
 
 import asyncio
+import concurrent.futures
+import contextvars
 import threading
 import time
 from unittest.mock import patch
 
 import pytest
-from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.async_helpers import BackgroundLoop, get_background_loop, run_until_complete
 
 
 class TestRunUntilComplete:
@@ -193,3 +195,94 @@ class TestRunUntilComplete:
             # Should have called asyncio.run (original behavior)
             mock_run.assert_called_once()
             assert result == "mocked_result"
+
+
+class TestBackgroundLoop:
+    """Test the background loop run_until_complete uses while a loop is running."""
+
+    def test_calls_share_one_background_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        async def main_test():
+            loops = [run_until_complete(current_loop()) for _ in range(3)]
+            return asyncio.get_running_loop(), loops
+
+        main_loop, loops = asyncio.run(main_test())
+        assert loops[0] is loops[1] is loops[2]
+        assert loops[0] is not main_loop
+        assert loops[0] is get_background_loop().loop
+
+    def test_loop_bound_objects_are_reused_across_calls(self):
+        async def create_queue():
+            return asyncio.Queue()
+
+        async def use_queue(queue):
+            await queue.put("item")
+            return await asyncio.wait_for(queue.get(), timeout=1)
+
+        async def main_test():
+            queue = run_until_complete(create_queue())
+            return [run_until_complete(use_queue(queue)) for _ in range(2)]
+
+        assert asyncio.run(main_test()) == ["item", "item"]
+
+    def test_context_variables_are_copied(self):
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        async def read_request_id():
+            return request_id.get()
+
+        async def main_test():
+            request_id.set("request-1")
+            return run_until_complete(read_request_id())
+
+        assert asyncio.run(main_test()) == "request-1"
+
+    def test_nested_call_from_the_background_loop(self):
+        async def inner():
+            await asyncio.sleep(0.001)
+            return "inner"
+
+        async def outer():
+            # Sync code running on the background loop must not wait for the loop it blocks
+            return run_until_complete(inner())
+
+        async def main_test():
+            return run_until_complete(outer())
+
+        assert asyncio.run(main_test()) == "inner"
+
+    def test_stop_cancels_pending_coroutines_and_restarts(self):
+        background_loop = BackgroundLoop(name="test-background-loop")
+        future = background_loop.submit(asyncio.sleep(10))
+        first_loop = background_loop.loop
+
+        background_loop.stop(timeout=5)
+
+        assert future.cancelled()
+        assert not background_loop.is_running()
+        assert first_loop.is_closed()
+
+        async def answer():
+            return 42
+
+        assert background_loop.run(answer()) == 42
+        assert background_loop.loop is not first_loop
+        background_loop.stop()
+
+    def test_run_timeout_cancels_the_coroutine(self):
+        background_loop = BackgroundLoop(name="test-background-loop")
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            background_loop.run(slow(), timeout=0.05)
+        assert cancelled.wait(timeout=5)
+        background_loop.stop()
@@ -1,8 +1,10 @@
 import asyncio
 import os
 import shutil
+import sys
 import tempfile
 import uuid
+from contextlib import asynccontextmanager
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path as SyncPath
@@ -11,9 +13,10 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from anyio import Path
 from httpx import AsyncClient
-from langflow.initial_setup.constants import STARTER_FOLDER_NAME
+from langflow.initial_setup.constants import STARTER_FOLDER_NAME, STARTER_PROJECT_FINGERPRINTS_FILE_NAME
 from langflow.initial_setup.setup import (
     copy_profile_pictures,
+    create_or_update_starter_projects,
     detect_github_url,
     get_project_data,
     load_bundles_from_urls,
@@ -80,6 +83,76 @@ async def test_create_or_update_starter_projects():
         assert num_db_projects == num_projects
 
 
+async def _starter_flow_ids() -> dict[str, uuid.UUID]:
+    async with session_scope() as session:
+        stmt = select(Flow.name, Flow.id).join(Folder).where(Folder.name == STARTER_FOLDER_NAME)
+        return dict((await session.exec(stmt)).all())
+
+
+@pytest.mark.usefixtures("client")
+async def test_reconcile_starter_projects_skips_unchanged_projects():
+    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+    # The first reconciliation records the fingerprints of the projects as created at startup
+    await create_or_update_starter_projects(all_types_dict)
+    flow_ids = await _starter_flow_ids()
+
+    await create_or_update_starter_projects(all_types_dict)
+
+    assert await _starter_flow_ids() == flow_ids
+
+
+@pytest.mark.usefixtures("client")
+async def test_reconcile_starter_projects_updates_changed_projects():
+    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+    await create_or_update_starter_projects(all_types_dict)
+    flow_ids = await _starter_flow_ids()
+    projects = {project["name"]: project for _, project in await load_starter_projects()}
+    changed_name = min(projects)
+    component_types = {node_type for category in all_types_dict.values() for node_type in category}
+    node_type = next(
+        node["data"]["type"]
+        for node in projects[changed_name]["data"]["nodes"]
+        if node["data"].get("type") in component_types
+    )
+    changed_types_dict = deepcopy(all_types_dict)
+    for category in changed_types_dict.values():
+        if node_type in category:
+            category[node_type]["revision"] = "newer"
+    async with session_scope() as session:
+        starter_folder = (await session.exec(select(Folder).where(Folder.name == STARTER_FOLDER_NAME))).first()
+        session.add(Flow(name="Removed starter project", data={}, folder_id=starter_folder.id))
+
+    await create_or_update_starter_projects(changed_types_dict)
+
+    new_flow_ids = await _starter_flow_ids()
+    assert set(new_flow_ids) == set(projects)
+    assert new_flow_ids[changed_name] != flow_ids[changed_name]
+    for name, project in projects.items():
+        uses_changed_type = any(node["data"].get("type") == node_type for node in project["data"]["nodes"])
+        assert (new_flow_ids[name] != flow_ids[name]) == uses_changed_type, name
+
+
+@pytest.mark.usefixtures("client")
+async def test_reconcile_starter_projects_records_fingerprints_only_after_commit(monkeypatch):
+    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+    fingerprints_path = Path(get_settings_service().settings.config_dir) / STARTER_PROJECT_FINGERPRINTS_FILE_NAME
+    if await fingerprints_path.exists():
+        await fingerprints_path.unlink()
+
+    @asynccontextmanager
+    async def failing_session_scope():
+        async with session_scope() as session:
+            yield session
+            msg = "Commit failed"
+            raise RuntimeError(msg)
+
+    monkeypatch.setattr("langflow.initial_setup.setup.session_scope", failing_session_scope)
+    with pytest.raises(RuntimeError, match="Commit failed"):
+        await create_or_update_starter_projects(all_types_dict)
+
+    assert not await fingerprints_path.exists()
+
+
 # Some starter projects require integration
 # async def test_starter_projects_can_run_successfully(client):
 #     with session_scope() as session:
@@ -281,7 +354,15 @@ def set_fs_flows_polling_interval():
     os.unsetenv("LANGFLOW_FS_FLOWS_POLLING_INTERVAL")
 
 
-@pytest.mark.usefixtures("set_fs_flows_polling_interval")
+@pytest.fixture(params=["watch", "poll"])
+def fs_flows_sync_mode(request, monkeypatch):
+    """Run the flow sync with file system notifications, and with polling as if watchfiles was not installed."""
+    if request.param == "poll":
+        monkeypatch.setitem(sys.modules, "watchfiles", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval", "fs_flows_sync_mode")
 async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
     # Use a relative path which will be placed in the user's flows directory
     # The path validation requires paths to be within the user's flows directory for security
@@ -329,6 +410,16 @@ async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
         assert result["description"] == "new description"
         assert result["data"] == {"nodes": {}, "edges": {}}
         assert result["locked"] is True
+
+        # Later changes are picked up too, once the file is watched
+        fs_flow.name = "newer name"
+        await flow_file.write_text(fs_flow.model_dump_json(), encoding="utf-8")
+        for i in range(30):
+            response = await client.get(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+            if response.json()["name"] == "newer name":
+                break
+            assert i != 29, "flow name should have been updated again"
+            await asyncio.sleep(0.1)
     finally:
         if "flow_file" in locals():
             await flow_file.unlink(missing_ok=True)
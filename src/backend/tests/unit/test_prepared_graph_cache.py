@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+from langflow.processing.prepared_graph_cache import PreparedGraphCache, fingerprint_tweaks
+
+BUILD_PREPARED_GRAPH = "langflow.processing.prepared_graph_cache.build_prepared_graph"
+
+
+def _new_prepared_graph(*_args, **_kwargs):
+    return object()
+
+
+def _flow(updated_at=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        name="flow",
+        data={"nodes": [], "edges": []},
+        updated_at=updated_at or datetime.now(timezone.utc),
+    )
+
+
+def test_fingerprint_tweaks_is_order_independent():
+    assert fingerprint_tweaks({"a": 1, "b": 2}, stream=False) == fingerprint_tweaks({"b": 2, "a": 1}, stream=False)
+    assert fingerprint_tweaks({"a": 1}, stream=False) != fingerprint_tweaks({"a": 1}, stream=True)
+    assert fingerprint_tweaks(None, stream=False) == fingerprint_tweaks({}, stream=False)
+
+
+def test_prepared_graph_is_reused_for_same_flow_version_and_tweaks():
+    cache = PreparedGraphCache(max_size=4)
+    flow = _flow()
+    with patch(BUILD_PREPARED_GRAPH, side_effect=_new_prepared_graph) as build:
+        first = cache.get_prepared_graph(flow, {"x": {"value": 1}}, stream=False)
+        second = cache.get_prepared_graph(flow, {"x": {"value": 1}}, stream=False)
+        third = cache.get_prepared_graph(flow, {"x": {"value": 2}}, stream=False)
+
+    assert first is second
+    assert third is not first
+    assert build.call_count == 2
+    assert cache.stats() == {"size": 2, "max_size": 4, "hits": 1, "misses": 2}
+
+
+def test_updated_flow_replaces_stale_entries():
+    cache = PreparedGraphCache(max_size=4)
+    flow = _flow()
+    with patch(BUILD_PREPARED_GRAPH, side_effect=_new_prepared_graph):
+        old = cache.get_prepared_graph(flow, {}, stream=False)
+        flow.updated_at += timedelta(seconds=1)
+        new = cache.get_prepared_graph(flow, {}, stream=False)
+
+    assert new is not old
+    assert len(cache) == 1
+
+
+def test_lru_eviction_and_invalidation():
+    cache = PreparedGraphCache(max_size=1)
+    flow_a, flow_b = _flow(), _flow()
+    with patch(BUILD_PREPARED_GRAPH, side_effect=_new_prepared_graph):
+        cache.get_prepared_graph(flow_a, {}, stream=False)
+        cache.get_prepared_graph(flow_b, {}, stream=False)
+        assert len(cache) == 1
+        cache.invalidate_flow(str(flow_b.id))
+    assert len(cache) == 0
@@ -1,4 +1,5 @@
 import ast
+import hashlib
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
@@ -11,7 +12,8 @@ from zipfile import ZipFile, is_zipfile
 import orjson
 import pandas as pd
 
-from lfx.base.data.storage_utils import get_file_size, read_file_bytes
+from lfx.base.data.parse_cache import ParseCache, get_parse_cache
+from lfx.base.data.storage_utils import get_file_size, get_file_version, read_file_bytes
 from lfx.custom.custom_component.component import Component
 from lfx.io import BoolInput, FileInput, HandleInput, Output, StrInput
 from lfx.schema.data import Data
@@ -112,6 +114,8 @@ class BaseFileComponent(Component, ABC):
 
     SERVER_FILE_PATH_FIELDNAME = "file_path"
     SUPPORTED_BUNDLE_EXTENSIONS = ["zip", "tar", "tgz", "bz2", "gz"]
+    # Bump when a change to the parsing changes the Data it produces, so that cached parses are not reused
+    PARSE_CACHE_VERSION = 1
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -220,8 +224,8 @@ class BaseFileComponent(Component, ABC):
             # Step 3: Final validation of file types
             final_files = self._filter_and_mark_files(all_files)
 
-            # Step 4: Process files
-            processed_files = self.process_files(final_files)
+            # Step 4: Process files, reusing earlier parses of the same contents
+            processed_files = self._process_files_with_parse_cache(final_files)
 
             # Extract and flatten Data objects to return
             return [data for file in processed_files for data in file.data if file.data]
@@ -238,6 +242,92 @@ class BaseFileComponent(Component, ABC):
                     else:
                         file.path.unlink()
 
+    def parse_cache_options(self, file_list: list[BaseFile]) -> dict[str, Any] | None:  # noqa: ARG002
+        """Return the options that determine how `file_list` is parsed, or None to always parse it.
+
+        Components whose parse results depend only on the file contents and these options
+        override this so that `load_files_base` reuses results from the parse cache.
+
+        Args:
+            file_list (list[BaseFile]): The files about to be processed.
+
+        Returns:
+            dict[str, Any] | None: JSON-serializable options that are part of the cache key.
+        """
+        return None
+
+    def _parse_cache_content_hash(self, cache: ParseCache, file: BaseFile) -> str:
+        if get_settings_service().settings.storage_type == "s3":
+            # The object version spares downloading the file just to hash it, which a miss does again
+            if (version := run_until_complete(get_file_version(str(file.path)))) is not None:
+                return hashlib.sha256(f"{file.path}\0{version}".encode()).hexdigest()
+            return hashlib.sha256(run_until_complete(read_file_bytes(str(file.path)))).hexdigest()
+        return cache.file_digest(file.path)
+
+    def _process_files_with_parse_cache(self, file_list: list[BaseFile]) -> list[BaseFile]:
+        """Process `file_list`, serving files parsed before with the same options from the parse cache.
+
+        Only the files that miss the cache are passed to `process_files`, each with nothing but its
+        path as input data. The results are cached and then merged into the input data like
+        `rollup_data` does, so hits and misses produce the same Data.
+        """
+        cache = get_parse_cache()
+        options = self.parse_cache_options(file_list) if cache is not None and file_list else None
+        if cache is None or options is None:
+            return self.process_files(file_list)
+
+        component_version = f"{type(self).__name__}:{self.PARSE_CACHE_VERSION}"
+        keys: list[str | None] = []
+        parsed: dict[int, list[Data]] = {}
+        for index, file in enumerate(file_list):
+            try:
+                # Parsers are picked by extension, so the same bytes under another one parse differently
+                key = cache.make_key(
+                    self._parse_cache_content_hash(cache, file),
+                    {**options, "suffix": file.path.suffix.lower()},
+                    component_version,
+                )
+            except (OSError, ValueError) as e:
+                self.log(f"Could not hash {file.path.name} for the parse cache: {e}")
+                key = None
+            keys.append(key)
+            if key is not None and (payloads := cache.get(key)) is not None:
+                parsed[index] = [
+                    Data(data={**payload, self.SERVER_FILE_PATH_FIELDNAME: str(file.path)}) for payload in payloads
+                ]
+
+        missed = [index for index in range(len(file_list)) if index not in parsed]
+        if missed:
+            bare_files = [
+                BaseFileComponent.BaseFile(
+                    Data(data={self.SERVER_FILE_PATH_FIELDNAME: str(file_list[index].path)}),
+                    file_list[index].path,
+                    delete_after_processing=file_list[index].delete_after_processing,
+                )
+                for index in missed
+            ]
+            for index, processed_file in zip(missed, self.process_files(bare_files), strict=True):
+                parsed[index] = processed_file.data
+                payloads = [data.data for data in processed_file.data]
+                # Failed parses are retried on the next run
+                if keys[index] is not None and payloads and not any("error" in payload for payload in payloads):
+                    cache.set(keys[index], payloads)
+
+        stats = cache.stats()
+        self.log(
+            f"Parse cache: {len(file_list) - len(missed)} hits, {len(missed)} misses "
+            f"(total {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions, "
+            f"{stats['bytes']} bytes)."
+        )
+        return [
+            BaseFileComponent.BaseFile(
+                data=file.merge_data(parsed[index]),
+                path=file.path,
+                delete_after_processing=file.delete_after_processing,
+            )
+            for index, file in enumerate(file_list)
+        ]
+
     def load_files_core(self) -> list[Data]:
         """Load files and return as Data objects.
 
@@ -0,0 +1,539 @@
+"""Docling conversion in isolated worker processes.
+
+All Docling parsing runs outside the Langflow process so that its memory use and native
+library state cannot affect the server. There are two ways to run it:
+
+- ``DOCLING_ONE_SHOT_SCRIPT`` converts a single file in a fresh ``python -c`` interpreter.
+- ``DoclingWorkerPool`` keeps a bounded number of long-lived interpreters that read jobs as JSON
+  lines from stdin. Each worker keeps its ``DocumentConverter`` instances warm per
+  (pipeline, OCR engine) configuration, so a batch of files pays the Docling import and model
+  load cost once per worker instead of once per file.
+
+Both exchange JSON only, which avoids pickling documents between processes. Workers are
+recycled after a number of jobs or when their resident memory has grown too much since their
+converters were loaded, and a worker that exceeds the job timeout is killed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from lfx.log.logger import logger
+
+_DOCLING_CONVERT_SCRIPT = textwrap.dedent(
+    r"""
+    import json, os, sys
+    from collections import OrderedDict
+
+    MAX_CONVERTERS = 4
+
+    def try_imports():
+        try:
+            from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
+            from docling.document_converter import DocumentConverter  # type: ignore
+            from docling_core.types.doc import ImageRefMode  # type: ignore
+            return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
+        except Exception as e:
+            raise e
+
+    def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
+        # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
+        if pipeline == "standard":
+            try:
+                from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
+                from docling.document_converter import PdfFormatOption  # type: ignore
+
+                pipe = PdfPipelineOptions()
+                pipe.do_ocr = False
+
+                if ocr_engine:
+                    try:
+                        from docling.models.factories import get_ocr_factory  # type: ignore
+                        pipe.do_ocr = True
+                        fac = get_ocr_factory(allow_external_plugins=False)
+                        pipe.ocr_options = fac.create_options(kind=ocr_engine)
+                    except Exception:
+                        # If OCR setup fails, disable it
+                        pipe.do_ocr = False
+
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
+
+                return DocumentConverter(format_options=fmt)
+            except Exception:
+                return DocumentConverter()
+
+        # --- Vision-Language Model (VLM) pipeline ---
+        if pipeline == "vlm":
+            try:
+                from docling.datamodel.pipeline_options import VlmPipelineOptions
+                from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
+                from docling.document_converter import PdfFormatOption
+                from docling.pipeline.vlm_pipeline import VlmPipeline
+
+                vl_pipe = VlmPipelineOptions(
+                    vlm_options=GRANITEDOCLING_TRANSFORMERS,
+                )
+
+                if sys.platform == "darwin":
+                    try:
+                        import mlx_vlm
+                        vl_pipe.vlm_options = GRANITEDOCLING_MLX
+                    except ImportError as e:
+                        raise e
+
+                # VLM paths generally don't need OCR; keep OCR off by default here.
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+
+                return DocumentConverter(format_options=fmt)
+            except Exception as e:
+                raise e
+
+        # --- Fallback: default converter with no special options ---
+        return DocumentConverter()
+
+    def get_converter(converters, pipeline, ocr_engine):
+        # Converters load their models when created, keep the most recently used ones
+        key = (pipeline, ocr_engine)
+        if key in converters:
+            converters.move_to_end(key)
+            return converters[key]
+        ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+        converters[key] = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
+        while len(converters) > MAX_CONVERTERS:
+            converters.popitem(last=False)
+        return converters[key]
+
+    def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
+        try:
+            mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
+            return document.export_to_markdown(
+                image_mode=mode,
+                image_placeholder=img_ph,
+                page_break_placeholder=pg_ph,
+            )
+        except Exception:
+            try:
+                return document.export_to_text()
+            except Exception:
+                return str(document)
+
+    def to_rows(doc_dict):
+        rows = []
+        for t in doc_dict.get("texts", []):
+            prov = t.get("prov") or []
+            page_no = None
+            if prov and isinstance(prov, list) and isinstance(prov[0], dict):
+                page_no = prov[0].get("page_no")
+            rows.append({
+                "page_no": page_no,
+                "label": t.get("label"),
+                "text": t.get("text"),
+                "level": t.get("level"),
+            })
+        return rows
+
+    def convert_file(cfg, converters):
+        file_path = cfg["file_path"]
+        markdown = cfg["markdown"]
+        image_mode = cfg["image_mode"]
+        img_ph = cfg["md_image_placeholder"]
+        pg_ph = cfg["md_page_break_placeholder"]
+        pipeline = cfg["pipeline"]
+        ocr_engine = cfg.get("ocr_engine")
+        meta = {"file_path": file_path}
+
+        try:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            converter = get_converter(converters, pipeline, ocr_engine)
+            try:
+                res = converter.convert(file_path)
+            except Exception as e:
+                return {"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}
+
+            ok = False
+            if hasattr(res, "status"):
+                try:
+                    ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
+                except Exception:
+                    ok = (str(res.status).lower() == "success")
+            if not ok and hasattr(res, "document"):
+                ok = getattr(res, "document", None) is not None
+            if not ok:
+                return {"ok": False, "error": "Docling conversion failed", "meta": meta}
+
+            doc = getattr(res, "document", None)
+            if doc is None:
+                return {"ok": False, "error": "Docling produced no document", "meta": meta}
+
+            if markdown:
+                text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
+                return {"ok": True, "mode": "markdown", "text": text, "meta": meta}
+
+            # structured
+            try:
+                doc_dict = doc.export_to_dict()
+            except Exception as e:
+                return {"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}
+
+            rows = to_rows(doc_dict)
+            return {"ok": True, "mode": "structured", "doc": rows, "meta": meta}
+        except Exception as e:
+            return {
+                "ok": False,
+                "error": f"Docling processing error: {e}",
+                "meta": {"file_path": file_path},
+            }
+
+    def rss_bytes():
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except Exception:
+            try:
+                import resource
+                usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                return usage if sys.platform == "darwin" else usage * 1024
+            except Exception:
+                return 0
+    """
+)
+
+DOCLING_ONE_SHOT_SCRIPT = _DOCLING_CONVERT_SCRIPT + textwrap.dedent(
+    r"""
+    def main():
+        cfg = json.loads(sys.stdin.read())
+        print(json.dumps(convert_file(cfg, OrderedDict())))
+
+    if __name__ == "__main__":
+        main()
+    """
+)
+"""Child script that converts the file described by the JSON config on stdin and prints a JSON result."""
+
+DOCLING_WORKER_SCRIPT = _DOCLING_CONVERT_SCRIPT + textwrap.dedent(
+    r"""
+    def main():
+        # Keep anything Docling prints off the stream the results are sent on
+        out = sys.stdout
+        sys.stdout = sys.stderr
+        converters = OrderedDict()
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            result = convert_file(json.loads(line), converters)
+            out.write(json.dumps({"result": result, "rss": rss_bytes()}) + "\n")
+            out.flush()
+
+    if __name__ == "__main__":
+        main()
+    """
+)
+"""Child script that converts one file per JSON line on stdin until stdin is closed.
+
+Each job is answered with one JSON line holding the result and the worker's resident memory.
+"""
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+DEFAULT_MAX_RSS_GROWTH_MB = 2048
+DEFAULT_JOB_TIMEOUT = 600.0
+_STDERR_TAIL_LINES = 50
+
+
+class DoclingWorkerError(RuntimeError):
+    """Raised when a Docling worker process exits while it has a job."""
+
+
+class _DoclingWorker:
+    """A long-lived interpreter running ``DOCLING_WORKER_SCRIPT``."""
+
+    def __init__(self, script: str) -> None:
+        self.process = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-u", "-c", script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self.jobs = 0
+        self.rss = 0
+        self.baseline_rss = 0
+        self.configs: set[tuple[Any, ...]] = set()
+        self._responses: queue.Queue[str | None] = queue.Queue()
+        self._stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        # Both pipes are drained continuously, a full pipe would block the worker
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        self._stderr_reader.start()
+
+    def _read_stdout(self) -> None:
+        for line in self.process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    def _read_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr_tail.append(line.rstrip())
+
+    def stderr_tail(self) -> str:
+        return "\n".join(self._stderr_tail) or "no output from worker process"
+
+    def run(self, job: dict[str, Any], timeout: float | None) -> dict[str, Any]:
+        """Send ``job`` to the worker and wait for its result.
+
+        Raises:
+            TimeoutError: If no result arrives within ``timeout`` seconds.
+            DoclingWorkerError: If the worker exits or answers with something that is not a result.
+        """
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+            line = self._responses.get(timeout=timeout)
+        except (BrokenPipeError, OSError) as exc:
+            msg = f"Docling worker is not running: {self.stderr_tail()}"
+            raise DoclingWorkerError(msg) from exc
+        except queue.Empty as exc:
+            msg = f"Docling worker did not finish within {timeout} seconds"
+            raise TimeoutError(msg) from exc
+        if line is None:
+            # Let the last lines the worker wrote to stderr arrive before reporting them
+            self._stderr_reader.join(timeout=1)
+            msg = f"Docling worker exited: {self.stderr_tail()}"
+            raise DoclingWorkerError(msg)
+        try:
+            response = json.loads(line)
+            result = response["result"]
+        except (ValueError, KeyError, TypeError) as exc:
+            msg = f"Invalid JSON from Docling worker: {exc}. stderr={self.stderr_tail()}"
+            raise DoclingWorkerError(msg) from exc
+        self.jobs += 1
+        self.rss = int(response.get("rss") or 0)
+        return result
+
+    def close(self, timeout: float = 5) -> None:
+        with contextlib.suppress(OSError):
+            self.process.stdin.close()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.wait()
+
+
+class DoclingWorkerPool:
+    """A size-bounded pool of Docling worker processes.
+
+    ``convert`` is thread-safe and blocks until a worker is free, so files are converted
+    concurrently by calling it from several threads. A job goes to an idle worker that already
+    has a converter for its (pipeline, OCR engine) configuration when there is one, then to any
+    idle worker, and a new worker is started only when none is idle.
+
+    Attributes:
+        max_workers (int): Maximum number of worker processes.
+        max_jobs_per_worker (int): Jobs after which a worker is replaced. 0 means no limit.
+        max_rss_growth_mb (int): Growth of a worker's resident memory, since its converters were
+            loaded, after which it is replaced. 0 means no limit.
+        job_timeout (float): Seconds a job may take before its worker is killed. 0 means no limit.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        max_rss_growth_mb: int = DEFAULT_MAX_RSS_GROWTH_MB,
+        job_timeout: float = DEFAULT_JOB_TIMEOUT,
+        worker_script: str = DOCLING_WORKER_SCRIPT,
+    ) -> None:
+        if max_workers < 1:
+            msg = "max_workers must be at least 1"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.job_timeout = job_timeout
+        self._worker_script = worker_script
+        self._idle: list[_DoclingWorker] = []
+        self._busy: set[_DoclingWorker] = set()
+        self._starting = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._metrics = {
+            "jobs": 0,
+            "failed_jobs": 0,
+            "timeouts": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+            "job_seconds": 0.0,
+        }
+
+    def _acquire(self, config: tuple[Any, ...]) -> _DoclingWorker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    msg = "The Docling worker pool is shut down"
+                    raise RuntimeError(msg)
+                worker = next((worker for worker in self._idle if config in worker.configs), None)
+                if worker is None and self._idle:
+                    worker = self._idle[-1]
+                if worker is not None:
+                    self._idle.remove(worker)
+                    self._busy.add(worker)
+                    return worker
+                if len(self._busy) + self._starting < self.max_workers:
+                    self._starting += 1
+                    break
+                self._condition.wait()
+        try:
+            worker = _DoclingWorker(self._worker_script)
+        finally:
+            with self._condition:
+                self._starting -= 1
+                self._condition.notify()
+        with self._condition:
+            self._busy.add(worker)
+            self._metrics["workers_started"] += 1
+        return worker
+
+    def _should_recycle(self, worker: _DoclingWorker) -> bool:
+        if self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+            return True
+        return bool(self.max_rss_growth_mb and worker.rss - worker.baseline_rss > self.max_rss_growth_mb * 1024 * 1024)
+
+    def _release(self, worker: _DoclingWorker, *, failed: bool) -> None:
+        recycle = not failed and self._should_recycle(worker)
+        with self._condition:
+            self._busy.discard(worker)
+            if recycle:
+                self._metrics["workers_recycled"] += 1
+            if failed or recycle or self._closed:
+                close = True
+            else:
+                close = False
+                self._idle.append(worker)
+            self._condition.notify()
+        if failed:
+            worker.kill()
+        elif close:
+            logger.debug(f"Recycling Docling worker after {worker.jobs} jobs at {worker.rss // (1024 * 1024)} MB")
+            worker.close()
+
+    def convert(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Convert one file and return the worker's result.
+
+        ``job`` holds the same config as the one-shot script reads from stdin. Timeouts and
+        worker crashes are returned as failed results so that one file cannot fail a batch.
+        """
+        config = (job.get("pipeline"), job.get("ocr_engine"))
+        worker = self._acquire(config)
+        started = time.perf_counter()
+        failed = timed_out = False
+        try:
+            result = worker.run(job, self.job_timeout or None)
+        except (TimeoutError, DoclingWorkerError) as exc:
+            failed = True
+            timed_out = isinstance(exc, TimeoutError)
+            result = {"ok": False, "error": str(exc), "meta": {"file_path": job.get("file_path")}}
+            logger.warning(f"Docling worker failed on {job.get('file_path')}: {exc}")
+        else:
+            if config not in worker.configs:
+                # Loading a converter grows the worker, measure growth from here
+                worker.configs.add(config)
+                worker.baseline_rss = worker.rss
+        finally:
+            elapsed = time.perf_counter() - started
+            self._release(worker, failed=failed)
+        with self._condition:
+            self._metrics["jobs"] += 1
+            self._metrics["job_seconds"] += elapsed
+            if not result.get("ok"):
+                self._metrics["failed_jobs"] += 1
+            if timed_out:
+                self._metrics["timeouts"] += 1
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the pool counters."""
+        with self._condition:
+            stats: dict[str, Any] = dict(self._metrics)
+            stats["workers"] = len(self._idle) + len(self._busy)
+            stats["idle_workers"] = len(self._idle)
+        stats["average_job_seconds"] = stats["job_seconds"] / stats["jobs"] if stats["jobs"] else 0.0
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop all idle workers. Busy workers are stopped when their job finishes."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for worker in idle:
+            worker.close()
+
+
+_pool: DoclingWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_docling_worker_pool() -> DoclingWorkerPool | None:
+    """Return the process-wide Docling worker pool, or None when it is disabled in the settings."""
+    global _pool  # noqa: PLW0603
+    if _pool is not None:
+        return _pool
+    from lfx.services.deps import get_settings_service
+
+    try:
+        settings = get_settings_service().settings
+    except Exception:  # noqa: BLE001
+        logger.debug("Settings service unavailable, the Docling worker pool is disabled")
+        return None
+    if settings.docling_worker_pool_size <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = DoclingWorkerPool(
+                max_workers=settings.docling_worker_pool_size,
+                max_jobs_per_worker=settings.docling_worker_max_jobs,
+                max_rss_growth_mb=settings.docling_worker_max_rss_growth_mb,
+                job_timeout=settings.docling_job_timeout,
+            )
+            atexit.register(shutdown_docling_worker_pool)
+    return _pool
+
+
+def shutdown_docling_worker_pool() -> None:
+    """Stop the process-wide Docling worker pool if it was started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -0,0 +1,207 @@
+"""On-disk cache of parsed file contents.
+
+File components parse every file on every run, even when a flow is fed the same upload again
+and again. ``ParseCache`` stores the ``Data`` payloads a parse produced under a key made of the
+file content hash, the options that affect parsing and the component version, so an unchanged
+file with unchanged options is never parsed twice.
+
+Entries are JSON files under ``<config_dir>/parse_cache``. Reading an entry refreshes its
+modification time, and once the directory grows over its size limit the least recently used
+entries are deleted. The directory is the source of truth, so several workers can share it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from lfx.log.logger import logger
+
+PARSE_CACHE_FORMAT_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+_DIGEST_MEMO_SIZE = 4096
+# Eviction frees a little more than needed so that it does not run on every write
+_EVICTION_TARGET_RATIO = 0.9
+
+
+def _lfx_version() -> str:
+    try:
+        return version("lfx")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class ParseCache:
+    """A size-bounded LRU cache of parse results stored as JSON files.
+
+    Attributes:
+        cache_dir (Path): Directory holding the entries.
+        max_bytes (int): Total size of the entries above which the least recently used ones are deleted.
+        hits (int): Lookups that found an entry.
+        misses (int): Lookups that found no entry.
+        evictions (int): Entries deleted to stay within ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes: int | None = None
+        self._digests: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(content_hash: str, options: dict[str, Any], component_version: str) -> str:
+        """Return the cache key of a file content parsed with ``options`` by ``component_version``."""
+        fingerprint = orjson.dumps(
+            {
+                "format": PARSE_CACHE_FORMAT_VERSION,
+                "content": content_hash,
+                "options": options,
+                "component": component_version,
+                "lfx": _lfx_version(),
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(fingerprint).hexdigest()
+
+    def file_digest(self, path: Path) -> str:
+        """Return the sha256 of a local file, reusing the last digest while its size and mtime are unchanged."""
+        stat = path.stat()
+        memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if (digest := self._digests.get(memo_key)) is not None:
+                self._digests.move_to_end(memo_key)
+                return digest
+        sha256 = hashlib.sha256()
+        with path.open("rb") as file:
+            while chunk := file.read(_HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+        with self._lock:
+            self._digests[memo_key] = digest
+            while len(self._digests) > _DIGEST_MEMO_SIZE:
+                self._digests.popitem(last=False)
+        return digest
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Return the payloads stored under ``key``, or None if there is no readable entry."""
+        path = self._entry_path(key)
+        try:
+            payloads = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            payloads = None
+        except (OSError, orjson.JSONDecodeError) as exc:
+            logger.debug(f"Ignoring unreadable parse cache entry {path}: {exc}")
+            with contextlib.suppress(OSError):
+                path.unlink()
+            payloads = None
+        with self._lock:
+            if payloads is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # The modification time orders entries for eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return payloads
+
+    def set(self, key: str, payloads: list[dict[str, Any]]) -> bool:
+        """Store ``payloads`` under ``key``. Returns False if they cannot be serialized to JSON."""
+        try:
+            content = orjson.dumps(payloads)
+        except TypeError as exc:
+            logger.debug(f"Not caching a parse result that cannot be serialized: {exc}")
+            return False
+        if len(content) > self.max_bytes:
+            return False
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary_path.write_bytes(content)
+        temporary_path.replace(path)
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan_size()
+            else:
+                self._bytes += len(content)
+            over_limit = self._bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+        return True
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Delete the least recently used entries until the cache is within its size limit."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICTION_TARGET_RATIO
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                evicted += 1
+            total -= size
+        with self._lock:
+            self._bytes = total
+            self.evictions += evicted
+        return evicted
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan_size()
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "bytes": self._bytes}
+
+
+_parse_cache: ParseCache | None = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Return the process-wide parse cache, or None when it is disabled in the settings."""
+    global _parse_cache  # noqa: PLW0603
+    if _parse_cache is not None:
+        return _parse_cache
+    from lfx.services.deps import get_settings_service
+
+    try:
+        settings = get_settings_service().settings
+    except Exception:  # noqa: BLE001
+        logger.debug("Settings service unavailable, the parse cache is disabled")
+        return None
+    if settings.file_parse_cache_max_mb <= 0 or not settings.config_dir:
+        return None
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            _parse_cache = ParseCache(
+                Path(settings.config_dir) / "parse_cache",
+                max_bytes=settings.file_parse_cache_max_mb * 1024 * 1024,
+            )
+    return _parse_cache
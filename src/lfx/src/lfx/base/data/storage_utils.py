@@ -91,6 +91,36 @@ async def read_file_bytes(
     return path_obj.read_bytes()
 
 
+async def get_file_version(file_path: str, storage_service: StorageService | None = None) -> str | None:
+    """Get the storage version of a file, which changes whenever its content does.
+
+    Args:
+        file_path: Path to the file (S3 key format "flow_id/filename" or local path)
+        storage_service: Optional storage service instance (will get from deps if not provided)
+
+    Returns:
+        str | None: The version of the file, or None for local files and storages that do not track one
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    settings = get_settings_service().settings
+
+    if settings.storage_type != "s3":
+        return None
+
+    parsed = parse_storage_path(file_path)
+    if not parsed:
+        msg = f"Invalid S3 path format: {file_path}. Expected 'flow_id/filename'"
+        raise ValueError(msg)
+
+    if storage_service is None:
+        storage_service = get_storage_service()
+
+    flow_id, filename = parsed
+    return await storage_service.get_file_version(flow_id, filename)
+
+
 async def read_file_text(
     file_path: str,
     encoding: str = "utf-8",
@@ -0,0 +1,3 @@
+from .loop_body import LoopBody
+
+__all__ = ["LoopBody"]
@@ -0,0 +1,199 @@
+"""Run the body of a Loop component for many items concurrently.
+
+In its default mode the Loop component sends one item at a time around the graph cycle, and the
+scheduler evaluates the cycle again for every item. ``LoopBody`` takes the vertices of that cycle
+out of the graph once, as a ``PreparedGraph``, and runs an independent copy of them for each item,
+so items that do not depend on each other can be processed concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any
+
+from lfx.graph.graph.prepared import PreparedGraph
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lfx.graph.graph.base import Graph
+    from lfx.graph.vertex.base import Vertex
+
+LOOP_ITEM_NAME = "item"
+
+
+class LoopBody:
+    """The vertices a Loop component sends each item through, prepared to run once per item.
+
+    The body is made of the vertices reachable from the Loop's ``item`` output without going
+    through the Loop again. One of them, the exit vertex, feeds the Loop's ``item`` input and its
+    output is the result for the item. Vertices outside the body that it depends on are built
+    once: their results are passed to every run, like the item itself. Those that have not been
+    built yet when the body is prepared are run with each item instead.
+
+    Args:
+        graph: The graph the Loop component belongs to.
+        loop_id: The ID of the Loop vertex.
+
+    Raises:
+        ValueError: If the Loop's ``item`` output or input is not connected, or the vertex
+            connected to the input is not reachable from the output.
+    """
+
+    def __init__(self, graph: Graph, loop_id: str) -> None:
+        self.graph = graph
+        self.loop_id = loop_id
+
+        item_edges = [
+            edge
+            for edge in graph.edges
+            if edge.source_id == loop_id and getattr(edge.source_handle, "name", None) == LOOP_ITEM_NAME
+        ]
+        feedback_edge = next(
+            (edge for edge in graph.edges if edge.target_id == loop_id and edge.target_param == LOOP_ITEM_NAME),
+            None,
+        )
+        if not item_edges or feedback_edge is None:
+            msg = "The Item output and the Item input of the Loop must both be connected to run items in parallel."
+            raise ValueError(msg)
+
+        body_ids = self._reachable({edge.target_id for edge in item_edges}, self._adjacency(graph, reverse=False))
+        if feedback_edge.source_id not in body_ids:
+            msg = "The component connected to the Item input of the Loop must be reachable from its Item output."
+            raise ValueError(msg)
+        vertex_ids = self._with_unbuilt_dependencies(body_ids)
+
+        # Edges coming from outside the run: the item, and the results of vertices built already
+        self._item_targets: list[tuple[str, str]] = []
+        self._external_sources: dict[tuple[str, str], list[Vertex]] = defaultdict(list)
+        for edge in graph.edges:
+            if edge.target_id not in vertex_ids or edge.source_id in vertex_ids or edge.target_param is None:
+                continue
+            if edge.source_id == loop_id:
+                if getattr(edge.source_handle, "name", None) == LOOP_ITEM_NAME:
+                    self._item_targets.append((edge.target_id, edge.target_param))
+                continue
+            self._external_sources[edge.target_id, edge.target_param].append(graph.get_vertex(edge.source_id))
+        self._external_values: dict[tuple[str, str], Any] | None = None
+
+        self.exit_id = feedback_edge.source_id
+        self.exit_output = feedback_edge.source_handle.name
+        self.vertex_ids = frozenset(vertex_ids)
+        self.prepared = PreparedGraph(
+            {
+                "nodes": [vertex.to_data() for vertex in graph.vertices if vertex.id in vertex_ids],
+                "edges": [
+                    edge.to_data()
+                    for edge in graph.edges
+                    if edge.source_id in vertex_ids and edge.target_id in vertex_ids
+                ],
+            },
+            flow_id=graph.flow_id,
+            flow_name=graph.flow_name,
+        )
+
+    def _adjacency(self, graph: Graph, *, reverse: bool) -> dict[str, set[str]]:
+        adjacency: dict[str, set[str]] = defaultdict(set)
+        for edge in graph.edges:
+            if self.loop_id in {edge.source_id, edge.target_id}:
+                continue
+            if reverse:
+                adjacency[edge.target_id].add(edge.source_id)
+            else:
+                adjacency[edge.source_id].add(edge.target_id)
+        return adjacency
+
+    @staticmethod
+    def _reachable(start: set[str], adjacency: dict[str, set[str]]) -> set[str]:
+        reachable = set(start)
+        queue = deque(start)
+        while queue:
+            for next_id in adjacency.get(queue.popleft(), ()):
+                if next_id not in reachable:
+                    reachable.add(next_id)
+                    queue.append(next_id)
+        return reachable
+
+    def _with_unbuilt_dependencies(self, body_ids: set[str]) -> set[str]:
+        predecessors = self._adjacency(self.graph, reverse=True)
+        vertex_ids = set(body_ids)
+        queue = deque(body_ids)
+        while queue:
+            for predecessor_id in predecessors.get(queue.popleft(), ()):
+                if predecessor_id in vertex_ids or self.graph.get_vertex(predecessor_id).built:
+                    continue
+                vertex_ids.add(predecessor_id)
+                queue.append(predecessor_id)
+        return vertex_ids
+
+    async def _get_external_values(self) -> dict[tuple[str, str], Any]:
+        if self._external_values is None:
+            values = {}
+            for (target_id, param), sources in self._external_sources.items():
+                target = self.graph.get_vertex(target_id)
+                results = [await source.get_result(target, target_handle_name=param) for source in sources]
+                values[target_id, param] = results[0] if len(results) == 1 else results
+            self._external_values = values
+        return self._external_values
+
+    async def run(self, item: Any, *, fallback_to_env_vars: bool = False) -> Any:
+        """Run the body for one item and return the output of the exit vertex."""
+        external_values = await self._get_external_values()
+        graph = self.prepared.instantiate(user_id=self.graph.user_id, context=dict(self.graph.context))
+        graph.session_id = self.graph.session_id
+        for (target_id, param), value in external_values.items():
+            graph.get_vertex(target_id).update_raw_params({param: value}, overwrite=True)
+        for target_id, param in self._item_targets:
+            graph.get_vertex(target_id).update_raw_params({param: item}, overwrite=True)
+
+        try:
+            await graph.process(fallback_to_env_vars=fallback_to_env_vars)
+        except Exception as exc:
+            await graph.end_all_traces(error=exc)
+            raise
+        await graph.end_all_traces()
+
+        exit_vertex = graph.get_vertex(self.exit_id)
+        if not exit_vertex.built or self.exit_output not in exit_vertex.results:
+            msg = f"{exit_vertex.display_name} did not produce a result for the item."
+            raise ValueError(msg)
+        return exit_vertex.results[self.exit_output]
+
+    async def map(
+        self,
+        items: Sequence[Any],
+        *,
+        max_concurrency: int,
+        stop_on_error: bool = True,
+        fallback_to_env_vars: bool = False,
+    ) -> list[Any]:
+        """Run the body for every item, at most ``max_concurrency`` at a time.
+
+        Returns:
+            The results in the order of ``items``. If ``stop_on_error`` is False, the exception
+            raised for an item takes the place of its result.
+
+        Raises:
+            Exception: The first error raised for an item if ``stop_on_error`` is True. The runs
+                still in progress are cancelled.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_item(item: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await self.run(item, fallback_to_env_vars=fallback_to_env_vars)
+                except Exception as exc:
+                    if stop_on_error:
+                        raise
+                    return exc
+
+        tasks = [asyncio.create_task(run_item(item)) for item in items]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -1,3 +1,12 @@
+from .hash_index import KnowledgeBaseHashIndex
 from .knowledge_base_utils import compute_bm25, compute_tfidf, get_knowledge_bases
+from .vector_store_cache import KnowledgeBaseCache, get_knowledge_base_cache
 
-__all__ = ["compute_bm25", "compute_tfidf", "get_knowledge_bases"]
+__all__ = [
+    "KnowledgeBaseCache",
+    "KnowledgeBaseHashIndex",
+    "compute_bm25",
+    "compute_tfidf",
+    "get_knowledge_base_cache",
+    "get_knowledge_bases",
+]
@@ -0,0 +1,117 @@
+"""Persisted index of the content hashes stored in a knowledge base.
+
+Knowledge Ingestion tags every document with the sha256 of its content (or identifier columns)
+in the ``_id`` metadata field and skips rows whose hash is already stored. ``KnowledgeBaseHashIndex``
+keeps those hashes in ``hash_index.txt`` next to the Chroma files, so an ingestion run loads a set
+of hashes instead of reading every document and its metadata back from the collection.
+
+The file holds one line per document in the collection, duplicates included. When its line count
+no longer matches the collection, for example after documents were added by another process or
+the file was deleted, the index is rebuilt from the collection metadata in pages.
+"""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+HASH_INDEX_FILE_NAME = "hash_index.txt"
+# Stands in for documents that have no ``_id`` so that the line count still matches the collection
+_MISSING_HASH = "-"
+_REBUILD_PAGE_SIZE = 10_000
+
+
+class KnowledgeBaseHashIndex:
+    """The set of document hashes of one knowledge base, backed by a file in its directory.
+
+    Attributes:
+        path (Path): The index file.
+        hashes (set[str]): Distinct hashes of the documents in the collection.
+        documents (int): Number of documents the index accounts for.
+    """
+
+    def __init__(self, kb_path: Path) -> None:
+        self.path = Path(kb_path) / HASH_INDEX_FILE_NAME
+        self.hashes: set[str] = set()
+        self.documents = 0
+
+    @classmethod
+    def load(cls, kb_path: Path, collection: Any, page_size: int = _REBUILD_PAGE_SIZE) -> KnowledgeBaseHashIndex:
+        """Load the index of a knowledge base, rebuilding it if it is missing or out of date.
+
+        Args:
+            kb_path: Directory of the knowledge base.
+            collection: The Chroma collection of the knowledge base.
+            page_size: Number of documents read per request when rebuilding.
+        """
+        index = cls(kb_path)
+        index.refresh(collection, page_size=page_size)
+        return index
+
+    def refresh(self, collection: Any, *, page_size: int = _REBUILD_PAGE_SIZE) -> None:
+        """Read the index file, or rebuild it when it does not account for every document in ``collection``."""
+        document_count = collection.count()
+        if self.path.exists():
+            try:
+                lines = self.path.read_text(encoding="utf-8").split()
+            except OSError as e:
+                logger.warning(f"Could not read knowledge base hash index {self.path}: {e}")
+            else:
+                if len(lines) == document_count:
+                    self._set(lines)
+                    return
+                logger.info(
+                    f"Knowledge base hash index {self.path} covers {len(lines)} of {document_count} documents, "
+                    "rebuilding it"
+                )
+        self.rebuild(collection, document_count, page_size=page_size)
+
+    def rebuild(self, collection: Any, document_count: int, *, page_size: int = _REBUILD_PAGE_SIZE) -> None:
+        """Read the hashes of all documents from ``collection`` and rewrite the index file."""
+        lines: list[str] = []
+        for offset in range(0, document_count, page_size):
+            page = collection.get(limit=page_size, offset=offset, include=["metadatas"])
+            lines.extend(self._line((metadata or {}).get("_id")) for metadata in page["metadatas"])
+        self._write(lines)
+        self._set(lines)
+
+    def add(self, hashes: Iterable[str]) -> None:
+        """Record the hashes of documents that were just added to the collection."""
+        lines = [self._line(value) for value in hashes]
+        if not lines:
+            return
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.hashes.update(lines)
+        self.hashes.discard(_MISSING_HASH)
+        self.documents += len(lines)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    @staticmethod
+    def _line(value: str | None) -> str:
+        return value if value and value.split() == [value] else _MISSING_HASH
+
+    def _set(self, lines: list[str]) -> None:
+        self.hashes = set(lines)
+        self.hashes.discard(_MISSING_HASH)
+        self.documents = len(lines)
+
+    def _write(self, lines: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+            tmp_path.replace(self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
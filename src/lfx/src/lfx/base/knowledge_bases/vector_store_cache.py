@@ -0,0 +1,163 @@
+"""Process-wide cache of opened knowledge base vector stores.
+
+Knowledge Retrieval used to look up the user, read ``embedding_metadata.json``, build an embedding
+model and open the Chroma collection on every query. ``KnowledgeBaseCache`` keeps the opened
+``Chroma`` store, with its embedding model, for each knowledge base directory and embedding
+metadata fingerprint, so repeated queries only pay for the search.
+
+The fingerprint hashes the metadata file and the API key given at run time, so changing the
+embedding model or key opens a new store. Entries unused for ``idle_timeout`` seconds are
+dropped, as are the least recently used ones past ``max_entries``. Ingesting into or deleting a
+knowledge base invalidates its entries, and updating or deleting a user its cached user name.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+EMBEDDING_METADATA_FILE_NAME = "embedding_metadata.json"
+
+
+class KnowledgeBaseCache:
+    """An LRU cache of vector stores keyed by knowledge base path and embedding metadata fingerprint.
+
+    Attributes:
+        max_entries (int): Number of stores kept open.
+        idle_timeout (float): Seconds after which an unused store or user name is dropped.
+        hits (int): Lookups that found an open store.
+        misses (int): Lookups that found none.
+        evictions (int): Stores dropped for being idle or least recently used.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        self.max_entries = max_entries
+        self.idle_timeout = idle_timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stores: OrderedDict[tuple[str, str], tuple[Any, float]] = OrderedDict()
+        self._usernames: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def metadata_fingerprint(kb_path: Path, api_key: str | None = None) -> str | None:
+        """Return the fingerprint of the embedding configuration of a knowledge base.
+
+        Returns:
+            A hash of ``embedding_metadata.json`` and ``api_key``, or None if the file cannot be read.
+        """
+        try:
+            metadata = (Path(kb_path) / EMBEDDING_METADATA_FILE_NAME).read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(metadata)
+        digest.update(b"\0")
+        digest.update((api_key or "").encode())
+        return digest.hexdigest()
+
+    def get(self, kb_path: Path, fingerprint: str) -> Any | None:
+        """Return the open store of a knowledge base, or None."""
+        key = (str(kb_path), fingerprint)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._stores.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._stores[key] = (entry[0], now)
+            self._stores.move_to_end(key)
+            return entry[0]
+
+    def put(self, kb_path: Path, fingerprint: str, store: Any) -> None:
+        """Keep ``store`` open for later queries, replacing stores opened with another fingerprint."""
+        path = str(kb_path)
+        now = time.monotonic()
+        with self._lock:
+            for key in [key for key in self._stores if key[0] == path and key[1] != fingerprint]:
+                del self._stores[key]
+            self._stores[(path, fingerprint)] = (store, now)
+            self._stores.move_to_end((path, fingerprint))
+            while len(self._stores) > self.max_entries:
+                self._stores.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, kb_path: Path) -> int:
+        """Drop every store of a knowledge base, after it was re-ingested or deleted.
+
+        Returns:
+            The number of stores dropped.
+        """
+        path = str(kb_path)
+        with self._lock:
+            keys = [key for key in self._stores if key[0] == path]
+            for key in keys:
+                del self._stores[key]
+        return len(keys)
+
+    def get_username(self, user_id: str) -> str | None:
+        """Return the cached user name of ``user_id``, or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._usernames.get(str(user_id))
+            if entry is None or now - entry[1] > self.idle_timeout:
+                self._usernames.pop(str(user_id), None)
+                return None
+            return entry[0]
+
+    def set_username(self, user_id: str, username: str) -> None:
+        """Remember the user name of ``user_id``, which knowledge base paths are built from."""
+        with self._lock:
+            self._usernames[str(user_id)] = (username, time.monotonic())
+
+    def invalidate_username(self, user_id: str) -> None:
+        """Forget the user name of ``user_id``, after the user was renamed or deleted."""
+        with self._lock:
+            self._usernames.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        """Drop every store and user name."""
+        with self._lock:
+            self._stores.clear()
+            self._usernames.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the cache and the number of open stores."""
+        with self._lock:
+            return {
+                "entries": len(self._stores),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _evict_idle(self, now: float) -> None:
+        # Entries are ordered by last use, so idle ones are at the front
+        while self._stores:
+            key, (_, last_used) = next(iter(self._stores.items()))
+            if now - last_used <= self.idle_timeout:
+                break
+            del self._stores[key]
+            self.evictions += 1
+
+
+_knowledge_base_cache: KnowledgeBaseCache | None = None
+_knowledge_base_cache_lock = threading.Lock()
+
+
+def get_knowledge_base_cache() -> KnowledgeBaseCache:
+    """Return the process-wide knowledge base cache."""
+    global _knowledge_base_cache  # noqa: PLW0603
+    if _knowledge_base_cache is None:
+        with _knowledge_base_cache_lock:
+            if _knowledge_base_cache is None:
+                _knowledge_base_cache = KnowledgeBaseCache()
+    return _knowledge_base_cache
@@ -12,8 +12,10 @@ import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import uuid
 import zipfile
+from contextvars import ContextVar
 from io import StringIO
 from pathlib import Path
 from shutil import which
@@ -32,6 +34,7 @@ from lfx.load import load_flow_from_json
 from lfx.schema.schema import InputValueRequest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from types import ModuleType
 
 # Attempt to import tomllib (3.11+) else fall back to tomli
@@ -293,9 +296,89 @@ def prepare_graph(graph, verbose_print):
         raise typer.Exit(1) from e
 
 
+_captured_stdout: ContextVar[StringIO | None] = ContextVar("lfx_captured_stdout", default=None)
+_captured_stderr: ContextVar[StringIO | None] = ContextVar("lfx_captured_stderr", default=None)
+_capture_lock = threading.Lock()
+_active_captures = 0
+_original_streams: tuple | None = None
+
+
+class _ContextCapturedStream:
+    """Stands in for sys.stdout or sys.stderr while output is captured.
+
+    Writes go to the capture buffer of the current context, so concurrent graph runs each capture
+    their own output, and to the original stream outside of a capture.
+    """
+
+    def __init__(self, stream, buffer: ContextVar[StringIO | None]) -> None:
+        self._stream = stream
+        self._buffer = buffer
+
+    def _target(self):
+        buffer = self._buffer.get()
+        return self._stream if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def writelines(self, lines) -> None:
+        self._target().writelines(lines)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._target(), name)
+
+
+def _acquire_capture_streams() -> None:
+    global _active_captures, _original_streams  # noqa: PLW0603
+    with _capture_lock:
+        if _active_captures == 0:
+            _original_streams = (sys.stdout, sys.stderr)
+            sys.stdout = _ContextCapturedStream(sys.stdout, _captured_stdout)
+            sys.stderr = _ContextCapturedStream(sys.stderr, _captured_stderr)
+        _active_captures += 1
+
+
+def _release_capture_streams() -> None:
+    global _active_captures, _original_streams  # noqa: PLW0603
+    with _capture_lock:
+        _active_captures -= 1
+        if _active_captures == 0 and _original_streams is not None:
+            sys.stdout, sys.stderr = _original_streams
+            _original_streams = None
+
+
+@contextlib.contextmanager
+def capture_output() -> Iterator[tuple[StringIO, StringIO]]:
+    """Capture what the current task prints to stdout and stderr.
+
+    Unlike swapping ``sys.stdout`` for a buffer, this is safe with concurrent tasks: the buffers
+    are looked up through context variables, so each task, and the threads it starts with
+    ``asyncio.to_thread``, only captures its own output. Output of other tasks is written to the
+    original streams.
+
+    Yields:
+        Tuple of (stdout buffer, stderr buffer)
+    """
+    stdout, stderr = StringIO(), StringIO()
+    stdout_token = _captured_stdout.set(stdout)
+    stderr_token = _captured_stderr.set(stderr)
+    _acquire_capture_streams()
+    try:
+        yield stdout, stderr
+    finally:
+        _release_capture_streams()
+        _captured_stdout.reset(stdout_token)
+        _captured_stderr.reset(stderr_token)
+
+
 async def execute_graph_with_capture(graph, input_value: str | None):
     """Execute a graph and capture output.
 
+    Output is captured per task with :func:`capture_output`, so several graphs can run at once.
+
     Args:
         graph: Graph object to execute
         input_value: Input value to pass to the graph
@@ -309,29 +392,16 @@ async def execute_graph_with_capture(graph, input_value: str | None):
     # Create input request
     inputs = InputValueRequest(input_value=input_value) if input_value else None
 
-    # Capture output during execution
-    captured_stdout = StringIO()
-    captured_stderr = StringIO()
-
-    # Redirect stdout and stderr during graph execution
-    original_stdout = sys.stdout
-    original_stderr = sys.stderr
-
-    try:
-        sys.stdout = captured_stdout
-        sys.stderr = captured_stderr
-        results = [result async for result in graph.async_start(inputs)]
-    except Exception as exc:
-        # Capture any error output that was written to stderr
-        error_output = captured_stderr.getvalue()
-        if error_output:
-            # Add error output to the exception for better debugging
-            exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
-        raise
-    finally:
-        # Restore original stdout/stderr
-        sys.stdout = original_stdout
-        sys.stderr = original_stderr
+    with capture_output() as (captured_stdout, captured_stderr):
+        try:
+            results = [result async for result in graph.async_start(inputs)]
+        except Exception as exc:
+            # Capture any error output that was written to stderr
+            error_output = captured_stderr.getvalue()
+            if error_output:
+                # Add error output to the exception for better debugging
+                exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
+            raise
 
     # Get captured logs
     captured_logs = captured_stdout.getvalue() + captured_stderr.getvalue()
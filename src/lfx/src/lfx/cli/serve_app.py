@@ -35,6 +35,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from lfx.graph import Graph
+    from lfx.graph.graph.prepared import PreparedGraph
 
 # Security - use the same pattern as Langflow main API
 API_KEY_NAME = "x-api-key"
@@ -258,6 +259,41 @@ class ErrorResponse(BaseModel):
 # -----------------------------------------------------------------------------
 
 
+class GraphRunFactory:
+    """Creates an independent graph for every run of a served flow.
+
+    Running a graph mutates its vertices and components, so concurrent requests cannot share the
+    loaded graph. Deep-copying it per request copies every built component and its state. Graphs
+    loaded from flow JSON are instead turned into a :class:`~lfx.graph.graph.prepared.PreparedGraph`
+    once, and each run gets a fresh graph instantiated from it, reusing the parsed payload, field
+    parameters and sorted layers. Graphs without flow data, such as graphs built in Python scripts,
+    are still deep-copied.
+
+    Args:
+        graph: The loaded graph, which is never run itself.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.prepared: PreparedGraph | None = None
+        raw_graph_data = getattr(graph, "raw_graph_data", None)
+        if isinstance(raw_graph_data, dict) and raw_graph_data.get("nodes"):
+            from lfx.graph.graph.prepared import PreparedGraph
+
+            try:
+                self.prepared = PreparedGraph(
+                    raw_graph_data, flow_id=getattr(graph, "flow_id", None), flow_name=getattr(graph, "flow_name", None)
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"Could not prepare flow {getattr(graph, 'flow_id', None)}, copying it per run: {exc}")
+
+    def __call__(self) -> Graph:
+        """Return a graph for a single run."""
+        if self.prepared is None:
+            return deepcopy(self.graph)
+        return self.prepared.instantiate(user_id=getattr(self.graph, "user_id", None))
+
+
 async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
     """Consumes events from a queue and yields them to the client while tracking timing metrics.
 
@@ -401,6 +437,7 @@ def create_multi_serve_app(
         """Create a router for a specific flow to avoid loop variable binding issues."""
         analysis = _analyze_graph_structure(graph)
         run_description = _generate_dynamic_run_description(graph)
+        new_run_graph = GraphRunFactory(graph)
 
         router = APIRouter(
             prefix=f"/flows/{flow_id}",
@@ -419,8 +456,7 @@ def create_multi_serve_app(
             request: RunRequest,
         ) -> RunResponse:
             try:
-                graph_copy = deepcopy(graph)
-                results, logs = await execute_graph_with_capture(graph_copy, request.input_value)
+                results, logs = await execute_graph_with_capture(new_run_graph(), request.input_value)
                 result_data = extract_result_data(results, logs)
 
                 # Debug logging
@@ -486,15 +522,15 @@ def create_multi_serve_app(
             """Stream the execution of the flow with real-time events."""
             try:
                 # Import here to avoid potential circular imports
-                from lfx.events.event_manager import create_stream_tokens_event_manager
+                from lfx.events.event_manager import create_stream_tokens_event_manager, get_coalescing_options
 
                 asyncio_queue: asyncio.Queue = asyncio.Queue()
                 asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-                event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+                event_manager = create_stream_tokens_event_manager(queue=asyncio_queue, **get_coalescing_options())
 
                 main_task = asyncio.create_task(
                     run_flow_generator_for_serve(
-                        graph=graph,
+                        graph=new_run_graph(),
                         input_request=request,
                         flow_id=flow_id,
                         event_manager=event_manager,
@@ -4,6 +4,8 @@ Notes:
 -----
 - ALL Docling parsing/export runs in a separate OS process to prevent memory
   growth and native library state from impacting the main Langflow process.
+  With `docling_worker_pool_size` set, files go to a pool of warm, long-lived
+  worker processes instead of one new process per file.
 - Standard text/structured parsing continues to use existing BaseFileComponent
   utilities (and optional threading via `parallel_load_data`).
 """
@@ -14,13 +16,16 @@ import contextlib
 import json
 import subprocess
 import sys
-import textwrap
+import time
+from collections.abc import Callable  # noqa: TC003
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any
 
 from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.docling_pool import DOCLING_ONE_SHOT_SCRIPT, DoclingWorkerPool, get_docling_worker_pool
 from lfx.base.data.storage_utils import parse_storage_path, read_file_bytes, validate_image_content_type
 from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from lfx.inputs import SortableListInput
@@ -773,6 +778,15 @@ class FileComponent(BaseFileComponent):
 
         For S3 storage, the file is downloaded to a temp file first.
         """
+        return self._run_docling_job(
+            file_path, lambda local_path: self._process_docling_subprocess_impl(local_path, file_path)
+        )
+
+    def _run_docling_job(self, file_path: str, convert: Callable[[str], Data | None]) -> Data | None:
+        """Call ``convert`` with a local path of ``file_path`` that is safe to hand to a Docling process.
+
+        For S3 storage, the file is downloaded to a temp file first and deleted once ``convert`` returns.
+        """
         if not file_path:
             return None
 
@@ -784,23 +798,31 @@ class FileComponent(BaseFileComponent):
             should_delete = False
 
         try:
-            return self._process_docling_subprocess_impl(local_path, file_path)
+            # Validate file_path to avoid command injection or unsafe input
+            if not isinstance(local_path, str) or any(c in local_path for c in [";", "|", "&", "$", "`"]):
+                return Data(data={"error": "Unsafe file path detected.", "file_path": local_path})
+            return convert(local_path)
         finally:
             # Clean up temp file if we created one
             if should_delete:
                 with contextlib.suppress(Exception):
                     Path(local_path).unlink()  # Ignore cleanup errors
 
-    def _process_docling_subprocess_impl(self, local_file_path: str, original_file_path: str) -> Data | None:
-        """Implementation of Docling subprocess processing.
+    def parse_cache_options(self, file_list: list[BaseFileComponent.BaseFile]) -> dict[str, Any] | None:
+        """Return the parser and Docling options that the parse cache keys results by."""
+        docling_compatible = [self._is_docling_compatible(str(file.path)) for file in file_list]
+        if not self.advanced_mode or not any(docling_compatible):
+            return {"parser": "standard"}
+        if not all(docling_compatible):
+            # The parser of a mixed batch depends on the whole batch, not on each file
+            return None
+        options = self._docling_job_config("")
+        del options["file_path"]
+        return {"parser": "docling", "export_format": self.EXPORT_FORMAT, **options}
 
-        Args:
-            local_file_path: Path to local file to process
-            original_file_path: Original file path to include in metadata
-        Returns:
-            Data object with processed content
-        """
-        args: dict[str, Any] = {
+    def _docling_job_config(self, local_file_path: str) -> dict[str, Any]:
+        """Build the config a Docling child process reads for one file."""
+        return {
             "file_path": local_file_path,
             "markdown": bool(self.markdown),
             "image_mode": str(self.IMAGE_MODE),
@@ -812,189 +834,18 @@ class FileComponent(BaseFileComponent):
             ),
         }
 
-        # Child script for isolating the docling processing
-        child_script = textwrap.dedent(
-            r"""
-            import json, sys
-
-            def try_imports():
-                try:
-                    from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
-                    from docling.document_converter import DocumentConverter  # type: ignore
-                    from docling_core.types.doc import ImageRefMode  # type: ignore
-                    return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
-                except Exception as e:
-                    raise e
-
-            def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
-                # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
-                if pipeline == "standard":
-                    try:
-                        from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
-                        from docling.document_converter import PdfFormatOption  # type: ignore
-
-                        pipe = PdfPipelineOptions()
-                        pipe.do_ocr = False
-
-                        if ocr_engine:
-                            try:
-                                from docling.models.factories import get_ocr_factory  # type: ignore
-                                pipe.do_ocr = True
-                                fac = get_ocr_factory(allow_external_plugins=False)
-                                pipe.ocr_options = fac.create_options(kind=ocr_engine)
-                            except Exception:
-                                # If OCR setup fails, disable it
-                                pipe.do_ocr = False
-
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception:
-                        return DocumentConverter()
-
-                # --- Vision-Language Model (VLM) pipeline ---
-                if pipeline == "vlm":
-                    try:
-                        from docling.datamodel.pipeline_options import VlmPipelineOptions
-                        from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
-                        from docling.document_converter import PdfFormatOption
-                        from docling.pipeline.vlm_pipeline import VlmPipeline
-
-                        vl_pipe = VlmPipelineOptions(
-                            vlm_options=GRANITEDOCLING_TRANSFORMERS,
-                        )
-
-                        if sys.platform == "darwin":
-                            try:
-                                import mlx_vlm
-                                vl_pipe.vlm_options = GRANITEDOCLING_MLX
-                            except ImportError as e:
-                                raise e
-
-                        # VLM paths generally don't need OCR; keep OCR off by default here.
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception as e:
-                        raise e
-
-                # --- Fallback: default converter with no special options ---
-                return DocumentConverter()
-
-            def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
-                try:
-                    mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
-                    return document.export_to_markdown(
-                        image_mode=mode,
-                        image_placeholder=img_ph,
-                        page_break_placeholder=pg_ph,
-                    )
-                except Exception:
-                    try:
-                        return document.export_to_text()
-                    except Exception:
-                        return str(document)
-
-            def to_rows(doc_dict):
-                rows = []
-                for t in doc_dict.get("texts", []):
-                    prov = t.get("prov") or []
-                    page_no = None
-                    if prov and isinstance(prov, list) and isinstance(prov[0], dict):
-                        page_no = prov[0].get("page_no")
-                    rows.append({
-                        "page_no": page_no,
-                        "label": t.get("label"),
-                        "text": t.get("text"),
-                        "level": t.get("level"),
-                    })
-                return rows
-
-            def main():
-                cfg = json.loads(sys.stdin.read())
-                file_path = cfg["file_path"]
-                markdown = cfg["markdown"]
-                image_mode = cfg["image_mode"]
-                img_ph = cfg["md_image_placeholder"]
-                pg_ph = cfg["md_page_break_placeholder"]
-                pipeline = cfg["pipeline"]
-                ocr_engine = cfg.get("ocr_engine")
-                meta = {"file_path": file_path}
-
-                try:
-                    ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
-                    converter = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
-                    try:
-                        res = converter.convert(file_path)
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}))
-                        return
-
-                    ok = False
-                    if hasattr(res, "status"):
-                        try:
-                            ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
-                        except Exception:
-                            ok = (str(res.status).lower() == "success")
-                    if not ok and hasattr(res, "document"):
-                        ok = getattr(res, "document", None) is not None
-                    if not ok:
-                        print(json.dumps({"ok": False, "error": "Docling conversion failed", "meta": meta}))
-                        return
-
-                    doc = getattr(res, "document", None)
-                    if doc is None:
-                        print(json.dumps({"ok": False, "error": "Docling produced no document", "meta": meta}))
-                        return
-
-                    if markdown:
-                        text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
-                        print(json.dumps({"ok": True, "mode": "markdown", "text": text, "meta": meta}))
-                        return
-
-                    # structured
-                    try:
-                        doc_dict = doc.export_to_dict()
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}))
-                        return
-
-                    rows = to_rows(doc_dict)
-                    print(json.dumps({"ok": True, "mode": "structured", "doc": rows, "meta": meta}))
-                except Exception as e:
-                    print(
-                        json.dumps({
-                            "ok": False,
-                            "error": f"Docling processing error: {e}",
-                            "meta": {"file_path": file_path},
-                        })
-                    )
-
-            if __name__ == "__main__":
-                main()
-            """
-        )
-
-        # Validate file_path to avoid command injection or unsafe input
-        if not isinstance(args["file_path"], str) or any(c in args["file_path"] for c in [";", "|", "&", "$", "`"]):
-            return Data(data={"error": "Unsafe file path detected.", "file_path": args["file_path"]})
+    def _process_docling_subprocess_impl(self, local_file_path: str, original_file_path: str) -> Data | None:
+        """Implementation of Docling subprocess processing.
 
+        Args:
+            local_file_path: Path to local file to process
+            original_file_path: Original file path to include in metadata
+        Returns:
+            Data object with processed content
+        """
+        args = self._docling_job_config(local_file_path)
         proc = subprocess.run(  # noqa: S603
-            [sys.executable, "-u", "-c", child_script],
+            [sys.executable, "-u", "-c", DOCLING_ONE_SHOT_SCRIPT],
             input=json.dumps(args).encode("utf-8"),
             capture_output=True,
             check=False,
@@ -1015,6 +866,33 @@ class FileComponent(BaseFileComponent):
                 },
             )
 
+        return self._docling_result_to_data(result, original_file_path)
+
+    def _process_docling_in_pool(self, file_paths: list[str], pool: DoclingWorkerPool) -> list[Data | None]:
+        """Convert files concurrently on the warm Docling worker pool, returning results in input order."""
+
+        def process(file_path: str) -> Data | None:
+            return self._run_docling_job(
+                file_path,
+                lambda local_path: self._docling_result_to_data(
+                    pool.convert(self._docling_job_config(local_path)), file_path
+                ),
+            )
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=pool.max_workers) as executor:
+            results = list(executor.map(process, file_paths))
+        elapsed = time.perf_counter() - started
+        stats = pool.stats()
+        self.log(
+            f"Docling worker pool converted {len(file_paths)} files in {elapsed:.2f}s "
+            f"({len(file_paths) / elapsed if elapsed else 0:.2f} files/s, {stats['workers']} workers, "
+            f"{stats['workers_recycled']} recycled, {stats['timeouts']} timeouts)."
+        )
+        return results
+
+    def _docling_result_to_data(self, result: dict[str, Any], original_file_path: str) -> Data:
+        """Map the JSON result of a Docling child process to a Data object."""
         if not result.get("ok"):
             error_msg = result.get("error", "Unknown Docling error")
             # Override meta file_path with original_file_path to ensure correct path matching
@@ -1115,9 +993,14 @@ class FileComponent(BaseFileComponent):
         # Advanced path: Check if ALL files are compatible with Docling
         if self.advanced_mode and docling_compatible:
             final_return: list[BaseFileComponent.BaseFile] = []
-            for file in file_list:
-                file_path = str(file.path)
-                advanced_data: Data | None = self._process_docling_in_subprocess(file_path)
+            file_paths = [str(file.path) for file in file_list]
+            pool = get_docling_worker_pool()
+            if pool is not None:
+                advanced_results = self._process_docling_in_pool(file_paths, pool)
+            else:
+                advanced_results = [self._process_docling_in_subprocess(file_path) for file_path in file_paths]
+            for file, file_path, docling_data in zip(file_list, file_paths, advanced_results, strict=True):
+                advanced_data: Data | None = docling_data
 
                 # Handle None case - Docling processing failed or returned None
                 if advanced_data is None:
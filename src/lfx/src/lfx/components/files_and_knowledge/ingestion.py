@@ -11,13 +11,16 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
 from langflow.services.auth.utils import decrypt_api_key, encrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 
+from lfx.base.knowledge_bases.hash_index import KnowledgeBaseHashIndex
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
 from lfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from lfx.components.processing.converter import convert_to_dataframe
 from lfx.custom import Component
@@ -48,6 +51,8 @@ HUGGINGFACE_MODEL_NAMES = [
     "sentence-transformers/all-mpnet-base-v2",
 ]
 COHERE_MODEL_NAMES = ["embed-english-v3.0", "embed-multilingual-v3.0"]
+# Embedding batches of ``chunk_size`` rows computed at the same time during ingestion
+MAX_CONCURRENT_EMBEDDING_BATCHES = 4
 
 _KNOWLEDGE_BASES_ROOT_PATH: Path | None = None
 
@@ -390,9 +395,6 @@ class KnowledgeIngestionComponent(Component):
             # Create embeddings model
             embedding_function = self._build_embeddings(embedding_model, api_key)
 
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
             # Create vector store
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
@@ -400,41 +402,41 @@ class KnowledgeIngestionComponent(Component):
                 collection_name=self.knowledge_base,
             )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
+            # Embeddings are computed in batches here, so documents go straight to the raw collection
+            collection = chroma._collection  # noqa: SLF001
+
+            # Load the hashes of the documents already stored, without reading the documents back
+            hash_index = await asyncio.to_thread(KnowledgeBaseHashIndex.load, vector_store_dir, collection)
+
+            texts, metadatas = self._prepare_documents(df_source, config_list, hash_index.hashes)
 
             # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            if texts:
+                try:
+                    await self._add_documents(collection, hash_index, embedding_function, texts, metadatas)
+                finally:
+                    # Retrieval reopens the knowledge base instead of reusing a store opened before ingestion
+                    get_knowledge_base_cache().invalidate(vector_store_dir)
+                self.log(f"Added {len(texts)} documents to vector store '{self.knowledge_base}'")
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
-    async def _convert_df_to_data_objects(
-        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
-    ) -> list[Data]:
-        """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
-
-        # Set up vector store directory
-        kb_path = await self._kb_path()
-
-        # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
-        )
-
-        # Get all documents and their metadata
-        all_docs = chroma.get()
+    def _prepare_documents(
+        self,
+        df_source: pd.DataFrame,
+        config_list: list[dict[str, Any]],
+        existing_hashes: set[str],
+    ) -> tuple[list[str], list[dict[str, str]]]:
+        """Build the page contents and metadata of the rows to store.
 
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
+        Rows are processed column by column. Unless duplicates are allowed, rows whose hash is in
+        ``existing_hashes`` or repeats an earlier row of ``df_source`` are dropped.
 
+        Returns:
+            The page content of each row to store and its metadata: the non-vectorized columns as
+            strings and the content hash under ``_id``.
+        """
         # Get column roles
         content_cols = []
         identifier_cols = []
@@ -449,45 +451,84 @@ class KnowledgeIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
-
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
-
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
-
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
+        # The page content joins the vectorized columns; the hash uses the identifier columns if there are any
+        page_contents = self._join_columns(df_source, content_cols)
+        hash_sources = self._join_columns(df_source, identifier_cols) if identifier_cols else page_contents
+        hashes = pd.Series(
+            [hashlib.sha256(value.encode()).hexdigest() for value in hash_sources], index=df_source.index
+        )
 
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
+        keep = np.ones(len(df_source), dtype=bool)
+        if not self.allow_duplicates:
+            keep = ~(hashes.isin(existing_hashes) | hashes.duplicated()).to_numpy()
+            skipped = int((~keep).sum())
+            if skipped:
+                self.log(f"Skipping {skipped} duplicate rows")
+
+        # Metadata holds the non-vectorized columns as strings, without missing values
+        metadata_cols = [col for col in df_source.columns if col not in content_cols]
+        metadata_values = df_source.loc[keep, metadata_cols]
+        metadata_values = metadata_values.astype(str).where(metadata_values.notna())
+        # A frame without columns has no records, whatever its length
+        records = metadata_values.to_dict("records") if metadata_cols else [{} for _ in range(len(metadata_values))]
+        metadatas = [
+            {**{col: value for col, value in record.items() if isinstance(value, str)}, "_id": row_hash}
+            for record, row_hash in zip(records, hashes[keep], strict=True)
+        ]
+        return page_contents[keep].tolist(), metadatas
+
+    @staticmethod
+    def _join_columns(df_source: pd.DataFrame, columns: list[str]) -> pd.Series:
+        """Join the non-missing values of ``columns`` in each row with spaces."""
+        values = df_source[columns]
+        parts = values.astype(str).where(values.notna(), None)
+        if len(columns) == 1:
+            return parts[columns[0]].fillna("")
+        return pd.Series(
+            [" ".join(part for part in row if part is not None) for row in parts.itertuples(index=False, name=None)],
+            index=df_source.index,
+            dtype=object,
+        )
 
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
-            data_dict["_id"] = page_content_hash
+    async def _add_documents(
+        self,
+        collection: Any,
+        hash_index: KnowledgeBaseHashIndex,
+        embedding_function: Any,
+        texts: list[str],
+        metadatas: list[dict[str, str]],
+    ) -> None:
+        """Embed ``texts`` in concurrent batches of ``chunk_size`` and add them to ``collection``.
 
-            # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
-                self.log(f"Skipping duplicate row with hash {page_content_hash}")
-                continue
+        Each batch is stored, and its hashes recorded in ``hash_index``, as soon as its embeddings
+        are ready, so batches stored before a failure are kept and not embedded again on the next run.
+        """
+        batch_size = max(self.chunk_size or 1, 1)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_BATCHES)
 
-            # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
+        async def embed_batch(start: int) -> tuple[int, list[list[float]]]:
+            async with semaphore:
+                embeddings = await asyncio.to_thread(
+                    embedding_function.embed_documents, texts[start : start + batch_size]
+                )
+            return start, embeddings
 
-        return data_objects
+        tasks = [asyncio.create_task(embed_batch(start)) for start in range(0, len(texts), batch_size)]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                start, embeddings = await next_batch
+                batch_metadatas = metadatas[start : start + batch_size]
+                await asyncio.to_thread(
+                    collection.upsert,
+                    ids=[str(uuid.uuid4()) for _ in batch_metadatas],
+                    embeddings=embeddings,
+                    documents=texts[start : start + batch_size],
+                    metadatas=batch_metadatas,
+                )
+                hash_index.add(metadata["_id"] for metadata in batch_metadatas)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     def is_valid_collection_name(self, name, min_length: int = 3, max_length: int = 63) -> bool:
         """Validates collection name against conditions 1-3.
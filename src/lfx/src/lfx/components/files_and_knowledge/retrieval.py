@@ -9,6 +9,7 @@ from langflow.services.database.models.user.crud import get_user_by_id
 from pydantic import SecretStr
 
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.vector_store_cache import get_knowledge_base_cache
 from lfx.custom import Component
 from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
 from lfx.log.logger import logger
@@ -186,25 +187,32 @@ class KnowledgeRetrievalComponent(Component):
         msg = f"Embedding provider '{provider}' is not supported for retrieval."
         raise NotImplementedError(msg)
 
-    async def retrieve_data(self) -> DataFrame:
-        """Retrieve data from the selected knowledge base by reading the Chroma collection.
-
-        Returns:
-            A DataFrame containing the data rows from the knowledge base.
-        """
-        # Check if we're in Astra cloud environment and raise an error if we are.
-        raise_error_if_astra_cloud_disable_component(astra_error_msg)
-        # Get the current user
-        async with session_scope() as db:
-            if not self.user_id:
-                msg = "User ID is required for fetching Knowledge Base data."
-                raise ValueError(msg)
-            current_user = await get_user_by_id(db, self.user_id)
-            if not current_user:
-                msg = f"User with ID {self.user_id} not found."
-                raise ValueError(msg)
-            kb_user = current_user.username
-        kb_path = _get_knowledge_bases_root_path() / kb_user / self.knowledge_base
+    async def _get_kb_user(self) -> str:
+        """Return the name of the current user, whose knowledge bases are stored under it."""
+        if not self.user_id:
+            msg = "User ID is required for fetching Knowledge Base data."
+            raise ValueError(msg)
+        cache = get_knowledge_base_cache()
+        kb_user = cache.get_username(self.user_id)
+        if kb_user is None:
+            async with session_scope() as db:
+                current_user = await get_user_by_id(db, self.user_id)
+                if not current_user:
+                    msg = f"User with ID {self.user_id} not found."
+                    raise ValueError(msg)
+                kb_user = current_user.username
+            cache.set_username(self.user_id, kb_user)
+        return kb_user
+
+    def _open_vector_store(self, kb_path: Path) -> Chroma:
+        """Return the vector store of a knowledge base, reusing the one opened by an earlier query."""
+        runtime_api_key = self.api_key.get_secret_value() if isinstance(self.api_key, SecretStr) else self.api_key
+        cache = get_knowledge_base_cache()
+        fingerprint = cache.metadata_fingerprint(kb_path, runtime_api_key)
+        if fingerprint is not None:
+            chroma = cache.get(kb_path, fingerprint)
+            if chroma is not None:
+                return chroma
 
         metadata = self._get_kb_metadata(kb_path)
         if not metadata:
@@ -214,12 +222,27 @@ class KnowledgeRetrievalComponent(Component):
         # Build the embedder for the knowledge base
         embedding_function = self._build_embeddings(metadata)
 
-        # Load vector store
         chroma = Chroma(
             persist_directory=str(kb_path),
             embedding_function=embedding_function,
             collection_name=self.knowledge_base,
         )
+        if fingerprint is not None:
+            cache.put(kb_path, fingerprint, chroma)
+        return chroma
+
+    async def retrieve_data(self) -> DataFrame:
+        """Retrieve data from the selected knowledge base by reading the Chroma collection.
+
+        Returns:
+            A DataFrame containing the data rows from the knowledge base.
+        """
+        # Check if we're in Astra cloud environment and raise an error if we are.
+        raise_error_if_astra_cloud_disable_component(astra_error_msg)
+        kb_path = _get_knowledge_bases_root_path() / await self._get_kb_user() / self.knowledge_base
+
+        # Load vector store
+        chroma = self._open_vector_store(kb_path)
 
         # If a search query is provided, perform a similarity search
         if self.search_query:
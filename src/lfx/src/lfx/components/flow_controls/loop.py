@@ -1,6 +1,7 @@
+from lfx.base.flow_controls import LoopBody
 from lfx.components.processing.converter import convert_to_data
 from lfx.custom.custom_component.component import Component
-from lfx.inputs.inputs import HandleInput
+from lfx.inputs.inputs import DropdownInput, HandleInput, IntInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
@@ -24,6 +25,35 @@ class LoopComponent(Component):
             info="The initial DataFrame to iterate over.",
             input_types=["DataFrame"],
         ),
+        DropdownInput(
+            name="mode",
+            display_name="Mode",
+            options=["Sequential", "Parallel"],
+            value="Sequential",
+            info=(
+                "Sequential sends one item at a time around the loop. Parallel runs the components "
+                "connected to Item for many items at once. Use it only when items do not depend on each other."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="The maximum number of items processed at the same time in Parallel mode.",
+            value=8,
+            advanced=True,
+        ),
+        DropdownInput(
+            name="error_policy",
+            display_name="Error Policy",
+            options=["Stop", "Skip", "Include Error"],
+            value="Stop",
+            info=(
+                "What to do when an item fails in Parallel mode. Stop fails the loop, Skip leaves the item out "
+                "of the results, and Include Error returns the item with an 'error' field in its place."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -88,11 +118,17 @@ class LoopComponent(Component):
         data_length = len(self.ctx.get(f"{self._id}_data", []))
         return current_index > data_length
 
-    def item_output(self) -> Data:
+    async def item_output(self) -> Data:
         """Output the next item in the list or stop if done."""
         self.initialize_data()
         current_item = Data(text="")
 
+        if self.mode == "Parallel":
+            # The items went through the loop body already, nothing goes around the cycle
+            await self.run_parallel()
+            self.stop("item")
+            return current_item
+
         if self.evaluate_stop_loop():
             self.stop("item")
         else:
@@ -113,16 +149,14 @@ class LoopComponent(Component):
 
     def update_dependency(self):
         item_dependency_id = self.get_incoming_edge_by_target_param("item")
-        if item_dependency_id not in self.graph.run_manager.run_predecessors[self._id]:
-            self.graph.run_manager.run_predecessors[self._id].append(item_dependency_id)
-            # CRITICAL: Also update run_map so remove_from_predecessors() works correctly
-            # run_map[predecessor] = list of vertices that depend on predecessor
-            if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
-                self.graph.run_manager.run_map[item_dependency_id].append(self._id)
-
-    def done_output(self) -> DataFrame:
+        # Updates run_map as well, so remove_from_predecessors() releases the loop when the item vertex runs
+        self.graph.run_manager.add_dependency(self._id, item_dependency_id)
+
+    async def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
         self.initialize_data()
+        if self.mode == "Parallel":
+            await self.run_parallel()
 
         if self.evaluate_stop_loop():
             self.stop("item")
@@ -134,6 +168,40 @@ class LoopComponent(Component):
         self.stop("done")
         return DataFrame([])
 
+    async def run_parallel(self) -> None:
+        """Run the loop body for all items concurrently and aggregate the results in input order."""
+        data_list, current_index = self.loop_variables()
+        if current_index > 0:
+            return
+
+        body = LoopBody(self.graph, self._id)
+        results = await body.map(
+            data_list,
+            max_concurrency=self.max_concurrency,
+            stop_on_error=self.error_policy == "Stop",
+            fallback_to_env_vars=self.graph.fallback_to_env_vars,
+        )
+
+        aggregated = []
+        failed = 0
+        for item, result in zip(data_list, results, strict=True):
+            if isinstance(result, Exception):
+                failed += 1
+                if self.error_policy == "Include Error":
+                    aggregated.append(Data(data={**item.data, "error": str(result)}))
+            elif isinstance(result, Message):
+                aggregated.append(self._convert_message_to_data(result))
+            else:
+                aggregated.append(result)
+        self.log(f"Processed {len(data_list)} items in parallel, {failed} failed.")
+
+        self.update_ctx(
+            {
+                f"{self._id}_index": len(data_list) + 1,
+                f"{self._id}_aggregated": aggregated,
+            }
+        )
+
     def loop_variables(self):
         """Retrieve loop variables from context."""
         return (
@@ -175,6 +175,7 @@ class MemoryComponent(Component):
                     context_id=message.context_id,
                     sender_name=message.sender_name,
                     sender=message.sender,
+                    limit=1,
                 )
                 or []
             )
@@ -224,17 +225,17 @@ class MemoryComponent(Component):
                 expected_type = MESSAGE_SENDER_AI if sender_type == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
                 stored = [m for m in stored if m.type == expected_type]
         else:
-            # For internal memory, we always fetch the last N messages by ordering by DESC
+            # For internal memory, the database returns the last N messages newest first
             stored = await aget_messages(
                 sender=sender_type,
                 sender_name=sender_name,
                 session_id=session_id,
                 context_id=context_id,
-                limit=10000,
-                order=order,
+                limit=n_messages or None,
+                order="DESC",
             )
-            if n_messages:
-                stored = stored[-n_messages:]  # Get last N messages
+            if order == "ASC":
+                stored = stored[::-1]
 
         # self.status = stored
         return cast("Data", stored)
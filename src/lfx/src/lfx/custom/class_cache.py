@@ -0,0 +1,139 @@
+"""Process-wide cache of classes compiled from custom component code.
+
+Evaluating component code parses it, rebuilds its global scope and compiles the
+class every time. The same code is evaluated for every vertex on every run, so
+the resulting class is cached here, keyed by a hash of the source code. Because
+the key is derived from the code itself, editing a component naturally produces
+a new entry and the stale one ages out through LRU eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_MAX_SIZE = 512
+
+
+def hash_code(code: str) -> str:
+    """Return the content hash used as the cache key for a piece of component code."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class CompiledClassCache:
+    """A thread-safe LRU cache of compiled component classes keyed by code hash.
+
+    Attributes:
+        max_size (int): Maximum number of classes to keep. A value of 0 disables caching.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required compiling the code.
+        evictions (int): Number of entries dropped to respect ``max_size``.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cache: OrderedDict[str, type[Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, code: str) -> bool:
+        return hash_code(code) in self._cache
+
+    def get(self, code: str) -> type[Any] | None:
+        """Return the cached class for ``code`` or None, updating the hit/miss counters."""
+        key = hash_code(code)
+        with self._lock:
+            class_object = self._cache.get(key)
+            if class_object is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return class_object
+
+    def set(self, code: str, class_object: type[Any]) -> None:
+        """Store the class compiled from ``code``, evicting the least recently used entries if needed."""
+        if self.max_size <= 0:
+            return
+        key = hash_code(code)
+        with self._lock:
+            self._cache[key] = class_object
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_create(self, code: str, factory: Callable[[str], type[Any]]) -> type[Any]:
+        """Return the cached class for ``code``, compiling it with ``factory`` on a miss.
+
+        Errors raised by ``factory`` are propagated and nothing is cached, so invalid
+        code is re-evaluated (and reported) on every call.
+        """
+        class_object = self.get(code)
+        if class_object is None:
+            class_object = factory(code)
+            self.set(code, class_object)
+        return class_object
+
+    def invalidate(self, code: str) -> bool:
+        """Drop the entry for ``code``. Returns True if an entry was removed."""
+        with self._lock:
+            return self._cache.pop(hash_code(code), None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_compiled_class_cache: CompiledClassCache | None = None
+_compiled_class_cache_lock = threading.Lock()
+
+
+def _get_configured_max_size() -> int:
+    from lfx.services.deps import get_settings_service
+
+    try:
+        settings_service = get_settings_service()
+    except Exception:  # noqa: BLE001
+        logger.debug("Settings service unavailable, using the default compiled class cache size")
+        return DEFAULT_MAX_SIZE
+    if settings_service is None:
+        return DEFAULT_MAX_SIZE
+    return settings_service.settings.component_class_cache_size
+
+
+def get_compiled_class_cache() -> CompiledClassCache:
+    """Return the process-wide compiled class cache, creating it on first use."""
+    global _compiled_class_cache  # noqa: PLW0603
+    if _compiled_class_cache is None:
+        with _compiled_class_cache_lock:
+            if _compiled_class_cache is None:
+                _compiled_class_cache = CompiledClassCache(max_size=_get_configured_max_size())
+    return _compiled_class_cache
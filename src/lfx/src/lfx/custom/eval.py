@@ -1,12 +1,21 @@
 from typing import TYPE_CHECKING
 
 from lfx.custom import validate
+from lfx.custom.class_cache import get_compiled_class_cache
 
 if TYPE_CHECKING:
     from lfx.custom.custom_component.custom_component import CustomComponent
 
 
-def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+def _compile_custom_component_code(code: str) -> type["CustomComponent"]:
     class_name = validate.extract_class_name(code)
     return validate.create_class(code, class_name)
+
+
+def eval_custom_component_code(code: str) -> type["CustomComponent"]:
+    """Evaluate custom component code.
+
+    The resulting class is cached by a hash of ``code``, so repeated evaluations of
+    the same code (e.g. the same vertex across runs) skip parsing and compilation.
+    """
+    return get_compiled_class_cache().get_or_create(code, _compile_custom_component_code)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
+import threading
 import time
 import uuid
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
@@ -25,10 +27,65 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+DEFAULT_COALESCE_MAX_DELAY = 0.05
+DEFAULT_COALESCE_MAX_BYTES = 4096
+
+
+def _is_plain_string_payload(data: Any) -> bool:
+    """Return True for payloads that jsonable_encoder would return unchanged: strings and flat dicts of strings."""
+    if type(data) is str:
+        return True
+    return type(data) is dict and all(type(key) is str and type(value) is str for key, value in data.items())
+
+
+def _is_plain_token(data: Any) -> bool:
+    return (
+        type(data) is dict
+        and len(data) == 2  # noqa: PLR2004
+        and type(data.get("chunk")) is str
+        and type(data.get("id")) is str
+    )
+
+
 class EventManager:
-    def __init__(self, queue):
+    """Encodes events and puts them on a queue as ``(event_id, bytes, put_time)`` tuples.
+
+    With ``coalesce_tokens`` enabled, consecutive ``token`` events for the same message are merged
+    into a single event whose chunk is the concatenation of theirs. A merged event is sent once
+    it holds ``coalesce_max_bytes`` bytes, once its first token is ``coalesce_max_delay`` seconds
+    old, or right before any other event so the order of events is preserved.
+
+    Args:
+        queue: The queue events are put on. Events are dropped when it is None.
+        coalesce_tokens: Whether to merge consecutive token events.
+        coalesce_max_delay: Maximum number of seconds a token is held before being sent.
+        coalesce_max_bytes: Size of the merged chunk, in bytes, that triggers sending it.
+    """
+
+    def __init__(
+        self,
+        queue,
+        *,
+        coalesce_tokens: bool = False,
+        coalesce_max_delay: float = DEFAULT_COALESCE_MAX_DELAY,
+        coalesce_max_bytes: int = DEFAULT_COALESCE_MAX_BYTES,
+    ):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.coalesce_tokens = coalesce_tokens
+        self.coalesce_max_delay = coalesce_max_delay
+        self.coalesce_max_bytes = coalesce_max_bytes
+        # Tokens are sent from worker threads as well as from the event loop
+        self._token_lock = threading.Lock()
+        self._pending_message_id: str | None = None
+        self._pending_chunks: list[str] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._pending_generation = 0
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -71,15 +128,105 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
+        if self.coalesce_tokens:
+            if event_type == "token" and _is_plain_token(data):
+                self._add_token(data)
+                return
+            # Pending tokens go out first so the order of events is preserved
+            self.flush_tokens()
+        self._put_event(event_type, data)
+
+    def _put_event(self, event_type: str, data: LoggableType) -> None:
+        jsonable_data = data if _is_plain_string_payload(data) else jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
         str_data = json.dumps(json_data) + "\n\n"
-        if self.queue:
+        if not self.queue:
+            return
+        item = (event_id, str_data.encode("utf-8"), time.time())
+        if self._is_foreign_thread():
+            # An asyncio.Queue is not thread-safe, so events sent from worker and timer threads
+            # are put on it from its loop
             try:
-                self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
-            except Exception:  # noqa: BLE001
-                logger.debug("Queue not available for event")
+                self._loop.call_soon_threadsafe(self._put_nowait, item)
+            except RuntimeError:
+                logger.debug("Event loop closed, dropping event")
+            return
+        self._put_nowait(item)
+
+    def _put_nowait(self, item: tuple[str, bytes, float]) -> None:
+        try:
+            self.queue.put_nowait(item)
+        except Exception:  # noqa: BLE001
+            logger.debug("Queue not available for event")
+
+    def _is_foreign_thread(self) -> bool:
+        """Whether the queue is an asyncio.Queue of a loop that is not running in the current thread."""
+        if self._loop is None or not self._loop.is_running() or not isinstance(self.queue, asyncio.Queue):
+            return False
+        try:
+            return asyncio.get_running_loop() is not self._loop
+        except RuntimeError:
+            return True
+
+    def _add_token(self, data: dict[str, str]) -> None:
+        chunk = data["chunk"]
+        with self._token_lock:
+            if self._pending_message_id is not None and self._pending_message_id != data["id"]:
+                self._flush_tokens_locked()
+            if self._pending_message_id is None:
+                self._pending_message_id = data["id"]
+                self._pending_since = time.monotonic()
+                self._schedule_token_flush(self._pending_generation)
+            self._pending_chunks.append(chunk)
+            self._pending_bytes += len(chunk.encode("utf-8"))
+            if (
+                self._pending_bytes >= self.coalesce_max_bytes
+                or time.monotonic() - self._pending_since >= self.coalesce_max_delay
+            ):
+                self._flush_tokens_locked()
+
+    def _schedule_token_flush(self, generation: int) -> None:
+        """Send the pending tokens after ``coalesce_max_delay`` even if no other event arrives."""
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(
+                    self._loop.call_later, self.coalesce_max_delay, self._flush_expired_tokens, generation
+                )
+            except RuntimeError:
+                # The loop was closed in the meantime
+                pass
+            else:
+                return
+        if isinstance(self.queue, asyncio.Queue):
+            # Without its loop, the queue cannot be fed from a timer thread; the pending tokens are
+            # sent by the next event or by flush_tokens instead
+            return
+        timer = threading.Timer(self.coalesce_max_delay, self._flush_expired_tokens, args=(generation,))
+        timer.daemon = True
+        timer.start()
+
+    def _flush_expired_tokens(self, generation: int) -> None:
+        with self._token_lock:
+            if generation == self._pending_generation:
+                self._flush_tokens_locked()
+
+    def _flush_tokens_locked(self) -> None:
+        if self._pending_message_id is None:
+            return
+        data = {"chunk": "".join(self._pending_chunks), "id": self._pending_message_id}
+        self._pending_message_id = None
+        self._pending_chunks = []
+        self._pending_bytes = 0
+        self._pending_generation += 1
+        self._put_event("token", data)
+
+    def flush_tokens(self) -> None:
+        """Send the token events held for coalescing, if any."""
+        if not self.coalesce_tokens:
+            return
+        with self._token_lock:
+            self._flush_tokens_locked()
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -88,8 +235,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue=None):
-    manager = EventManager(queue)
+def create_default_event_manager(queue=None, **coalescing_options):
+    manager = EventManager(queue, **coalescing_options)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -102,9 +249,28 @@ def create_default_event_manager(queue=None):
     return manager
 
 
-def create_stream_tokens_event_manager(queue=None):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue=None, **coalescing_options):
+    manager = EventManager(queue, **coalescing_options)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
     return manager
+
+
+def get_coalescing_options() -> dict[str, Any]:
+    """Return the token coalescing options of the EventManager configured in the settings."""
+    from lfx.services.deps import get_settings_service
+
+    try:
+        settings_service = get_settings_service()
+    except Exception:  # noqa: BLE001
+        logger.debug("Settings service unavailable, token coalescing is disabled")
+        return {}
+    if settings_service is None:
+        return {}
+    settings = settings_service.settings
+    return {
+        "coalesce_tokens": settings.event_token_coalescing_enabled,
+        "coalesce_max_delay": settings.event_token_coalescing_max_delay,
+        "coalesce_max_bytes": settings.event_token_coalescing_max_bytes,
+    }
@@ -22,7 +22,7 @@ from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from lfx.graph.graph.schema import ExecutionMode, GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from lfx.graph.graph.state_model import create_state_model_from_graph
 from lfx.graph.graph.utils import (
     find_all_cycle_edges,
@@ -51,10 +51,12 @@ if TYPE_CHECKING:
     from lfx.custom.custom_component.component import Component
     from lfx.events.event_manager import EventManager
     from lfx.graph.edge.schema import EdgeData
+    from lfx.graph.graph.prepared import PreparedGraph
     from lfx.graph.schema import ResultData
     from lfx.schema.schema import InputValueRequest
     from lfx.services.chat.schema import GetCache, SetCache
     from lfx.services.tracing.service import TracingService
+    from lfx.services.variable.resolver import VariableResolver
 
 
 class Graph:
@@ -91,6 +93,8 @@ class Graph:
         self.flow_name = flow_name
         self.description = description
         self.user_id = user_id
+        # Whether the current run falls back to environment variables, for vertices built outside of build_vertex
+        self.fallback_to_env_vars = False
         self._is_input_vertices: list[str] = []
         self._is_output_vertices: list[str] = []
         self._is_state_vertices: list[str] | None = None
@@ -130,6 +134,16 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        # Batches the global variable lookups of the current run, see lfx.services.variable.resolver
+        self.variable_resolver: VariableResolver | None = None
+        # Overrides of the graph_execution_mode and graph_max_concurrency settings for this graph
+        self.execution_mode: ExecutionMode | None = None
+        self.max_concurrency: int | None = None
+        # Shared, read-only structures provided by a PreparedGraph (see prepared.py)
+        self._precomputed_field_params: dict[str, tuple[dict[str, Any], list[str]]] | None = None
+        self._sorted_vertices_cache: dict[tuple[str | None, str | None], tuple[list[str], list[list[str]]]] | None = (
+            None
+        )
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -1056,6 +1070,7 @@ class Graph:
             "flow_name": self.flow_name,
             "description": self.description,
             "user_id": self.user_id,
+            "fallback_to_env_vars": self.fallback_to_env_vars,
             "raw_graph_data": self.raw_graph_data,
             "top_level_vertices": self.top_level_vertices,
             "inactivated_vertices": self.inactivated_vertices,
@@ -1118,7 +1133,10 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        state.setdefault("fallback_to_env_vars", False)
         self.__dict__.update(state)
+        self._precomputed_field_params = None
+        self._sorted_vertices_cache = None
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
@@ -1162,6 +1180,50 @@ class Graph:
         else:
             return graph
 
+    @classmethod
+    def from_prepared(
+        cls,
+        prepared: PreparedGraph,
+        *,
+        user_id: str | None = None,
+        context: dict | None = None,
+    ) -> Graph:
+        """Creates a graph for a single run from a PreparedGraph.
+
+        The processed payload, cycle vertices, per-vertex field parameters and sorted layers are
+        taken from the prepared graph instead of being computed again. Vertices, edges and
+        component instances are new and belong only to the returned graph.
+
+        Args:
+            prepared: The prepared graph to instantiate.
+            user_id: The user ID.
+            context: Optional context dictionary for request-specific data.
+
+        Returns:
+            Graph: The created graph.
+        """
+        graph = cls(flow_id=prepared.flow_id, flow_name=prepared.flow_name, user_id=user_id, context=context)
+        graph._cycle_vertices = set(prepared.cycle_vertices)
+        graph._precomputed_field_params = prepared.field_params
+        graph._sorted_vertices_cache = prepared.sorted_vertices_cache
+
+        processed = prepared.load_processed_graph_data()
+        graph.raw_graph_data = prepared.raw_graph_data
+        graph._graph_data = processed
+        graph._vertices = processed["nodes"]
+        graph._edges = processed["edges"]
+        graph.top_level_vertices = list(prepared.top_level_vertices)
+        for vertex_id in graph.top_level_vertices:
+            if vertex_id in graph._cycle_vertices:
+                graph.run_manager.add_to_cycle_vertices(vertex_id)
+        graph.initialize()
+        return graph
+
+    @property
+    def processed_graph_data(self) -> GraphData:
+        """The graph data after group nodes are flattened, as used to build vertices and edges."""
+        return {"nodes": self._vertices, "edges": self._edges}
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1253,6 +1315,7 @@ class Graph:
         """
         vertex.full_data = other_vertex.full_data
         vertex.parse_data()
+        self._discard_precomputed_field_params(vertex.id)
         # Now we update the edges of the vertex
         self.update_edges_from_vertex(other_vertex)
         vertex.params = {}
@@ -1267,6 +1330,14 @@ class Graph:
             vertex.set_top_level(self.top_level_vertices)
         self.reset_all_edges_of_vertex(vertex)
 
+    def _discard_precomputed_field_params(self, vertex_id: str) -> None:
+        """Stop reusing the field parameters a PreparedGraph computed for a vertex whose data was replaced."""
+        if self._precomputed_field_params and vertex_id in self._precomputed_field_params:
+            # The mapping belongs to the PreparedGraph and is shared by its other instances
+            self._precomputed_field_params = {
+                key: value for key, value in self._precomputed_field_params.items() if key != vertex_id
+            }
+
     def reset_all_edges_of_vertex(self, vertex: Vertex) -> None:
         """Resets all the edges of a vertex."""
         for edge in vertex.edges:
@@ -1463,6 +1534,71 @@ class Graph:
             }
         )
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Return the scheduling state of the current run as JSON-compatible data.
+
+        Vertex results and the context are not included, see ``lfx.graph.graph.run_state``.
+        """
+        run_manager = self.run_manager
+        return {
+            "run_id": self._run_id,
+            "session_id": self._session_id,
+            "prepared": self._prepared,
+            "fallback_to_env_vars": self.fallback_to_env_vars,
+            "run_manager": {
+                "run_map": {key: sorted(value) for key, value in run_manager.run_map.items()},
+                "run_predecessors": {key: sorted(value) for key, value in run_manager.run_predecessors.items()},
+                "vertices_to_run": sorted(run_manager.vertices_to_run),
+                "vertices_being_run": sorted(run_manager.vertices_being_run),
+                "ran_at_least_once": sorted(run_manager.ran_at_least_once),
+                "cycle_vertices": sorted(run_manager.cycle_vertices),
+            },
+            "run_queue": list(self._run_queue),
+            "first_layer": list(self._first_layer),
+            "vertices_layers": self.vertices_layers,
+            "sorted_vertices_layers": self._sorted_vertices_layers,
+            "vertices_to_run": sorted(self.vertices_to_run),
+            "stop_vertex": self.stop_vertex,
+            "inactivated_vertices": sorted(self.inactivated_vertices),
+            "inactive_vertices": sorted(self.inactive_vertices),
+            "activated_vertices": list(self.activated_vertices),
+            "conditionally_excluded_vertices": sorted(self.conditionally_excluded_vertices),
+            "conditional_exclusion_sources": {
+                key: sorted(value) for key, value in self.conditional_exclusion_sources.items()
+            },
+        }
+
+    def set_run_state(self, state: dict[str, Any]) -> None:
+        """Restore the scheduling state returned by ``get_run_state``."""
+        run_manager_state = state["run_manager"]
+        self.run_manager = RunnableVerticesManager.from_dict(
+            {
+                "run_map": run_manager_state["run_map"],
+                "run_predecessors": run_manager_state["run_predecessors"],
+                "vertices_to_run": set(run_manager_state["vertices_to_run"]),
+                "vertices_being_run": set(run_manager_state["vertices_being_run"]),
+                "ran_at_least_once": set(run_manager_state["ran_at_least_once"]),
+            }
+        )
+        self.run_manager.cycle_vertices = set(run_manager_state["cycle_vertices"])
+        self._run_id = state["run_id"]
+        self._session_id = state["session_id"]
+        self._prepared = state["prepared"]
+        self.fallback_to_env_vars = state["fallback_to_env_vars"]
+        self._run_queue = deque(state["run_queue"])
+        self._first_layer = list(state["first_layer"])
+        self.vertices_layers = [list(layer) for layer in state["vertices_layers"]]
+        self._sorted_vertices_layers = [list(layer) for layer in state["sorted_vertices_layers"]]
+        self.vertices_to_run = set(state["vertices_to_run"])
+        self.stop_vertex = state["stop_vertex"]
+        self.inactivated_vertices = set(state["inactivated_vertices"])
+        self.inactive_vertices = set(state["inactive_vertices"])
+        self.activated_vertices = list(state["activated_vertices"])
+        self.conditionally_excluded_vertices = set(state["conditionally_excluded_vertices"])
+        self.conditional_exclusion_sources = {
+            key: set(value) for key, value in state["conditional_exclusion_sources"].items()
+        }
+
     def _record_snapshot(self, vertex_id: str | None = None) -> None:
         self._snapshots.append(self.get_snapshot())
         if vertex_id:
@@ -1519,6 +1655,7 @@ class Graph:
             ValueError: If no result is found for the vertex.
         """
         vertex = self.get_vertex(vertex_id)
+        self.fallback_to_env_vars = fallback_to_env_vars
         self.run_manager.add_to_vertices_being_run(vertex_id)
         try:
             params = ""
@@ -1654,6 +1791,20 @@ class Graph:
 
         await self.initialize_run()
         lock = asyncio.Lock()
+        execution_mode, max_concurrency = self._get_execution_options()
+        if execution_mode == "eager":
+            await self._process_eager(
+                first_layer,
+                lock=lock,
+                max_concurrency=max_concurrency,
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=get_cache_func,
+                set_cache=set_cache_func,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+            )
+            await logger.adebug("Graph processing complete")
+            return self
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1691,18 +1842,125 @@ class Graph:
         await logger.adebug("Graph processing complete")
         return self
 
+    def _get_execution_options(self) -> tuple[ExecutionMode, int]:
+        """Return the execution mode and concurrency cap, preferring the values set on the graph."""
+        from lfx.services.deps import get_settings_service
+
+        execution_mode = getattr(self, "execution_mode", None)
+        max_concurrency = getattr(self, "max_concurrency", None)
+        if execution_mode is None or max_concurrency is None:
+            try:
+                settings_service = get_settings_service()
+            except Exception:  # noqa: BLE001
+                settings_service = None
+            settings = settings_service.settings if settings_service is not None else None
+            if execution_mode is None:
+                execution_mode = getattr(settings, "graph_execution_mode", "layered")
+            if max_concurrency is None:
+                max_concurrency = getattr(settings, "graph_max_concurrency", 0)
+        return execution_mode, max_concurrency
+
+    async def _process_eager(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        max_concurrency: int,
+        fallback_to_env_vars: bool,
+        get_cache: GetCache,
+        set_cache: SetCache,
+        event_manager: EventManager | None,
+        has_webhook_component: bool,
+    ) -> None:
+        """Runs each vertex as soon as its own predecessors are built instead of waiting for whole layers.
+
+        Args:
+            first_layer: The vertices to start with.
+            lock: Async lock for synchronization.
+            max_concurrency: Maximum number of vertices built at the same time. 0 means no limit.
+            fallback_to_env_vars: Whether to fall back to environment variables.
+            get_cache: Function to read the cache.
+            set_cache: Function to write the cache.
+            event_manager: The event manager for the graph.
+            has_webhook_component: Whether the graph has a webhook component.
+        """
+        vertex_task_run_count: dict[str, int] = {}
+        to_process: deque[str] = deque(first_layer)
+        queued: set[str] = set(first_layer)
+        running: dict[asyncio.Task, str] = {}
+
+        try:
+            while to_process or running:
+                while to_process and (max_concurrency <= 0 or len(running) < max_concurrency):
+                    vertex_id = to_process.popleft()
+                    queued.discard(vertex_id)
+                    run_count = vertex_task_run_count.get(vertex_id, 0)
+                    task = asyncio.create_task(
+                        self.build_vertex(
+                            vertex_id=vertex_id,
+                            user_id=self.user_id,
+                            inputs_dict={},
+                            fallback_to_env_vars=fallback_to_env_vars,
+                            get_cache=get_cache,
+                            set_cache=set_cache,
+                            event_manager=event_manager,
+                        ),
+                        name=f"{vertex_id} Run {run_count}",
+                    )
+                    running[task] = vertex_id
+                    vertex_task_run_count[vertex_id] = run_count + 1
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # Handle simultaneous completions in start order, like the layered mode handles a layer
+                for task in [task for task in running if task in done]:
+                    vertex_id = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as exc:
+                        await logger.aerror(f"Task {task.get_name()} failed with exception: {exc}")
+                        if has_webhook_component:
+                            await self._log_vertex_build_from_exception(vertex_id, exc)
+                        raise
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+
+                    await self._log_build_result(result)
+                    self.run_manager.remove_vertex_from_runnables(result.vertex.id)
+                    await logger.adebug(
+                        f"Vertex {result.vertex.id}, result: {result.vertex.built_result}, "
+                        f"object: {result.vertex.built_object}"
+                    )
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    await self._emit_build_event(result, next_runnable_vertices)
+                    for next_vertex_id in next_runnable_vertices:
+                        if next_vertex_id not in queued and next_vertex_id not in running.values():
+                            queued.add(next_vertex_id)
+                            to_process.append(next_vertex_id)
+        finally:
+            # Same as the cancellation of a layer's gather: the vertices still being built are cancelled
+            for task in running:
+                task.cancel()
+            # and waited for, so none of them is still running once the graph has stopped
+            await asyncio.gather(*running, return_exceptions=True)
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
         For each successor, if it is not runnable, recursively finds its runnable
         predecessors; otherwise, includes the successor itself. Returns a sorted list of all such vertex IDs.
         """
-        next_runnable_vertices = set()
-        for v_id in sorted(vertex_successors_ids):
-            if not self.is_vertex_runnable(v_id):
-                next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id))
-            else:
+        next_runnable_vertices: set[str] = set()
+        # Shared across successors: a vertex reached from one of them has the same outcome for the others
+        visited: set[str] = set()
+        for v_id in vertex_successors_ids:
+            if self.is_vertex_runnable(v_id):
                 next_runnable_vertices.add(v_id)
+            elif self.cycle_vertices or self.run_manager.has_stalled_vertices(ignore=vertex_successors_ids):
+                # Outside cycles, only stalled vertices can be found among the ancestors of a waiting vertex
+                next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id, visited))
 
         return sorted(next_runnable_vertices)
 
@@ -1789,8 +2047,6 @@ class Graph:
             lock: Async lock for synchronization
             has_webhook_component: Whether the graph has a webhook component
         """
-        from lfx.graph.utils import emit_vertex_build_event
-
         results = []
         completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
         vertices: list[Vertex] = []
@@ -1812,14 +2068,7 @@ class Graph:
                 raise result
             if isinstance(result, VertexBuildResult):
                 if self.flow_id is not None:
-                    await log_vertex_build(
-                        flow_id=self.flow_id,
-                        vertex_id=result.vertex.id,
-                        valid=result.valid,
-                        params=result.params,
-                        data=result.result_dict,
-                        artifacts=result.artifacts,
-                    )
+                    await self._log_build_result(result)
                     # Store for SSE emission later
                     build_results[result.vertex.id] = result
 
@@ -1841,27 +2090,46 @@ class Graph:
             results.extend(next_runnable_vertices)
 
             # Emit SSE event with complete data including next_vertices_ids
-            if self.flow_id is not None and v.id in build_results:
-                build_result = build_results[v.id]
-                # Get top level vertices for these next runnable vertices
-                top_level = self.get_top_level_vertices(next_runnable_vertices)
-                # Get inactivated vertices
-                inactivated = list(self.inactivated_vertices.union(self.conditionally_excluded_vertices))
-
-                await emit_vertex_build_event(
-                    flow_id=self.flow_id,
-                    vertex_id=v.id,
-                    valid=build_result.valid,
-                    params=build_result.params,
-                    data_dict=build_result.result_dict,
-                    artifacts_dict=build_result.artifacts,
-                    next_vertices_ids=next_runnable_vertices,
-                    top_level_vertices=top_level,
-                    inactivated_vertices=inactivated,
-                )
+            if v.id in build_results:
+                await self._emit_build_event(build_results[v.id], next_runnable_vertices)
 
         return list(set(results))
 
+    async def _log_build_result(self, result: VertexBuildResult) -> None:
+        if self.flow_id is None:
+            return
+        await log_vertex_build(
+            flow_id=self.flow_id,
+            vertex_id=result.vertex.id,
+            valid=result.valid,
+            params=result.params,
+            data=result.result_dict,
+            artifacts=result.artifacts,
+        )
+
+    async def _emit_build_event(self, result: VertexBuildResult, next_runnable_vertices: list[str]) -> None:
+        """Emits the SSE event of a built vertex with complete data including next_vertices_ids."""
+        from lfx.graph.utils import emit_vertex_build_event
+
+        if self.flow_id is None:
+            return
+        # Get top level vertices for these next runnable vertices
+        top_level = self.get_top_level_vertices(next_runnable_vertices)
+        # Get inactivated vertices
+        inactivated = list(self.inactivated_vertices.union(self.conditionally_excluded_vertices))
+
+        await emit_vertex_build_event(
+            flow_id=self.flow_id,
+            vertex_id=result.vertex.id,
+            valid=result.valid,
+            params=result.params,
+            data_dict=result.result_dict,
+            artifacts_dict=result.artifacts,
+            next_vertices_ids=next_runnable_vertices,
+            top_level_vertices=top_level,
+            inactivated_vertices=inactivated,
+        )
+
     def topological_sort(self) -> list[Vertex]:
         """Performs a topological sort of the vertices in the graph.
 
@@ -2184,20 +2452,31 @@ class Graph:
         """Sorts the vertices in the graph."""
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
-            is_cyclic=self.is_cyclic,
-        )
+        cache_key = (stop_component_id, start_component_id)
+        if self._sorted_vertices_cache is not None and cache_key in self._sorted_vertices_cache:
+            cached_first_layer, cached_remaining_layers = self._sorted_vertices_cache[cache_key]
+            first_layer = list(cached_first_layer)
+            remaining_layers = [list(layer) for layer in cached_remaining_layers]
+        else:
+            first_layer, remaining_layers = get_sorted_vertices(
+                vertices_ids=self.get_vertex_ids(),
+                cycle_vertices=self.cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                graph_dict=self.__to_dict(),
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            )
+            if self._sorted_vertices_cache is not None:
+                self._sorted_vertices_cache[cache_key] = (
+                    list(first_layer),
+                    [list(layer) for layer in remaining_layers],
+                )
 
         self.increment_run_count()
         self._sorted_vertices_layers = [first_layer, *remaining_layers]
@@ -2265,9 +2544,10 @@ class Graph:
 
         return sorted(runnable_vertices)
 
-    def find_runnable_predecessors_for_successor(self, vertex_id: str) -> list[str]:
+    def find_runnable_predecessors_for_successor(self, vertex_id: str, visited: set[str] | None = None) -> list[str]:
         runnable_vertices = []
-        visited = set()
+        if visited is None:
+            visited = set()
 
         def find_runnable_predecessors(predecessor_id: str) -> None:
             if predecessor_id in visited:
@@ -0,0 +1,72 @@
+"""Pre-parsed flow topology that can cheaply produce per-run Graph instances.
+
+``Graph.from_payload`` flattens group nodes, detects cycles, builds every vertex's
+parameters from its template and, on the first run, computes the sorted layers.
+For a flow that is executed many times with the same data all of that work is
+identical, so a ``PreparedGraph`` does it once and keeps the results. Each call
+to ``instantiate`` then builds a fresh ``Graph`` whose vertices, edges and
+component instances belong to that run only, while the processed payload, cycle
+information, per-vertex field parameters and sorted layers are reused.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from lfx.graph.graph.base import Graph
+from lfx.graph.vertex.param_handler import ParameterHandler
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.schema import GraphData
+
+
+class PreparedGraph:
+    """An immutable, pre-parsed flow that stamps out independent per-run graphs.
+
+    Args:
+        payload: The flow data (with ``nodes`` and ``edges``, optionally nested under ``data``).
+            It is never mutated.
+        flow_id: The ID of the flow.
+        flow_name: The name of the flow.
+    """
+
+    def __init__(self, payload: dict, *, flow_id: str | None = None, flow_name: str | None = None) -> None:
+        if "data" in payload:
+            payload = payload["data"]
+        self.flow_id = flow_id
+        self.flow_name = flow_name
+
+        template = Graph.from_payload(copy.deepcopy(payload), flow_id=flow_id, flow_name=flow_name)
+
+        self.raw_graph_data: GraphData = template.raw_graph_data
+        self.top_level_vertices: tuple[str, ...] = tuple(template.top_level_vertices)
+        self.cycle_vertices: frozenset[str] = frozenset(template.cycle_vertices)
+        self.vertex_ids: tuple[str, ...] = tuple(vertex.id for vertex in template.vertices)
+        self.field_params: dict[str, tuple[dict[str, Any], list[str]]] = {
+            vertex.id: ParameterHandler(vertex, storage_service=None).process_field_parameters()
+            for vertex in template.vertices
+        }
+        # Filled lazily by Graph.sort_vertices the first time each (stop, start) combination is sorted
+        self.sorted_vertices_cache: dict[tuple[str | None, str | None], tuple[list[str], list[list[str]]]] = {}
+        self._processed_graph_data = self._freeze(template.processed_graph_data)
+
+    @staticmethod
+    def _freeze(data: GraphData) -> bytes | GraphData:
+        """Serialize the processed payload so every run gets its own deep copy cheaply."""
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            return copy.deepcopy(data)
+
+    def load_processed_graph_data(self) -> GraphData:
+        """Return a private copy of the processed nodes and edges."""
+        if isinstance(self._processed_graph_data, bytes):
+            return orjson.loads(self._processed_graph_data)
+        return copy.deepcopy(self._processed_graph_data)
+
+    def instantiate(self, *, user_id: str | None = None, context: dict | None = None) -> Graph:
+        """Build a new Graph for a single run from the prepared topology."""
+        return Graph.from_prepared(self, user_id=user_id, context=context)
@@ -0,0 +1,320 @@
+"""Compact, versioned snapshots of a graph's run state.
+
+Caches that live outside the process (Redis, disk) used to pickle the whole ``Graph``
+between build requests: every vertex, its parameters, the component instances and
+whatever objects they built. That is slow, produces large payloads and fails as soon
+as a component holds an object that cannot be pickled, such as an LLM client.
+
+A run state only captures what changes while a flow runs: the run manager, the run
+queue and layers, the vertex states and, for each built vertex, its results and
+artifacts. It is encoded as JSON, so unlike unpickling, reading it cannot run code. Values are
+tagged with their type when JSON cannot represent them, and only models, enums and
+dataframes defined in ``lfx`` or ``langflow`` modules are rebuilt.
+
+Restoring a state instantiates the flow from a ``PreparedGraph`` of the same topology
+and applies the state on top. Vertices whose results cannot be encoded are restored
+unbuilt and are built again the first time another vertex requests their result.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel
+
+from lfx.graph.utils import UnbuiltObject, UnbuiltResult
+from lfx.graph.vertex.base import VertexStates
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+    from lfx.graph.graph.prepared import PreparedGraph
+    from lfx.graph.vertex.base import Vertex
+
+RUN_STATE_VERSION = 1
+PREPARED_TOPOLOGY_CACHE_SIZE = 32
+
+_TAG = "__t__"
+_ALLOWED_MODULE_PREFIXES = ("lfx.", "langflow.")
+_VERTEX_RESULT_FIELDS = ("results", "artifacts", "built_object", "built_result", "result")
+
+
+class RunStateError(ValueError):
+    """Raised when a run state cannot be captured or restored."""
+
+
+def _class_path(cls: type) -> str:
+    path = f"{cls.__module__}.{cls.__qualname__}"
+    if not path.startswith(_ALLOWED_MODULE_PREFIXES) or "<locals>" in path:
+        msg = f"Values of type {path} cannot be stored in a run state"
+        raise RunStateError(msg)
+    return path
+
+
+def _import_class(path: str, base: type) -> type:
+    if not path.startswith(_ALLOWED_MODULE_PREFIXES):
+        msg = f"Refusing to load {path} from a run state"
+        raise RunStateError(msg)
+    # Walk the qualified name from the longest importable module prefix
+    parts = path.split(".")
+    for index in range(len(parts) - 1, 0, -1):
+        try:
+            obj: Any = importlib.import_module(".".join(parts[:index]))
+        except ImportError:
+            continue
+        try:
+            for name in parts[index:]:
+                obj = getattr(obj, name)
+        except AttributeError:
+            break
+        if isinstance(obj, type) and issubclass(obj, base):
+            return obj
+        break
+    msg = f"Could not load {path} from a run state"
+    raise RunStateError(msg)
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a value into JSON-compatible data that ``decode_value`` turns back into an equal value.
+
+    Raises:
+        RunStateError: If the value, or anything it contains, cannot be encoded.
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and _TAG not in value:
+            return {key: encode_value(item) for key, item in value.items()}
+        return {_TAG: "dict", "items": [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    if isinstance(value, tuple | set | frozenset):
+        return {_TAG: type(value).__name__, "items": [encode_value(item) for item in value]}
+    if isinstance(value, BaseModel):
+        return {
+            _TAG: "model",
+            "cls": _class_path(type(value)),
+            "fields": {name: encode_value(item) for name, item in value.__dict__.items()},
+            "extra": encode_value(value.__pydantic_extra__),
+        }
+    if isinstance(value, Enum):
+        return {_TAG: "enum", "cls": _class_path(type(value)), "value": encode_value(value.value)}
+    if isinstance(value, UUID):
+        return {_TAG: "uuid", "value": str(value)}
+    if isinstance(value, datetime):
+        return {_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, UnbuiltObject):
+        return {_TAG: "unbuilt_object"}
+    if isinstance(value, UnbuiltResult):
+        return {_TAG: "unbuilt_result"}
+    return _encode_other(value)
+
+
+def _encode_other(value: Any) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, np.generic):
+        return encode_value(value.item())
+    if isinstance(value, pd.DataFrame) and isinstance(value.index, pd.RangeIndex) and value.index.start == 0:
+        columns = [encode_value(column) for column in value.columns]
+        encoded = {
+            _TAG: "dataframe",
+            "cls": "pandas.DataFrame" if type(value) is pd.DataFrame else _class_path(type(value)),
+            "columns": columns,
+            "rows": [encode_value(list(row)) for row in value.itertuples(index=False, name=None)],
+        }
+        for attribute in ("text_key", "default_value"):
+            if hasattr(value, f"_{attribute}"):
+                encoded[attribute] = encode_value(getattr(value, f"_{attribute}"))
+        return encoded
+    msg = f"Values of type {type(value).__module__}.{type(value).__qualname__} cannot be stored in a run state"
+    raise RunStateError(msg)
+
+
+def decode_value(data: Any) -> Any:
+    """Rebuild a value encoded with ``encode_value``."""
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    tag = data.get(_TAG)
+    if tag is None:
+        return {key: decode_value(item) for key, item in data.items()}
+    if tag == "dict":
+        return {decode_value(key): decode_value(item) for key, item in data["items"]}
+    if tag in {"tuple", "set", "frozenset"}:
+        return {"tuple": tuple, "set": set, "frozenset": frozenset}[tag](decode_value(item) for item in data["items"])
+    if tag == "model":
+        model_class = _import_class(data["cls"], BaseModel)
+        model = model_class.model_construct(**decode_value(data["fields"]))
+        extra = decode_value(data.get("extra"))
+        if extra:
+            object.__setattr__(model, "__pydantic_extra__", extra)
+        return model
+    if tag == "enum":
+        return _import_class(data["cls"], Enum)(decode_value(data["value"]))
+    if tag == "uuid":
+        return UUID(data["value"])
+    if tag == "datetime":
+        return datetime.fromisoformat(data["value"])
+    if tag == "unbuilt_object":
+        return UnbuiltObject()
+    if tag == "unbuilt_result":
+        return UnbuiltResult()
+    if tag == "dataframe":
+        return _decode_dataframe(data)
+    msg = f"Unknown value type {tag!r} in run state"
+    raise RunStateError(msg)
+
+
+def _decode_dataframe(data: dict) -> Any:
+    import pandas as pd
+
+    dataframe_class = pd.DataFrame if data["cls"] == "pandas.DataFrame" else _import_class(data["cls"], pd.DataFrame)
+    columns = [decode_value(column) for column in data["columns"]]
+    rows = [decode_value(row) for row in data["rows"]]
+    frame = pd.DataFrame(rows, columns=columns)
+    if dataframe_class is pd.DataFrame:
+        return frame
+    options = {key: decode_value(data[key]) for key in ("text_key", "default_value") if key in data}
+    return dataframe_class(frame, **options)
+
+
+def topology_key(raw_graph_data: dict) -> str:
+    """Return a hash identifying the flow data a graph was built from."""
+    return hashlib.sha256(orjson.dumps(raw_graph_data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _dump_vertex(vertex: Vertex) -> dict[str, Any]:
+    data: dict[str, Any] = {"state": vertex.state.value}
+    if not vertex.built:
+        return data
+    try:
+        encoded = {field: encode_value(getattr(vertex, field)) for field in _VERTEX_RESULT_FIELDS}
+    except RunStateError as exc:
+        logger.debug(f"Vertex {vertex.id} will be rebuilt when its state is restored: {exc}")
+        data["rebuild"] = True
+        return data
+    data["built"] = True
+    data.update(encoded)
+    return data
+
+
+def _dump_context(graph: Graph) -> dict[str, Any]:
+    context = {}
+    for key, value in graph.context.items():
+        try:
+            context[key] = encode_value(value)
+        except RunStateError:
+            logger.debug(f"Skipping context entry {key!r} that cannot be stored in a run state")
+    return context
+
+
+def dump_run_state(graph: Graph) -> dict[str, Any]:
+    """Capture the run state of ``graph`` as JSON-compatible data.
+
+    Raises:
+        RunStateError: If the graph was not built from flow data, so it cannot be rebuilt.
+    """
+    if not graph.raw_graph_data.get("nodes"):
+        msg = "Only graphs built from flow data can be stored as a run state"
+        raise RunStateError(msg)
+    return {
+        "version": RUN_STATE_VERSION,
+        "topology": topology_key(graph.raw_graph_data),
+        "payload": graph.raw_graph_data,
+        "flow_id": graph.flow_id,
+        "flow_name": graph.flow_name,
+        "user_id": graph.user_id,
+        "run": graph.get_run_state(),
+        "context": _dump_context(graph),
+        "vertices": {vertex.id: _dump_vertex(vertex) for vertex in graph.vertices},
+    }
+
+
+def dumps_run_state(graph: Graph) -> bytes:
+    """Capture the run state of ``graph`` and serialize it to JSON bytes."""
+    return orjson.dumps(dump_run_state(graph))
+
+
+def loads_run_state(data: bytes | str) -> dict[str, Any]:
+    """Parse a serialized run state, checking that this version of the code can restore it."""
+    state = orjson.loads(data)
+    if not isinstance(state, dict) or state.get("version") != RUN_STATE_VERSION:
+        version = state.get("version") if isinstance(state, dict) else None
+        msg = f"Unsupported run state version {version!r}, expected {RUN_STATE_VERSION}"
+        raise RunStateError(msg)
+    return state
+
+
+def restore_run_state(graph: Graph, state: dict[str, Any]) -> Graph:
+    """Apply a run state onto a graph freshly built from the same topology.
+
+    Raises:
+        RunStateError: If the state was captured from a different topology.
+    """
+    missing = set(state["vertices"]) - set(graph.vertex_map)
+    if missing:
+        msg = f"Run state does not match the graph topology, unknown vertices: {sorted(missing)}"
+        raise RunStateError(msg)
+
+    graph.flow_name = state["flow_name"]
+    if state["user_id"]:
+        graph.user_id = state["user_id"]
+    graph.set_run_state(state["run"])
+    graph.context = {**graph.context, **decode_value(state["context"])}
+
+    for vertex_id, vertex_state in state["vertices"].items():
+        vertex = graph.vertex_map[vertex_id]
+        vertex.state = VertexStates(vertex_state["state"])
+        if vertex_state.get("built"):
+            for field in _VERTEX_RESULT_FIELDS:
+                setattr(vertex, field, decode_value(vertex_state[field]))
+            vertex.built = True
+        elif vertex_state.get("rebuild"):
+            vertex.rebuild_on_request = True
+    return graph
+
+
+_prepared_topologies: OrderedDict[str, PreparedGraph] = OrderedDict()
+_prepared_topologies_lock = threading.Lock()
+
+
+def _get_prepared_topology(state: dict[str, Any]) -> PreparedGraph:
+    from lfx.graph.graph.prepared import PreparedGraph
+
+    key = state["topology"]
+    with _prepared_topologies_lock:
+        prepared = _prepared_topologies.get(key)
+        if prepared is not None:
+            _prepared_topologies.move_to_end(key)
+            return prepared
+    prepared = PreparedGraph(state["payload"], flow_id=state["flow_id"], flow_name=state["flow_name"])
+    with _prepared_topologies_lock:
+        _prepared_topologies[key] = prepared
+        while len(_prepared_topologies) > PREPARED_TOPOLOGY_CACHE_SIZE:
+            _prepared_topologies.popitem(last=False)
+    return prepared
+
+
+def graph_from_run_state(state: dict[str, Any], prepared: PreparedGraph | None = None) -> Graph:
+    """Build a graph from a run state.
+
+    Args:
+        state: A state returned by ``dump_run_state`` or ``loads_run_state``.
+        prepared: The prepared topology to instantiate. When omitted, a process-wide cache of
+            prepared topologies keyed by the hash of the flow data is used.
+    """
+    if prepared is None:
+        prepared = _get_prepared_topology(state)
+    graph = prepared.instantiate(user_id=state["user_id"])
+    return restore_run_state(graph, state)
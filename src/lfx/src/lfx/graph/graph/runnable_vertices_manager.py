@@ -1,14 +1,47 @@
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
+
+
+class VertexIdSet(set):
+    """A set of vertex ids that also accepts ``append``.
+
+    Component code saved in flows (such as older Loop components) appends to ``run_predecessors``
+    and ``run_map`` entries as if they were lists, so the adjacency sets keep that method.
+    """
+
+    def append(self, vertex_id: str) -> None:
+        self.add(vertex_id)
+
+
+def _to_adjacency(mapping: Mapping[str, Iterable[str]]) -> defaultdict[str, VertexIdSet]:
+    adjacency: defaultdict[str, VertexIdSet] = defaultdict(VertexIdSet)
+    for vertex_id, neighbors in mapping.items():
+        adjacency[vertex_id] = VertexIdSet(neighbors)
+    return adjacency
 
 
 class RunnableVerticesManager:
+    """Tracks which vertices of a graph are ready to run.
+
+    ``run_predecessors`` maps each vertex to the set of predecessors it is still waiting for and
+    ``run_map`` maps each vertex to the set of its successors. The size of a pending set is the
+    vertex's pending count, so completing a vertex only touches its own successors and costs
+    O(out-degree) instead of rescanning predecessor lists.
+
+    The manager also tracks stalled vertices: vertices that other vertices wait for, whose own
+    predecessors are fulfilled, but that are not being run. Only those can be found by searching
+    the ancestors of a waiting vertex, so while there are none the search can be skipped.
+    """
+
     def __init__(self) -> None:
-        self.run_map: dict[str, list[str]] = defaultdict(list)  # Tracks successors of each vertex
-        self.run_predecessors: dict[str, list[str]] = defaultdict(list)  # Tracks predecessors for each vertex
+        self.run_map: defaultdict[str, VertexIdSet] = defaultdict(VertexIdSet)  # Tracks successors of each vertex
+        # Tracks the pending predecessors of each vertex
+        self.run_predecessors: defaultdict[str, VertexIdSet] = defaultdict(VertexIdSet)
         self.vertices_to_run: set[str] = set()  # Set of vertices that are ready to run
         self.vertices_being_run: set[str] = set()  # Set of vertices that are currently running
         self.cycle_vertices: set[str] = set()  # Set of vertices that are in a cycle
         self.ran_at_least_once: set[str] = set()  # Set of vertices that have been run at least once
+        self._stalled: set[str] = set()  # Awaited vertices with fulfilled predecessors that are not being run
 
     def to_dict(self) -> dict:
         return {
@@ -22,11 +55,12 @@ class RunnableVerticesManager:
     @classmethod
     def from_dict(cls, data: dict) -> "RunnableVerticesManager":
         instance = cls()
-        instance.run_map = data["run_map"]
-        instance.run_predecessors = data["run_predecessors"]
+        instance.run_map = _to_adjacency(data["run_map"])
+        instance.run_predecessors = _to_adjacency(data["run_predecessors"])
         instance.vertices_to_run = data["vertices_to_run"]
         instance.vertices_being_run = data["vertices_being_run"]
         instance.ran_at_least_once = data.get("ran_at_least_once", set())
+        instance._recompute_stalled()
         return instance
 
     def __getstate__(self) -> object:
@@ -36,23 +70,75 @@ class RunnableVerticesManager:
             "vertices_to_run": self.vertices_to_run,
             "vertices_being_run": self.vertices_being_run,
             "ran_at_least_once": self.ran_at_least_once,
+            "cycle_vertices": self.cycle_vertices,
         }
 
     def __setstate__(self, state: dict) -> None:
-        self.run_map = state["run_map"]
-        self.run_predecessors = state["run_predecessors"]
+        # States pickled before the adjacency became set-based hold lists
+        self.run_map = _to_adjacency(state["run_map"])
+        self.run_predecessors = _to_adjacency(state["run_predecessors"])
         self.vertices_to_run = state["vertices_to_run"]
         self.vertices_being_run = state["vertices_being_run"]
         self.ran_at_least_once = state["ran_at_least_once"]
+        self.cycle_vertices = state.get("cycle_vertices", set())
+        self._recompute_stalled()
 
     def all_predecessors_are_fulfilled(self) -> bool:
         return all(not value for value in self.run_predecessors.values())
 
-    def update_run_state(self, run_predecessors: dict, vertices_to_run: set) -> None:
-        self.run_predecessors.update(run_predecessors)
+    def pending_count(self, vertex_id: str) -> int:
+        """Returns the number of predecessors the vertex is still waiting for."""
+        pending = self.run_predecessors.get(vertex_id)
+        return len(pending) if pending else 0
+
+    def has_stalled_vertices(self, ignore: Iterable[str] = ()) -> bool:
+        """Returns whether a vertex that others wait for has its predecessors fulfilled but is not being run.
+
+        Args:
+            ignore: Vertices that should not be counted, such as the ones the caller is about to check itself.
+        """
+        if not self._stalled:
+            return False
+        return bool(self._stalled.difference(ignore))
+
+    def _is_awaited(self, vertex_id: str) -> bool:
+        return any(
+            vertex_id in self.run_predecessors.get(successor, ()) for successor in self.run_map.get(vertex_id, ())
+        )
+
+    def _refresh_stalled(self, vertex_id: str) -> None:
+        if (
+            vertex_id in self.vertices_to_run
+            and vertex_id not in self.vertices_being_run
+            and not self.run_predecessors.get(vertex_id)
+            and self._is_awaited(vertex_id)
+        ):
+            self._stalled.add(vertex_id)
+        else:
+            self._stalled.discard(vertex_id)
+
+    def _recompute_stalled(self) -> None:
+        awaited = set().union(*self.run_predecessors.values())
+        self._stalled = {
+            vertex_id
+            for vertex_id in awaited
+            if vertex_id in self.vertices_to_run
+            and vertex_id not in self.vertices_being_run
+            and not self.run_predecessors.get(vertex_id)
+        }
+
+    def update_run_state(self, run_predecessors: Mapping[str, Iterable[str]], vertices_to_run: set) -> None:
+        for vertex_id, predecessors in run_predecessors.items():
+            self.run_predecessors[vertex_id] = VertexIdSet(predecessors)
         self.vertices_to_run.update(vertices_to_run)
         self.build_run_map(self.run_predecessors, self.vertices_to_run)
 
+    def add_dependency(self, vertex_id: str, predecessor_id: str) -> None:
+        """Makes the vertex wait for ``predecessor_id`` to run again."""
+        self.run_predecessors[vertex_id].add(predecessor_id)
+        self.run_map[predecessor_id].add(vertex_id)
+        self._refresh_stalled(predecessor_id)
+
     def is_vertex_runnable(self, vertex_id: str, *, is_active: bool, is_loop: bool = False) -> bool:
         """Determines if a vertex is runnable based on its active state and predecessor fulfillment."""
         if not is_active:
@@ -79,41 +165,48 @@ class RunnableVerticesManager:
             bool: True if all predecessor conditions are met, False otherwise
         """
         # Get pending predecessors, return True if none exist
-        pending = self.run_predecessors.get(vertex_id, [])
+        pending = self.run_predecessors.get(vertex_id)
         if not pending:
             return True
 
         # For cycle vertices, check if any pending predecessors are also in cycle
-        # Using set intersection is faster than iteration
         if vertex_id in self.cycle_vertices:
-            pending_set = set(pending)
-            running_predecessors = pending_set & self.vertices_being_run
-
-            # If this vertex has already run at least once, be strict: wait until NOTHING is pending or running
+            # If this vertex has already run at least once, be strict: wait until NOTHING is pending
             if vertex_id in self.ran_at_least_once:
-                # Wait if there are still pending or running predecessors; otherwise allow.
-                return not (pending_set or running_predecessors)
+                return False
 
             # FIRST execution of a cycle vertex
             # Allow running **only** if it's a loop AND *all* pending predecessors are cycle vertices
-            return is_loop and pending_set <= self.cycle_vertices
+            return is_loop and pending <= self.cycle_vertices
         return False
 
-    def remove_from_predecessors(self, vertex_id: str) -> None:
-        """Removes a vertex from the predecessor list of its successors."""
-        predecessors = self.run_map.get(vertex_id, [])
-        for predecessor in predecessors:
-            if vertex_id in self.run_predecessors[predecessor]:
-                self.run_predecessors[predecessor].remove(vertex_id)
+    def remove_from_predecessors(self, vertex_id: str) -> list[str]:
+        """Removes a vertex from the pending predecessors of its successors.
 
-    def build_run_map(self, predecessor_map, vertices_to_run) -> None:
+        Returns:
+            list[str]: The successors that are no longer waiting for any predecessor.
+        """
+        fulfilled = []
+        for successor in self.run_map.get(vertex_id, ()):
+            pending = self.run_predecessors.get(successor)
+            if pending and vertex_id in pending:
+                pending.discard(vertex_id)
+                if not pending:
+                    fulfilled.append(successor)
+                    self._refresh_stalled(successor)
+        # Nothing waits for the vertex anymore
+        self._stalled.discard(vertex_id)
+        return fulfilled
+
+    def build_run_map(self, predecessor_map: Mapping[str, Iterable[str]], vertices_to_run) -> None:
         """Builds a map of vertices and their runnable successors."""
-        self.run_map = defaultdict(list)
-        for vertex_id, predecessors in predecessor_map.items():
+        self.run_predecessors = _to_adjacency(predecessor_map)
+        self.run_map = defaultdict(VertexIdSet)
+        for vertex_id, predecessors in self.run_predecessors.items():
             for predecessor in predecessors:
-                self.run_map[predecessor].append(vertex_id)
-        self.run_predecessors = predecessor_map.copy()
+                self.run_map[predecessor].add(vertex_id)
         self.vertices_to_run = vertices_to_run
+        self._recompute_stalled()
 
     def update_vertex_run_state(self, vertex_id: str, *, is_runnable: bool) -> None:
         """Updates the runnable state of a vertex."""
@@ -121,13 +214,20 @@ class RunnableVerticesManager:
             self.vertices_to_run.add(vertex_id)
         else:
             self.vertices_being_run.discard(vertex_id)
+        self._refresh_stalled(vertex_id)
 
-    def remove_vertex_from_runnables(self, v_id) -> None:
-        self.update_vertex_run_state(v_id, is_runnable=False)
-        self.remove_from_predecessors(v_id)
+    def remove_vertex_from_runnables(self, v_id) -> list[str]:
+        """Marks a vertex as done and releases the successors waiting for it.
+
+        Returns:
+            list[str]: The successors that are no longer waiting for any predecessor.
+        """
+        self.vertices_being_run.discard(v_id)
+        return self.remove_from_predecessors(v_id)
 
     def add_to_vertices_being_run(self, v_id) -> None:
         self.vertices_being_run.add(v_id)
+        self._stalled.discard(v_id)
 
     def add_to_cycle_vertices(self, v_id):
         self.cycle_vertices.add(v_id)
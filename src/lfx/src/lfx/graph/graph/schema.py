@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Literal, NamedTuple, Protocol
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
     from lfx.schema.log import LoggableType
 
 
+# How Graph.process schedules vertices: a whole layer at a time, or each vertex once its predecessors are built
+ExecutionMode = Literal["layered", "eager"]
+
+
 class ViewPort(TypedDict):
     x: float
     y: float
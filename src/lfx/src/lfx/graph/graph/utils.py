@@ -692,6 +692,8 @@ def _sort_single_layer_by_dependency(
         if vertex in dependency_cache:
             return dependency_cache[vertex]
         max_index = index_map[vertex]
+        # Vertices of a cycle, such as a Loop and its body, can share a layer
+        dependency_cache[vertex] = max_index
         for successor in get_vertex_successors(vertex):
             if successor in index_map:
                 max_index = max(max_index, max_dependency_index(successor))
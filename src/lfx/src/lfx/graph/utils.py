@@ -364,6 +364,12 @@ async def log_vertex_build(
                 artifacts=artifacts_dict,
             )
 
+            if getattr(settings_service.settings, "buffered_log_writer_enabled", False):
+                from langflow.services.deps import get_buffered_writer_service
+
+                await get_buffered_writer_service().add_vertex_build(vertex_build)
+                return
+
             db_service = langflow_get_db_service()
             if db_service is None:
                 return
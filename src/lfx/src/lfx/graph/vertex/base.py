@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import inspect
 import traceback
 import types
@@ -108,6 +109,8 @@ class Vertex:
         self.use_result = False
         self.build_times: list[float] = []
         self.state = VertexStates.ACTIVE
+        # Set when a run state is restored without this vertex's results, see lfx.graph.graph.run_state
+        self.rebuild_on_request = False
         self.output_names: list[str] = [
             output["name"] for output in self.outputs if isinstance(output, dict) and "name" in output
         ]
@@ -345,8 +348,13 @@ class Vertex:
         # Process edge parameters
         edge_params = param_handler.process_edge_parameters(self.edges)
 
-        # Process field parameters
-        field_params, load_from_db_fields = param_handler.process_field_parameters()
+        # Process field parameters, reusing the ones computed by a PreparedGraph when available
+        precomputed = (getattr(self.graph, "_precomputed_field_params", None) or {}).get(self.id)
+        if precomputed is not None:
+            field_params = copy.deepcopy(precomputed[0])
+            load_from_db_fields = list(precomputed[1])
+        else:
+            field_params, load_from_db_fields = param_handler.process_field_parameters()
 
         # Combine parameters, edge_params take precedence
         self.params = {**field_params, **edge_params}
@@ -527,6 +535,10 @@ class Vertex:
         Returns:
             The result of the vertex.
         """
+        if self.rebuild_on_request and not self.built:
+            # The results could not be restored with the rest of the run state, build them again
+            self.rebuild_on_request = False
+            await self.build(user_id=self.graph.user_id, fallback_to_env_vars=self.graph.fallback_to_env_vars)
         async with self.lock:
             return await self._get_result(requester, target_handle_name)
 
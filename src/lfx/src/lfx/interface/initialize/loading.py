@@ -12,8 +12,9 @@ from lfx.custom.eval import eval_custom_component_code
 from lfx.log.logger import logger
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
-from lfx.services.deps import get_settings_service, session_scope
+from lfx.services.deps import get_settings_service, get_variable_service, session_scope
 from lfx.services.session import NoopSession
+from lfx.services.variable.resolver import VariableResolver
 
 if TYPE_CHECKING:
     from lfx.custom.custom_component.component import Component
@@ -137,12 +138,60 @@ def load_from_env_vars(params, load_from_db_fields, context=None):
     return params
 
 
+def get_variable_resolver(custom_component: CustomComponent) -> VariableResolver | None:
+    """Return the variable resolver shared by the current run of the component's graph.
+
+    Returns None when the variables cannot be fetched in batch, for instance when the user id
+    is unknown or the variable service does not support it. Callers then resolve each variable
+    through ``custom_component.get_variable``.
+    """
+    try:
+        user_id = custom_component.user_id
+    except Exception:  # noqa: BLE001
+        return None
+    variable_service = get_variable_service()
+    if not user_id or not hasattr(variable_service, "get_all_decrypted_variables"):
+        return None
+
+    graph = getattr(custom_component, "graph", None)
+    if graph is None:
+        return VariableResolver(user_id, variable_service)
+    run_id = getattr(graph, "_run_id", "")
+    resolver = getattr(graph, "variable_resolver", None)
+    if resolver is None or resolver.run_id != run_id or resolver.user_id != user_id:
+        resolver = VariableResolver(user_id, variable_service, run_id=run_id)
+        graph.variable_resolver = resolver
+    return resolver
+
+
+async def resolve_variable(
+    custom_component: CustomComponent,
+    name: str,
+    field: str,
+    session,
+    resolver: VariableResolver | None,
+):
+    """Resolve a global variable, serving it from the run's resolver when possible.
+
+    Request-level overrides, credentials used in Session ID fields and variables missing from
+    the batch go through ``custom_component.get_variable`` so its checks and errors still apply.
+    """
+    if resolver is not None and field != "session_id":
+        context = getattr(getattr(custom_component, "graph", None), "context", None)
+        if not context or name not in (context.get("request_variables") or {}):
+            value = await resolver.get(name, session)
+            if value is not None:
+                return value
+    return await custom_component.get_variable(name=name, field=field, session=session)
+
+
 async def update_table_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params: dict,
     table_field_name: str,
     *,
     fallback_to_env_vars: bool = False,
+    resolver: VariableResolver | None = None,
 ) -> dict:
     """Update table parameters with load_from_db column values."""
     # Get the table data and column metadata
@@ -204,8 +253,12 @@ async def update_table_params_with_load_from_db_fields(
                                 logger.error(f"Environment variable {variable_name} is not set.")
                     else:
                         # Load from database
-                        key = await custom_component.get_variable(
-                            name=variable_name, field=f"{table_field_name}.{column_name}", session=session
+                        key = await resolve_variable(
+                            custom_component,
+                            variable_name,
+                            f"{table_field_name}.{column_name}",
+                            session,
+                            resolver,
                         )
 
                 except ValueError as e:
@@ -253,6 +306,7 @@ async def update_params_with_load_from_db_fields(
             if hasattr(custom_component, "graph") and hasattr(custom_component.graph, "context"):
                 context = custom_component.graph.context
             return load_from_env_vars(params, load_from_db_fields, context=context)
+        resolver = get_variable_resolver(custom_component) if load_from_db_fields else None
         for field in load_from_db_fields:
             # Check if this is a table field (using our naming convention)
             if field.startswith("table:"):
@@ -262,6 +316,7 @@ async def update_params_with_load_from_db_fields(
                     params,
                     table_field_name,
                     fallback_to_env_vars=fallback_to_env_vars,
+                    resolver=resolver,
                 )
             else:
                 # Handle regular field-level load_from_db
@@ -269,7 +324,7 @@ async def update_params_with_load_from_db_fields(
                     continue
 
                 try:
-                    key = await custom_component.get_variable(name=params[field], field=field, session=session)
+                    key = await resolve_variable(custom_component, params[field], field, session, resolver)
                 except ValueError as e:
                     if any(reason in str(e) for reason in ["User id is not set", "variable not found."]):
                         raise
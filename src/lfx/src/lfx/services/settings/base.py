@@ -147,12 +147,56 @@ class Settings(BaseSettings):
     Controlled by LANGFLOW_USE_NOOP_DATABASE env variable."""
 
     # cache configuration
-    cache_type: Literal["async", "redis", "memory", "disk"] = "async"
-    """The cache type can be 'async' or 'redis'."""
+    cache_type: Literal["async", "redis", "memory", "disk", "sharded"] = "async"
+    """The cache type can be 'async', 'redis', 'memory', 'disk' or 'sharded'. 'sharded' is an async in-memory
+    cache with per-shard locks that is bounded by the estimated memory of its items."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_bytes: int = 1024 * 1024 * 1024
+    """Estimated memory, in bytes, the 'sharded' cache may hold before it evicts the least recently used items.
+    0 means no limit."""
+    cache_shards: int = 16
+    """Number of shards of the 'sharded' cache."""
+    cache_sweep_interval: float = 60
+    """Seconds between two sweeps of expired items in the 'sharded' cache. 0 disables the sweeper."""
+    graph_cache_serialization: Literal["pickle", "run_state"] = "pickle"
+    """How the redis and disk caches store graphs between build requests. 'pickle' stores the whole graph,
+    'run_state' stores a compact JSON snapshot of its run state and rebuilds the graph from the flow data when
+    it is read. Graphs that cannot be snapshotted are pickled."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    component_class_cache_size: int = 512
+    """Maximum number of compiled custom component classes to keep in the process-wide class cache.
+    Classes are keyed by a hash of their source code. Set to 0 to disable the cache."""
+    variable_cache_ttl: float = 5.0
+    """Seconds to keep each user's decrypted global variables in memory after a run fetched them.
+    Changes made through this process invalidate the entry immediately, changes made by other workers
+    are picked up once it expires. Set to 0 to fetch the variables once per run."""
+    prepared_graph_cache_size: int = 128
+    """Maximum number of pre-parsed flows kept by the run endpoints. Entries are keyed by flow id,
+    flow update time and tweaks, so each request only builds a per-run graph. Set to 0 to disable."""
+    chat_history_cache_size: int = 0
+    """Number of the newest messages of each chat session and context kept in the cache service, so memory
+    components read them without querying the database. Only changes made by this worker update the cached
+    messages, so enable it only when Langflow runs a single worker. Set to 0 to disable."""
+    graph_execution_mode: Literal["layered", "eager"] = "layered"
+    """How graphs schedule their vertices. "layered" builds a whole layer before starting the next one,
+    "eager" starts each vertex as soon as its own predecessors are built."""
+    graph_max_concurrency: int = 0
+    """Maximum number of vertices of a graph built at the same time in the "eager" execution mode.
+    Set to 0 for no limit."""
+    docling_worker_pool_size: int = 0
+    """Number of long-lived Docling worker processes used by the Read File component in advanced mode.
+    Workers keep their converters loaded between files. Set to 0 to convert each file in a new process."""
+    docling_worker_max_jobs: int = 50
+    """Files a Docling worker converts before it is replaced. Set to 0 for no limit."""
+    docling_worker_max_rss_growth_mb: int = 2048
+    """Growth of a Docling worker's resident memory, in MB, after which it is replaced. Set to 0 for no limit."""
+    docling_job_timeout: float = 600
+    """Seconds a Docling worker may spend on one file before it is killed. Set to 0 for no limit."""
+    file_parse_cache_max_mb: int = 0
+    """Size in MB of the on-disk cache of parsed files under the config dir. Files with the same contents
+    and parser options are parsed once and later runs reuse the result. Set to 0 to disable the cache."""
 
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
@@ -160,6 +204,13 @@ class Settings(BaseSettings):
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: float = 30.0
+    """Seconds an authenticated API key is trusted without checking it against the database again. Deleting
+    the key or updating its user takes effect at once in the same worker, and after this delay in the others.
+    Set to 0 to check the key on every request."""
+    api_key_usage_flush_interval: float = 10.0
+    """Interval in seconds at which the uses of each API key, counted in memory, are added to its total uses
+    and last use time in the database. Set to 0 to write them on every request."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     components_index_path: str | None = None
@@ -180,6 +231,23 @@ class Settings(BaseSettings):
     redis_url: str | None = None
     redis_cache_expire: int = 3600
 
+    # Job queue
+    job_queue_backend: Literal["memory", "redis"] = "memory"
+    """Where the events of flow build jobs are kept. 'memory' keeps them in the worker that runs the build, so
+    events can only be consumed from that worker. 'redis' stores them in Redis streams (using the redis_*
+    settings) so they can be consumed from any worker or replica."""
+    job_queue_max_events: int = 10000
+    """Maximum number of unread events kept in the event stream of a job. Once it is reached, the job waits
+    for its events to be consumed before publishing more."""
+    job_queue_ttl: int = 600
+    """Seconds an event stream is kept after the last event of its job before being removed."""
+    event_token_coalescing_enabled: bool = False
+    """If set to True, consecutive streamed tokens of the same message are merged into a single event."""
+    event_token_coalescing_max_delay: float = 0.05
+    """Maximum number of seconds a token is held back to be merged with the following ones."""
+    event_token_coalescing_max_bytes: int = 4096
+    """Size in bytes of the merged tokens that triggers sending them without waiting for the delay."""
+
     # Sentry
     sentry_dsn: str | None = None
     sentry_traces_sample_rate: float | None = 1.0
@@ -198,6 +266,9 @@ class Settings(BaseSettings):
     """Object storage prefix for file storage. Defaults to 'files'."""
     object_storage_tags: dict[str, str] | None = None
     """Object storage tags for file storage."""
+    object_storage_max_pool_connections: int = 50
+    """Maximum number of connections the object storage client keeps open. The client and its connections
+    are shared by all file operations."""
 
     celery_enabled: bool = False
 
@@ -272,12 +343,30 @@ class Settings(BaseSettings):
     """The maximum file size for the upload in MB."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_queue_size: int = 10_000
+    """Maximum number of trace events waiting for the thread that calls the tracers."""
+    tracing_queue_full_policy: Literal["drop", "block"] = "drop"
+    """What happens to a component trace when the trace queue is full. "drop" discards it and counts it as
+    dropped, "block" makes the component wait, without blocking the event loop, until the queue has room.
+    The end of a trace that was queued, and the end of each run, always wait."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    buffered_log_writer_enabled: bool = False
+    """If set to True, transactions and vertex builds are buffered in memory and written to the database in
+    batches, and the retention limits above are enforced by a periodic sweep instead of on every insert."""
+    buffered_log_writer_batch_size: int = 100
+    """Number of buffered records that triggers an immediate flush of the buffered log writer."""
+    buffered_log_writer_flush_interval: float = 1.0
+    """Maximum number of seconds a record stays in the buffered log writer before being flushed."""
+    buffered_log_writer_max_buffer_size: int = 5000
+    """Maximum number of records held by the buffered log writer. When reached, writers wait for a flush and,
+    if the database is unavailable, the oldest records are dropped."""
+    buffered_log_writer_retention_interval: float = 60.0
+    """Interval in seconds between retention sweeps that trim old transactions and vertex builds."""
     webhook_polling_interval: int = 0
     """The polling interval for the webhook in ms. Set to 0 to disable (SSE provides real-time updates)."""
     fs_flows_polling_interval: int = 10000
@@ -337,6 +426,9 @@ class Settings(BaseSettings):
     this is intended to be used to skip all startup project logic."""
     update_starter_projects: bool = True
     """If set to True, Langflow will update starter projects."""
+    reconcile_starter_projects: bool = True
+    """If set to True, updating starter projects skips those whose file and components did not change since they
+    were last updated, instead of deleting and re-creating every starter project on each start."""
 
     # SSRF Protection
     ssrf_protection_enabled: bool = False
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import uuid
 from typing import TYPE_CHECKING
 
 import aiofiles
@@ -11,6 +13,8 @@ from lfx.services.base import Service
 from lfx.services.storage.service import StorageService
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
 
     from lfx.services.settings.service import SettingsService
@@ -127,6 +131,46 @@ class LocalStorageService(StorageService, Service):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(
+        self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes], *, append: bool = False
+    ) -> int:
+        """Save a file in the local storage from a stream of chunks.
+
+        New files are written to a temporary file that replaces the target once the stream is
+        complete, so a failed upload never leaves a truncated file behind.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The content of the file.
+            append: If True, append to existing file; if False, overwrite.
+
+        Returns:
+            The number of bytes written.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        write_path = file_path if append else folder_path / f".{file_name}.{uuid.uuid4().hex}.part"
+
+        written = 0
+        try:
+            async with aiofiles.open(str(write_path), "ab" if append else "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    written += len(chunk)
+            if not append:
+                await write_path.replace(file_path)
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            if not append:
+                with contextlib.suppress(OSError):
+                    await write_path.unlink()
+            raise
+        action = "appended to" if append else "saved"
+        await logger.ainfo(f"File {file_name} {action} successfully in flow {flow_id} ({written} bytes).")
+        return written
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -152,6 +196,34 @@ class LocalStorageService(StorageService, Service):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        chunk_size: int = 8192,
+        *,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Retrieve a file, or the byte range from start to end inclusive, from the local storage as a stream."""
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            await logger.awarning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end - start + 1
+        async with aiofiles.open(str(file_path), "rb") as f:
+            if start:
+                await f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
     async def list_files(self, flow_id: str) -> list[str]:
         """List all files in a specific flow directory.
 
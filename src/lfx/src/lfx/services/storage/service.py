@@ -8,7 +8,7 @@ import anyio
 from lfx.services.base import Service
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterable, AsyncIterator, Sequence
 
     from lfx.services.settings.service import SettingsService
 
@@ -106,6 +106,27 @@ class StorageService(Service):
         """
         raise NotImplementedError
 
+    async def save_file_stream(
+        self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes], *, append: bool = False
+    ) -> int:
+        """Save a file to storage from a stream of chunks.
+
+        Default implementation buffers the stream and calls ``save_file``.
+        Subclasses can override this to write the chunks as they arrive.
+
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            file_name: The name of the file to save
+            chunks: The file content
+            append: If True, append to existing file instead of overwriting.
+
+        Returns:
+            int: The number of bytes written
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data, append=append)
+        return len(data)
+
     @abstractmethod
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from storage.
@@ -122,8 +143,16 @@ class StorageService(Service):
         """
         raise NotImplementedError
 
-    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = 8192) -> AsyncIterator[bytes]:
-        """Retrieve a file from storage as a stream.
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        chunk_size: int = 8192,
+        *,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Retrieve a file, or a byte range of it, from storage as a stream.
 
         Default implementation loads the entire file and yields it in chunks.
         Subclasses can override this for more efficient streaming.
@@ -132,6 +161,8 @@ class StorageService(Service):
             flow_id: The flow/user identifier for namespacing
             file_name: The name of the file to retrieve
             chunk_size: Size of chunks to yield (default: 8192 bytes)
+            start: Offset of the first byte to yield
+            end: Offset of the last byte to yield, inclusive as in HTTP ranges. None reads to the end.
 
         Yields:
             bytes: Chunks of the file content
@@ -141,8 +172,9 @@ class StorageService(Service):
         """
         # Default implementation - subclasses can override for true streaming
         content = await self.get_file(flow_id, file_name)
-        for i in range(0, len(content), chunk_size):
-            yield content[i : i + chunk_size]
+        stop = len(content) if end is None else min(end + 1, len(content))
+        for i in range(start, stop, chunk_size):
+            yield content[i : min(i + chunk_size, stop)]
 
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
@@ -159,6 +191,24 @@ class StorageService(Service):
         """
         raise NotImplementedError
 
+    async def iter_files(self, flow_id: str, *, prefix: str = "", page_size: int = 1000) -> AsyncIterator[list[str]]:
+        """List the files of a flow namespace page by page.
+
+        Default implementation pages through ``list_files``. Object stores override it to
+        fetch one page per request.
+
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            prefix: Only list the files whose name starts with this prefix
+            page_size: Maximum number of file names per page
+
+        Yields:
+            list[str]: A page of file names
+        """
+        files = [file_name for file_name in await self.list_files(flow_id) if file_name.startswith(prefix)]
+        for i in range(0, len(files), page_size):
+            yield files[i : i + page_size]
+
     @abstractmethod
     async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in bytes.
@@ -175,6 +225,24 @@ class StorageService(Service):
         """
         raise NotImplementedError
 
+    async def get_file_version(self, flow_id: str, file_name: str) -> str | None:  # noqa: ARG002
+        """Get a string that changes whenever the content of a file changes, without reading it.
+
+        Default implementation returns None, meaning the content has to be read to tell versions
+        apart. Object stores override it with the metadata they keep for every object.
+
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            file_name: The name of the file
+
+        Returns:
+            str | None: The version of the file, or None if the storage does not track one
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        return None
+
     @abstractmethod
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from storage.
@@ -188,6 +256,27 @@ class StorageService(Service):
         """
         raise NotImplementedError
 
+    async def delete_files(self, flow_id: str, file_names: Sequence[str]) -> dict[str, OSError]:
+        """Delete several files from storage.
+
+        Default implementation calls ``delete_file`` for each file. Object stores override it to
+        delete the files in batches.
+
+        Args:
+            flow_id: The flow/user identifier for namespacing
+            file_names: The names of the files to delete
+
+        Returns:
+            dict[str, OSError]: The files that could not be deleted, with the error for each
+        """
+        failures: dict[str, OSError] = {}
+        for file_name in file_names:
+            try:
+                await self.delete_file(flow_id=flow_id, file_name=file_name)
+            except OSError as err:
+                failures[file_name] = err
+        return failures
+
     async def teardown(self) -> None:
         """Perform cleanup operations when the service is being shut down.
 
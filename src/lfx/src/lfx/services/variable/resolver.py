@@ -0,0 +1,151 @@
+"""Batched resolution of global variables for a flow run.
+
+Building a vertex resolves each of its ``load_from_db`` fields through the variable
+service, which costs one query (and one decryption) per field per vertex. The resolver
+in this module fetches all of the user's variables with a single
+``get_all_decrypted_variables`` call the first time a run needs one and serves every
+other lookup of that run from memory.
+
+The decrypted values are also kept in a short-lived, process-wide cache keyed by user
+so that back-to-back runs do not query the database again. The variable service drops
+a user's entry whenever one of their variables is created, updated or deleted, and the
+TTL bounds staleness for changes made by other processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from lfx.services.interfaces import VariableServiceProtocol
+
+DEFAULT_TTL = 5.0
+
+
+class DecryptedVariableCache:
+    """A thread-safe cache of each user's decrypted variables with a per-entry TTL.
+
+    Attributes:
+        ttl (float): Seconds an entry stays valid. A value of 0 disables caching.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that found no valid entry.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        self._entries: dict[str, tuple[float, dict[str, str]]] = {}
+        self._lock = threading.Lock()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: Any) -> dict[str, str] | None:
+        """Return the cached variables of ``user_id`` or None if there is no valid entry."""
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def set(self, user_id: Any, variables: dict[str, str]) -> None:
+        """Store the decrypted variables of ``user_id``."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[str(user_id)] = (time.monotonic() + self.ttl, variables)
+
+    def invalidate(self, user_id: Any) -> None:
+        """Drop the entry of ``user_id``."""
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {"size": len(self._entries), "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+_decrypted_variable_cache: DecryptedVariableCache | None = None
+_decrypted_variable_cache_lock = threading.Lock()
+
+
+def _get_configured_ttl() -> float:
+    from lfx.services.deps import get_settings_service
+
+    try:
+        settings_service = get_settings_service()
+    except Exception:  # noqa: BLE001
+        logger.debug("Settings service unavailable, using the default variable cache TTL")
+        return DEFAULT_TTL
+    if settings_service is None:
+        return DEFAULT_TTL
+    return settings_service.settings.variable_cache_ttl
+
+
+def get_decrypted_variable_cache() -> DecryptedVariableCache:
+    """Return the process-wide decrypted variable cache, creating it on first use."""
+    global _decrypted_variable_cache  # noqa: PLW0603
+    if _decrypted_variable_cache is None:
+        with _decrypted_variable_cache_lock:
+            if _decrypted_variable_cache is None:
+                _decrypted_variable_cache = DecryptedVariableCache(ttl=_get_configured_ttl())
+    return _decrypted_variable_cache
+
+
+def invalidate_user_variables(user_id: Any) -> None:
+    """Forget the cached variables of ``user_id``. Called after any change to their variables."""
+    if _decrypted_variable_cache is not None:
+        _decrypted_variable_cache.invalidate(user_id)
+
+
+class VariableResolver:
+    """Resolves the global variables of one user for the duration of a run.
+
+    The variables are fetched at most once per resolver, the first time ``get`` is called.
+    ``get`` returns None for names it cannot serve, including when the batch fetch fails,
+    so callers fall back to the per-variable lookup and keep its error reporting.
+    """
+
+    def __init__(self, user_id: Any, variable_service: VariableServiceProtocol, run_id: str = "") -> None:
+        self.user_id = user_id
+        self.run_id = run_id
+        self.variable_service = variable_service
+        self._variables: dict[str, str] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def _load(self, session: Any) -> dict[str, str]:
+        async with self._load_lock:
+            if self._variables is not None:
+                return self._variables
+            cache = get_decrypted_variable_cache()
+            variables = cache.get(self.user_id)
+            if variables is None:
+                try:
+                    variables = await self.variable_service.get_all_decrypted_variables(self.user_id, session)
+                except Exception as exc:  # noqa: BLE001
+                    await logger.awarning(f"Could not load variables in batch, resolving them one by one: {exc!s}")
+                    variables = {}
+                else:
+                    cache.set(self.user_id, variables)
+            self._variables = variables
+            return variables
+
+    async def get(self, name: str, session: Any) -> str | None:
+        """Return the decrypted value of ``name`` or None if it has to be looked up individually."""
+        variables = self._variables if self._variables is not None else await self._load(session)
+        return variables.get(name)
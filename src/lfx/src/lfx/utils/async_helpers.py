@@ -1,5 +1,14 @@
 import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import os
+import threading
+from collections.abc import Coroutine
 from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+T = TypeVar("T")
 
 if hasattr(asyncio, "timeout"):
 
@@ -19,15 +28,134 @@ else:
             raise TimeoutError(msg) from e
 
 
+class BackgroundLoop:
+    """An event loop running in a daemon thread, for sync code that needs to await coroutines.
+
+    Sync code called while an event loop is running cannot run a coroutine on that loop. It used
+    to start a thread with a new event loop for every coroutine and close both afterwards, so each
+    call paid for them and nothing opened by the coroutine, such as connection pools or clients,
+    outlived it. The background loop runs until ``stop`` is called, so clients opened on it can be
+    kept and reused by later calls. The loop is started on first use and again after ``stop``.
+
+    Coroutines run in a copy of the caller's context. They share the loop, so they should not
+    block it.
+    """
+
+    def __init__(self, name: str = "lfx-background-loop") -> None:
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The running background loop, or None if it is not started."""
+        return self._loop if self.is_running() else None
+
+    def is_running(self) -> bool:
+        # A forked process inherits the loop but not its thread
+        return self._thread is not None and self._thread.is_alive() and self._pid == os.getpid()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller runs on the background loop."""
+        return self.is_running() and threading.current_thread() is self._thread
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop, if it is not running, and return it."""
+        with self._lock:
+            if not self.is_running():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                thread = threading.Thread(target=self._run, args=(loop, started), name=self.name, daemon=True)
+                thread.start()
+                started.wait()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule a coroutine on the background loop and return a future for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the background loop and wait for its result.
+
+        Raises:
+            TimeoutError: If ``timeout`` seconds pass first. The coroutine is cancelled.
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 10) -> None:
+        """Cancel the coroutines still running on the background loop and stop it.
+
+        Waits up to ``timeout`` seconds for them to finish cancelling.
+        """
+        with self._lock:
+            if not self.is_running():
+                self._loop = self._thread = None
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        with contextlib.suppress(concurrent.futures.TimeoutError):
+            asyncio.run_coroutine_threadsafe(_cancel_tasks(), loop).result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+async def _cancel_tasks() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_background_loop: BackgroundLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Return the process-wide background loop used by ``run_until_complete``."""
+    global _background_loop  # noqa: PLW0603
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                _background_loop = BackgroundLoop()
+                atexit.register(_background_loop.stop)
+    return _background_loop
+
+
+def stop_background_loop(timeout: float = 10) -> None:
+    """Stop the process-wide background loop, if it was started."""
+    if _background_loop is not None:
+        _background_loop.stop(timeout)
+
+
 def run_until_complete(coro):
     try:
         asyncio.get_running_loop()
     except RuntimeError:
         # If there's no event loop, create a new one and run the coroutine
         return asyncio.run(coro)
-    # If there's already a running event loop, we can't call run_until_complete on it
-    # Instead, we need to run the coroutine in a new thread with a new event loop
-    import concurrent.futures
+    # If there's already a running event loop, we can't call run_until_complete on it.
+    # Instead, the coroutine runs on the shared background loop, unless this is it.
+    background_loop = get_background_loop()
+    if not background_loop.in_loop_thread():
+        return background_loop.run(coro)
 
     def run_in_new_loop():
         new_loop = asyncio.new_event_loop()
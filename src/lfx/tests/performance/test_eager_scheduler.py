@@ -0,0 +1,76 @@
+"""Benchmark layered and eager graph execution on a wide fan-out with skewed latencies."""
+
+import asyncio
+import random
+import time
+
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.custom.custom_component.component import Component
+from lfx.graph import Graph
+from lfx.io import FloatInput, MessageTextInput, Output
+from lfx.schema.message import Message
+
+WIDTH = 16
+DEPTH = 3
+SLOW_DELAY = 0.3
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [Output(display_name="Message", name="message", method="sleep_and_return")]
+
+    async def sleep_and_return(self) -> Message:
+        # Stands in for a model call: the event loop is free while waiting
+        await asyncio.sleep(self.delay)
+        return Message(text=self.text)
+
+
+class JoinComponent(Component):
+    display_name = "Join"
+    inputs = [MessageTextInput(name=f"text{i}", display_name=f"Text {i}") for i in range(WIDTH)]
+    outputs = [Output(display_name="Message", name="message", method="join")]
+
+    def join(self) -> Message:
+        return Message(text="".join(getattr(self, f"text{i}") or "" for i in range(WIDTH)))
+
+
+def _fan_out_graph(seed: int = 0) -> Graph:
+    """WIDTH branches of DEPTH vertices each; every layer has one slow vertex, on a different branch."""
+    rng = random.Random(seed)  # noqa: S311
+    chat_input = ChatInput(_id="chat_input")
+    join = JoinComponent(_id="join")
+    for branch in range(WIDTH):
+        previous = chat_input.message_response
+        for step in range(DEPTH):
+            sleeper = SleepComponent(_id=f"sleep_{branch}_{step}")
+            delay = SLOW_DELAY if branch == step else rng.uniform(0.01, 0.05)
+            sleeper.set(text=previous, delay=delay)
+            previous = sleeper.sleep_and_return
+        join.set(**{f"text{branch}": previous})
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=join.join)
+    return Graph(chat_input, chat_output)
+
+
+async def _wall_time(mode: str) -> float:
+    graph = _fan_out_graph()
+    graph.execution_mode = mode
+    start = time.perf_counter()
+    await graph.process(fallback_to_env_vars=False)
+    return time.perf_counter() - start
+
+
+async def test_eager_scheduler_wall_time():
+    """Layered waits for the slow vertex of every layer; eager only for the slowest branch."""
+    layered = await _wall_time("layered")
+    eager = await _wall_time("eager")
+
+    print(  # noqa: T201
+        f"\n{WIDTH}x{DEPTH} fan-out, one {SLOW_DELAY}s vertex per layer: "
+        f"layered {layered:.2f}s, eager {eager:.2f}s ({layered / eager:.2f}x)"
+    )
+    assert eager < layered
@@ -0,0 +1,48 @@
+"""Benchmark streaming token events with and without coalescing."""
+
+import asyncio
+import time
+
+from lfx.events.event_manager import create_default_event_manager
+
+N_TOKENS = 20_000
+CHUNK = "tok "
+
+
+def _stream_tokens(manager) -> float:
+    start = time.perf_counter()
+    for _ in range(N_TOKENS):
+        manager.on_token(data={"chunk": CHUNK, "id": "message-id"})
+    manager.flush_tokens()
+    return time.perf_counter() - start
+
+
+def _drain(queue: asyncio.Queue) -> tuple[int, int]:
+    frames = 0
+    total_bytes = 0
+    while not queue.empty():
+        _, data, _ = queue.get_nowait()
+        frames += 1
+        total_bytes += len(data)
+    return frames, total_bytes
+
+
+async def test_token_coalescing_throughput():
+    """Compare the frames and bytes put on the queue for the same token stream."""
+    results = {}
+    for coalesce in (False, True):
+        queue: asyncio.Queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=coalesce, coalesce_max_delay=10)
+        elapsed = _stream_tokens(manager)
+        frames, total_bytes = _drain(queue)
+        results[coalesce] = (frames, total_bytes, elapsed)
+        print(  # noqa: T201
+            f"\ncoalesce={coalesce}: {N_TOKENS / elapsed:,.0f} tokens/s, {frames} frames, "
+            f"{frames / elapsed:,.0f} events/s, {total_bytes / elapsed / 1e6:.1f} MB/s, {total_bytes:,} bytes"
+        )
+
+    plain_frames, plain_bytes, _ = results[False]
+    coalesced_frames, coalesced_bytes, _ = results[True]
+    assert plain_frames == N_TOKENS
+    assert coalesced_frames < plain_frames
+    assert coalesced_bytes < plain_bytes
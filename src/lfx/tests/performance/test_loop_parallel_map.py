@@ -0,0 +1,58 @@
+"""Benchmark the Loop component in Sequential and Parallel mode with a slow, mocked LLM as its body."""
+
+import time
+
+from lfx.components.flow_controls import LoopComponent
+from lfx.components.input_output import ChatOutput
+from lfx.custom.custom_component.component import Component
+from lfx.graph import Graph
+from lfx.io import IntInput, Output
+from lfx.schema.dataframe import DataFrame
+
+from tests.unit.components.flow_controls.slow_llm import SlowLLMComponent
+
+ROWS = 200
+LATENCY = 0.05
+MAX_CONCURRENCY = 32
+
+
+class RowsComponent(Component):
+    display_name = "Rows"
+    inputs = [IntInput(name="count", display_name="Count", value=ROWS)]
+    outputs = [Output(display_name="Rows", name="rows", method="build_rows")]
+
+    def build_rows(self) -> DataFrame:
+        return DataFrame([{"text": f"row {i}"} for i in range(self.count)])
+
+
+def _enrichment_graph(mode: str) -> Graph:
+    rows = RowsComponent(_id="rows")
+    loop = LoopComponent(_id="loop", mode=mode, max_concurrency=MAX_CONCURRENCY)
+    loop.set(data=rows.build_rows)
+    llm = SlowLLMComponent(_id="llm", latency=LATENCY)
+    llm.set(record=loop.item_output)
+    loop.set(item=llm.complete)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=loop.done_output)
+    return Graph(rows, chat_output)
+
+
+async def _rows_per_second(mode: str) -> float:
+    graph = _enrichment_graph(mode)
+    start = time.perf_counter()
+    await graph.process(fallback_to_env_vars=False)
+    elapsed = time.perf_counter() - start
+    assert len(graph.get_vertex("loop").results["done"]) == ROWS
+    return ROWS / elapsed
+
+
+async def test_loop_parallel_map_throughput():
+    """Sequential pays the model latency once per row; Parallel overlaps up to MAX_CONCURRENCY calls."""
+    sequential = await _rows_per_second("Sequential")
+    parallel = await _rows_per_second("Parallel")
+
+    print(  # noqa: T201
+        f"\n{ROWS} rows, {LATENCY}s per model call: sequential {sequential:.1f} rows/s, "
+        f"parallel ({MAX_CONCURRENCY} at a time) {parallel:.1f} rows/s ({parallel / sequential:.1f}x)"
+    )
+    assert parallel > sequential
@@ -0,0 +1,46 @@
+"""Benchmark per-request graph construction with and without a PreparedGraph."""
+
+import copy
+import time
+
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.graph.graph.prepared import PreparedGraph
+
+N_VERTICES = 50
+N_REQUESTS = 20
+
+
+def _chain_payload(n_vertices: int) -> dict:
+    chat_input = ChatInput(_id="chat_input")
+    previous = chat_input.message_response
+    for i in range(n_vertices - 2):
+        component = CombineTextComponent(_id=f"combine-{i}")
+        component.set(text1=previous, text2="x", delimiter=" ")
+        previous = component.combine_texts
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=previous)
+    return Graph(chat_input, chat_output).dump()
+
+
+def _requests_per_second(build) -> float:
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        build().prepare()
+    return N_REQUESTS / (time.perf_counter() - start)
+
+
+def test_prepared_graph_requests_per_second():
+    """Compare parsing the payload on every request against instantiating a prepared graph."""
+    payload = _chain_payload(N_VERTICES)
+    prepared = PreparedGraph(payload, flow_id="benchmark")
+
+    from_payload_rps = _requests_per_second(lambda: Graph.from_payload(copy.deepcopy(payload), flow_id="benchmark"))
+    prepared_rps = _requests_per_second(prepared.instantiate)
+
+    print(  # noqa: T201
+        f"\n{N_VERTICES}-vertex flow: from_payload {from_payload_rps:.1f} req/s, "
+        f"prepared {prepared_rps:.1f} req/s ({prepared_rps / from_payload_rps:.2f}x)"
+    )
+    assert prepared_rps > 0
@@ -0,0 +1,126 @@
+"""Benchmark the scheduling overhead of Graph.find_next_runnable_vertices on large synthetic DAGs."""
+
+import random
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+from lfx.graph import Graph
+
+FAN_IN = 8
+
+
+def _random_dag(n_vertices: int, seed: int = 0) -> dict[str, list[str]]:
+    """Return a predecessor map where each vertex depends on up to FAN_IN earlier vertices, plus a wide sink."""
+    rng = random.Random(seed)  # noqa: S311
+    predecessors: dict[str, list[str]] = {"v0": []}
+    for i in range(1, n_vertices - 1):
+        predecessors[f"v{i}"] = [f"v{j}" for j in rng.sample(range(i), min(i, rng.randint(1, FAN_IN)))]
+    # A sink that waits for every other vertex, like an aggregating output
+    predecessors[f"v{n_vertices - 1}"] = [f"v{i}" for i in range(n_vertices - 1)]
+    return predecessors
+
+
+def _stub_graph(predecessors: dict[str, list[str]]) -> Graph:
+    graph = Graph()
+    graph._cycle_vertices = set()
+    graph.vertex_map = {
+        vertex_id: SimpleNamespace(id=vertex_id, is_active=lambda: True, is_loop=False) for vertex_id in predecessors
+    }
+    graph.run_manager.build_run_map(predecessors, set(predecessors))
+    return graph
+
+
+def _run(predecessors: dict[str, list[str]]) -> int:
+    """Complete every vertex in topological waves, the way Graph.get_next_runnable_vertices drives the manager."""
+    graph = _stub_graph(predecessors)
+    successors = {vertex_id: list(graph.run_manager.run_map.get(vertex_id, ())) for vertex_id in predecessors}
+    ready = [vertex_id for vertex_id, preds in predecessors.items() if not preds]
+    for vertex_id in ready:
+        graph.run_manager.add_to_vertices_being_run(vertex_id)
+
+    completed = 0
+    while ready:
+        next_ready = []
+        for vertex_id in ready:
+            completed += 1
+            graph.run_manager.remove_vertex_from_runnables(vertex_id)
+            for next_id in graph.find_next_runnable_vertices(successors[vertex_id]):
+                graph.run_manager.add_to_vertices_being_run(next_id)
+                next_ready.append(next_id)
+        ready = next_ready
+    return completed
+
+
+def _run_legacy(predecessors: dict[str, list[str]]) -> int:
+    """The same run with list-based predecessors and a predecessor search for every waiting successor."""
+    run_map: dict[str, list[str]] = defaultdict(list)
+    for vertex_id, preds in predecessors.items():
+        for predecessor in preds:
+            run_map[predecessor].append(vertex_id)
+    pending = {vertex_id: list(preds) for vertex_id, preds in predecessors.items()}
+    being_run: set[str] = set()
+
+    def is_runnable(vertex_id: str) -> bool:
+        return vertex_id not in being_run and not pending[vertex_id]
+
+    def find_runnable_predecessors(vertex_id: str) -> list[str]:
+        runnable, visited = [], set()
+
+        def visit(predecessor_id: str) -> None:
+            if predecessor_id in visited:
+                return
+            visited.add(predecessor_id)
+            if is_runnable(predecessor_id):
+                runnable.append(predecessor_id)
+            else:
+                for pred_pred_id in pending[predecessor_id]:
+                    visit(pred_pred_id)
+
+        for predecessor_id in pending[vertex_id]:
+            visit(predecessor_id)
+        return runnable
+
+    ready = [vertex_id for vertex_id, preds in predecessors.items() if not preds]
+    being_run.update(ready)
+    completed = 0
+    while ready:
+        next_ready = []
+        for vertex_id in ready:
+            completed += 1
+            being_run.discard(vertex_id)
+            for successor in run_map[vertex_id]:
+                if vertex_id in pending[successor]:
+                    pending[successor].remove(vertex_id)
+            next_runnable = set()
+            for successor in sorted(run_map[vertex_id]):
+                if is_runnable(successor):
+                    next_runnable.add(successor)
+                else:
+                    next_runnable.update(find_runnable_predecessors(successor))
+            for next_id in sorted(next_runnable):
+                being_run.add(next_id)
+                next_ready.append(next_id)
+        ready = next_ready
+    return completed
+
+
+@pytest.mark.parametrize("n_vertices", [100, 1000, 5000])
+def test_run_manager_scaling(n_vertices):
+    predecessors = _random_dag(n_vertices)
+
+    start = time.perf_counter()
+    legacy_completed = _run_legacy(predecessors)
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    completed = _run(predecessors)
+    elapsed = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\n{n_vertices} vertices: predecessor search {legacy_elapsed * 1e3:.1f} ms, "
+        f"pending counts {elapsed * 1e3:.1f} ms ({elapsed / n_vertices * 1e6:.2f} us/vertex, "
+        f"{legacy_elapsed / elapsed:.1f}x)"
+    )
+    assert completed == legacy_completed == n_vertices
@@ -0,0 +1,73 @@
+"""Latency of ``lfx serve`` runs at increasing concurrency, deep-copying the graph versus instantiating it.
+
+Each request to ``/flows/{id}/run`` needs a graph of its own. The previous path deep-copied the
+loaded graph, with all of its built components, on every request; the new path instantiates a
+fresh graph from a prepared flow. Both run the same chat flow through the ASGI app, so the numbers
+include routing, execution and output capture.
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from copy import deepcopy
+from pathlib import Path
+
+import httpx
+from lfx.cli.serve_app import FlowMeta, GraphRunFactory, create_multi_serve_app
+from lfx.graph import Graph
+
+FLOW_PATH = Path(__file__).parent.parent / "data" / "simple_chat_no_llm.json"
+FLOW_ID = "benchmark"
+CONCURRENCY_LEVELS = (1, 16, 64)
+ROUNDS = 4
+API_KEY = "benchmark-key"  # pragma: allowlist secret
+
+
+def _app():
+    graph = Graph.from_payload(json.loads(FLOW_PATH.read_text()), flow_id=FLOW_ID)
+    graph.prepare()
+    meta = FlowMeta(id=FLOW_ID, relative_path=FLOW_PATH.name, title="Benchmark")
+    return create_multi_serve_app(
+        root_dir=FLOW_PATH.parent, graphs={FLOW_ID: graph}, metas={FLOW_ID: meta}, verbose_print=lambda _: None
+    )
+
+
+async def _latencies(app, concurrency: int) -> list[float]:
+    async def run(client: httpx.AsyncClient) -> float:
+        start = time.perf_counter()
+        response = await client.post(
+            f"/flows/{FLOW_ID}/run", json={"input_value": "hello"}, headers={"x-api-key": API_KEY}
+        )
+        assert response.json()["success"], response.text
+        return (time.perf_counter() - start) * 1000
+
+    latencies = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await run(client)
+        for _ in range(ROUNDS):
+            latencies += await asyncio.gather(*(run(client) for _ in range(concurrency)))
+    return latencies
+
+
+def _percentiles(latencies: list[float]) -> tuple[float, float]:
+    return statistics.median(latencies), statistics.quantiles(latencies, n=100)[-1]
+
+
+async def test_run_latency_at_increasing_concurrency(monkeypatch):
+    monkeypatch.setenv("LANGFLOW_API_KEY", API_KEY)
+    app = _app()
+
+    print("\n/run latency in ms")  # noqa: T201
+    medians = {}
+    for concurrency in CONCURRENCY_LEVELS:
+        with monkeypatch.context() as patched:
+            patched.setattr(GraphRunFactory, "__call__", lambda self: deepcopy(self.graph))
+            copied = _percentiles(await _latencies(app, concurrency))
+        instantiated = _percentiles(await _latencies(app, concurrency))
+        medians[concurrency] = (copied[0], instantiated[0])
+        print(  # noqa: T201
+            f"  {concurrency:>3} concurrent: deepcopy p50={copied[0]:.1f} p99={copied[1]:.1f}, "
+            f"prepared p50={instantiated[0]:.1f} p99={instantiated[1]:.1f}"
+        )
+    assert medians[max(CONCURRENCY_LEVELS)][1] < medians[max(CONCURRENCY_LEVELS)][0]
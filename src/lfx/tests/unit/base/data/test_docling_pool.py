@@ -0,0 +1,170 @@
+"""Tests for the Docling worker pool."""
+
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lfx.base.data.docling_pool import DOCLING_WORKER_SCRIPT, DoclingWorkerPool
+
+# Speaks the worker protocol without Docling. The file path selects the behavior of a job.
+FAKE_WORKER_SCRIPT = textwrap.dedent(
+    r"""
+    import json, os, sys, time
+
+    for line in sys.stdin:
+        cfg = json.loads(line)
+        path = cfg["file_path"]
+        if path == "crash":
+            print("worker crashed", file=sys.stderr, flush=True)
+            os._exit(1)
+        if path.startswith("sleep"):
+            time.sleep(float(path.split(":")[1]))
+        result = {"ok": True, "mode": "markdown", "text": f"{os.getpid()}:{path}", "meta": {"file_path": path}}
+        sys.stdout.write(json.dumps({"result": result, "rss": cfg.get("rss", 0)}) + "\n")
+        sys.stdout.flush()
+    """
+)
+
+
+def job(file_path: str, **extra) -> dict:
+    return {"file_path": file_path, "pipeline": "standard", "ocr_engine": None, **extra}
+
+
+def worker_pid(result: dict) -> str:
+    return result["text"].split(":")[0]
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs) -> DoclingWorkerPool:
+        kwargs.setdefault("worker_script", FAKE_WORKER_SCRIPT)
+        pool = DoclingWorkerPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_workers_are_reused_between_jobs(make_pool):
+    pool = make_pool(max_workers=2)
+
+    first = pool.convert(job("a.pdf"))
+    second = pool.convert(job("b.pdf"))
+
+    assert first["text"].endswith(":a.pdf")
+    assert worker_pid(first) == worker_pid(second)
+    stats = pool.stats()
+    assert stats["jobs"] == 2
+    assert stats["workers_started"] == 1
+    assert stats["idle_workers"] == 1
+
+
+def test_concurrent_jobs_are_bounded_by_the_pool_size(make_pool):
+    pool = make_pool(max_workers=2)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(pool.convert, [job(f"sleep:0.2:{i}") for i in range(6)]))
+
+    assert len({worker_pid(result) for result in results}) == 2
+    assert [result["meta"]["file_path"] for result in results] == [f"sleep:0.2:{i}" for i in range(6)]
+    assert pool.stats()["workers_started"] == 2
+
+
+def test_jobs_prefer_a_worker_with_a_warm_converter(make_pool):
+    pool = make_pool(max_workers=2)
+    barrier = threading.Barrier(2)
+
+    def convert_together(item):
+        barrier.wait()
+        return pool.convert(item)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        standard, vlm = executor.map(convert_together, [job("sleep:0.2"), {**job("sleep:0.2"), "pipeline": "vlm"}])
+
+    for _ in range(3):
+        assert worker_pid(pool.convert({**job("b.pdf"), "pipeline": "vlm"})) == worker_pid(vlm)
+        assert worker_pid(pool.convert(job("c.pdf"))) == worker_pid(standard)
+
+
+def test_workers_are_recycled_after_max_jobs(make_pool):
+    pool = make_pool(max_workers=1, max_jobs_per_worker=2)
+
+    pids = [worker_pid(pool.convert(job(f"{i}.pdf"))) for i in range(4)]
+
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+    assert pool.stats()["workers_recycled"] == 2
+
+
+def test_workers_are_recycled_on_memory_growth(make_pool):
+    pool = make_pool(max_workers=1, max_rss_growth_mb=10)
+    megabyte = 1024 * 1024
+
+    first = pool.convert(job("a.pdf", rss=100 * megabyte))
+    second = pool.convert(job("b.pdf", rss=105 * megabyte))
+    third = pool.convert(job("c.pdf", rss=111 * megabyte))
+    fourth = pool.convert(job("d.pdf", rss=100 * megabyte))
+
+    assert worker_pid(first) == worker_pid(second) == worker_pid(third) != worker_pid(fourth)
+    assert pool.stats()["workers_recycled"] == 1
+
+
+def test_timed_out_jobs_kill_their_worker(make_pool):
+    pool = make_pool(max_workers=1, job_timeout=0.2)
+
+    result = pool.convert(job("sleep:5"))
+
+    assert not result["ok"]
+    assert "did not finish within 0.2 seconds" in result["error"]
+    assert result["meta"]["file_path"] == "sleep:5"
+    # Leave the replacement worker time to start on a busy machine
+    pool.job_timeout = 30
+    assert pool.convert(job("a.pdf"))["ok"]
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["failed_jobs"] == 1
+    assert stats["workers_started"] == 2
+
+
+def test_crashed_workers_are_replaced(make_pool):
+    pool = make_pool(max_workers=1)
+
+    result = pool.convert(job("crash"))
+
+    assert not result["ok"]
+    assert "worker crashed" in result["error"]
+    assert pool.convert(job("a.pdf"))["ok"]
+
+
+def test_shut_down_pool_rejects_jobs(make_pool):
+    pool = make_pool(max_workers=1)
+    pool.convert(job("a.pdf"))
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError, match="shut down"):
+        pool.convert(job("b.pdf"))
+    assert pool.stats()["workers"] == 0
+
+
+def test_docling_worker_script_answers_each_job(make_pool):
+    pool = make_pool(max_workers=1, worker_script=DOCLING_WORKER_SCRIPT)
+    config = job(
+        "missing.pdf",
+        markdown=True,
+        image_mode="placeholder",
+        md_image_placeholder="<!-- image -->",
+        md_page_break_placeholder="",
+    )
+
+    first = pool.convert(config)
+    second = pool.convert(config)
+
+    # Without Docling, or with a missing file, every job fails on its own and the worker stays up
+    assert not first["ok"]
+    assert not second["ok"]
+    assert first["meta"]["file_path"] == "missing.pdf"
+    assert pool.stats()["workers_started"] == 1
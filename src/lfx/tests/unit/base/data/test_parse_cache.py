@@ -0,0 +1,197 @@
+"""Tests for the parse cache and its use by BaseFileComponent."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.parse_cache import ParseCache
+from lfx.components.files_and_knowledge.file import FileComponent
+from lfx.schema.data import Data
+
+
+class CountingFileComponent(BaseFileComponent):
+    """Parses text files into upper-cased text and records which files it parsed."""
+
+    VALID_EXTENSIONS = ["txt"]
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self.set_attributes(
+            {
+                "path": [],
+                "file_path": None,
+                "separator": "\n\n",
+                "silent_errors": False,
+                "delete_server_file_after_processing": False,
+                "ignore_unsupported_extensions": True,
+                "ignore_unspecified_files": False,
+            }
+        )
+        self.mode = "upper"
+        self.parsed: list[str] = []
+
+    def parse_cache_options(self, file_list):  # noqa: ARG002
+        return {"mode": self.mode}
+
+    def process_files(self, file_list):
+        rows = []
+        for file in file_list:
+            self.parsed.append(file.path.name)
+            text = file.path.read_text()
+            if text == "broken":
+                rows.append(Data(data={"file_path": str(file.path), "error": "cannot parse"}))
+            else:
+                rows.append(Data(data={"file_path": str(file.path), "text": getattr(text, self.mode)()}))
+        return self.rollup_data(file_list, rows)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ParseCache(tmp_path / "cache", max_bytes=1024 * 1024)
+    with patch("lfx.base.data.base_file.get_parse_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for name, text in (("a.txt", "first"), ("b.txt", "second")):
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(str(path))
+    return paths
+
+
+def load(paths: list[str]) -> tuple[CountingFileComponent, list[Data]]:
+    component = CountingFileComponent()
+    component.path = paths
+    return component, component.load_files_base()
+
+
+class TestParseCache:
+    def test_get_and_set(self, tmp_path):
+        cache = ParseCache(tmp_path, max_bytes=1024)
+        key = ParseCache.make_key("hash", {"mode": "a"}, "component:1")
+
+        assert cache.get(key) is None
+        assert cache.set(key, [{"text": "parsed"}])
+        assert cache.get(key) == [{"text": "parsed"}]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_keys_depend_on_content_options_and_version(self):
+        key = ParseCache.make_key("hash", {"mode": "a"}, "component:1")
+
+        assert key == ParseCache.make_key("hash", {"mode": "a"}, "component:1")
+        assert key != ParseCache.make_key("other", {"mode": "a"}, "component:1")
+        assert key != ParseCache.make_key("hash", {"mode": "b"}, "component:1")
+        assert key != ParseCache.make_key("hash", {"mode": "a"}, "component:2")
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ParseCache(tmp_path, max_bytes=300)
+        payload = [{"text": "x" * 80}]
+        for index, key in enumerate(("a", "b", "c")):
+            cache.set(key * 64, payload)
+            entry = cache._entry_path(key * 64)
+            os.utime(entry, (index, index))
+        # Reading "a" makes it the most recently used entry
+        assert cache.get("a" * 64) is not None
+
+        cache.set("d" * 64, payload)
+
+        assert cache.get("a" * 64) is not None
+        assert cache.get("b" * 64) is None
+        assert cache.get("d" * 64) is not None
+        assert cache.stats()["evictions"] >= 1
+        assert cache.stats()["bytes"] <= 300
+
+    def test_unserializable_payloads_are_not_cached(self, tmp_path):
+        cache = ParseCache(tmp_path, max_bytes=1024)
+
+        assert not cache.set("a" * 64, [{"value": object()}])
+        assert cache.get("a" * 64) is None
+
+    def test_file_digest_follows_content_changes(self, tmp_path):
+        cache = ParseCache(tmp_path, max_bytes=1024)
+        path = tmp_path / "file.txt"
+        path.write_text("one")
+        first = cache.file_digest(path)
+        os.utime(path, ns=(1, 1))
+        path.write_text("two")
+
+        assert cache.file_digest(path) != first
+
+
+@pytest.mark.usefixtures("cache")
+class TestBaseFileComponentParseCache:
+    def test_unchanged_files_are_parsed_once(self, files):
+        first_component, first = load(files)
+        second_component, second = load(files)
+
+        assert first_component.parsed == ["a.txt", "b.txt"]
+        assert second_component.parsed == []
+        assert [data.data for data in second] == [data.data for data in first]
+        assert [data.data["text"] for data in second] == ["FIRST", "SECOND"]
+
+    def test_only_missed_files_are_parsed(self, files):
+        load(files[:1])
+        component, result = load(files)
+
+        assert component.parsed == ["b.txt"]
+        assert [data.data["text"] for data in result] == ["FIRST", "SECOND"]
+
+    def test_copies_with_the_same_content_share_the_entry(self, files, tmp_path):
+        load(files)
+        copy = tmp_path / "copy.txt"
+        copy.write_text("first")
+
+        component, result = load([str(copy)])
+
+        assert component.parsed == []
+        assert result[0].data["file_path"] == str(copy)
+
+    def test_same_content_under_another_extension_misses_the_cache(self, tmp_path):
+        yaml_file = tmp_path / "x.yaml"
+        text_file = tmp_path / "x.txt"
+        yaml_file.write_text("a: 1\nb: two\n")
+        text_file.write_text("a: 1\nb: two\n")
+
+        first = FileComponent()
+        first.path = [str(yaml_file)]
+        yaml_data = first.load_files_base()
+        second = FileComponent()
+        second.path = [str(text_file)]
+        text_data = second.load_files_base()
+
+        assert yaml_data[0].data["text"] == {"a": 1, "b": "two"}
+        assert text_data[0].data["text"] == "a: 1\nb: two\n"
+
+    def test_changed_options_miss_the_cache(self, files):
+        load(files)
+        component = CountingFileComponent()
+        component.path = files
+        component.mode = "lower"
+
+        result = component.load_files_base()
+
+        assert component.parsed == ["a.txt", "b.txt"]
+        assert [data.data["text"] for data in result] == ["first", "second"]
+
+    def test_failed_parses_are_not_cached(self, tmp_path):
+        path = tmp_path / "broken.txt"
+        path.write_text("broken")
+
+        load([str(path)])
+        component, result = load([str(path)])
+
+        assert component.parsed == ["broken.txt"]
+        assert result[0].data["error"] == "cannot parse"
+
+    def test_components_without_options_do_not_use_the_cache(self, files, cache):
+        with patch.object(CountingFileComponent, "parse_cache_options", return_value=None):
+            load(files)
+            component, _ = load(files)
+
+        assert component.parsed == ["a.txt", "b.txt"]
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 0
@@ -1,5 +1,6 @@
 """Unit tests for LFX CLI common utilities."""
 
+import asyncio
 import os
 import socket
 import sys
@@ -10,6 +11,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 import typer
 from lfx.cli.common import (
+    capture_output,
     create_verbose_printer,
     execute_graph_with_capture,
     extract_result_data,
@@ -255,6 +257,53 @@ class TestGraphExecution:
         with pytest.raises(RuntimeError, match="Execution failed"):
             await execute_graph_with_capture(mock_graph, "test input")
 
+    @pytest.mark.asyncio
+    async def test_concurrent_executions_capture_their_own_output(self):
+        """Test that graphs running at the same time do not capture each other's output."""
+
+        def printing_graph(name):
+            async def mock_async_start(inputs):  # noqa: ARG001
+                for step in range(3):
+                    print(f"{name} {step}")  # noqa: T201
+                    await asyncio.sleep(0)
+                print(f"{name} warning", file=sys.stderr)  # noqa: T201
+                yield MagicMock(results={"text": name})
+
+            mock_graph = MagicMock()
+            mock_graph.async_start = mock_async_start
+            return mock_graph
+
+        original_stdout, original_stderr = sys.stdout, sys.stderr
+        outputs = await asyncio.gather(*(execute_graph_with_capture(printing_graph(name), "x") for name in "abc"))
+
+        for name, (_, logs) in zip("abc", outputs, strict=True):
+            assert logs == f"{name} 0\n{name} 1\n{name} 2\n{name} warning\n"
+        assert sys.stdout is original_stdout
+        assert sys.stderr is original_stderr
+
+    @pytest.mark.asyncio
+    async def test_capture_output_leaves_other_tasks_alone(self, capsys):
+        """Test that output of tasks outside the capture reaches the original stream."""
+        captured_started = asyncio.Event()
+        other_done = asyncio.Event()
+
+        async def captured():
+            with capture_output() as (stdout, _):
+                print("inside")  # noqa: T201
+                captured_started.set()
+                await other_done.wait()
+            return stdout.getvalue()
+
+        async def other():
+            await captured_started.wait()
+            print("outside")  # noqa: T201
+            other_done.set()
+
+        inside, _ = await asyncio.gather(captured(), other())
+
+        assert inside == "inside\n"
+        assert capsys.readouterr().out == "outside\n"
+
 
 class TestResultExtraction:
     """Test result data extraction."""
@@ -10,6 +10,7 @@ from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from lfx.cli.serve_app import (
     FlowMeta,
+    GraphRunFactory,
     create_multi_serve_app,
     verify_api_key,
 )
@@ -161,6 +162,31 @@ class TestCreateServeApp:
                 verbose_print=verbose_print,
             )
 
+    def test_run_factory_instantiates_graphs_from_flow_data(self, real_graph):
+        """Test that each run gets its own graph built from the prepared flow."""
+        new_run_graph = GraphRunFactory(real_graph)
+
+        first, second = new_run_graph(), new_run_graph()
+
+        assert new_run_graph.prepared is not None
+        assert first is not second
+        assert first is not real_graph
+        assert first.flow_id == "test-flow-id"
+        assert {vertex.id for vertex in first.vertices} == {vertex.id for vertex in real_graph.vertices}
+        assert first.vertices[0] is not second.vertices[0]
+
+    def test_run_factory_copies_graphs_without_flow_data(self):
+        """Test that graphs without flow data, like script graphs, are deep-copied per run."""
+        graph = MagicMock(raw_graph_data={})
+
+        with patch("lfx.cli.serve_app.deepcopy") as mock_deepcopy:
+            new_run_graph = GraphRunFactory(graph)
+            run_graph = new_run_graph()
+
+        assert new_run_graph.prepared is None
+        mock_deepcopy.assert_called_once_with(graph)
+        assert run_graph is mock_deepcopy.return_value
+
 
 class TestServeAppEndpoints:
     """Test the FastAPI endpoints."""
@@ -0,0 +1,29 @@
+"""A stand-in for a slow LLM call, used as the body of Loop components in tests.
+
+The component is the only one in this module because graphs load it back from the module source.
+"""
+
+import asyncio
+
+from lfx.custom.custom_component.component import Component
+from lfx.io import DataInput, FloatInput, MessageTextInput, Output
+from lfx.schema.data import Data
+
+
+class SlowLLMComponent(Component):
+    display_name = "Slow LLM"
+    description = "Answers after a fixed latency. Records with a true 'fail' field raise an error."
+
+    inputs = [
+        DataInput(name="record", display_name="Record"),
+        MessageTextInput(name="instructions", display_name="Instructions", value="Summarize"),
+        FloatInput(name="latency", display_name="Latency", value=0.0),
+    ]
+    outputs = [Output(display_name="Completion", name="completion", method="complete")]
+
+    async def complete(self) -> Data:
+        await asyncio.sleep(self.latency)
+        if self.record.data.get("fail"):
+            msg = f"The model failed on {self.record.text}"
+            raise ValueError(msg)
+        return Data(data={**self.record.data, "completion": f"{self.instructions}: {self.record.text}"})
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from lfx.base.flow_controls import LoopBody
+from lfx.components.flow_controls import LoopComponent
+from lfx.components.input_output import ChatOutput, TextInputComponent
+from lfx.custom.custom_component.component import Component
+from lfx.graph import Graph
+from lfx.io import BoolInput, IntInput, Output
+from lfx.schema.dataframe import DataFrame
+
+from tests.unit.components.flow_controls.slow_llm import SlowLLMComponent
+
+
+class RecordsComponent(Component):
+    inputs = [
+        IntInput(name="count", value=3),
+        BoolInput(name="fail_second", value=False),
+    ]
+    outputs = [Output(name="records", method="build_records")]
+
+    def build_records(self) -> DataFrame:
+        return DataFrame([{"text": f"row {i}", "fail": self.fail_second and i == 1} for i in range(self.count)])
+
+
+def _loop_graph(*, mode="Parallel", count=3, fail_second=False, error_policy="Stop", latency=0.0, instructions=None):
+    records = RecordsComponent(_id="records", count=count, fail_second=fail_second)
+    loop = LoopComponent(_id="loop", mode=mode, max_concurrency=4, error_policy=error_policy)
+    loop.set(data=records.build_records)
+    llm = SlowLLMComponent(_id="llm", latency=latency)
+    llm.set(record=loop.item_output)
+    if instructions is not None:
+        llm.set(instructions=instructions.text_response)
+    loop.set(item=llm.complete)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=loop.done_output)
+    return Graph(records, chat_output)
+
+
+def _done(graph: Graph) -> list[dict]:
+    return [row.data for row in graph.get_vertex("loop").results["done"].to_data_list()]
+
+
+@pytest.mark.parametrize("mode", ["Sequential", "Parallel"])
+async def test_modes_produce_the_same_results(mode):
+    graph = _loop_graph(mode=mode)
+    await graph.process(fallback_to_env_vars=False)
+
+    assert [row["completion"] for row in _done(graph)] == [
+        "Summarize: row 0",
+        "Summarize: row 1",
+        "Summarize: row 2",
+    ]
+
+
+async def test_parallel_mode_runs_items_concurrently():
+    graph = _loop_graph(count=4, latency=0.2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await graph.process(fallback_to_env_vars=False)
+
+    assert len(_done(graph)) == 4
+    # One item after another would take at least 0.8s
+    assert loop.time() - start < 0.6
+
+
+async def test_parallel_mode_does_not_run_the_body_in_the_graph():
+    graph = _loop_graph()
+    await graph.process(fallback_to_env_vars=False)
+
+    assert not graph.get_vertex("llm").built
+    assert graph.get_vertex("chat_output").built
+
+
+async def test_dependencies_outside_the_body_are_passed_to_each_run():
+    graph = _loop_graph(instructions=TextInputComponent(_id="instructions", input_value="Translate"))
+    await graph.process(fallback_to_env_vars=False)
+
+    assert [row["completion"] for row in _done(graph)] == [
+        "Translate: row 0",
+        "Translate: row 1",
+        "Translate: row 2",
+    ]
+
+
+@pytest.mark.parametrize("fallback_to_env_vars", [True, False])
+async def test_items_run_with_the_fallback_setting_of_the_run(monkeypatch, fallback_to_env_vars):
+    settings = []
+    run = LoopBody.run
+
+    async def record_run(self, item, *, fallback_to_env_vars=False):
+        settings.append(fallback_to_env_vars)
+        return await run(self, item, fallback_to_env_vars=fallback_to_env_vars)
+
+    monkeypatch.setattr(LoopBody, "run", record_run)
+    await _loop_graph().process(fallback_to_env_vars=fallback_to_env_vars)
+
+    assert settings == [fallback_to_env_vars] * 3
+
+
+def test_unbuilt_dependencies_run_with_each_item():
+    graph = _loop_graph(instructions=TextInputComponent(_id="instructions", input_value="Translate"))
+
+    body = LoopBody(graph, "loop")
+
+    assert body.vertex_ids == {"llm", "instructions"}
+    assert body.exit_id == "llm"
+    assert body.exit_output == "completion"
+
+
+async def test_stop_policy_fails_the_loop():
+    graph = _loop_graph(fail_second=True)
+
+    with pytest.raises(Exception, match="The model failed on row 1"):
+        await graph.process(fallback_to_env_vars=False)
+
+
+async def test_skip_policy_leaves_failed_items_out():
+    graph = _loop_graph(fail_second=True, error_policy="Skip")
+    await graph.process(fallback_to_env_vars=False)
+
+    assert [row["text"] for row in _done(graph)] == ["row 0", "row 2"]
+
+
+async def test_include_error_policy_keeps_failed_items_in_place():
+    graph = _loop_graph(fail_second=True, error_policy="Include Error")
+    await graph.process(fallback_to_env_vars=False)
+
+    rows = _done(graph)
+    assert [row["text"] for row in rows] == ["row 0", "row 1", "row 2"]
+    assert "The model failed on row 1" in rows[1]["error"]
+    assert "completion" in rows[0]
+
+
+def test_loop_body_requires_the_feedback_edge():
+    records = RecordsComponent(_id="records")
+    loop = LoopComponent(_id="loop", mode="Parallel")
+    loop.set(data=records.build_records)
+    llm = SlowLLMComponent(_id="llm")
+    llm.set(record=loop.item_output)
+    graph = Graph(records, llm)
+
+    with pytest.raises(ValueError, match="must both be connected"):
+        LoopBody(graph, "loop")
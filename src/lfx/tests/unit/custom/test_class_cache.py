@@ -0,0 +1,97 @@
+from textwrap import dedent
+
+import pytest
+from lfx.custom.class_cache import CompiledClassCache, get_compiled_class_cache, hash_code
+from lfx.custom.eval import eval_custom_component_code
+
+COMPONENT_CODE = dedent("""
+from lfx.custom import Component
+
+class CachedComponent(Component):
+    display_name = "Cached"
+""")
+
+
+@pytest.fixture(autouse=True)
+def clear_class_cache():
+    get_compiled_class_cache().clear()
+    yield
+    get_compiled_class_cache().clear()
+
+
+def test_hash_code_is_content_addressed():
+    assert hash_code("a") == hash_code("a")
+    assert hash_code("a") != hash_code("b")
+
+
+def test_get_or_create_counts_hits_and_misses():
+    cache = CompiledClassCache(max_size=2)
+    calls = []
+
+    def factory(code):
+        calls.append(code)
+        return type("Generated", (), {})
+
+    first = cache.get_or_create("code", factory)
+    second = cache.get_or_create("code", factory)
+
+    assert first is second
+    assert calls == ["code"]
+    assert cache.stats() == {"size": 1, "max_size": 2, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_lru_eviction():
+    cache = CompiledClassCache(max_size=2)
+    cache.set("a", int)
+    cache.set("b", str)
+    assert cache.get("a") is int  # "a" becomes most recently used
+    cache.set("c", float)
+
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+
+
+def test_zero_max_size_disables_caching():
+    cache = CompiledClassCache(max_size=0)
+    cache.set("a", int)
+    assert len(cache) == 0
+
+
+def test_factory_errors_are_not_cached():
+    cache = CompiledClassCache()
+
+    def factory(_code):
+        msg = "bad code"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="bad code"):
+        cache.get_or_create("broken", factory)
+    assert "broken" not in cache
+
+
+def test_invalidate():
+    cache = CompiledClassCache()
+    cache.set("a", int)
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+
+
+def test_eval_custom_component_code_reuses_compiled_class():
+    first = eval_custom_component_code(COMPONENT_CODE)
+    second = eval_custom_component_code(COMPONENT_CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    stats = get_compiled_class_cache().stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_eval_custom_component_code_recompiles_changed_code():
+    first = eval_custom_component_code(COMPONENT_CODE)
+    changed = eval_custom_component_code(COMPONENT_CODE.replace('"Cached"', '"Changed"'))
+
+    assert first is not changed
+    assert changed.display_name == "Changed"
@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -368,3 +370,131 @@ class TestEventManagerAsync:
         for sent, received in zip(events_to_send, received_events, strict=False):
             assert sent[0] == received[0]  # event type
             assert sent[1] == received[1]  # data
+
+
+def _drain(queue: asyncio.Queue) -> list[tuple[str, object]]:
+    events = []
+    while not queue.empty():
+        _, data_bytes, _ = queue.get_nowait()
+        parsed = json.loads(data_bytes.decode("utf-8").strip())
+        events.append((parsed["event"], parsed["data"]))
+    return events
+
+
+class TestEventManagerTokenCoalescing:
+    """Test cases for merging consecutive token events."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_not_coalesced_by_default(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue)
+
+        manager.on_token(data={"chunk": "a", "id": "m1"})
+        manager.on_token(data={"chunk": "b", "id": "m1"})
+
+        assert _drain(queue) == [("token", {"chunk": "a", "id": "m1"}), ("token", {"chunk": "b", "id": "m1"})]
+
+    @pytest.mark.asyncio
+    async def test_consecutive_tokens_are_merged(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=10)
+
+        for chunk in ["Hel", "lo", " world"]:
+            manager.on_token(data={"chunk": chunk, "id": "m1"})
+        assert queue.empty()
+
+        manager.flush_tokens()
+        assert _drain(queue) == [("token", {"chunk": "Hello world", "id": "m1"})]
+
+    @pytest.mark.asyncio
+    async def test_message_change_flushes_previous_tokens(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=10)
+
+        manager.on_token(data={"chunk": "a", "id": "m1"})
+        manager.on_token(data={"chunk": "b", "id": "m2"})
+        manager.flush_tokens()
+
+        assert _drain(queue) == [("token", {"chunk": "a", "id": "m1"}), ("token", {"chunk": "b", "id": "m2"})]
+
+    @pytest.mark.asyncio
+    async def test_other_events_keep_their_order(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=10)
+
+        manager.on_token(data={"chunk": "a", "id": "m1"})
+        manager.on_token(data={"chunk": "b", "id": "m1"})
+        manager.on_end(data={"status": "done"})
+
+        assert _drain(queue) == [("token", {"chunk": "ab", "id": "m1"}), ("end", {"status": "done"})]
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_flushes_immediately(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=10, coalesce_max_bytes=4)
+
+        manager.on_token(data={"chunk": "ab", "id": "m1"})
+        assert queue.empty()
+        manager.on_token(data={"chunk": "cd", "id": "m1"})
+        manager.on_token(data={"chunk": "e", "id": "m1"})
+
+        assert _drain(queue) == [("token", {"chunk": "abcd", "id": "m1"})]
+
+    @pytest.mark.asyncio
+    async def test_max_delay_flushes_without_new_events(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=0.01)
+
+        manager.on_token(data={"chunk": "a", "id": "m1"})
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+
+        assert json.loads(event[1])["data"] == {"chunk": "a", "id": "m1"}
+
+    @pytest.mark.asyncio
+    async def test_tokens_sent_from_threads_are_merged(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=10)
+
+        for chunk in ["a", "b", "c"]:
+            await asyncio.to_thread(manager.on_token, data={"chunk": chunk, "id": "m1"})
+        manager.flush_tokens()
+
+        assert _drain(queue) == [("token", {"chunk": "abc", "id": "m1"})]
+
+    @pytest.mark.asyncio
+    async def test_tokens_flushed_from_threads_are_put_from_the_loop(self):
+        queue = asyncio.Queue()
+        put_threads = []
+        put_nowait = queue.put_nowait
+
+        def record_thread(item):
+            put_threads.append(threading.get_ident())
+            put_nowait(item)
+
+        queue.put_nowait = record_thread
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=10, coalesce_max_bytes=1)
+
+        await asyncio.to_thread(manager.on_token, data={"chunk": "a", "id": "m1"})
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+
+        assert json.loads(event[1])["data"] == {"chunk": "a", "id": "m1"}
+        assert put_threads == [threading.get_ident()]
+
+    def test_tokens_held_without_a_loop_are_sent_by_the_next_event(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, coalesce_tokens=True, coalesce_max_delay=0.01)
+
+        manager.on_token(data={"chunk": "a", "id": "m1"})
+        time.sleep(0.05)
+        assert queue.empty()
+
+        manager.on_end(data={"status": "done"})
+        assert _drain(queue) == [("token", {"chunk": "a", "id": "m1"}), ("end", {"status": "done"})]
+
+    def test_tokens_with_extra_fields_are_not_merged(self):
+        queue = MagicMock()
+        manager = EventManager(queue, coalesce_tokens=True, coalesce_max_delay=10)
+
+        manager.send_event(event_type="token", data={"chunk": "a", "id": "m1", "extra": 1})
+
+        queue.put_nowait.assert_called_once()
@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.custom.custom_component.component import Component
+from lfx.exceptions.component import ComponentBuildError
+from lfx.graph import Graph
+from lfx.io import FloatInput, MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [Output(display_name="Message", name="message", method="sleep_and_return")]
+
+    async def sleep_and_return(self) -> Message:
+        timeline = self.graph.context.setdefault("timeline", [])
+        timeline.append(("start", self._id, time.perf_counter()))
+        if self.delay < 0:
+            msg = f"{self._id} failed"
+            raise ValueError(msg)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            # Cleaning up takes a moment, like closing a connection
+            await asyncio.sleep(0.05)
+            timeline.append(("cancelled", self._id, time.perf_counter()))
+            raise
+        timeline.append(("end", self._id, time.perf_counter()))
+        return Message(text=f"{self.text}>{self._id}")
+
+
+class JoinComponent(Component):
+    display_name = "Join"
+    inputs = [MessageTextInput(name=f"text{i}", display_name=f"Text {i}") for i in range(4)]
+    outputs = [Output(display_name="Message", name="message", method="join")]
+
+    def join(self) -> Message:
+        return Message(text="|".join(sorted(getattr(self, f"text{i}") or "" for i in range(4))))
+
+
+def _skewed_graph(slow_delay: float = 0.3, fast_delay: float = 0.01) -> Graph:
+    """chat_input feeds a slow vertex and a chain of two fast ones, all joined before the output."""
+    chat_input = ChatInput(_id="chat_input")
+    slow = SleepComponent(_id="slow")
+    slow.set(text=chat_input.message_response, delay=slow_delay)
+    fast_a = SleepComponent(_id="fast_a")
+    fast_a.set(text=chat_input.message_response, delay=fast_delay)
+    fast_b = SleepComponent(_id="fast_b")
+    fast_b.set(text=fast_a.sleep_and_return, delay=fast_delay)
+    join = JoinComponent(_id="join")
+    join.set(text0=slow.sleep_and_return, text1=fast_b.sleep_and_return)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=join.join)
+    return Graph(chat_input, chat_output)
+
+
+def _fan_out_graph(delays: list[float]) -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    join = JoinComponent(_id="join")
+    for i, delay in enumerate(delays):
+        sleeper = SleepComponent(_id=f"sleep_{i}")
+        sleeper.set(text=chat_input.message_response, delay=delay)
+        join.set(**{f"text{i}": sleeper.sleep_and_return})
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=join.join)
+    return Graph(chat_input, chat_output)
+
+
+def _times(graph: Graph, event: str) -> dict[str, float]:
+    return {vertex_id: at for kind, vertex_id, at in graph.context["timeline"] if kind == event}
+
+
+async def _process(graph: Graph, mode: str, max_concurrency: int = 0) -> Graph:
+    graph.execution_mode = mode
+    graph.max_concurrency = max_concurrency
+    graph.context["timeline"] = []
+    return await graph.process(fallback_to_env_vars=False)
+
+
+async def test_eager_mode_starts_vertices_when_their_predecessors_finish():
+    layered = await _process(_skewed_graph(), "layered")
+    eager = await _process(_skewed_graph(), "eager")
+
+    # Layered: fast_b waits for the whole first layer, including the slow vertex
+    assert _times(layered, "start")["fast_b"] >= _times(layered, "end")["slow"]
+    # Eager: fast_b only waits for fast_a
+    assert _times(eager, "start")["fast_b"] < _times(eager, "end")["slow"]
+    assert eager.get_vertex("join").results["message"].text == layered.get_vertex("join").results["message"].text
+    assert {vertex.id for vertex in eager.vertices if vertex.built} == {vertex.id for vertex in layered.vertices}
+
+
+async def test_eager_mode_respects_max_concurrency():
+    graph = await _process(_fan_out_graph([0.05] * 4), "eager", max_concurrency=2)
+
+    running = 0
+    max_running = 0
+    for kind, vertex_id, _ in sorted(graph.context["timeline"], key=lambda entry: entry[2]):
+        if vertex_id.startswith("sleep_"):
+            running += 1 if kind == "start" else -1
+            max_running = max(max_running, running)
+    assert max_running == 2
+    assert all(graph.get_vertex(f"sleep_{i}").built for i in range(4))
+
+
+async def test_eager_mode_error_cancels_running_vertices():
+    graph = _fan_out_graph([-1, 5.0])
+
+    with pytest.raises(ComponentBuildError, match="sleep_0 failed"):
+        await asyncio.wait_for(_process(graph, "eager"), timeout=2)
+
+    assert "sleep_1" not in _times(graph, "end")
+    assert "sleep_1" in _times(graph, "cancelled")
+
+
+async def test_eager_mode_cancellation_cancels_running_vertices():
+    graph = _fan_out_graph([5.0, 5.0])
+    task = asyncio.create_task(_process(graph, "eager"))
+    await asyncio.sleep(0.5)
+    assert set(_times(graph, "start")) == {"sleep_0", "sleep_1"}
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The vertices have finished cleaning up by the time process() returns, not just been asked to stop
+    assert set(_times(graph, "cancelled")) == {"sleep_0", "sleep_1"}
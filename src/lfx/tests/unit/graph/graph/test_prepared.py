@@ -0,0 +1,93 @@
+import copy
+
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.graph.graph.prepared import PreparedGraph
+
+
+def _chain_payload(n_middle: int = 3) -> dict:
+    chat_input = ChatInput(_id="chat_input")
+    previous = chat_input.message_response
+    for i in range(n_middle):
+        component = CombineTextComponent(_id=f"combine-{i}")
+        component.set(text1=previous, text2="x", delimiter=" ")
+        previous = component.combine_texts
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=previous)
+    return Graph(chat_input, chat_output).dump()
+
+
+def test_instantiate_matches_from_payload():
+    payload = _chain_payload()
+    expected = Graph.from_payload(copy.deepcopy(payload), flow_id="flow")
+    expected.prepare()
+
+    graph = PreparedGraph(payload, flow_id="flow").instantiate(user_id="user")
+    graph.prepare()
+
+    assert [vertex.id for vertex in graph.vertices] == [vertex.id for vertex in expected.vertices]
+    assert graph.vertices_layers == expected.vertices_layers
+    assert graph._first_layer == expected._first_layer
+    assert graph.user_id == "user"
+    for vertex, expected_vertex in zip(graph.vertices, expected.vertices, strict=True):
+        assert vertex.params.keys() == expected_vertex.params.keys()
+        assert vertex.load_from_db_fields == expected_vertex.load_from_db_fields
+
+
+def test_instances_are_isolated():
+    payload = _chain_payload()
+    prepared = PreparedGraph(payload, flow_id="flow")
+
+    first = prepared.instantiate()
+    second = prepared.instantiate()
+
+    assert first is not second
+    for vertex_id in prepared.vertex_ids:
+        first_vertex = first.get_vertex(vertex_id)
+        second_vertex = second.get_vertex(vertex_id)
+        assert first_vertex is not second_vertex
+        assert first_vertex.custom_component is not second_vertex.custom_component
+        assert first_vertex.params is not second_vertex.params
+        assert first_vertex.data is not second_vertex.data
+    # Edge params point at the vertices of their own run
+    combine = first.get_vertex("combine-0")
+    assert combine.params["text1"] is first.get_vertex("chat_input")
+
+
+def test_payload_is_not_mutated():
+    payload = _chain_payload()
+    original = copy.deepcopy(payload)
+    prepared = PreparedGraph(payload, flow_id="flow")
+    prepared.instantiate().prepare()
+
+    assert payload == original
+
+
+def test_sorted_layers_are_reused_across_runs():
+    prepared = PreparedGraph(_chain_payload(), flow_id="flow")
+    first = prepared.instantiate()
+    first.prepare()
+    assert prepared.sorted_vertices_cache
+
+    second = prepared.instantiate()
+    second.prepare()
+    assert second.vertices_layers == first.vertices_layers
+    second.vertices_layers.clear()
+    third = prepared.instantiate()
+    third.prepare()
+    assert third.vertices_layers == first.vertices_layers
+
+
+def test_updated_vertices_do_not_reuse_the_prepared_field_params():
+    payload = _chain_payload()
+    prepared = PreparedGraph(payload, flow_id="flow")
+    graph = prepared.instantiate()
+    changed = copy.deepcopy(payload)
+    node = next(node for node in changed["data"]["nodes"] if node["id"] == "combine-1")
+    node["data"]["node"]["template"]["text2"]["value"] = "y"
+
+    graph.update(Graph.from_payload(changed, flow_id="flow"))
+
+    assert graph.get_vertex("combine-1").params["text2"] == "y"
+    assert prepared.instantiate().get_vertex("combine-1").params["text2"] == "x"
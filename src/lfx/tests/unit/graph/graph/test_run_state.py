@@ -0,0 +1,208 @@
+import copy
+import uuid
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.graph.graph.prepared import PreparedGraph
+from lfx.graph.graph.run_state import (
+    RUN_STATE_VERSION,
+    RunStateError,
+    decode_value,
+    dump_run_state,
+    dumps_run_state,
+    encode_value,
+    graph_from_run_state,
+    loads_run_state,
+)
+from lfx.graph.schema import ResultData
+from lfx.graph.vertex.base import VertexStates
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.message import Message
+
+
+def _chain_payload(n_middle: int = 2) -> dict:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(input_value="hello")
+    previous = chat_input.message_response
+    for i in range(n_middle):
+        component = CombineTextComponent(_id=f"combine-{i}")
+        component.set(text1=previous, text2=f"x{i}", delimiter=" ")
+        previous = component.combine_texts
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=previous)
+    return Graph(chat_input, chat_output).dump()
+
+
+async def _run_to_end(graph: Graph) -> list[str]:
+    order = []
+    while graph._run_queue:
+        result = await graph.astep()
+        order.append(result.vertex.id)
+    return order
+
+
+def roundtrip(value):
+    return decode_value(orjson.loads(orjson.dumps(encode_value(value))))
+
+
+class TestValueEncoding:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "text",
+            1.5,
+            [1, "a", None],
+            {"nested": {"list": [1, 2]}},
+            (1, 2),
+            {1, 2},
+            frozenset({"a"}),
+            {1: "int key"},
+            {"__t__": "looks like a tag"},
+            uuid.uuid4(),
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            VertexStates.INACTIVE,
+        ],
+    )
+    def test_roundtrip(self, value):
+        assert roundtrip(value) == value
+
+    def test_models_keep_their_types(self):
+        message = Message(text="hi", sender="User", sender_name="User", session_id="session")
+        result = ResultData(results={"message": message}, artifacts={"data": Data(data={"a": 1})})
+
+        restored = roundtrip(result)
+
+        assert isinstance(restored, ResultData)
+        assert isinstance(restored.results["message"], Message)
+        assert restored.results["message"].text == "hi"
+        assert restored.results["message"].session_id == "session"
+        assert isinstance(restored.artifacts["data"], Data)
+        assert restored.artifacts["data"].data == {"a": 1}
+
+    def test_dataframes(self):
+        frame = DataFrame([{"text": "a", "count": 1}, {"text": "b", "count": 2}], text_key="text")
+
+        restored = roundtrip(frame)
+
+        assert isinstance(restored, DataFrame)
+        assert restored.to_dict(orient="records") == frame.to_dict(orient="records")
+        assert restored.text_key == "text"
+
+    def test_unsupported_values_raise(self):
+        with pytest.raises(RunStateError):
+            encode_value(object())
+
+        class LocalModel(Message):
+            pass
+
+        with pytest.raises(RunStateError):
+            encode_value(LocalModel(text="hi"))
+
+    def test_only_lfx_and_langflow_classes_are_loaded(self):
+        with pytest.raises(RunStateError, match="Refusing to load"):
+            decode_value({"__t__": "model", "cls": "os.PathLike", "fields": {}, "extra": None})
+
+
+class TestGraphRunState:
+    def test_state_is_json(self):
+        graph = Graph.from_payload(_chain_payload(), flow_id="flow")
+        graph.prepare()
+
+        state = loads_run_state(dumps_run_state(graph))
+
+        assert state["version"] == RUN_STATE_VERSION
+        assert state["run"]["run_queue"] == ["chat_input"]
+
+    def test_version_is_checked(self):
+        graph = Graph.from_payload(_chain_payload(), flow_id="flow")
+        state = dump_run_state(graph)
+        state["version"] = RUN_STATE_VERSION + 1
+
+        with pytest.raises(RunStateError, match="Unsupported run state version"):
+            loads_run_state(orjson.dumps(state))
+
+    def test_graphs_without_flow_data_are_rejected(self):
+        graph = Graph(ChatInput(_id="chat_input"), ChatOutput(_id="chat_output"))
+
+        with pytest.raises(RunStateError):
+            dump_run_state(graph)
+
+    async def test_resumes_a_run_on_a_prepared_topology(self):
+        payload = _chain_payload()
+        expected = Graph.from_payload(copy.deepcopy(payload), flow_id="flow")
+        expected.prepare()
+        expected_order = await _run_to_end(expected)
+
+        graph = Graph.from_payload(copy.deepcopy(payload), flow_id="flow")
+        graph.prepare()
+        graph.set_run_id("run")
+        first = await graph.astep()
+        second = await graph.astep()
+        prepared = PreparedGraph(payload, flow_id="flow")
+
+        restored = graph_from_run_state(loads_run_state(dumps_run_state(graph)), prepared=prepared)
+
+        assert restored.run_id == "run"
+        assert restored._run_queue == graph._run_queue
+        assert restored.run_manager.run_predecessors == graph.run_manager.run_predecessors
+        assert restored.get_vertex("combine-0").built
+        assert restored.get_vertex("combine-0").results["combined_text"].text == "hello x0"
+        order = [first.vertex.id, second.vertex.id, *await _run_to_end(restored)]
+        assert order == expected_order
+        assert (
+            restored.get_vertex("chat_output").results["message"].text
+            == expected.get_vertex("chat_output").results["message"].text
+            == "hello x0 x1"
+        )
+
+    async def test_vertices_with_unencodable_results_are_rebuilt_on_request(self):
+        payload = _chain_payload()
+        graph = Graph.from_payload(copy.deepcopy(payload), flow_id="flow")
+        graph.prepare()
+        await graph.astep()
+        await graph.astep()
+        graph.get_vertex("combine-0").artifacts = {"client": object()}
+
+        state = dump_run_state(graph)
+        restored = graph_from_run_state(state, prepared=PreparedGraph(payload, flow_id="flow"))
+
+        assert state["vertices"]["combine-0"] == {"state": "ACTIVE", "rebuild": True}
+        combine = restored.get_vertex("combine-0")
+        assert not combine.built
+        assert combine.rebuild_on_request
+        await _run_to_end(restored)
+        assert combine.built
+        assert restored.get_vertex("chat_output").results["message"].text == "hello x0 x1"
+
+    async def test_vertices_are_rebuilt_with_the_fallback_setting_of_the_run(self, monkeypatch):
+        payload = _chain_payload()
+        graph = Graph.from_payload(copy.deepcopy(payload), flow_id="flow")
+        graph.prepare()
+        await graph.astep()
+        await graph.astep()
+        graph.get_vertex("combine-0").artifacts = {"client": object()}
+        # As recorded by a run that falls back to environment variables
+        graph.fallback_to_env_vars = True
+
+        restored = graph_from_run_state(
+            loads_run_state(dumps_run_state(graph)), prepared=PreparedGraph(payload, flow_id="flow")
+        )
+        combine = restored.get_vertex("combine-0")
+        settings = []
+        build = combine.build
+
+        async def record_build(*args, fallback_to_env_vars=False, **kwargs):
+            settings.append(fallback_to_env_vars)
+            return await build(*args, fallback_to_env_vars=fallback_to_env_vars, **kwargs)
+
+        monkeypatch.setattr(combine, "build", record_build)
+        await combine.get_result(restored.get_vertex("combine-1"), target_handle_name="text1")
+
+        assert restored.fallback_to_env_vars
+        assert settings == [True]
@@ -206,3 +206,65 @@ def test_add_to_vertices_being_run(data):
     manager.add_to_vertices_being_run(vertex_id)
 
     assert vertex_id in manager.vertices_being_run
+
+
+def test_remove_vertex_from_runnables_returns_fulfilled_successors(data):
+    manager = RunnableVerticesManager.from_dict(data)
+
+    assert sorted(manager.remove_vertex_from_runnables("A")) == ["B", "C"]
+    assert manager.pending_count("D") == 2
+    assert manager.remove_vertex_from_runnables("B") == []
+    assert manager.remove_vertex_from_runnables("C") == ["D"]
+    assert manager.pending_count("D") == 0
+
+
+def test_list_based_state_is_converted(data):
+    data["run_map"] = {key: list(value) for key, value in data["run_map"].items()}
+    data["run_predecessors"] = {key: list(value) for key, value in data["run_predecessors"].items()}
+
+    manager = RunnableVerticesManager.from_dict(data)
+
+    assert manager.run_predecessors["D"] == {"B", "C"}
+    assert manager.run_map["A"] == {"B", "C"}
+
+
+def test_adjacency_sets_accept_append(data):
+    manager = RunnableVerticesManager.from_dict(data)
+
+    manager.run_predecessors["A"].append("D")
+    manager.run_predecessors["A"].append("D")
+
+    assert manager.run_predecessors["A"] == {"D"}
+
+
+def test_add_dependency(data):
+    manager = RunnableVerticesManager.from_dict(data)
+
+    manager.add_dependency("A", "D")
+
+    assert "D" in manager.run_predecessors["A"]
+    assert "A" in manager.run_map["D"]
+    assert manager.pending_count("A") == 1
+
+
+def test_stalled_vertices_tracking():
+    manager = RunnableVerticesManager()
+    manager.build_run_map({"A": [], "B": ["A"], "C": ["B"]}, {"A", "B", "C"})
+
+    # A is awaited by B and ready, but not scheduled yet
+    assert manager.has_stalled_vertices()
+    assert not manager.has_stalled_vertices(ignore=["A"])
+
+    manager.add_to_vertices_being_run("A")
+    assert not manager.has_stalled_vertices()
+
+    assert manager.remove_vertex_from_runnables("A") == ["B"]
+    # B is now ready and awaited by C until it is scheduled
+    assert manager.has_stalled_vertices()
+    manager.add_to_vertices_being_run("B")
+    assert not manager.has_stalled_vertices()
+
+    manager.remove_vertex_from_runnables("B")
+    manager.add_to_vertices_being_run("C")
+    manager.remove_vertex_from_runnables("C")
+    assert not manager.has_stalled_vertices()
@@ -26,6 +26,29 @@ class TestLocalStorageService:
         retrieved = await storage.get_file("flow_123", "test.txt")
         assert retrieved == data
 
+    @pytest.mark.asyncio
+    async def test_save_file_stream(self, storage):
+        """Test saving a file from a stream of chunks."""
+
+        async def chunks():
+            for chunk in (b"test ", b"content"):
+                yield chunk
+
+        written = await storage.save_file_stream("flow_123", "test.txt", chunks())
+
+        assert written == 12
+        assert await storage.get_file("flow_123", "test.txt") == b"test content"
+        assert await storage.list_files("flow_123") == ["test.txt"]
+
+    @pytest.mark.asyncio
+    async def test_get_file_stream_range(self, storage):
+        """Test streaming a byte range of a file."""
+        await storage.save_file("flow_123", "digits.txt", b"0123456789")
+
+        chunks = [chunk async for chunk in storage.get_file_stream("flow_123", "digits.txt", 2, start=3, end=7)]
+
+        assert chunks == [b"34", b"56", b"7"]
+
     @pytest.mark.asyncio
     async def test_list_files(self, storage):
         """Test listing files in a flow."""
@@ -0,0 +1,101 @@
+"""Tests for the run-scoped variable resolver and the decrypted variable cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from lfx.services.variable import resolver as resolver_module
+from lfx.services.variable.resolver import (
+    DecryptedVariableCache,
+    VariableResolver,
+    get_decrypted_variable_cache,
+    invalidate_user_variables,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    cache = DecryptedVariableCache(ttl=60)
+    with patch.object(resolver_module, "_decrypted_variable_cache", cache):
+        yield cache
+
+
+def make_variable_service(variables: dict[str, str]) -> MagicMock:
+    variable_service = MagicMock()
+    variable_service.get_all_decrypted_variables = AsyncMock(return_value=variables)
+    return variable_service
+
+
+class TestDecryptedVariableCache:
+    def test_get_set_and_invalidate(self):
+        cache = DecryptedVariableCache(ttl=60)
+        assert cache.get("user") is None
+        cache.set("user", {"KEY": "value"})
+        assert cache.get("user") == {"KEY": "value"}
+        cache.invalidate("user")
+        assert cache.get("user") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_entries_expire(self):
+        cache = DecryptedVariableCache(ttl=10)
+        with patch.object(resolver_module.time, "monotonic", return_value=100.0):
+            cache.set("user", {"KEY": "value"})
+        with patch.object(resolver_module.time, "monotonic", return_value=109.0):
+            assert cache.get("user") == {"KEY": "value"}
+        with patch.object(resolver_module.time, "monotonic", return_value=110.0):
+            assert cache.get("user") is None
+
+    def test_zero_ttl_disables_caching(self):
+        cache = DecryptedVariableCache(ttl=0)
+        cache.set("user", {"KEY": "value"})
+        assert cache.get("user") is None
+
+    def test_keys_are_normalized_to_strings(self, fresh_cache):
+        user_id = MagicMock(__str__=lambda _: "user-1")
+        fresh_cache.set(user_id, {"KEY": "value"})
+        assert fresh_cache.get("user-1") == {"KEY": "value"}
+        invalidate_user_variables("user-1")
+        assert get_decrypted_variable_cache().get(user_id) is None
+
+
+class TestVariableResolver:
+    async def test_fetches_variables_once_per_run(self):
+        variable_service = make_variable_service({"A": "1", "B": "2"})
+        resolver = VariableResolver("user", variable_service, run_id="run")
+
+        assert await resolver.get("A", session=None) == "1"
+        assert await resolver.get("B", session=None) == "2"
+        assert await resolver.get("MISSING", session=None) is None
+        variable_service.get_all_decrypted_variables.assert_awaited_once_with("user", None)
+
+    async def test_concurrent_lookups_share_one_fetch(self):
+        variable_service = make_variable_service({"A": "1"})
+        resolver = VariableResolver("user", variable_service)
+
+        results = await asyncio.gather(*(resolver.get("A", session=None) for _ in range(10)))
+
+        assert results == ["1"] * 10
+        variable_service.get_all_decrypted_variables.assert_awaited_once()
+
+    async def test_later_runs_are_served_from_the_cache_until_invalidated(self):
+        variable_service = make_variable_service({"A": "1"})
+
+        assert await VariableResolver("user", variable_service, run_id="run-1").get("A", None) == "1"
+        assert await VariableResolver("user", variable_service, run_id="run-2").get("A", None) == "1"
+        assert variable_service.get_all_decrypted_variables.await_count == 1
+
+        invalidate_user_variables("user")
+        variable_service.get_all_decrypted_variables.return_value = {"A": "2"}
+        assert await VariableResolver("user", variable_service, run_id="run-3").get("A", None) == "2"
+        assert variable_service.get_all_decrypted_variables.await_count == 2
+
+    async def test_fetch_errors_fall_back_to_individual_lookups(self, fresh_cache):
+        variable_service = MagicMock()
+        variable_service.get_all_decrypted_variables = AsyncMock(side_effect=RuntimeError("database is down"))
+        resolver = VariableResolver("user", variable_service)
+
+        assert await resolver.get("A", session=None) is None
+        assert await resolver.get("B", session=None) is None
+        variable_service.get_all_decrypted_variables.assert_awaited_once()
+        assert fresh_cache.get("user") is None